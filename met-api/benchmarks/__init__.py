@@ -0,0 +1,5 @@
+"""Performance benchmarks.
+
+Each module can be run on its own, for example `python -m benchmarks.bench_comment_export`, and prints the timings
+of the current implementation against the implementation it replaced.
+"""
@@ -0,0 +1,155 @@
+"""Benchmark of the shaping of comments for the proponent and staff exports.
+
+Compares the previous list scanning implementations of the CommentService export helpers with the current ones on a
+synthetic survey, and checks that both produce the same output.
+
+    python -m benchmarks.bench_comment_export --comments 50000 --questions 20
+"""
+import argparse
+import copy
+import random
+import time
+from types import SimpleNamespace
+
+from met_api.services.comment_service import CommentService
+
+
+def legacy_group_comments_by_submission_id(comments):
+    """Group the comments by submission, scanning the groups for each comment."""
+    grouped_comments = []
+    for comment in comments:
+        submission_id = comment['submission_id']
+        text = comment.get('text', '')
+        label = comment['label']
+        existing_group = next((group for group in grouped_comments
+                               if group['submission_id'] == submission_id), None)
+        if existing_group:
+            existing_group['commentText'].append({'text': text, 'label': label})
+        else:
+            grouped_comments.append({'submission_id': submission_id, 'commentText': [{'text': text, 'label': label}]})
+    return grouped_comments
+
+
+def legacy_get_visible_titles(survey, comments):
+    """Filter the titles, rebuilding the list of labels for each comment."""
+    visible_titles = []
+    for comment in comments:
+        label = comment['label']
+        if label not in [title['label'] for title in visible_titles]:
+            visible_titles.append({'label': label})
+    return [title for title in CommentService.get_titles(survey) if title in visible_titles]
+
+
+def legacy_sort_comments_by_titles(titles, grouped_comments):
+    """Sort the comments of each group, filtering the whole group for each title."""
+    for group in grouped_comments:
+        sorted_comment_text = []
+        for title in titles:
+            label = title['label']
+            matching_comments = [comment for comment in group['commentText'] if comment['label'] == label]
+            if not matching_comments:
+                sorted_comment_text.append({'text': '', 'label': label})
+            else:
+                sorted_comment_text.extend(matching_comments)
+        group['commentText'] = sorted_comment_text
+    return grouped_comments
+
+
+def legacy_format_comments(comments):
+    """Format the comments, popping the head of each label list until they are all empty."""
+    comments_by_label = {}
+    unique_titles = []
+    for comment in comments:
+        submission_id = comment.get('submission_id', '')
+        label = comment['label']
+        text = comment.get('text', '')
+        if label not in unique_titles:
+            unique_titles.append(label)
+        if label not in comments_by_label:
+            comments_by_label[label] = []
+        comments_by_label[label].append({'text': text, 'submission_id': submission_id})
+
+    titles = [{'label': title, 'proponent_answers': 'Proponent Answer'} for title in unique_titles]
+    formatted_comments = []
+    row_id = 1
+    while any(comments_by_label.get(title['label']) for title in titles):
+        comment_row = {'row_id': row_id, 'commentText': []}
+        for title in titles:
+            label_comments = comments_by_label.get(title['label'], [{'text': '', 'submission_id': ''}])
+            if label_comments:
+                comment_text = label_comments.pop(0)
+            else:
+                comment_text = {'text': '', 'submission_id': ''}
+            comment_row['commentText'].append(comment_text)
+        formatted_comments.append(comment_row)
+        row_id += 1
+    return {'titles': titles, 'comments': formatted_comments}
+
+
+def build_survey(question_count):
+    """Build a wizard survey with one text question per page."""
+    return SimpleNamespace(id=None, updated_date=None, form_json={
+        'display': 'wizard',
+        'components': [
+            {'key': f'page{index}', 'components': [
+                {'key': f'question{index}', 'label': f'Question {index}', 'inputType': 'text'}
+            ]}
+            for index in range(question_count)
+        ]
+    })
+
+
+def build_comments(comment_count, question_count, seed=0):
+    """Build comments answering a random subset of the questions of each submission."""
+    rng = random.Random(seed)
+    comments = []
+    submission_id = 0
+    while len(comments) < comment_count:
+        submission_id += 1
+        answered = rng.sample(range(question_count), rng.randint(1, question_count))
+        for question in answered[:comment_count - len(comments)]:
+            comments.append({
+                'submission_id': submission_id,
+                'label': f'Question {question}',
+                'text': f'Comment {len(comments)}',
+            })
+    return comments
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def run(comment_count, question_count):
+    """Run each step with both implementations and print the timings."""
+    survey = build_survey(question_count)
+    comments = build_comments(comment_count, question_count)
+    titles = CommentService.get_titles(survey)
+    grouped = CommentService.group_comments_by_submission_id(comments)
+    steps = (
+        ('format_comments', legacy_format_comments, CommentService.format_comments, lambda: (comments,)),
+        ('group_comments_by_submission_id', legacy_group_comments_by_submission_id,
+         CommentService.group_comments_by_submission_id, lambda: (comments,)),
+        ('get_visible_titles', legacy_get_visible_titles, CommentService.get_visible_titles,
+         lambda: (survey, comments)),
+        ('sort_comments_by_titles', legacy_sort_comments_by_titles, CommentService.sort_comments_by_titles,
+         lambda: (titles, copy.deepcopy(grouped))),
+    )
+
+    print(f'{comment_count} comments, {question_count} questions, {len(grouped)} submissions')
+    print(f'{"step":<34}{"previous (s)":>14}{"current (s)":>14}{"speedup":>10}')
+    for name, legacy, current, get_args in steps:
+        legacy_time, legacy_result = _timed(legacy, *get_args())
+        current_time, current_result = _timed(current, *get_args())
+        assert legacy_result == current_result, f'{name} output differs'
+        print(f'{name:<34}{legacy_time:>14.3f}{current_time:>14.3f}{legacy_time / current_time:>9.0f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--comments', type=int, default=50000)
+    parser.add_argument('--questions', type=int, default=20)
+    arguments = parser.parse_args()
+    run(arguments.comments, arguments.questions)
@@ -0,0 +1,39 @@
+"""Benchmark of the signing of document storage requests.
+
+Signs a batch of new documents with ObjectStorageService.get_auth_headers, which computes the authorization
+headers and presigned URLs locally instead of sending a request to the object storage for each document.
+
+    python -m benchmarks.bench_document_signing --documents 1000
+"""
+import argparse
+import time
+
+from met_api.services.object_storage_service import ObjectStorageService
+from met_api.utils.sigv4 import SigV4Signer
+
+
+def run(document_count, repeat):
+    """Sign the batch of documents and print the best time."""
+    service = ObjectStorageService()
+    service.s3_auth = SigV4Signer('access-key', 'secret-key', 'storage.example', 'us-east-1', 's3')
+    service.s3_bucket = 'bucket'
+
+    timings = []
+    for _ in range(repeat):
+        documents = [{'filename': f'document{index}.pdf'} for index in range(document_count)]
+        start = time.perf_counter()
+        signed = service.get_auth_headers(documents)
+        timings.append(time.perf_counter() - start)
+        assert all(document['authheader'] and document['presignedurl'] for document in signed)
+
+    best = min(timings)
+    print(f'{document_count} documents signed in {best * 1000:.1f} ms '
+          f'({best / document_count * 1_000_000:.1f} us per document, best of {repeat})')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--documents', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    arguments = parser.parse_args()
+    run(arguments.documents, arguments.repeat)
@@ -0,0 +1,70 @@
+"""Benchmark of the validation of request payloads against the JSON schemas.
+
+Compares the previous implementation of schema_utils.validate, which read the schema store and compiled two
+validators on every call, with the current one, which reuses the cached validator of the schema.
+
+    python -m benchmarks.bench_schema_validation --validations 2000
+"""
+import argparse
+import time
+from os import path
+
+from jsonschema import Draft7Validator, RefResolver, draft7_format_checker
+
+from met_api.schemas import utils as schema_utils
+
+
+PAYLOADS = (
+    ('poll_response', {'selected_answer_id': 1}),
+    ('poll_response', {'selected_answer_id': 'one'}),
+    ('engagement_translation', {'engagement_id': 1, 'language_id': 1, 'name': 'Engagement'}),
+    ('engagement_translation', {'language_id': 'en'}),
+)
+
+
+def legacy_validate(json_data, schema_id):
+    """Validate the payload, loading the schema store and compiling the validator for each call."""
+    schema_search_path = schema_utils.DEFAULT_SCHEMA_SEARCH_PATH
+    schema_store = schema_utils.get_schema_store(False, schema_search_path)
+    schema = schema_store.get(f'{schema_utils.BASE_URI}/{schema_id}')
+    resolver = RefResolver(f'file://{path.join(schema_search_path, schema_id)}.json', schema, schema_store)
+    if Draft7Validator(schema, format_checker=draft7_format_checker, resolver=resolver).is_valid(json_data):
+        return True, None
+    errors = Draft7Validator(schema, format_checker=draft7_format_checker, resolver=resolver).iter_errors(json_data)
+    return False, errors
+
+
+def _validate_all(validate, validation_count):
+    results = []
+    for index in range(validation_count):
+        schema_id, payload = PAYLOADS[index % len(PAYLOADS)]
+        valid_format, errors = validate(payload, schema_id)
+        results.append((valid_format, schema_utils.serialize(errors) if errors else None))
+    return results
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def run(validation_count):
+    """Validate the payloads with both implementations and print the throughputs."""
+    schema_utils.clear_validator_cache()
+    legacy_time, legacy_results = _timed(_validate_all, legacy_validate, validation_count)
+    current_time, current_results = _timed(_validate_all, schema_utils.validate, validation_count)
+    assert legacy_results == current_results, 'validation results differ'
+
+    print(f'{validation_count} validations, half of them invalid')
+    print(f'{"implementation":<16}{"validations/s":>16}')
+    print(f'{"previous":<16}{validation_count / legacy_time:>16.0f}')
+    print(f'{"current":<16}{validation_count / current_time:>16.0f}')
+    print(f'speedup {legacy_time / current_time:.0f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--validations', type=int, default=2000)
+    arguments = parser.parse_args()
+    run(arguments.validations)
@@ -2,6 +2,9 @@ from flask_script import Manager
 from flask_migrate import Migrate, MigrateCommand
 
 from met_api import create_app, db
+from met_api.models.poll_response_count import PollResponseCount
+from met_api.models.submission_status_count import SubmissionStatusCount
+from met_api.services.email_outbox_service import EmailOutboxService
 
 app = create_app()
 # app.config.from_object(os.environ['APP_SETTINGS'])
@@ -11,5 +14,29 @@ manager = Manager(app)
 
 manager.add_command('db', MigrateCommand)
 
+
+@manager.command
+def rebuild_submission_status_counts():
+    """Recompute the per-survey comment status counters from the submissions."""
+    rebuilt = SubmissionStatusCount.rebuild()
+    db.session.commit()
+    print(f'Rebuilt comment status counters for {rebuilt} surveys.')
+
+
+@manager.command
+def rebuild_poll_response_counts():
+    """Recompute the per-poll and per-answer response counters from the poll responses."""
+    rebuilt = PollResponseCount.rebuild()
+    db.session.commit()
+    print(f'Rebuilt response counters for {rebuilt} polls.')
+
+
+@manager.command
+def dispatch_email_outbox():
+    """Send the emails of the outbox which are due, as the EMAIL_OUTBOX job of met-cron does."""
+    totals = EmailOutboxService.dispatch()
+    print(f'Dispatched the email outbox: {dict(totals)}.')
+
+
 if __name__ == '__main__':
-    manager.run()
\ No newline at end of file
+    manager.run()
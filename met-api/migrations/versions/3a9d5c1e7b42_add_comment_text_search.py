@@ -0,0 +1,48 @@
+"""add a full text search vector with a GIN index to the comments
+
+Revision ID: 3a9d5c1e7b42
+Revises: 6f57c27869fd
+Create Date: 2026-10-18 14:05:31.208114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '3a9d5c1e7b42'
+down_revision = '6f57c27869fd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The comment_search configuration splits the text into words without stemming or stop words, lower cases them
+    # and, when the unaccent extension is available, removes their accents. Both the stored vectors and the search
+    # queries go through it, so that matching is case and accent insensitive on both sides.
+    conn = op.get_bind()
+    has_unaccent = conn.execute(sa.text(
+        "SELECT 1 FROM pg_available_extensions WHERE name = 'unaccent'"
+    )).first() is not None
+    op.execute('CREATE TEXT SEARCH CONFIGURATION comment_search (COPY = simple)')
+    if has_unaccent:
+        op.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+        op.execute("""
+            ALTER TEXT SEARCH CONFIGURATION comment_search
+                ALTER MAPPING FOR hword, hword_part, word WITH unaccent, simple
+        """)
+
+    op.add_column('comment', sa.Column(
+        'text_search',
+        postgresql.TSVECTOR(),
+        sa.Computed("to_tsvector('comment_search'::regconfig, coalesce(text, ''))", persisted=True),
+        nullable=True
+    ))
+    op.create_index('ix_comment_text_search', 'comment', ['text_search'], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    op.drop_index('ix_comment_text_search', table_name='comment', postgresql_using='gin')
+    op.drop_column('comment', 'text_search')
+    op.execute('DROP TEXT SEARCH CONFIGURATION comment_search')
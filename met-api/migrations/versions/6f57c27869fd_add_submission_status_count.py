@@ -0,0 +1,49 @@
+"""add submission_status_count table with per-survey comment status counters
+
+Revision ID: 6f57c27869fd
+Revises: 901a6724bca2
+Create Date: 2026-10-18 09:12:44.512801
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6f57c27869fd'
+down_revision = '901a6724bca2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('submission_status_count',
+                    sa.Column('survey_id', sa.Integer(), nullable=False),
+                    sa.Column('total', sa.Integer(), server_default='0', nullable=False),
+                    sa.Column('pending', sa.Integer(), server_default='0', nullable=False),
+                    sa.Column('approved', sa.Integer(), server_default='0', nullable=False),
+                    sa.Column('rejected', sa.Integer(), server_default='0', nullable=False),
+                    sa.Column('needs_further_review', sa.Integer(), server_default='0', nullable=False),
+                    sa.Column('updated_date', sa.DateTime(), nullable=True),
+                    sa.ForeignKeyConstraint(['survey_id'], ['survey.id'], ondelete='CASCADE'),
+                    sa.PrimaryKeyConstraint('survey_id')
+                    )
+    # Backfill the counters from the existing submissions. Submissions reviewed by the system are only
+    # counted in the total.
+    op.execute("""
+        INSERT INTO submission_status_count
+            (survey_id, total, pending, approved, rejected, needs_further_review, updated_date)
+        SELECT survey_id,
+               count(id),
+               count(id) FILTER (WHERE comment_status_id = 1 AND reviewed_by IS DISTINCT FROM 'System'),
+               count(id) FILTER (WHERE comment_status_id = 2 AND reviewed_by IS DISTINCT FROM 'System'),
+               count(id) FILTER (WHERE comment_status_id = 3 AND reviewed_by IS DISTINCT FROM 'System'),
+               count(id) FILTER (WHERE comment_status_id = 4 AND reviewed_by IS DISTINCT FROM 'System'),
+               now()
+        FROM submission
+        GROUP BY survey_id
+    """)
+
+
+def downgrade():
+    op.drop_table('submission_status_count')
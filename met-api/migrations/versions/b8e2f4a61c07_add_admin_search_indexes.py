@@ -0,0 +1,47 @@
+"""add trigram indexes for the admin searches and a case insensitive index on the slugs
+
+Revision ID: b8e2f4a61c07
+Revises: 3a9d5c1e7b42
+Create Date: 2026-10-18 16:42:09.517233
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8e2f4a61c07'
+down_revision = '3a9d5c1e7b42'
+branch_labels = None
+depends_on = None
+
+# Columns searched by substring in the admin lists, as (index name, table, indexed expression). The staff user
+# expression is the full_name column property of the StaffUser model and must stay identical to it.
+TRIGRAM_INDEXES = (
+    ('ix_engagement_name_trgm', 'engagement', 'name'),
+    ('ix_survey_name_trgm', 'survey', 'name'),
+    ('ix_staff_users_full_name_trgm', 'staff_users', "(first_name || ' ' || last_name)"),
+    ('ix_submission_reviewed_by_trgm', 'submission', 'reviewed_by'),
+)
+
+
+def upgrade():
+    # Trigram GIN indexes serve the ILIKE '%text%' searches and the word similarity operators. They need the pg_trgm
+    # extension, which is skipped where it is not available; the searches then keep scanning the tables.
+    conn = op.get_bind()
+    has_pg_trgm = conn.execute(sa.text(
+        "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"
+    )).first() is not None
+    if has_pg_trgm:
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for index_name, table_name, expression in TRIGRAM_INDEXES:
+            op.execute(f'CREATE INDEX {index_name} ON {table_name} USING gin ({expression} gin_trgm_ops)')
+
+    # The slugs are looked up case insensitively, by value and by prefix
+    op.execute('CREATE INDEX ix_engagement_slug_lower_slug ON engagement_slug (lower(slug) text_pattern_ops)')
+
+
+def downgrade():
+    op.execute('DROP INDEX IF EXISTS ix_engagement_slug_lower_slug')
+    for index_name, _, _ in TRIGRAM_INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {index_name}')
@@ -0,0 +1,41 @@
+"""add the indexed metadata values of the engagements
+
+Revision ID: c4d7a9e2f513
+Revises: b8e2f4a61c07
+Create Date: 2026-10-18 18:11:47.362920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d7a9e2f513'
+down_revision = 'b8e2f4a61c07'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Every metadata value of an engagement, as '<taxon id>:<value>', maintained by the EngagementMetadata model events
+    op.add_column('engagement', sa.Column(
+        'metadata_values', postgresql.ARRAY(sa.Text()), server_default='{}', nullable=False
+    ))
+    op.execute("""
+        UPDATE engagement SET metadata_values = facets.metadata_values
+        FROM (
+            SELECT engagement_id, array_agg(concat(taxon_id, ':', value)) AS metadata_values
+            FROM engagement_metadata
+            WHERE engagement_id IS NOT NULL
+            GROUP BY engagement_id
+        ) AS facets
+        WHERE facets.engagement_id = engagement.id
+    """)
+    op.create_index('ix_engagement_metadata_values', 'engagement', ['metadata_values'], unique=False,
+                    postgresql_using='gin')
+
+
+def downgrade():
+    op.drop_index('ix_engagement_metadata_values', table_name='engagement', postgresql_using='gin')
+    op.drop_column('engagement', 'metadata_values')
@@ -0,0 +1,27 @@
+"""add the index counting the poll responses of a participant
+
+Revision ID: d5e1a7c3b902
+Revises: c4d7a9e2f513
+Create Date: 2026-10-18 20:02:31.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5e1a7c3b902'
+down_revision = 'c4d7a9e2f513'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Covers the count of the responses of a participant to a poll done when recording a response, as an index
+    # only scan
+    op.create_index('ix_poll_responses_poll_participant', 'poll_responses', ['poll_id', 'participant_id'],
+                    unique=False, postgresql_where=sa.text('is_deleted = false'))
+
+
+def downgrade():
+    op.drop_index('ix_poll_responses_poll_participant', table_name='poll_responses')
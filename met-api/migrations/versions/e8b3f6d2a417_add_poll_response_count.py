@@ -0,0 +1,59 @@
+"""add poll_response_count and poll_answer_response_count tables with the poll results counters
+
+Revision ID: e8b3f6d2a417
+Revises: d5e1a7c3b902
+Create Date: 2026-10-18 20:41:09.204716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8b3f6d2a417'
+down_revision = 'd5e1a7c3b902'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('poll_response_count',
+                    sa.Column('poll_id', sa.Integer(), nullable=False),
+                    sa.Column('total', sa.Integer(), server_default='0', nullable=False),
+                    sa.Column('updated_date', sa.DateTime(), nullable=True),
+                    sa.ForeignKeyConstraint(['poll_id'], ['widget_polls.id'], ondelete='CASCADE'),
+                    sa.PrimaryKeyConstraint('poll_id')
+                    )
+    op.create_table('poll_answer_response_count',
+                    sa.Column('answer_id', sa.Integer(), nullable=False),
+                    sa.Column('poll_id', sa.Integer(), nullable=False),
+                    sa.Column('total', sa.Integer(), server_default='0', nullable=False),
+                    sa.ForeignKeyConstraint(['answer_id'], ['poll_answers.id'], ondelete='CASCADE'),
+                    sa.ForeignKeyConstraint(['poll_id'], ['widget_polls.id'], ondelete='CASCADE'),
+                    sa.PrimaryKeyConstraint('answer_id')
+                    )
+    op.create_index(op.f('ix_poll_answer_response_count_poll_id'), 'poll_answer_response_count', ['poll_id'],
+                    unique=False)
+    # Backfill the counters from the existing responses. Soft deleted responses are not counted.
+    op.execute("""
+        INSERT INTO poll_response_count (poll_id, total, updated_date)
+        SELECT widget_polls.id, count(poll_responses.id), now()
+        FROM widget_polls
+        LEFT JOIN poll_responses
+            ON poll_responses.poll_id = widget_polls.id AND poll_responses.is_deleted = false
+        GROUP BY widget_polls.id
+    """)
+    op.execute("""
+        INSERT INTO poll_answer_response_count (answer_id, poll_id, total)
+        SELECT poll_answers.id, poll_answers.poll_id, count(poll_responses.id)
+        FROM poll_answers
+        LEFT JOIN poll_responses
+            ON poll_responses.selected_answer_id = poll_answers.id AND poll_responses.is_deleted = false
+        GROUP BY poll_answers.id, poll_answers.poll_id
+    """)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_poll_answer_response_count_poll_id'), table_name='poll_answer_response_count')
+    op.drop_table('poll_answer_response_count')
+    op.drop_table('poll_response_count')
@@ -0,0 +1,51 @@
+"""add the email_outbox table with the emails queued by the requests and sent by the dispatcher
+
+Revision ID: f2c8a4d61b95
+Revises: e8b3f6d2a417
+Create Date: 2026-10-18 22:05:37.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c8a4d61b95'
+down_revision = 'e8b3f6d2a417'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('email_outbox',
+                    sa.Column('created_date', sa.DateTime(), nullable=False),
+                    sa.Column('updated_date', sa.DateTime(), nullable=True),
+                    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+                    sa.Column('idempotency_key', sa.String(length=200), nullable=False),
+                    sa.Column('email_address', sa.String(length=500), nullable=False),
+                    sa.Column('subject', sa.String(length=500), nullable=True),
+                    sa.Column('html_body', sa.Text(), nullable=True),
+                    sa.Column('args', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+                    sa.Column('template_id', sa.String(length=100), nullable=True),
+                    sa.Column('status', sa.Enum('PENDING', 'SENDING', 'SENT', 'FAILED', name='emailoutboxstatus'),
+                              nullable=False),
+                    sa.Column('attempts', sa.Integer(), nullable=False),
+                    sa.Column('next_attempt_date', sa.DateTime(), nullable=False),
+                    sa.Column('last_error', sa.Text(), nullable=True),
+                    sa.Column('sent_date', sa.DateTime(), nullable=True),
+                    sa.Column('created_by', sa.String(length=50), nullable=True),
+                    sa.Column('updated_by', sa.String(length=50), nullable=True),
+                    sa.PrimaryKeyConstraint('id'),
+                    sa.UniqueConstraint('idempotency_key')
+                    )
+    # only the emails waiting to be sent are indexed, so the index stays small as the sent emails accumulate
+    op.create_index('ix_email_outbox_due', 'email_outbox', ['next_attempt_date'], unique=False,
+                    postgresql_where=sa.text("status IN ('PENDING', 'SENDING')"))
+
+
+def downgrade():
+    op.drop_index('ix_email_outbox_due', table_name='email_outbox',
+                  postgresql_where=sa.text("status IN ('PENDING', 'SENDING')"))
+    op.drop_table('email_outbox')
+    op.execute('DROP TYPE IF EXISTS emailoutboxstatus;')
@@ -12,11 +12,12 @@ from flask_cors import CORS
 from met_api.auth import jwt
 from met_api.config import get_named_config
 from met_api.models import db, ma, migrate
-from met_api.models.tenant import Tenant as TenantModel
-from met_api.services.staff_user_service import StaffUserService
-from met_api.services.user_group_membership_service import UserGroupMembershipService
+from met_api.services.identity_service import IdentityService
+from met_api.services.tenant_service import TenantService
 from met_api.utils import constants
 from met_api.utils.cache import cache
+from met_api.utils.identity_cache import get_identity_cache, reset_identity_cache
+from met_api.utils.response_cache import set_cache_control
 from met_api.utils.roles import Role
 
 # Security Response headers
@@ -75,6 +76,16 @@ def create_app(run_mode=os.getenv('FLASK_ENV', 'development')):
     def set_origin():
         g.origin_url = request.environ.get('HTTP_ORIGIN', 'localhost')
 
+    @app.before_request
+    def clear_identity():
+        """Resolve the identity of the user again for each request, even when the app context is reused."""
+        IdentityService.clear_context()
+
+    @app.before_request
+    def clear_identity_cache():
+        """Look up the models again for each request, even when the app context is reused."""
+        reset_identity_cache()
+
     build_cache(app)
 
     @app.before_request
@@ -89,17 +100,11 @@ def create_app(run_mode=os.getenv('FLASK_ENV', 'development')):
             if hasattr(g, 'tenant_name'):
                 del g.tenant_name
             return
-        key = tenant_short_name.upper()
-        tenant = cache.get(f'tenant_{key}')
-        cache_miss = not tenant
-        if cache_miss:
-            tenant: TenantModel = TenantModel.find_by_short_name(tenant_short_name)
-            if not tenant:
-                return
-            key = tenant.short_name.upper()
-            cache.set(f'tenant_{key}', tenant)
-        g.tenant_id = tenant.id
-        g.tenant_name = key
+        tenant = TenantService.get_cached(tenant_short_name)
+        if not tenant:
+            return
+        g.tenant_id = tenant['id']
+        g.tenant_name = tenant['short_name'].upper()
 
     @app.after_request
     def set_secure_headers(response):
@@ -108,6 +113,14 @@ def create_app(run_mode=os.getenv('FLASK_ENV', 'development')):
         response.headers.add('Cross-Origin-Resource-Policy', '*')
         response.headers['Cross-Origin-Opener-Policy'] = '*'
         response.headers['Cross-Origin-Embedder-Policy'] = 'unsafe-none'
+        return set_cache_control(response)
+
+    @app.after_request
+    def log_query_count(response):
+        """Log the number of queries run by the request and the model lookups answered by the identity cache."""
+        identity_cache = get_identity_cache()
+        app.logger.debug('%s %s: %s queries, %s identity cache hits', request.method, request.path,
+                         identity_cache.queries, identity_cache.hits)
         return response
 
     # Return App for run in run.py file
@@ -115,12 +128,13 @@ def create_app(run_mode=os.getenv('FLASK_ENV', 'development')):
 
 
 def build_cache(app):
-    """Build cache."""
+    """Build cache.
+
+    The cache may be shared with the other workers, so it is not cleared; the cached tenants are refreshed instead.
+    """
     cache.init_app(app)
     with app.app_context():
-        cache.clear()
         try:
-            from met_api.services.tenant_service import TenantService  # pylint: disable=import-outside-toplevel
             TenantService.build_all_tenant_cache()
         except Exception as e:  # NOQA # pylint:disable=broad-except
             current_app.logger.error('Error on caching ')
@@ -160,12 +174,10 @@ def setup_jwt_manager(app_context, jwt_manager):
         # ... so any extraneous roles are discarded
         user_roles = list(set(roles_from_token).intersection(keycloak_forwarded_roles))
 
-        # Retrieve user by external ID from token info
-        user = StaffUserService.get_user_by_external_id(token_info['sub'])
-
-        # Retrieve user roles within a tenant using UserGroupMembershipService
-        additional_user_roles, _ = UserGroupMembershipService.get_user_roles_within_tenant(
-            token_info['sub'], g.tenant_id)
+        # Retrieve the user and their roles within the tenant, resolved once per request
+        identity = IdentityService.get_context(token_info['sub'], g.tenant_id)
+        user = identity.staff_user
+        additional_user_roles = identity.tenant_roles
         if user and additional_user_roles:
             # Add additional user roles to user_roles list
             user_roles.extend(additional_user_roles)
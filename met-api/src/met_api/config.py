@@ -160,6 +160,25 @@ class Config:  # pylint: disable=too-few-public-methods
         'The default tenant for MET. Used for testing and development.'
     )
 
+    # Cache shared by the API workers. 'FileSystemCache' stores the entries in CACHE_DIR, which can be on a
+    # tmpfs such as /dev/shm; 'RedisCache' uses CACHE_REDIS_URL and needs the redis package.
+    CACHE_TYPE = os.getenv('CACHE_TYPE', 'FileSystemCache')
+    CACHE_DIR = os.getenv('CACHE_DIR', '/tmp/met-api-cache')
+    CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL')
+    CACHE_KEY_PREFIX = os.getenv('CACHE_KEY_PREFIX', 'met_api_')
+    CACHE_DEFAULT_TIMEOUT = int(os.getenv('CACHE_DEFAULT_TIMEOUT', '300'))
+    # Seconds during which the engagement memberships and tenants checked by the authorization are cached (0 disables)
+    AUTHORIZATION_CACHE_TIMEOUT = int(os.getenv('AUTHORIZATION_CACHE_TIMEOUT', '60'))
+    # Seconds during which each worker keeps the reference data tables such as the statuses and languages (0 disables)
+    REFERENCE_DATA_CACHE_TTL = int(os.getenv('REFERENCE_DATA_CACHE_TTL', '900'))
+    # Seconds during which the responses to the anonymous GET requests of the engagement pages are cached (0 disables)
+    PUBLIC_RESPONSE_CACHE_TIMEOUT = int(os.getenv('PUBLIC_RESPONSE_CACHE_TIMEOUT', '300'))
+    # Poll responses accepted per second from the network of a participant by each worker, after a burst (0 disables)
+    POLL_RESPONSE_RATE = float(os.getenv('POLL_RESPONSE_RATE', '1'))
+    POLL_RESPONSE_BURST = int(os.getenv('POLL_RESPONSE_BURST', '10'))
+    # Whether the response counts of the polls of the visible engagements can be read without authentication
+    POLL_RESULTS_PUBLIC = env_truthy('POLL_RESULTS_PUBLIC')
+
     # CORS settings
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', '').split(',')
 
@@ -232,6 +251,8 @@ class Config:  # pylint: disable=too-few-public-methods
         'HOST': os.getenv('S3_HOST'),
         'REGION': os.getenv('S3_REGION'),
         'SERVICE': os.getenv('S3_SERVICE'),
+        # Seconds during which the presigned document URLs are valid
+        'PRESIGNED_URL_EXPIRY': int(os.getenv('S3_PRESIGNED_URL_EXPIRY', '3600')),
     }
 
     # The following are the paths used in the email templates. They do not
@@ -264,6 +285,20 @@ class Config:  # pylint: disable=too-few-public-methods
 
     # The API endpoint used to send emails to participants.
     NOTIFICATIONS_EMAIL_ENDPOINT = os.getenv('NOTIFICATIONS_EMAIL_ENDPOINT')
+    # The API endpoint used to send several emails in one request.
+    NOTIFICATIONS_EMAIL_BATCH_ENDPOINT = os.getenv('NOTIFICATIONS_EMAIL_BATCH_ENDPOINT') or \
+        f'{NOTIFICATIONS_EMAIL_ENDPOINT}/batch'
+    # The emails queued by the requests are sent by the EMAIL_OUTBOX job of met-cron, in batches of this size.
+    EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv('EMAIL_OUTBOX_BATCH_SIZE', '50'))
+    # Attempts made to send an email before it is marked as failed.
+    EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv('EMAIL_OUTBOX_MAX_ATTEMPTS', '8'))
+    # Seconds before an email is sent again after a failure, doubled after each attempt up to the maximum.
+    EMAIL_OUTBOX_RETRY_DELAY = int(os.getenv('EMAIL_OUTBOX_RETRY_DELAY', '60'))
+    EMAIL_OUTBOX_MAX_RETRY_DELAY = int(os.getenv('EMAIL_OUTBOX_MAX_RETRY_DELAY', '3600'))
+    # Seconds an email being sent is reserved to its dispatcher, after which another dispatcher can send it.
+    EMAIL_OUTBOX_LEASE = int(os.getenv('EMAIL_OUTBOX_LEASE', '300'))
+    # Days the sent emails are kept in the outbox (0 keeps them).
+    EMAIL_OUTBOX_RETENTION_DAYS = int(os.getenv('EMAIL_OUTBOX_RETENTION_DAYS', '30'))
     # The secret key used for encryption when sending emails to participants.
     EMAIL_SECRET_KEY = os.getenv('EMAIL_SECRET_KEY', os.urandom(24))
     # Templates for sending users various notifications by email.
@@ -318,8 +353,20 @@ class Config:  # pylint: disable=too-few-public-methods
         'SERVICE_CLIENT': os.getenv('CDOGS_SERVICE_CLIENT'),
         'SERVICE_CLIENT_SECRET': os.getenv('CDOGS_SERVICE_CLIENT_SECRET'),
         'TOKEN_URL': os.getenv('CDOGS_TOKEN_URL'),
+        # Seconds during which a template found in CDOGS is rendered without checking it again
+        'TEMPLATE_CACHE_TTL': int(os.getenv('CDOGS_TEMPLATE_CACHE_TTL', '3600')),
+        # Seconds to wait for the access token, which is requested while the other requests wait for it
+        'CONNECT_TIMEOUT': int(os.getenv('CDOGS_CONNECT_TIMEOUT', '60')),
     }
 
+    # Generate the comment sheets with CDOGS ('cdogs') or stream them from the API ('local')
+    COMMENT_EXPORT_ENGINE = os.getenv('COMMENT_EXPORT_ENGINE', 'cdogs')
+    # Search the comments by words with the full text index; when disabled, searches match substrings with ilike
+    COMMENT_FULL_TEXT_SEARCH = env_truthy('COMMENT_FULL_TEXT_SEARCH', default=True)
+    # Also match the words similar to the search text, typos included, in the engagement, survey and staff user lists.
+    # Needs the pg_trgm extension; the lists can be sorted by similarity with the 'relevance' sort key.
+    ADMIN_SEARCH_TYPO_TOLERANT = env_truthy('ADMIN_SEARCH_TYPO_TOLERANT', default=False)
+
     PROPAGATE_EXCEPTIONS = True
 
 
@@ -368,6 +415,15 @@ class TestConfig(TestKeyConfig, Config):  # pylint: disable=too-few-public-metho
     # unhandled exception occurs
     USE_DEBUG = False
 
+    # Keep the cache of each test run in memory
+    CACHE_TYPE = 'SimpleCache'
+    # The reference data is created by the factories of each test
+    REFERENCE_DATA_CACHE_TTL = 0
+    # The ids of the engagements are reused between the tests
+    PUBLIC_RESPONSE_CACHE_TIMEOUT = 0
+    # The poll responses of the tests all come from the same address
+    POLL_RESPONSE_RATE = 0
+
     # JWT OIDC Settings for the test environment
     JWT_OIDC_TEST_MODE = True  # enables the test mode for flask_jwt_oidc
     JWT_OIDC_TEST_AUDIENCE = os.getenv('JWT_OIDC_TEST_AUDIENCE')
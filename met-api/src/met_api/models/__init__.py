@@ -36,6 +36,7 @@ from .membership_status_code import MembershipStatusCode
 from .participant import Participant
 from .staff_note import StaffNote
 from .submission import Submission
+from .submission_status_count import SubmissionStatusCount
 from .subscription import Subscription
 from .survey import Survey
 from .tenant import Tenant
@@ -47,6 +48,7 @@ from .widget_events import WidgetEvents
 from .widgets_subscribe import WidgetSubscribe
 from .widget_item import WidgetItem
 from .widget_type import WidgetType
+from .email_outbox import EmailOutbox
 from .email_queue import EmailQueue
 from .engagement_slug import EngagementSlug
 from .report_setting import ReportSetting
@@ -58,6 +60,7 @@ from .timeline_event import TimelineEvent
 from .widget_poll import Poll
 from .poll_answers import PollAnswer
 from .poll_responses import PollResponse
+from .poll_response_count import PollAnswerResponseCount, PollResponseCount
 from .language import Language
 from .language_tenant_mapping import LanguageTenantMapping
 from .widget_translation import WidgetTranslation
@@ -19,6 +19,7 @@ from sqlalchemy import Column
 from sqlalchemy.ext.declarative import declared_attr
 
 from .db import db
+from ..utils.identity_cache import identity_cached
 from ..utils.token_info import TokenInfo
 
 TENANT_ID = 'tenant_id'
@@ -51,6 +52,7 @@ class BaseModel(db.Model):
         return TokenInfo.get_id()
 
     @classmethod
+    @identity_cached
     def find_by_id(cls, identifier: int):
         """Return model by id."""
         return cls.query.get(identifier)
@@ -3,20 +3,25 @@
 Manages the comment
 """
 from __future__ import annotations
+import re
 from datetime import datetime
 from operator import or_
 
-from sqlalchemy import and_, asc, desc
-from sqlalchemy.sql import text
+from flask import current_app
+from sqlalchemy import Computed, and_, func, literal, select
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql.expression import true
 from sqlalchemy.sql.schema import ForeignKey
 from sqlalchemy.ext.hybrid import hybrid_property
 
 from met_api.constants.comment_status import Status as CommentStatus
 from met_api.constants.engagement_status import Status as EngagementStatus
+from met_api.models.pagination import CountMode, Page, SortKeys, count, paginate
 from met_api.models.pagination_options import PaginationOptions
 from met_api.models.engagement import Engagement
 from met_api.models.report_setting import ReportSetting
+from met_api.models.search import contains
 from met_api.models.submission import Submission
 from met_api.models.survey import Survey
 from met_api.schemas.comment import CommentSchema
@@ -27,6 +32,13 @@ from .comment_status import CommentStatus as CommentStatusModel
 from .db import db
 
 
+# text search configuration of the comments, see the add_comment_text_search migration
+TEXT_SEARCH_CONFIG = 'comment_search'
+HEADLINE_OPTIONS = 'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2'
+# the last word of a search, matched as a prefix while it is being typed
+LAST_WORD = re.compile(r'(?:^|\s)(\w+)$')
+
+
 class Comment(BaseModel):
     """Definition of the Comment entity."""
 
@@ -38,21 +50,26 @@ class Comment(BaseModel):
     participant_id = db.Column(db.Integer, ForeignKey('participant.id', ondelete='SET NULL'), nullable=True)
     submission_id = db.Column(db.Integer, ForeignKey('submission.id', ondelete='SET NULL'), nullable=True)
     component_id = db.Column(db.String(10))
+    # words of the text, maintained by the database and indexed for the full text search
+    text_search = deferred(db.Column(
+        TSVECTOR, Computed(f"to_tsvector('{TEXT_SEARCH_CONFIG}'::regconfig, coalesce(text, ''))", persisted=True)
+    ))
 
     @hybrid_property
     def is_displayed(self):
         """Get report settings."""
         return self._display()
 
+    @is_displayed.expression
+    def is_displayed(cls):  # pylint:disable=no-self-argument, # noqa: N805
+        """Return the report setting display flag of the comment question, for use in queries."""
+        return select(ReportSetting.display)\
+            .where(ReportSetting.question_key == cls.component_id, ReportSetting.survey_id == cls.survey_id)\
+            .scalar_subquery()
+
     def _display(self):
         """Return report settings for single/multi line comment type questions."""
-        report_setting = db.session.query(ReportSetting).filter(
-            ReportSetting.question_key == self.component_id,
-            ReportSetting.survey_id == self.survey_id).one_or_none()
-        if report_setting:
-            return f'{report_setting.display}'
-
-        return None
+        return ReportSetting.get_display_map(self.survey_id).get(self.component_id)
 
     @classmethod
     def get_by_submission(cls, submission_id):
@@ -63,7 +80,8 @@ class Comment(BaseModel):
             .all()
 
     @classmethod
-    def get_comments_by_survey_id_paginated(cls, survey_id, pagination_options: PaginationOptions, search_text=''):
+    def get_comments_by_survey_id_paginated(
+            cls, survey_id, pagination_options: PaginationOptions, search_text='') -> Page:
         """Get comments paginated."""
         query = db.session.query(Comment)\
             .join(Survey)\
@@ -72,12 +90,20 @@ class Comment(BaseModel):
             .filter(and_(Comment.survey_id == survey_id, ReportSetting.display == true()))
 
         if search_text:
-            query = query.filter(Comment.text.ilike('%' + search_text + '%'))
+            query = query.filter(cls.text_matches(search_text))
 
-        sort = asc(text(pagination_options.sort_key)) if pagination_options.sort_order == 'asc'\
-            else desc(text(pagination_options.sort_key))
+        return paginate(query, pagination_options, COMMENT_SORT_KEYS)
 
-        query = query.order_by(sort)
+    @classmethod
+    def get_accepted_comments_by_survey_id_paginated(
+            cls, survey_id, pagination_options: PaginationOptions, search_text='', include_unpublished=False):
+        """Get comments for closed engagements."""
+        query = cls._get_accepted_comments_query(survey_id, include_unpublished)
+
+        if search_text:
+            query = query.filter(cls.text_matches(search_text))
+
+        query = query.order_by(Comment.id.asc())
 
         no_pagination_options = not pagination_options or not pagination_options.page or not pagination_options.size
         if no_pagination_options:
@@ -89,9 +115,42 @@ class Comment(BaseModel):
         return page.items, page.total
 
     @classmethod
-    def get_accepted_comments_by_survey_id_paginated(
-            cls, survey_id, pagination_options: PaginationOptions, search_text='', include_unpublished=False):
-        """Get comments for closed engagements."""
+    def search_accepted_comments_by_survey_id(
+            cls, survey_id, search_text: str, pagination_options: PaginationOptions = None,
+            include_unpublished=False) -> Page:
+        """Search the comments for closed engagements, best matches first.
+
+        The items are (comment, rank, snippet) rows. The snippet is the HTML escaped text with the matching words
+        within <mark> tags. When the full text search is disabled or the search text has no words, the comments are
+        matched with ilike, unranked, and the snippet is the whole text.
+        """
+        query = cls._get_accepted_comments_query(survey_id, include_unpublished)
+        text_search_query = cls.text_search_query(search_text)
+        if text_search_query is None:
+            rank = literal(0.0)
+            snippet = _escape_html(Comment.text)
+            query = query.filter(Comment.text.ilike('%' + search_text + '%'))
+            order = (Comment.id,)
+        else:
+            rank = func.ts_rank_cd(Comment.text_search, text_search_query)
+            snippet = func.ts_headline(
+                TEXT_SEARCH_CONFIG, _escape_html(Comment.text), text_search_query, HEADLINE_OPTIONS)
+            query = query.filter(Comment.text_search.op('@@')(text_search_query))
+            order = (rank.desc(), Comment.id)
+
+        no_pagination_options = not pagination_options or not pagination_options.page or not pagination_options.size
+        total = None if no_pagination_options else count(query, CountMode(pagination_options.count))
+        query = query.add_columns(rank.label('rank'), snippet.label('snippet')).order_by(*order)
+        if no_pagination_options:
+            items = query.all()
+            return Page(items, len(items))
+
+        offset = (pagination_options.page - 1) * pagination_options.size
+        return Page(query.offset(offset).limit(pagination_options.size).all(), total)
+
+    @staticmethod
+    def _get_accepted_comments_query(survey_id, include_unpublished=False):
+        """Return the query of the approved and displayed comments of the survey."""
         query = db.session.query(Comment)\
             .join(Submission, Submission.id == Comment.submission_id)\
             .join(CommentStatusModel, Submission.comment_status_id == CommentStatusModel.id)\
@@ -108,20 +167,7 @@ class Comment(BaseModel):
 
         if not include_unpublished:
             query = query.filter(Engagement.status_id != EngagementStatus.Unpublished.value)
-
-        if search_text:
-            query = query.filter(Comment.text.ilike('%' + search_text + '%'))
-
-        query = query.order_by(Comment.id.asc())
-
-        no_pagination_options = not pagination_options or not pagination_options.page or not pagination_options.size
-        if no_pagination_options:
-            items = query.all()
-            return items, len(items)
-
-        page = query.paginate(page=pagination_options.page, per_page=pagination_options.size)
-
-        return page.items, page.total
+        return query
 
     @classmethod
     def get_by_survey_id_paginated(
@@ -130,7 +176,7 @@ class Comment(BaseModel):
         pagination_options: PaginationOptions,
         search_text='',
         advanced_search_filters=None
-    ):
+    ) -> Page:
         """Get submissions by survey id paginated."""
         null_value = None
         query = db.session.query(Submission)\
@@ -138,25 +184,14 @@ class Comment(BaseModel):
                          or_(Submission.reviewed_by != 'System', Submission.reviewed_by == null_value)))
 
         if search_text:
-            # Remove all non-digit characters from search text
-            query = query.filter(Submission.comments.any(Comment.text.ilike('%' + search_text + '%')))
+            matching_submission_ids = select(Comment.submission_id)\
+                .where(Comment.survey_id == survey_id, cls.text_matches(search_text))
+            query = query.filter(Submission.id.in_(matching_submission_ids))
 
         if advanced_search_filters:
             query = cls._filter_by_advanced_filters(query, advanced_search_filters)
 
-        sort = asc(text(pagination_options.sort_key)) if pagination_options.sort_order == 'asc'\
-            else desc(text(pagination_options.sort_key))
-
-        query = query.order_by(sort)
-
-        no_pagination_options = not pagination_options.page or not pagination_options.size
-        if no_pagination_options:
-            items = query.all()
-            return items, len(items)
-
-        page = query.paginate(page=pagination_options.page, per_page=pagination_options.size)
-
-        return page.items, page.total
+        return paginate(query, pagination_options, SUBMISSION_SORT_KEYS)
 
     @staticmethod
     def __create_new_comment_entity(comment: CommentSchema):
@@ -172,6 +207,32 @@ class Comment(BaseModel):
             component_id=comment.get('component_id', None)
         )
 
+    @staticmethod
+    def text_search_query(search_text: str):
+        """Return the full text search query of the search text, or None if it cannot be searched by words.
+
+        Quoted phrases, "or" and "-" exclusions follow the web search syntax of Postgres. The last word is matched as
+        a prefix, as it may still be being typed.
+        """
+        if not current_app.config.get('COMMENT_FULL_TEXT_SEARCH') or not re.search(r'\w', search_text or ''):
+            return None
+        last_word = LAST_WORD.search(search_text) if search_text.count('"') % 2 == 0 else None
+        if not last_word:
+            return func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, search_text)
+        prefix_query = func.to_tsquery(TEXT_SEARCH_CONFIG, last_word.group(1) + ':*')
+        head = search_text[:last_word.start(1)]
+        if not re.search(r'\w', head):
+            return prefix_query
+        return func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, head).op('&&')(prefix_query)
+
+    @classmethod
+    def text_matches(cls, search_text: str):
+        """Return the condition on the comments matching the search text, by words when possible."""
+        text_search_query = cls.text_search_query(search_text)
+        if text_search_query is None:
+            return Comment.text.ilike('%' + search_text + '%')
+        return Comment.text_search.op('@@')(text_search_query)
+
     @staticmethod
     def _filter_by_advanced_filters(query, advanced_search_filters: dict):
         if status := advanced_search_filters.get('status'):
@@ -184,7 +245,7 @@ class Comment(BaseModel):
             query = query.filter(Submission.created_date >= comment_date_from)
 
         if reviewer := advanced_search_filters.get('reviewer'):
-            query = query.filter(Submission.reviewed_by.ilike(f'%{reviewer}%'))
+            query = query.filter(contains(Submission.reviewed_by, reviewer))
 
         if reviewed_date_from := advanced_search_filters.get('reviewed_date_from'):
             query = query.filter(Submission.review_date >= reviewed_date_from)
@@ -235,9 +296,23 @@ class Comment(BaseModel):
         return SubmissionSchema(many=True, exclude=['submission_json']).dump(items)
 
     @classmethod
-    def get_public_viewable_comments_by_survey_id(cls, survey_id):
-        """Get comments that are viewable on the public report."""
-        query = db.session.query(Comment)\
+    def get_staff_export_rows(cls, survey_id, batch_size=1000):
+        """Get the comments for the staff export with their submission, streamed in submission order."""
+        null_value = None
+        query = db.session.query(
+            Submission.id.label('submission_id'), Submission.created_date, Submission.comment_status_id,
+            Submission.review_date, Submission.reviewed_by, Submission.has_personal_info, Submission.has_profanity,
+            Submission.has_threat, Submission.rejected_reason_other, Comment.component_id, Comment.text)\
+            .join(Comment, Submission.id == Comment.submission_id)\
+            .filter(and_(Submission.survey_id == survey_id,
+                         or_(Submission.reviewed_by != 'System', Submission.reviewed_by == null_value)))\
+            .order_by(Submission.id.asc(), Comment.id.asc())
+        return query.yield_per(batch_size)
+
+    @classmethod
+    def _get_public_viewable_comments_query(cls, survey_id):
+        """Get the query of the comments that are viewable on the public report."""
+        return db.session.query(Comment)\
             .join(Submission, Submission.id == Comment.submission_id)\
             .join(CommentStatusModel, Submission.comment_status_id == CommentStatusModel.id)\
             .join(Survey, Survey.id == Submission.survey_id)\
@@ -250,6 +325,40 @@ class Comment(BaseModel):
                     ReportSetting.display == true(),
                     Submission.reviewed_by != 'System'
                 ))
+
+    @classmethod
+    def get_public_viewable_comments_by_survey_id(cls, survey_id):
+        """Get comments that are viewable on the public report."""
+        query = cls._get_public_viewable_comments_query(survey_id)
         query = query.order_by(Comment.text.asc())
         items = query.all()
         return CommentSchema(many=True, only=['submission_id', 'label', 'text']).dump(items)
+
+    @classmethod
+    def get_public_viewable_component_ids(cls, survey_id):
+        """Get the questions with comments viewable on the public report, ordered by their first comment text."""
+        query = cls._get_public_viewable_comments_query(survey_id)\
+            .with_entities(Comment.component_id)\
+            .group_by(Comment.component_id)\
+            .order_by(func.min(Comment.text).asc())
+        return [component_id for component_id, in query.all()]
+
+    @classmethod
+    def get_public_viewable_texts(cls, survey_id, component_ids, batch_size=1000):
+        """Get the texts of the comments viewable on the public report for the questions, streamed in text order."""
+        query = cls._get_public_viewable_comments_query(survey_id)\
+            .with_entities(Comment.text)\
+            .filter(Comment.component_id.in_(component_ids))\
+            .order_by(Comment.text.asc())
+        return (comment_text for comment_text, in query.yield_per(batch_size))
+
+
+COMMENT_SORT_KEYS = SortKeys(Comment, Survey, ReportSetting)
+SUBMISSION_SORT_KEYS = SortKeys(Submission)
+
+
+def _escape_html(text):
+    """Return the SQL expression escaping the HTML special characters of the text."""
+    for character, entity in (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;')):
+        text = func.replace(text, character, entity)
+    return text
@@ -0,0 +1,95 @@
+"""Email outbox model class.
+
+Manages the emails written in the transaction of the requests which send them, and sent afterwards by the dispatcher.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import Index, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert
+
+from met_api.constants.email_outbox_status import EmailOutboxStatus
+from .base_model import BaseModel
+from .db import db
+
+
+class EmailOutbox(BaseModel):  # pylint: disable=too-few-public-methods
+    """Definition of the email outbox entity."""
+
+    __tablename__ = 'email_outbox'
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    # identifies the email, so that it is queued only once however many times its request is retried
+    idempotency_key = db.Column(db.String(200), nullable=False, unique=True)
+    email_address = db.Column(db.String(500), nullable=False)
+    subject = db.Column(db.String(500), nullable=True)
+    html_body = db.Column(db.Text(), nullable=True)
+    args = db.Column(postgresql.JSONB(astext_type=db.Text()), nullable=True)
+    template_id = db.Column(db.String(100), nullable=True)
+    status = db.Column(db.Enum(EmailOutboxStatus), nullable=False, default=EmailOutboxStatus.PENDING)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    # when a pending email can be sent, or when the lease of an email being sent expires
+    next_attempt_date = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_error = db.Column(db.Text(), nullable=True)
+    sent_date = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        Index('ix_email_outbox_due', next_attempt_date,
+              postgresql_where=status.in_([EmailOutboxStatus.PENDING, EmailOutboxStatus.SENDING])),
+    )
+
+    @classmethod
+    def enqueue(cls, idempotency_key: str, email_address: str, subject: str,  # pylint: disable=too-many-arguments
+                html_body: str, args: dict, template_id: str) -> Optional[int]:
+        """Queue an email in the current transaction, returning its id, or None if the key was already queued."""
+        now = datetime.utcnow()
+        statement = insert(cls.__table__).values(
+            idempotency_key=idempotency_key,
+            email_address=email_address,
+            subject=subject,
+            html_body=html_body,
+            args=args,
+            template_id=template_id,
+            status=EmailOutboxStatus.PENDING,
+            attempts=0,
+            next_attempt_date=now,
+            created_date=now,
+            updated_date=now,
+            created_by=cls._get_current_user(),
+        ).on_conflict_do_nothing(index_elements=[cls.idempotency_key]).returning(cls.id)
+        return db.session.execute(statement).scalar()
+
+    @classmethod
+    def claim_due(cls, batch_size: int, lease: timedelta) -> List[EmailOutbox]:
+        """Lease the emails due to be sent, oldest first, and count the attempt.
+
+        The emails being sent by another dispatcher are skipped, and an email whose lease expired without being
+        sent, as when its dispatcher stopped, is due again.
+        """
+        now = datetime.utcnow()
+        due = select(cls.id)\
+            .where(cls.status.in_([EmailOutboxStatus.PENDING, EmailOutboxStatus.SENDING]),
+                   cls.next_attempt_date <= now)\
+            .order_by(cls.next_attempt_date)\
+            .limit(batch_size)\
+            .with_for_update(skip_locked=True)
+        claimed_ids = db.session.execute(
+            update(cls)
+            .where(cls.id.in_(due.scalar_subquery()))
+            .values(status=EmailOutboxStatus.SENDING, attempts=cls.attempts + 1, next_attempt_date=now + lease)
+            .returning(cls.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        if not claimed_ids:
+            return []
+        return db.session.query(cls).filter(cls.id.in_(claimed_ids)).order_by(cls.id).populate_existing().all()
+
+    @classmethod
+    def purge_sent(cls, sent_before: datetime) -> int:
+        """Delete the emails sent before the given date, returning their number."""
+        return db.session.query(cls)\
+            .filter(cls.status == EmailOutboxStatus.SENT, cls.sent_date < sent_before)\
+            .delete(synchronize_session=False)
@@ -65,10 +65,10 @@ class EmailVerification(BaseModel):  # pylint: disable=too-few-public-methods
         }
         email_verification_id = email_verification.get('id', None)
         query = EmailVerification.query.filter_by(id=email_verification_id)
-        record = query.first()
+        record = cls.find_by_id(email_verification_id)
         if not record:
             raise ValueError('Email Verification Not Found')
         query.update(update_fields)
         if session is None:
             db.session.commit()
-        return query.first()
+        return cls.find_by_id(email_verification_id)
@@ -6,20 +6,22 @@ Manages the engagement
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from sqlalchemy import and_, asc, desc, or_
-from sqlalchemy.dialects.postgresql import JSON
-from sqlalchemy.sql import text
+from sqlalchemy import Text, and_, cast, event, func, inspect, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSON, array
 from sqlalchemy.sql.schema import ForeignKey
 
 from met_api.constants.engagement_status import EngagementDisplayStatus, Status
 from met_api.constants.user import SYSTEM_USER
 from met_api.models.engagement_scope_options import EngagementScopeOptions
 from met_api.models.membership import Membership as MembershipModel
+from met_api.models.pagination import Page, SortKeys, paginate
 from met_api.models.pagination_options import PaginationOptions
+from met_api.models.search import matches, relevance
 from met_api.models.staff_user import StaffUser
 from met_api.schemas.engagement import EngagementSchema
+from met_api.utils import authorization_cache
 from met_api.utils.datetime import local_datetime
 from met_api.utils.enums import MembershipStatus
 from met_api.utils.filter_types import filter_map
@@ -27,6 +29,7 @@ from met_api.utils.filter_types import filter_map
 from .base_model import BaseModel
 from .db import db
 from .engagement_metadata import EngagementMetadata as EngagementMetadataModel
+from .engagement_metadata import metadata_facet
 from .engagement_status import EngagementStatus
 
 
@@ -58,6 +61,8 @@ class Engagement(BaseModel):
     sponsor_name = db.Column(db.String(50), nullable=True)
     cta_message = db.Column(db.String(50), nullable=True)
     cta_url = db.Column(db.String(500), nullable=True)
+    # the metadata values of the engagement as facets, maintained by the engagement metadata events below
+    metadata_values = db.Column(ARRAY(db.Text), nullable=False, server_default='{}')
 
     @classmethod
     def get_engagements_paginated(
@@ -66,8 +71,31 @@ class Engagement(BaseModel):
             pagination_options: PaginationOptions,
             scope_options: EngagementScopeOptions,
             search_options=None,
-    ):
+    ) -> Page:
         """Get engagements paginated."""
+        query = cls._get_engagements_query(external_user_id, scope_options, search_options)
+
+        sort_keys = ENGAGEMENT_SORT_KEYS
+        if search_text := (search_options or {}).get('search_text'):
+            sort_keys = sort_keys.with_columns(relevance=relevance(Engagement.name, search_text))
+        return paginate(query, pagination_options, sort_keys)
+
+    @classmethod
+    def get_metadata_facet_counts(
+            cls,
+            external_user_id,
+            scope_options: EngagementScopeOptions,
+            search_options=None,
+    ) -> List[Tuple[str, int]]:
+        """Get the number of engagements matching the search for each of their metadata facets."""
+        engagements = cls._get_engagements_query(external_user_id, scope_options, search_options) \
+            .with_entities(Engagement.metadata_values).subquery()
+        facets = select(func.unnest(engagements.c.metadata_values).label('facet')).subquery()
+        return db.session.query(facets.c.facet, func.count()).group_by(facets.c.facet).all()
+
+    @classmethod
+    def _get_engagements_query(cls, external_user_id, scope_options: EngagementScopeOptions, search_options=None):
+        """Return the query of the engagements matching the search within the scope."""
         query = db.session.query(Engagement).join(EngagementStatus)
 
         query = cls._add_tenant_filter(query)
@@ -96,27 +124,7 @@ class Engagement(BaseModel):
                 statuses = scope_options.engagement_status_ids
                 query = cls._filter_by_statuses(query, statuses)
 
-        sort = cls._get_sort_order(pagination_options)
-
-        query = query.order_by(sort)
-
-        no_pagination_options = not pagination_options.page or not pagination_options.size
-        if no_pagination_options:
-            items = query.all()
-            return items, len(items)
-
-        # Calculate offset and limit for pagination
-        offset = (pagination_options.page - 1) * pagination_options.size
-        limit = pagination_options.size
-
-        # Apply pagination using limit and offset
-        paginated_query = query.offset(offset).limit(limit)
-
-        # Fetch paginated items and total count
-        items = paginated_query.all()
-        total_count = query.count()
-
-        return items, total_count
+        return query
 
     @classmethod
     def update_engagement(cls, engagement: EngagementSchema) -> Engagement:
@@ -216,12 +224,6 @@ class Engagement(BaseModel):
         db.session.commit()
         return records
 
-    @staticmethod
-    def _get_sort_order(pagination_options):
-        sort = asc(text(pagination_options.sort_key)) if pagination_options.sort_order == 'asc' \
-            else desc(text(pagination_options.sort_key))
-        return sort
-
     @staticmethod
     def _filter_by_engagement_status(query, search_options):
         statuses = [int(status)
@@ -279,8 +281,7 @@ class Engagement(BaseModel):
     @staticmethod
     def _filter_by_search_text(query, search_options):
         if search_text := search_options.get('search_text'):
-            query = query.filter(
-                Engagement.name.ilike('%' + search_text + '%'))
+            query = query.filter(matches(Engagement.name, search_text))
         return query
 
     @staticmethod
@@ -308,16 +309,9 @@ class Engagement(BaseModel):
             if any([taxon_id is None, values is None, filter_type is None]):
                 continue  # skip criterion if any of the required fields are missing
 
-            taxon_query = query.session.query(
-                EngagementMetadataModel.engagement_id
-            ).filter(
-                # Filter the metadata entries to only include those that match the current taxon
-                EngagementMetadataModel.taxon_id == taxon_id
-            )
-            # Use the filter function to create a subquery that filters the engagements
-            filter_subquery = filter_type(taxon_query, values)
-            # Filter the main query to include only engagements found in the subquery
-            query = query.filter(Engagement.id.in_(filter_subquery))
+            # the conditions of all the criteria apply to the same indexed array of facets
+            facets = [metadata_facet(taxon_id, value) for value in values]
+            query = query.filter(filter_type(Engagement.metadata_values, facets))
 
         return query
 
@@ -368,3 +362,36 @@ class Engagement(BaseModel):
                 )) \
             .all()
         return engagements
+
+
+ENGAGEMENT_SORT_KEYS = SortKeys(Engagement, EngagementStatus)
+
+
+@event.listens_for(Engagement, 'after_update')
+def _invalidate_cached_tenant(_mapper, _connection, target: Engagement):
+    """Remove the tenant of the engagement from the authorization cache when it changes."""
+    if inspect(target).attrs.tenant_id.history.has_changes():
+        authorization_cache.invalidate_engagement_tenant(target.id)
+
+
+@event.listens_for(Engagement, 'after_delete')
+def _invalidate_cached_deleted_engagement(_mapper, _connection, target: Engagement):
+    """Remove the tenant of a deleted engagement from the authorization cache."""
+    authorization_cache.invalidate_engagement_tenant(target.id)
+
+
+@event.listens_for(EngagementMetadataModel, 'after_insert')
+@event.listens_for(EngagementMetadataModel, 'after_update')
+@event.listens_for(EngagementMetadataModel, 'after_delete')
+def _refresh_metadata_values(_mapper, connection, target: EngagementMetadataModel):
+    """Recompute the metadata facets of the engagement of the metadata, within the flush that changed it."""
+    if target.engagement_id is None:
+        return
+    facets = select(
+        func.array_agg(func.concat(EngagementMetadataModel.taxon_id, ':', EngagementMetadataModel.value))
+    ).where(EngagementMetadataModel.engagement_id == target.engagement_id).scalar_subquery()
+    connection.execute(
+        update(Engagement.__table__)
+        .where(Engagement.__table__.c.id == target.engagement_id)
+        .values(metadata_values=func.coalesce(facets, cast(array([]), ARRAY(Text))))
+    )
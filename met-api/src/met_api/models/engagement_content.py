@@ -10,6 +10,7 @@ from typing import Optional
 
 from sqlalchemy.sql.schema import ForeignKey
 from met_api.constants.engagement_content_type import EngagementContentType
+from met_api.utils.response_cache import invalidate_rows
 
 from .base_model import BaseModel
 from .db import db
@@ -39,12 +40,14 @@ class EngagementContent(BaseModel):
     @classmethod
     def update_engagement_contents(cls, update_mappings: list) -> None:
         """Update contents."""
+        invalidate_rows(cls.__tablename__, update_mappings)
         db.session.bulk_update_mappings(EngagementContent, update_mappings)
         db.session.commit()
 
     @classmethod
     def save_engagement_content(cls, content: list) -> None:
         """Update custom content."""
+        invalidate_rows(cls.__tablename__, content)
         db.session.bulk_save_objects(content)
 
     @classmethod
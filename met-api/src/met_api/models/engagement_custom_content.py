@@ -8,6 +8,7 @@ from __future__ import annotations
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.sql.schema import ForeignKey
 
+from met_api.utils.response_cache import invalidate_rows
 from .base_model import BaseModel
 from .db import db
 
@@ -44,4 +45,5 @@ class EngagementCustom(BaseModel):
     @classmethod
     def save_engagement_custom_content(cls, custom_content: list) -> None:
         """Save custom content."""
+        invalidate_rows(cls.__tablename__, custom_content)
         db.session.bulk_save_objects(custom_content)
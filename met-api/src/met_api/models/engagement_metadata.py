@@ -67,6 +67,17 @@ class EngagementMetadata(BaseModel):
                 f'{self.taxon.name} = {self.value}>')
 
 
+def metadata_facet(taxon_id: int, value: str) -> str:
+    """Return the metadata value prefixed by its taxon id, as stored in the metadata_values of the engagements."""
+    return f'{taxon_id}:{value}'
+
+
+def parse_metadata_facet(facet: str) -> tuple[int, str]:
+    """Return the taxon id and the value of a metadata facet."""
+    taxon_id, value = facet.split(':', 1)
+    return int(taxon_id), value
+
+
 class MetadataTaxonDataType(str, enum.Enum):
     """The data types that can be stored in a metadata property."""
 
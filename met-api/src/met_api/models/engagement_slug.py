@@ -2,11 +2,13 @@
 
 Manages the engagement slug
 """
-from sqlalchemy import ForeignKey, Index, or_
+from sqlalchemy import ForeignKey, Index, func, or_
 from sqlalchemy.orm import relationship
 
+from met_api.utils.identity_cache import identity_cached
 from .base_model import BaseModel
 from .db import db
+from .search import LIKE_ESCAPE, escape_like
 
 
 class EngagementSlug(BaseModel):
@@ -19,6 +21,7 @@ class EngagementSlug(BaseModel):
 
     engagement = relationship('Engagement', backref='engagement_slugs')
 
+    # the slugs are also indexed by lower(slug), see the add_admin_search_indexes migration
     __table_args__ = (
         Index('idx_slug', slug),
     )
@@ -26,9 +29,10 @@ class EngagementSlug(BaseModel):
     @classmethod
     def find_by_slug(cls, slug):
         """Return engagement slug by slug."""
-        return cls.query.filter(cls.slug.ilike(slug)).first()
+        return cls.query.filter(func.lower(cls.slug) == slug.lower()).first()
 
     @classmethod
+    @identity_cached
     def find_by_engagement_id(cls, engagement_id):
         """Return engagement slug by engagement id."""
         return cls.query.filter_by(engagement_id=engagement_id).first()
@@ -38,8 +42,8 @@ class EngagementSlug(BaseModel):
         """Find already saved slugs with similar name and pattern."""
         similar_slugs = EngagementSlug.query.filter(
             or_(
-                EngagementSlug.slug == target_slug,
-                EngagementSlug.slug.ilike(target_slug + '-%')
+                func.lower(EngagementSlug.slug) == target_slug.lower(),
+                func.lower(EngagementSlug.slug).like(escape_like(target_slug.lower()) + '-%', escape=LIKE_ESCAPE)
             )
         ).all()
         return similar_slugs
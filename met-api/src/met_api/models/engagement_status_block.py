@@ -9,6 +9,7 @@ from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.sql.schema import ForeignKey
 
 from met_api.constants.engagement_status import SubmissionStatus
+from met_api.utils.response_cache import invalidate_rows
 from .base_model import BaseModel
 from .db import db
 
@@ -38,4 +39,5 @@ class EngagementStatusBlock(BaseModel):
     @classmethod
     def save_status_blocks(cls, status_blocks: list) -> None:
         """Update widgets.."""
+        invalidate_rows(cls.__tablename__, status_blocks)
         db.session.bulk_save_objects(status_blocks)
@@ -8,6 +8,7 @@ from __future__ import annotations
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.sql.schema import ForeignKey
 
+from met_api.utils.response_cache import invalidate_rows
 from .base_model import BaseModel
 from .db import db
 
@@ -52,4 +53,5 @@ class EngagementSummary(BaseModel):
     @classmethod
     def save_engagement_summary_content(cls, summary_content: list) -> None:
         """Save summary content."""
+        invalidate_rows(cls.__tablename__, summary_content)
         db.session.bulk_save_objects(summary_content)
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from sqlalchemy.sql.schema import ForeignKey
 
+from met_api.utils.response_cache import invalidate_rows
 from .base_model import BaseModel
 from .db import db
 
@@ -28,4 +29,5 @@ class EventItem(BaseModel):  # pylint: disable=too-few-public-methods, too-many-
     @classmethod
     def save_event_items(cls, event_items: list) -> None:
         """Update widgets.."""
+        invalidate_rows(cls.__tablename__, event_items)
         db.session.bulk_save_objects(event_items)
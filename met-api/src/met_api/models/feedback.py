@@ -4,10 +4,10 @@ Manages the feedback
 """
 from datetime import datetime
 
-from sqlalchemy import TEXT, asc, cast, desc
-from sqlalchemy.sql import text
+from sqlalchemy import TEXT, cast
 
 from met_api.constants.feedback import CommentType, FeedbackSourceType, FeedbackStatusType, RatingType
+from met_api.models.pagination import Page, SortKeys, paginate
 from met_api.models.pagination_options import PaginationOptions
 
 from .base_model import BaseModel
@@ -34,7 +34,7 @@ class Feedback(BaseModel):
                           pagination_options: PaginationOptions,
                           status: FeedbackStatusType,
                           search_text='',
-                          ):
+                          ) -> Page:
         """Get feedback paginated."""
         query = db.session.query(Feedback)
 
@@ -45,28 +45,7 @@ class Feedback(BaseModel):
             query = query.filter(
                 cast(Feedback.id, TEXT).like('%' + search_text + '%'))
 
-        sort = asc(text(pagination_options.sort_key)) if pagination_options.sort_order == 'asc'\
-            else desc(text(pagination_options.sort_key))
-
-        query = query.order_by(sort)
-
-        no_pagination_options = not pagination_options.page or not pagination_options.size
-        if no_pagination_options:
-            items = query.all()
-            return items, len(items)
-
-        # Calculate offset and limit for pagination
-        offset = (pagination_options.page - 1) * pagination_options.size
-        limit = pagination_options.size
-
-        # Apply pagination using limit and offset
-        paginated_query = query.offset(offset).limit(limit)
-
-        # Fetch paginated items and total count
-        items = paginated_query.all()
-        total_count = query.count()
-
-        return items, total_count
+        return paginate(query, pagination_options, FEEDBACK_SORT_KEYS)
 
     @staticmethod
     def create_feedback(feedback):
@@ -107,3 +86,6 @@ class Feedback(BaseModel):
 
         db.session.commit()
         return feedback
+
+
+FEEDBACK_SORT_KEYS = SortKeys(Feedback)
@@ -7,9 +7,10 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import ForeignKey, and_, or_
+from sqlalchemy import ForeignKey, and_, event, or_
 
 from met_api.constants.membership_type import MembershipType
+from met_api.utils import authorization_cache
 from met_api.utils.enums import MembershipStatus
 
 from .base_model import BaseModel
@@ -207,3 +208,14 @@ class Membership(BaseModel):
         db.session.commit()
 
         return new_memberships
+
+
+@event.listens_for(Membership, 'after_insert')
+@event.listens_for(Membership, 'after_update')
+@event.listens_for(Membership, 'after_delete')
+def _invalidate_cached_membership(_mapper, _connection, target: Membership):
+    """Remove the membership from the authorization cache when it is written.
+
+    Bulk writes do not emit these events; the membership service invalidates them once committed.
+    """
+    authorization_cache.invalidate_engagement_memberships(target.user_id, target.engagement_id)
@@ -0,0 +1,195 @@
+"""Pagination of the list queries.
+
+Pages are addressed either by number, using OFFSET and LIMIT, or by an opaque cursor holding the sort value and the id
+of the last row of the previous page. Cursor pages are fetched with a (sort column, id) comparison, so their cost does
+not grow with the depth of the page. The rows are always ordered by the sort column and then by id, so that rows
+sharing a sort value keep a stable order between pages.
+"""
+import base64
+import binascii
+import copy
+import enum
+import json
+from datetime import date, datetime
+from typing import Dict, List, NamedTuple, Optional
+
+from sqlalchemy import and_, literal, or_, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from .db import db
+from .pagination_options import PaginationOptions
+
+
+class CountMode(enum.Enum):
+    """How the total of the rows matching a list query is computed."""
+
+    EXACT = 'exact'
+    ESTIMATE = 'estimate'
+    NONE = 'none'
+
+
+class Page(NamedTuple):
+    """A page of rows."""
+
+    items: List
+    total: Optional[int]
+    next_cursor: Optional[str] = None
+
+
+class SortKeys:
+    """Whitelist of the sort keys accepted by a list query, mapped to their columns.
+
+    The columns of the model are accepted by name and by table qualified name, the columns of the joined models by
+    table qualified name only. An empty sort key sorts by id.
+    """
+
+    def __init__(self, model, *joined_models):
+        """Register the columns of the model and of the models it is joined with."""
+        self.id_column = model.id
+        self._columns = {}
+        for joined_model in joined_models:
+            self._add_columns(joined_model.__table__, qualified_only=True)
+        self._add_columns(model.__table__, qualified_only=False)
+
+    def _add_columns(self, table, qualified_only: bool):
+        for column in table.columns:
+            self._columns[f'{table.name}.{column.name}'] = column
+            if not qualified_only:
+                self._columns[column.name] = column
+
+    def get_column(self, sort_key: Optional[str]):
+        """Return the column of the sort key."""
+        sort_key = (sort_key or '').strip()
+        if not sort_key:
+            return self.id_column
+        if sort_key not in self._columns:
+            raise ValueError(f'Invalid sort key {sort_key}')
+        return self._columns[sort_key]
+
+    def with_columns(self, **columns) -> 'SortKeys':
+        """Return a copy of the sort keys also accepting the given expressions, such as a computed relevance."""
+        sort_keys = copy.copy(self)
+        sort_keys._columns = {**self._columns, **columns}  # pylint: disable=protected-access
+        return sort_keys
+
+
+def paginate(query, pagination_options: PaginationOptions, sort_keys: SortKeys) -> Page:
+    """Sort the query and return the page requested by the options."""
+    sort_column = sort_keys.get_column(pagination_options.sort_key)
+    id_column = sort_keys.id_column
+    ascending = pagination_options.sort_order == 'asc'
+    count_mode = CountMode(pagination_options.count or CountMode.EXACT.value)
+
+    if pagination_options.cursor is not None:
+        return _paginate_by_cursor(query, pagination_options, sort_column, id_column, ascending, count_mode)
+
+    if ascending:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    else:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+
+    no_pagination_options = not pagination_options.page or not pagination_options.size
+    if no_pagination_options:
+        items = query.all()
+        return Page(items, len(items))
+
+    offset = (pagination_options.page - 1) * pagination_options.size
+    items = query.offset(offset).limit(pagination_options.size).all()
+    return Page(items, count(query, count_mode))
+
+
+def _paginate_by_cursor(query, pagination_options: PaginationOptions,  # pylint: disable=too-many-arguments
+                        sort_column, id_column, ascending: bool, count_mode: CountMode) -> Page:
+    """Return the rows following the cursor, sorting NULL values last in both directions."""
+    total = count(query, count_mode)
+    if pagination_options.cursor:
+        cursor = _decode_cursor(pagination_options)
+        query = query.filter(_after_cursor(sort_column, id_column, ascending, cursor['value'], cursor['id']))
+
+    if ascending:
+        query = query.order_by(sort_column.asc().nulls_last(), id_column.asc())
+    else:
+        query = query.order_by(sort_column.desc().nulls_last(), id_column.desc())
+    # the sort value is selected along with the rows, as the sort column can belong to a joined table
+    query = query.add_columns(sort_column, id_column)
+
+    if not pagination_options.size:
+        return Page([row[0] for row in query.all()], total)
+
+    rows = query.limit(pagination_options.size + 1).all()
+    next_cursor = None
+    if len(rows) > pagination_options.size:
+        rows = rows[:pagination_options.size]
+        _, last_value, last_id = rows[-1]
+        next_cursor = _encode_cursor(pagination_options, last_value, last_id)
+    return Page([row[0] for row in rows], total, next_cursor)
+
+
+def _after_cursor(sort_column, id_column, ascending: bool, value, row_id):
+    """Return the condition selecting the rows sorted after the cursor."""
+    if value is None:
+        # only NULL sort values follow a NULL sort value
+        following_ids = id_column > row_id if ascending else id_column < row_id
+        return and_(sort_column.is_(None), following_ids)
+    cursor_row = tuple_(sort_column, id_column)
+    cursor_value = tuple_(literal(value, sort_column.type), row_id)
+    following_rows = cursor_row > cursor_value if ascending else cursor_row < cursor_value
+    return or_(following_rows, sort_column.is_(None))
+
+
+def _encode_cursor(pagination_options: PaginationOptions, value, row_id) -> str:
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    elif isinstance(value, enum.Enum):
+        value = value.name
+    cursor = {
+        'sort_key': pagination_options.sort_key or '',
+        'sort_order': pagination_options.sort_order,
+        'value': value,
+        'id': row_id,
+    }
+    return base64.urlsafe_b64encode(json.dumps(cursor, separators=(',', ':')).encode()).decode().rstrip('=')
+
+
+def _decode_cursor(pagination_options: PaginationOptions) -> Dict:
+    """Return the content of the cursor, which must have been issued for the same sort."""
+    encoded_cursor = pagination_options.cursor
+    try:
+        cursor = json.loads(base64.urlsafe_b64decode(encoded_cursor + '=' * (-len(encoded_cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as err:
+        raise ValueError('Invalid cursor') from err
+    is_valid = isinstance(cursor, dict) and 'value' in cursor and isinstance(cursor.get('id'), int) \
+        and cursor.get('sort_key') == (pagination_options.sort_key or '') \
+        and cursor.get('sort_order') == pagination_options.sort_order
+    if not is_valid:
+        raise ValueError('Invalid cursor')
+    return cursor
+
+
+class _Explain(Executable, ClauseElement):  # pylint: disable=too-many-ancestors
+    """EXPLAIN statement returning the plan of a query as JSON."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        """Explain the statement."""
+        self.statement = statement
+
+
+@compiles(_Explain, 'postgresql')
+def _compile_explain(element, compiler, **kwargs):
+    return f'EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kwargs)}'
+
+
+def count(query, count_mode: CountMode = CountMode.EXACT) -> Optional[int]:
+    """Return the number of rows of the query, exact, estimated by the query planner, or not at all."""
+    if count_mode == CountMode.NONE:
+        return None
+    query = query.order_by(None)
+    if count_mode == CountMode.EXACT:
+        return query.count()
+    plan = db.session.execute(_Explain(query.statement)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
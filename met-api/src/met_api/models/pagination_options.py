@@ -1,5 +1,7 @@
 """This module holds data classes."""
 
+from typing import Optional
+
 from attr import dataclass
 
 
@@ -11,3 +13,7 @@ class PaginationOptions:  # pylint: disable=too-many-instance-attributes
     size: int
     sort_key: int
     sort_order: str
+    # opaque cursor of the next page; when set, even to an empty string, pages are fetched by keyset instead of offset
+    cursor: Optional[str] = None
+    # how the total is computed: exact, estimate or none
+    count: str = 'exact'
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from sqlalchemy.sql.schema import ForeignKey
 
+from met_api.utils.response_cache import invalidate_rows
 from .base_model import BaseModel
 from .db import db
 
@@ -37,13 +38,16 @@ class PollAnswer(BaseModel):
         return answer
 
     @classmethod
-    def delete_answers_by_poll_id(cls, poll_id):
+    def delete_answers_by_poll_id(cls, poll_id, session=None):
         """Delete answers."""
         poll_answers = db.session.query(PollAnswer).filter(
             PollAnswer.poll_id == poll_id
         )
         poll_answers.delete()
-        db.session.commit()
+        if session is None:
+            db.session.commit()
+        else:
+            session.flush()
 
     @classmethod
     def bulk_insert_answers(cls, poll_id, answers):
@@ -52,5 +56,6 @@ class PollAnswer(BaseModel):
             {'poll_id': poll_id, 'answer_text': answer['answer_text']}
             for answer in answers
         ]
+        invalidate_rows(cls.__tablename__, answer_data)
         db.session.bulk_insert_mappings(PollAnswer, answer_data)
         db.session.commit()
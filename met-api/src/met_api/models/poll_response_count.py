@@ -0,0 +1,140 @@
+"""Poll response count model classes.
+
+Maintains the number of responses of each poll and of each of its answers, so that the results of a poll are read
+without counting its responses.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import ForeignKey, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql.expression import false
+
+from .db import db
+
+
+# (poll_id, selected_answer_id) of a response counted in the results
+ResponseState = Tuple[int, int]
+
+
+class PollResponseCount(db.Model):  # pylint: disable=too-few-public-methods
+    """Definition of the poll response count entity, the number of responses of a poll."""
+
+    __tablename__ = 'poll_response_count'
+
+    poll_id = db.Column(db.Integer, ForeignKey('widget_polls.id', ondelete='CASCADE'), primary_key=True)
+    total = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    updated_date = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=True)
+
+    @classmethod
+    def get_totals(cls, poll_id) -> Tuple[int, dict]:
+        """Return the number of responses of the poll and the number of responses of each of its answers."""
+        poll_count = db.session.query(cls).get(poll_id)
+        answer_totals = dict(
+            db.session.query(PollAnswerResponseCount.answer_id, PollAnswerResponseCount.total)
+            .filter(PollAnswerResponseCount.poll_id == poll_id)
+        )
+        return (poll_count.total if poll_count else 0), answer_totals
+
+    @classmethod
+    def apply_transition(cls, connection, before: Optional[ResponseState], after: Optional[ResponseState]):
+        """Move a response between counters.
+
+        `before` is None for a response which was not counted, such as a new or deleted response, and `after` is
+        None for a response which is no longer counted. The counters are incremented in place with upserts, so
+        concurrent responses to the same poll never lose updates. `connection` can be either a session or a
+        connection.
+        """
+        poll_deltas = Counter()
+        answer_deltas = Counter()
+        for state, delta in ((before, -1), (after, 1)):
+            if state is not None:
+                poll_id, answer_id = state
+                poll_deltas[poll_id] += delta
+                answer_deltas[(poll_id, answer_id)] += delta
+
+        for poll_id, delta in poll_deltas.items():
+            if delta:
+                connection.execute(increment_poll_totals(select(literal(poll_id), literal(max(delta, 0))), delta))
+        for (poll_id, answer_id), delta in answer_deltas.items():
+            if delta:
+                connection.execute(increment_answer_totals(
+                    select(literal(answer_id), literal(poll_id), literal(max(delta, 0))), delta))
+
+    @classmethod
+    def rebuild(cls, poll_ids: Iterable[int] = None, session=None) -> int:
+        """Recompute the counters from the poll responses which are not deleted.
+
+        Rebuilds the given polls, or every poll when no ids are passed. `session` can be either a session or a
+        connection. Returns the number of polls rebuilt.
+        """
+        # the tables are read from the metadata, as the poll models import this module
+        tables = db.metadata.tables
+        poll, poll_answer, poll_response = (
+            tables[name].c for name in ('widget_polls', 'poll_answers', 'poll_responses'))
+
+        session = session or db.session
+        poll_ids = list(poll_ids) if poll_ids is not None else None
+        if poll_ids is not None and not poll_ids:
+            return 0
+
+        # the polls and answers without responses get counters of 0
+        is_counted = poll_response.is_deleted == false()
+        poll_aggregate = select(poll.id, func.count(poll_response.id), func.now())\
+            .select_from(tables['widget_polls'])\
+            .outerjoin(tables['poll_responses'], (poll_response.poll_id == poll.id) & is_counted)\
+            .group_by(poll.id)
+        answer_aggregate = select(poll_answer.id, poll_answer.poll_id, func.count(poll_response.id))\
+            .select_from(tables['poll_answers'])\
+            .outerjoin(tables['poll_responses'], (poll_response.selected_answer_id == poll_answer.id) & is_counted)\
+            .group_by(poll_answer.id, poll_answer.poll_id)
+
+        answer_table = PollAnswerResponseCount.__table__
+        delete_statement = cls.__table__.delete()
+        delete_answers_statement = answer_table.delete()
+        if poll_ids is not None:
+            poll_aggregate = poll_aggregate.where(poll.id.in_(poll_ids))
+            answer_aggregate = answer_aggregate.where(poll_answer.poll_id.in_(poll_ids))
+            delete_statement = delete_statement.where(cls.poll_id.in_(poll_ids))
+            delete_answers_statement = delete_answers_statement.where(answer_table.c.poll_id.in_(poll_ids))
+
+        session.execute(delete_statement)
+        session.execute(delete_answers_statement)
+        result = session.execute(
+            insert(cls.__table__).from_select(['poll_id', 'total', 'updated_date'], poll_aggregate)
+        )
+        session.execute(insert(answer_table).from_select(['answer_id', 'poll_id', 'total'], answer_aggregate))
+        return result.rowcount
+
+
+class PollAnswerResponseCount(db.Model):  # pylint: disable=too-few-public-methods
+    """Definition of the poll answer response count entity, the number of responses selecting an answer."""
+
+    __tablename__ = 'poll_answer_response_count'
+
+    answer_id = db.Column(db.Integer, ForeignKey('poll_answers.id', ondelete='CASCADE'), primary_key=True)
+    poll_id = db.Column(db.Integer, ForeignKey('widget_polls.id', ondelete='CASCADE'), nullable=False, index=True)
+    total = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+
+def increment_poll_totals(rows, delta: int):
+    """Return the upsert adding delta to the counters of the polls of the rows, selecting (poll_id, initial total)."""
+    table = PollResponseCount.__table__
+    statement = insert(table).from_select(['poll_id', 'total', 'updated_date'], rows.add_columns(func.now()))
+    return statement.on_conflict_do_update(
+        index_elements=[table.c.poll_id],
+        set_={'total': table.c.total + delta, 'updated_date': statement.excluded.updated_date}
+    )
+
+
+def increment_answer_totals(rows, delta: int):
+    """Return the upsert adding delta to the counters of the answers of the rows.
+
+    The rows select (answer_id, poll_id, initial total).
+    """
+    table = PollAnswerResponseCount.__table__
+    statement = insert(table).from_select(['answer_id', 'poll_id', 'total'], rows)
+    return statement.on_conflict_do_update(index_elements=[table.c.answer_id], set_={'total': table.c.total + delta})
@@ -5,11 +5,21 @@ Manages the Poll Responses
 """
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import event, func, insert, inspect, literal, select
 from sqlalchemy.sql.expression import false
 from sqlalchemy.sql.schema import ForeignKey
 
+from met_api.constants.engagement_status import Status
+
 from .base_model import BaseModel
 from .db import db
+from .engagement import Engagement
+from .poll_answers import PollAnswer
+from .poll_response_count import PollResponseCount, increment_answer_totals, increment_poll_totals
+from .widget_poll import Poll
 
 
 class PollResponse(BaseModel):
@@ -23,6 +33,11 @@ class PollResponse(BaseModel):
     widget_id = db.Column(db.Integer, ForeignKey('widget.id', ondelete='CASCADE'), nullable=False)
     is_deleted = db.Column(db.Boolean, default=False)
 
+    __table_args__ = (
+        db.Index('ix_poll_responses_poll_participant', 'poll_id', 'participant_id',
+                 postgresql_where=db.text('is_deleted = false')),
+    )
+
     @classmethod
     def get_responses(cls, poll_id) -> list[PollResponse]:
         """Get responses for a poll."""
@@ -35,6 +50,48 @@ class PollResponse(BaseModel):
                                                      PollResponse.participant_id == participant_id,
                                                      PollResponse.is_deleted == false()).all()
 
+    @classmethod
+    def count_responses_query(cls, poll_id, participant_id):
+        """Return the count of the responses of the participant to a poll, as a scalar subquery."""
+        return select(func.count(cls.id))\
+            .where(cls.poll_id == poll_id, cls.participant_id == participant_id, cls.is_deleted == false())\
+            .scalar_subquery()
+
+    @classmethod
+    def insert_response(cls, poll_id, participant_id, selected_answer_id, max_responses) -> Optional[int]:
+        """Insert and count a response with a single statement, returning its id, or None when it is not allowed.
+
+        The response is inserted only if the poll is active, its engagement is published, the answer is one of the
+        answers of the poll and the participant has fewer than max_responses responses to the poll.
+        """
+        now = datetime.utcnow()
+        allowed_response = select(
+            literal(participant_id, db.String), PollAnswer.id, Poll.id, Poll.widget_id, false(),
+            literal(now), literal(now), literal(cls._get_current_user(), db.String),
+        ).select_from(Poll)\
+            .join(Engagement, Engagement.id == Poll.engagement_id)\
+            .join(PollAnswer, PollAnswer.poll_id == Poll.id)\
+            .where(Poll.id == poll_id,
+                   Poll.status == 'active',
+                   Engagement.status_id == Status.Published.value,
+                   PollAnswer.id == selected_answer_id,
+                   cls.count_responses_query(poll_id, participant_id) < max_responses)
+        table = cls.__table__
+        inserted_response = insert(table)\
+            .from_select(['participant_id', 'selected_answer_id', 'poll_id', 'widget_id', 'is_deleted',
+                          'created_date', 'updated_date', 'created_by'], allowed_response)\
+            .returning(table.c.id, table.c.poll_id, table.c.selected_answer_id)\
+            .cte('inserted_response')
+        # the counters of the poll and of the answer are incremented by the same statement, as common table
+        # expressions, which get no column defaults
+        poll_count = increment_poll_totals(
+            select(inserted_response.c.poll_id, literal(1)), 1).cte('poll_count')
+        answer_count = increment_answer_totals(
+            select(inserted_response.c.selected_answer_id, inserted_response.c.poll_id, literal(1)), 1
+        ).cte('answer_count')
+        statement = select(inserted_response.c.id).add_cte(poll_count).add_cte(answer_count)
+        return db.session.execute(statement).scalar()
+
     @classmethod
     def update_response(cls, response_id, response_data: dict) -> PollResponse:
         """Update a poll response."""
@@ -44,3 +101,33 @@ class PollResponse(BaseModel):
                 setattr(response, key, value)
             response.save()
         return response
+
+
+def _get_counted_state(target: PollResponse, previous: bool = False):
+    """Return the (poll, answer) a response is counted in, before the pending flush if previous, or None."""
+    values = {}
+    for attribute in ('poll_id', 'selected_answer_id', 'is_deleted'):
+        history = inspect(target).attrs[attribute].history
+        values[attribute] = history.deleted[0] if previous and history.deleted else getattr(target, attribute)
+    if values['is_deleted']:
+        return None
+    return values['poll_id'], values['selected_answer_id']
+
+
+@event.listens_for(PollResponse, 'after_insert')
+def _count_new_response(_mapper, connection, target: PollResponse):
+    """Count a new response in the poll counters."""
+    PollResponseCount.apply_transition(connection, None, _get_counted_state(target))
+
+
+@event.listens_for(PollResponse, 'after_update')
+def _count_updated_response(_mapper, connection, target: PollResponse):
+    """Move an updated response, such as a soft deleted one, between the poll counters."""
+    PollResponseCount.apply_transition(connection, _get_counted_state(target, previous=True),
+                                       _get_counted_state(target))
+
+
+@event.listens_for(PollResponse, 'after_delete')
+def _uncount_deleted_response(_mapper, connection, target: PollResponse):
+    """Remove a deleted response from the poll counters."""
+    PollResponseCount.apply_transition(connection, _get_counted_state(target, previous=True), None)
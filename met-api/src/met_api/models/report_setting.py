@@ -5,6 +5,9 @@ questions will either be displayed/hidden on the dashboard
 """
 from __future__ import annotations
 
+from typing import Dict
+
+from flask import g, has_app_context
 from sqlalchemy import ForeignKey
 from met_api.schemas.report_setting import ReportSettingSchema
 
@@ -34,6 +37,30 @@ class ReportSetting(BaseModel):  # pylint: disable=too-few-public-methods
             .all()
         return report_settings
 
+    @classmethod
+    def get_display_map(cls, survey_id) -> Dict[str, bool]:
+        """Return the display flag of each question of a survey by question key.
+
+        The settings of a survey are loaded once per request, so that displaying many comments does not query
+        the setting of each comment.
+        """
+        display_maps = _get_display_maps()
+        if survey_id not in display_maps:
+            rows = db.session.query(ReportSetting.question_key, ReportSetting.display) \
+                .filter(ReportSetting.survey_id == survey_id) \
+                .all()
+            display_maps[survey_id] = dict(rows)
+        return display_maps[survey_id]
+
+    @staticmethod
+    def clear_display_map(survey_id=None):
+        """Discard the loaded display flags of a survey, or of all surveys."""
+        display_maps = _get_display_maps()
+        if survey_id is None:
+            display_maps.clear()
+        else:
+            display_maps.pop(survey_id, None)
+
     @classmethod
     def find_by_question_key(cls, survey_id, question_key):
         """Return report setting by survey id."""
@@ -82,3 +109,12 @@ class ReportSetting(BaseModel):  # pylint: disable=too-few-public-methods
         db.session.bulk_update_mappings(ReportSetting, report_settings)
         db.session.commit()
         return report_settings
+
+
+def _get_display_maps() -> dict:
+    """Return the display flags loaded in the current request, by survey id."""
+    if not has_app_context():
+        return {}
+    if 'report_setting_display' not in g:
+        g.report_setting_display = {}
+    return g.report_setting_display
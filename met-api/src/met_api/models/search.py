@@ -0,0 +1,61 @@
+"""Substring search on the text columns of the admin lists.
+
+The searched columns have trigram GIN indexes when the pg_trgm extension is installed, see the add_admin_search_indexes
+migration. These indexes serve the ILIKE '%text%' conditions as well as the word similarity operator, which matches the
+words of a column that are close to the search text, typos included. Without the extension, the searches match
+substrings only, by scanning the tables.
+"""
+from typing import Dict
+
+from flask import current_app
+from sqlalchemy import func, literal, or_, text
+
+from .db import db
+
+
+LIKE_ESCAPE = '\\'
+
+_has_pg_trgm: Dict[str, bool] = {}
+
+
+def escape_like(search_text: str) -> str:
+    """Escape the LIKE wildcards of the search text, so that it is matched as typed."""
+    return search_text.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2).replace('%', LIKE_ESCAPE + '%') \
+        .replace('_', LIKE_ESCAPE + '_')
+
+
+def has_pg_trgm() -> bool:
+    """Return whether the pg_trgm extension is installed, checking the database once per process."""
+    url = str(db.engine.url)
+    if url not in _has_pg_trgm:
+        _has_pg_trgm[url] = db.session.execute(
+            text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        ).first() is not None
+    return _has_pg_trgm[url]
+
+
+def is_typo_tolerant() -> bool:
+    """Return whether the searches also match the words similar to the search text."""
+    return current_app.config.get('ADMIN_SEARCH_TYPO_TOLERANT', False) and has_pg_trgm()
+
+
+def contains(column, search_text: str):
+    """Return the condition on the rows whose column contains the search text, ignoring case."""
+    return column.ilike('%' + escape_like(search_text) + '%', escape=LIKE_ESCAPE)
+
+
+def matches(column, search_text: str):
+    """Return the condition on the rows whose column contains the search text or, when enabled, a similar word."""
+    if not is_typo_tolerant():
+        return contains(column, search_text)
+    return or_(contains(column, search_text), literal(search_text).op('<%')(column))
+
+
+def relevance(column, search_text: str):
+    """Return the expression sorting the rows by relevance to the search text, from the lowest to the highest.
+
+    The relevance is the word similarity of the column to the search text, or the column itself without pg_trgm.
+    """
+    if not has_pg_trgm():
+        return column
+    return func.word_similarity(search_text, column)
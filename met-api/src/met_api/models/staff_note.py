@@ -7,6 +7,7 @@ from __future__ import annotations
 from sqlalchemy import and_
 from sqlalchemy.sql.schema import ForeignKey
 
+from met_api.utils.identity_cache import identity_cached
 from .db import db
 from .base_model import BaseModel
 
@@ -29,6 +30,7 @@ class StaffNote(BaseModel):
             .all()
 
     @classmethod
+    @identity_cached
     def get_staff_note_by_type(cls, submission_id, note_type):
         """Get staff note by submission id and note type."""
         return db.session.query(StaffNote)\
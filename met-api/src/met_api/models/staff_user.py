@@ -7,10 +7,8 @@ from __future__ import annotations
 from typing import Optional
 
 from flask import g
-from sqlalchemy import Column, ForeignKey, String, asc, desc, func
+from sqlalchemy import Column, ForeignKey, String, func
 from sqlalchemy.orm import column_property
-from sqlalchemy.sql import text
-from sqlalchemy.sql.operators import ilike_op
 
 from met_api.models.user_group_membership import UserGroupMembership
 from met_api.utils.enums import UserStatus
@@ -19,7 +17,9 @@ from met_api.utils.token_info import TokenInfo
 
 from .base_model import TENANT_ID, BaseModel
 from .db import db
+from .pagination import Page, SortKeys, paginate
 from .pagination_options import PaginationOptions
+from .search import matches, relevance
 
 
 class StaffUser(BaseModel):
@@ -41,32 +41,22 @@ class StaffUser(BaseModel):
     tenant_id = db.Column(db.Integer, db.ForeignKey('tenant.id'), nullable=True)
 
     @classmethod
-    def get_all_paginated(cls, pagination_options: PaginationOptions, search_text='', include_inactive=False):
+    def get_all_paginated(cls, pagination_options: PaginationOptions, search_text='', include_inactive=False) -> Page:
         """Fetch list of users by access type."""
         query = cls.query
         # Don't filter out users from other tenants if the user is a super admin; show everything
         if Role.SUPER_ADMIN.value not in TokenInfo.get_user_roles():
             query = cls._add_tenant_filter(query)
 
-        if pagination_options.sort_key:
-            sort = asc(text(pagination_options.sort_key)) if pagination_options.sort_order == 'asc' \
-                else desc(text(pagination_options.sort_key))
-
-            query = query.order_by(sort)
-
+        sort_keys = STAFF_USER_SORT_KEYS
         if search_text:
-            query = query.filter(ilike_op(StaffUser.full_name, '%' + search_text + '%'))
+            query = query.filter(matches(StaffUser.full_name, search_text))
+            sort_keys = sort_keys.with_columns(relevance=relevance(StaffUser.full_name, search_text))
 
         if not include_inactive:
             query = query.filter(StaffUser.status_id == UserStatus.ACTIVE.value)
 
-        no_pagination_options = not pagination_options.page or not pagination_options.size
-        if no_pagination_options:
-            items = query.all()
-            return items, len(items)
-
-        page = query.paginate(page=pagination_options.page, per_page=pagination_options.size)
-        return page.items, page.total
+        return paginate(query, pagination_options, sort_keys)
 
     @classmethod
     def _add_tenant_filter(cls, query):
@@ -101,7 +91,7 @@ class StaffUser(BaseModel):
         return query.first()
 
     @classmethod
-    def create_user(cls, user) -> StaffUser:
+    def create_user(cls, user, session=None) -> StaffUser:
         """Create user."""
         user = StaffUser(
             first_name=user.get('first_name', None),
@@ -112,7 +102,10 @@ class StaffUser(BaseModel):
             external_id=user.get('external_id', None),
             username=user.get('username', None),
         )
-        user.save()
+        if session is None:
+            user.save()
+        else:
+            user.flush()
 
         return user
 
@@ -136,3 +129,6 @@ class StaffUser(BaseModel):
         query.update(update_fields)
         db.session.commit()
         return user
+
+
+STAFF_USER_SORT_KEYS = SortKeys(StaffUser)
@@ -7,12 +7,13 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, event, inspect
 from sqlalchemy.dialects import postgresql
 
 from met_api.constants.comment_status import Status
 from met_api.constants.user import SYSTEM_REVIEWER
 from met_api.models.participant import Participant
+from met_api.models.submission_status_count import SubmissionStatusCount
 from met_api.models.survey import Survey
 from met_api.schemas.submission import SubmissionSchema
 
@@ -107,7 +108,7 @@ class Submission(BaseModel):  # pylint: disable=too-few-public-methods
         }
         submission_id = submission.get('id', None)
         query = Submission.query.filter_by(id=submission_id)
-        record = query.first()
+        record = cls.find_by_id(submission_id)
         if not record:
             raise ValueError('Submission Not Found')
         query.update(update_fields)
@@ -115,7 +116,7 @@ class Submission(BaseModel):  # pylint: disable=too-few-public-methods
             db.session.commit()
         else:
             session.flush()
-        return query.first()
+        return cls.find_by_id(submission_id)
 
     @classmethod
     def update_comment_status(cls, submission_id, comment: dict, session=None) -> Submission:
@@ -128,9 +129,10 @@ class Submission(BaseModel):  # pylint: disable=too-few-public-methods
         notify_email = comment.get('notify_email', None)
 
         query = Submission.query.filter_by(id=submission_id)
-
-        if not query.first():
+        record = cls.find_by_id(submission_id)
+        if not record:
             return None
+        previous_state = (record.comment_status_id, record.reviewed_by)
 
         update_fields = {
             'comment_status_id': status_id,
@@ -146,12 +148,15 @@ class Submission(BaseModel):  # pylint: disable=too-few-public-methods
         }
 
         query.update(update_fields)
+        # bulk updates bypass the mapper events, so the counters are moved here
+        SubmissionStatusCount.apply_transition(
+            session or db.session, record.survey_id, previous_state, (status_id, comment.get('reviewed_by')))
         if session is None:
             db.session.commit()
         else:
             session.flush()
 
-        return query.first()
+        return cls.find_by_id(submission_id)
 
     @classmethod
     def get_engaged_participants(cls, engagement_id) -> List[Participant]:
@@ -162,3 +167,46 @@ class Submission(BaseModel):  # pylint: disable=too-few-public-methods
             .filter(Survey.engagement_id == engagement_id)\
             .all()
         return users
+
+
+def _get_previous_state(target: Submission):
+    """Return the (status, reviewer) of a submission before the pending flush, or None if it is unknown."""
+    previous_state = []
+    for attribute in ('comment_status_id', 'reviewed_by'):
+        history = inspect(target).attrs[attribute].history
+        if history.deleted:
+            previous_state.append(history.deleted[0])
+        elif history.added:
+            # the previous value was never loaded
+            return None
+        else:
+            previous_state.append(getattr(target, attribute))
+    return tuple(previous_state)
+
+
+@event.listens_for(Submission, 'after_insert')
+def _count_new_submission(_mapper, connection, target: Submission):
+    """Count a new submission in the survey counters."""
+    SubmissionStatusCount.apply_transition(
+        connection, target.survey_id, None, (target.comment_status_id, target.reviewed_by))
+
+
+@event.listens_for(Submission, 'after_update')
+def _count_updated_submission(_mapper, connection, target: Submission):
+    """Move an updated submission between the survey counters."""
+    state = inspect(target)
+    if not (state.attrs.comment_status_id.history.has_changes() or state.attrs.reviewed_by.history.has_changes()):
+        return
+    previous_state = _get_previous_state(target)
+    if previous_state is None:
+        SubmissionStatusCount.rebuild([target.survey_id], connection)
+        return
+    SubmissionStatusCount.apply_transition(
+        connection, target.survey_id, previous_state, (target.comment_status_id, target.reviewed_by))
+
+
+@event.listens_for(Submission, 'after_delete')
+def _uncount_deleted_submission(_mapper, connection, target: Submission):
+    """Remove a deleted submission from the survey counters."""
+    previous_state = _get_previous_state(target) or (target.comment_status_id, target.reviewed_by)
+    SubmissionStatusCount.apply_transition(connection, target.survey_id, previous_state, None)
@@ -0,0 +1,137 @@
+"""Submission status count model class.
+
+Maintains a per-survey projection of the submission review statuses, so that listing pages can report the
+comment counts of a survey without loading its submissions.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import ForeignKey, and_, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+
+from met_api.constants.comment_status import Status
+from met_api.constants.user import SYSTEM_REVIEWER
+
+from .db import db
+
+
+# status id -> counter column. Submissions reviewed by the system are only counted in the total.
+STATUS_COLUMNS = {
+    Status.Pending.value: 'pending',
+    Status.Approved.value: 'approved',
+    Status.Rejected.value: 'rejected',
+    Status.Needs_further_review.value: 'needs_further_review',
+}
+
+COUNTER_COLUMNS = ('total', *STATUS_COLUMNS.values())
+
+# (comment_status_id, reviewed_by) of a submission
+SubmissionState = Tuple[Optional[int], Optional[str]]
+
+
+class SubmissionStatusCount(db.Model):  # pylint: disable=too-few-public-methods
+    """Definition of the submission status count entity."""
+
+    __tablename__ = 'submission_status_count'
+
+    survey_id = db.Column(db.Integer, ForeignKey('survey.id', ondelete='CASCADE'), primary_key=True)
+    total = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    pending = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    approved = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rejected = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    needs_further_review = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    updated_date = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=True)
+
+    @classmethod
+    def find_by_survey_id(cls, survey_id) -> Optional[SubmissionStatusCount]:
+        """Return the counters of a survey."""
+        return db.session.query(SubmissionStatusCount).get(survey_id)
+
+    @staticmethod
+    def get_status_column(state: Optional[SubmissionState]) -> Optional[str]:
+        """Return the counter column a submission in the given state is counted in, besides the total."""
+        if state is None:
+            return None
+        status_id, reviewed_by = state
+        if reviewed_by == SYSTEM_REVIEWER:
+            return None
+        return STATUS_COLUMNS.get(status_id)
+
+    @classmethod
+    def apply_transition(cls, connection, survey_id, before: Optional[SubmissionState],
+                         after: Optional[SubmissionState]):
+        """Move a submission between counters.
+
+        `before` is None for a new submission and `after` is None for a deleted one. The counters are
+        incremented in place with a single upsert, so concurrent reviews on the same survey never lose updates.
+        `connection` can be either a session or a connection.
+        """
+        if survey_id is None:
+            return
+        deltas = dict.fromkeys(COUNTER_COLUMNS, 0)
+        deltas['total'] = int(after is not None) - int(before is not None)
+        if before_column := cls.get_status_column(before):
+            deltas[before_column] -= 1
+        if after_column := cls.get_status_column(after):
+            deltas[after_column] += 1
+        deltas = {column: delta for column, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        table = cls.__table__
+        statement = insert(table).values(
+            survey_id=survey_id,
+            updated_date=datetime.utcnow(),
+            **{column: max(delta, 0) for column, delta in deltas.items()}
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.survey_id],
+            set_={
+                'updated_date': statement.excluded.updated_date,
+                **{column: table.c[column] + delta for column, delta in deltas.items()}
+            }
+        )
+        connection.execute(statement)
+
+    @classmethod
+    def rebuild(cls, survey_ids: Iterable[int] = None, session=None) -> int:
+        """Recompute the counters from the submission table.
+
+        Rebuilds the given surveys, or every survey when no ids are passed. `session` can be either a session or a
+        connection. Returns the number of surveys rebuilt.
+        """
+        # the table is read from the metadata, as the Submission model imports this module for its listeners
+        submission = db.metadata.tables['submission'].c
+
+        session = session or db.session
+        survey_ids = list(survey_ids) if survey_ids is not None else None
+        if survey_ids is not None and not survey_ids:
+            return 0
+
+        is_reviewed_by_user = or_(submission.reviewed_by.is_(None), submission.reviewed_by != SYSTEM_REVIEWER)
+        aggregate = select(
+            submission.survey_id,
+            func.count(submission.id),
+            *[
+                func.count(submission.id).filter(and_(submission.comment_status_id == status_id, is_reviewed_by_user))
+                for status_id in STATUS_COLUMNS
+            ],
+            func.now(),
+        ).group_by(submission.survey_id)
+
+        delete_statement = cls.__table__.delete()
+        if survey_ids is not None:
+            aggregate = aggregate.where(submission.survey_id.in_(survey_ids))
+            delete_statement = delete_statement.where(cls.survey_id.in_(survey_ids))
+
+        session.execute(delete_statement)
+        result = session.execute(
+            insert(cls.__table__).from_select(['survey_id', *COUNTER_COLUMNS, 'updated_date'], aggregate)
+        )
+        return result.rowcount
+
+    def as_dict(self) -> dict:
+        """Return the counters as a dictionary."""
+        return {column: getattr(self, column) or 0 for column in COUNTER_COLUMNS}
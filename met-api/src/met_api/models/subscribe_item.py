@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from sqlalchemy.sql.schema import ForeignKey
 
+from met_api.utils.response_cache import invalidate_rows
 from .base_model import BaseModel
 from .db import db
 
@@ -26,4 +27,5 @@ class SubscribeItem(BaseModel):  # pylint: disable=too-few-public-methods, too-m
     @classmethod
     def save_subscribe_items(cls, subscribe_items: list) -> None:
         """Update widgets.."""
+        invalidate_rows(cls.__tablename__, subscribe_items)
         db.session.bulk_save_objects(subscribe_items)
@@ -8,14 +8,15 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import ForeignKey, and_, asc, desc, func, or_
+from sqlalchemy import ForeignKey, and_, func, or_
 from sqlalchemy.dialects import postgresql
-from sqlalchemy.sql import text
 
 from met_api.constants.engagement_status import Status
 from met_api.models.engagement import Engagement
 from met_api.models.engagement_status import EngagementStatus
+from met_api.models.pagination import Page, SortKeys, paginate
 from met_api.models.pagination_options import PaginationOptions
+from met_api.models.search import matches, relevance
 from met_api.models.survey_search_options import SurveySearchOptions
 from met_api.schemas.survey import SurveySchema
 
@@ -34,6 +35,7 @@ class Survey(BaseModel):  # pylint: disable=too-few-public-methods
     engagement_id = db.Column(db.Integer, ForeignKey('engagement.id', ondelete='CASCADE'))
     comments = db.relationship('Comment', backref='survey', cascade='all, delete')
     submissions = db.relationship('Submission', backref='survey', cascade='all, delete')
+    status_count = db.relationship('SubmissionStatusCount', uselist=False, lazy='joined', viewonly=True)
     # Survey templates might not need tenant id
     tenant_id = db.Column(db.Integer, db.ForeignKey('tenant.id'), nullable=True)
     is_hidden = db.Column(db.Boolean, nullable=False)
@@ -54,35 +56,17 @@ class Survey(BaseModel):  # pylint: disable=too-few-public-methods
 
     @classmethod
     def get_surveys_paginated(cls, pagination_options: PaginationOptions,
-                              survey_search_options: SurveySearchOptions):
+                              survey_search_options: SurveySearchOptions) -> Page:
         """Get surveys paginated."""
         query = db.session.query(Survey).join(Engagement, isouter=True).join(EngagementStatus, isouter=True)
         query = cls._add_tenant_filter(query)
 
         query = cls.filter_by_search_options(survey_search_options, query)
 
-        sort = asc(text(pagination_options.sort_key)) if pagination_options.sort_order == 'asc'\
-            else desc(text(pagination_options.sort_key))
-
-        query = query.order_by(sort)
-
-        no_pagination_options = not pagination_options.page or not pagination_options.size
-        if no_pagination_options:
-            items = query.all()
-            return items, len(items)
-
-        # Calculate offset and limit for pagination
-        offset = (pagination_options.page - 1) * pagination_options.size
-        limit = pagination_options.size
-
-        # Apply pagination using limit and offset
-        paginated_query = query.offset(offset).limit(limit)
-
-        # Fetch paginated items and total count
-        items = paginated_query.all()
-        total_count = query.count()
-
-        return items, total_count
+        sort_keys = SURVEY_SORT_KEYS
+        if search_text := survey_search_options.search_text:
+            sort_keys = sort_keys.with_columns(relevance=relevance(Survey.name, search_text))
+        return paginate(query, pagination_options, sort_keys)
 
     @classmethod
     def filter_by_search_options(cls, survey_search_options: SurveySearchOptions, query):
@@ -120,7 +104,7 @@ class Survey(BaseModel):  # pylint: disable=too-few-public-methods
             query = query.filter(Engagement.id.in_(survey_search_options.assigned_engagements))
 
         if survey_search_options.search_text:
-            query = query.filter(Survey.name.ilike('%' + survey_search_options.search_text + '%'))
+            query = query.filter(matches(Survey.name, survey_search_options.search_text))
         return query
 
     @classmethod
@@ -215,3 +199,6 @@ class Survey(BaseModel):  # pylint: disable=too-few-public-methods
         if search_options.published_date_to:
             query = query.filter(Engagement.published_date <= search_options.published_date_to)
         return query
+
+
+SURVEY_SORT_KEYS = SortKeys(Survey, Engagement, EngagementStatus)
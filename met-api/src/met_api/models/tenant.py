@@ -4,6 +4,7 @@ Manages the tenants
 """
 from __future__ import annotations
 from typing import List, Optional
+from met_api.utils.identity_cache import identity_cached
 from .base_model import BaseModel
 from .db import db
 
@@ -33,8 +34,9 @@ class Tenant(BaseModel):
         """Find tenant using short name."""
         return db.session.query(Tenant).filter(Tenant.short_name.ilike(short_name)).one_or_none()
 
-    @staticmethod
-    def find_by_id(identifier: int) -> Optional[Tenant]:
+    @classmethod
+    @identity_cached
+    def find_by_id(cls, identifier: int) -> Optional[Tenant]:
         """Find tenant by id."""
         return db.session.query(Tenant).filter(Tenant.id == identifier).one_or_none()
 
@@ -9,6 +9,7 @@ from typing import Optional
 from sqlalchemy.sql.schema import ForeignKey
 
 
+from met_api.utils.response_cache import invalidate_rows
 from .widget_item import WidgetItem
 
 from .base_model import BaseModel
@@ -87,6 +88,7 @@ class Widget(BaseModel):  # pylint: disable=too-few-public-methods
     @classmethod
     def update_widgets(cls, update_mappings: list) -> None:
         """Update widgets.."""
+        invalidate_rows(cls.__tablename__, update_mappings)
         db.session.bulk_update_mappings(Widget, update_mappings)
         db.session.commit()
 
@@ -9,6 +9,7 @@ from typing import List
 from sqlalchemy.sql.schema import ForeignKey
 import sqlalchemy as sa
 
+from met_api.utils.response_cache import invalidate_rows
 from .base_model import BaseModel
 from .db import db
 
@@ -64,5 +65,6 @@ class WidgetDocuments(BaseModel):  # pylint: disable=too-few-public-methods
     @classmethod
     def update_documents(cls, update_mappings: list) -> None:
         """Update documents.."""
+        invalidate_rows(cls.__tablename__, update_mappings)
         db.session.bulk_update_mappings(WidgetDocuments, update_mappings)
         db.session.commit()
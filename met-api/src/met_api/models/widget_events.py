@@ -8,6 +8,7 @@ from typing import List
 
 from sqlalchemy.sql.schema import ForeignKey
 
+from met_api.utils.response_cache import invalidate_rows
 from .base_model import BaseModel
 from .db import db
 from ..constants.event_types import EventTypes
@@ -36,6 +37,7 @@ class WidgetEvents(BaseModel):  # pylint: disable=too-few-public-methods
     @classmethod
     def update_widget_events_bulk(cls, update_mappings: list) -> list[WidgetEvents]:
         """Save widget events sorting."""
+        invalidate_rows(cls.__tablename__, update_mappings)
         db.session.bulk_update_mappings(WidgetEvents, update_mappings)
         db.session.commit()
         return update_mappings
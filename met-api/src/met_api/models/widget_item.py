@@ -8,6 +8,7 @@ from datetime import datetime
 from sqlalchemy.sql.schema import ForeignKey
 
 
+from met_api.utils.response_cache import invalidate_rows
 from .base_model import BaseModel
 from .db import db
 
@@ -85,6 +86,7 @@ class WidgetItem(BaseModel):  # pylint: disable=too-few-public-methods
     @classmethod
     def update_widget_items_bulk(cls, update_mappings: list) -> list[WidgetItem]:
         """Save widget items sorting."""
+        invalidate_rows(cls.__tablename__, update_mappings)
         db.session.bulk_update_mappings(WidgetItem, update_mappings)
         db.session.commit()
         return update_mappings
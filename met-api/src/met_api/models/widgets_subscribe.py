@@ -8,6 +8,7 @@ from typing import List
 
 from sqlalchemy.sql.schema import ForeignKey
 
+from met_api.utils.response_cache import invalidate_rows
 from .base_model import BaseModel
 from .db import db
 from ..constants.subscribe_types import SubscribeTypes
@@ -42,6 +43,7 @@ class WidgetSubscribe(BaseModel):  # pylint: disable=too-few-public-methods
     @classmethod
     def update_widget_subscribes_bulk(cls, update_mappings: list) -> list[WidgetSubscribe]:
         """Save widget subscribe sorting."""
+        invalidate_rows(cls.__tablename__, update_mappings)
         db.session.bulk_update_mappings(WidgetSubscribe, update_mappings)
         db.session.commit()
         return update_mappings
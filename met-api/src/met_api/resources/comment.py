@@ -62,6 +62,35 @@ class SurveyComments(Resource):
             return str(err), HTTPStatus.INTERNAL_SERVER_ERROR
 
 
+@cors_preflight('GET, OPTIONS')
+@API.route('/survey/<survey_id>/search')
+class SurveyCommentsSearch(Resource):
+    """Resource for searching comments."""
+
+    @staticmethod
+    @cross_origin(origins=allowedorigins())
+    @auth.optional
+    def get(survey_id):
+        """Search comments, best matches first."""
+        try:
+            args = request.args
+            search_text = args.get('search_text', '', str)
+            if not search_text.strip():
+                return 'Search text is required', HTTPStatus.BAD_REQUEST
+
+            pagination_options = PaginationOptions(
+                page=args.get('page', None, int),
+                size=args.get('size', None, int),
+                sort_key=None,
+                sort_order=None,
+                count=args.get('count', 'exact', str),
+            )
+            comment_records = CommentService().search_comments(survey_id, search_text, pagination_options)
+            return comment_records, HTTPStatus.OK
+        except ValueError as err:
+            return str(err), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
 @cors_preflight('GET, OPTIONS')
 @API.route('/survey/<survey_id>/sheet/staff')
 class GeneratedStaffCommentsSheet(Resource):
@@ -75,6 +104,8 @@ class GeneratedStaffCommentsSheet(Resource):
         try:
 
             response = CommentService().export_comments_to_spread_sheet_staff(survey_id)
+            if isinstance(response, Response):
+                return response
             response_headers = dict(response.headers)
             headers = {
                 'content-type': response_headers.get('content-type'),
@@ -102,6 +133,8 @@ class GeneratedProponentCommentsSheet(Resource):
         try:
 
             response = CommentService().export_comments_to_spread_sheet_proponent(survey_id)
+            if isinstance(response, Response):
+                return response
             response_headers = dict(response.headers)
             headers = {
                 'content-type': response_headers.get('content-type'),
@@ -26,6 +26,7 @@ from met_api.auth import jwt as _jwt
 from met_api.models.pagination_options import PaginationOptions
 from met_api.schemas.engagement import EngagementSchema
 from met_api.services.engagement_service import EngagementService
+from met_api.utils.response_cache import cached_public_response
 from met_api.utils.roles import Role
 from met_api.utils.tenant_validator import require_role
 from met_api.utils.token_info import TokenInfo
@@ -37,6 +38,57 @@ API = Namespace(
 """
 
 
+def _get_search_options(args, external_user_id) -> dict:
+    """Return the engagement search options of the request arguments."""
+    exclude_internal = None
+    if external_user_id is None:
+        exclude_internal = True
+
+    if metadata := args.get('metadata', []):
+        metadata = json.loads(metadata)
+        if not isinstance(metadata, list) or not all(isinstance(item, dict) for item in metadata):
+            # if metadata is not a list of dictionaries, it is in the wrong format.
+            # blank it to avoid any issues.
+            metadata = []
+
+    return {
+        'search_text': args.get('search_text', '', type=str),
+        'engagement_status': args.getlist('engagement_status[]'),
+        'created_from_date': args.get('created_from_date', None, type=str),
+        'created_to_date': args.get('created_to_date', None, type=str),
+        'published_from_date': args.get('published_from_date', None, type=str),
+        'published_to_date': args.get('published_to_date', None, type=str),
+        'metadata': metadata,
+        'exclude_internal': exclude_internal,
+        # the membership changing pages sometimes need only engagements where users can add a member.
+        # pass this has_team_access to restrict searches only within engagements they have access on.
+        'has_team_access': args.get(
+            'has_team_access',
+            default=False,
+            type=lambda v: v.lower() == 'true'
+        ),
+    }
+
+
+@cors_preflight('GET,OPTIONS')
+@API.route('/facets')
+class EngagementFacets(Resource):
+    """Resource for the metadata facets of the engagements."""
+
+    @staticmethod
+    @cross_origin(origins=allowedorigins())
+    @auth.optional
+    def get():
+        """Fetch the number of engagements matching the search for each metadata value."""
+        try:
+            external_user_id = TokenInfo.get_id()
+            search_options = _get_search_options(request.args, external_user_id)
+            facets = EngagementService().get_metadata_facets(external_user_id, search_options)
+            return facets, HTTPStatus.OK
+        except ValueError as err:
+            return str(err), HTTPStatus.BAD_REQUEST
+
+
 @cors_preflight('GET,OPTIONS')
 @API.route('/<engagement_id>')
 class Engagement(Resource):
@@ -44,6 +96,7 @@ class Engagement(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @cached_public_response()
     @auth.optional
     def get(engagement_id):
         """Fetch a single engagement matching the provided id."""
@@ -79,36 +132,11 @@ class Engagements(Resource):
                 size=args.get('size', None, int),
                 sort_key=args.get('sort_key', 'name', str),
                 sort_order=args.get('sort_order', 'asc', str),
+                cursor=args.get('cursor', None, str),
+                count=args.get('count', 'exact', str),
             )
 
-            exclude_internal = None
-            if external_user_id is None:
-                exclude_internal = True
-
-            if metadata := args.get('metadata', []):
-                metadata = json.loads(metadata)
-                if not isinstance(metadata, list) or not all(isinstance(item, dict) for item in metadata):
-                    # if metadata is not a list of dictionaries, it is in the wrong format.
-                    # blank it to avoid any issues.
-                    metadata = []
-
-            search_options = {
-                'search_text': args.get('search_text', '', type=str),
-                'engagement_status': args.getlist('engagement_status[]'),
-                'created_from_date': args.get('created_from_date', None, type=str),
-                'created_to_date': args.get('created_to_date', None, type=str),
-                'published_from_date': args.get('published_from_date', None, type=str),
-                'published_to_date': args.get('published_to_date', None, type=str),
-                'metadata': metadata,
-                'exclude_internal': exclude_internal,
-                # the membership changing pages sometimes need only engagements where users can add a member.
-                # pass this has_team_access to restrict searches only within engagements they have access on.
-                'has_team_access': args.get(
-                    'has_team_access',
-                    default=False,
-                    type=lambda v: v.lower() == 'true'
-                ),
-            }
+            search_options = _get_search_options(args, external_user_id)
 
             engagement_records = EngagementService() \
                 .get_engagements_paginated(
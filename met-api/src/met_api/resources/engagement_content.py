@@ -24,6 +24,7 @@ from met_api.auth import jwt as _jwt
 from met_api.exceptions.business_exception import BusinessException
 from met_api.schemas import utils as schema_utils
 from met_api.services.engagement_content_service import EngagementContentService
+from met_api.utils.response_cache import cached_public_response
 from met_api.utils.token_info import TokenInfo
 from met_api.utils.util import allowedorigins, cors_preflight
 
@@ -40,6 +41,7 @@ class EngagementContent(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @cached_public_response()
     def get(engagement_id):
         """Fetch a list of engagement contents by engagement id."""
         try:
@@ -12,6 +12,7 @@ from met_api.schemas import utils as schema_utils
 from met_api.schemas.engagement_content_translation import EngagementContentTranslationSchema
 from met_api.services.engagement_content_translation_service import EngagementContentTranslationService
 from met_api.exceptions.business_exception import BusinessException
+from met_api.utils.response_cache import cached_public_response, parent_engagement_id
 from met_api.utils.util import allowedorigins, cors_preflight
 
 API = Namespace('engagement_content_translation', description='Endpoints for Engagement Content Translation Management')
@@ -24,6 +25,7 @@ class EngagementContentTranslationsByLanguage(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @cached_public_response(parent_engagement_id('engagement_content', 'content_id'))
     def get(content_id, language_id):
         """Fetch content translations based on content_id AND language_id."""
         translations = EngagementContentTranslationService().get_translations_by_content_and_language(
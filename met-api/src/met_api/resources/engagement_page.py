@@ -0,0 +1,57 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""API endpoints for fetching the public page of an engagement."""
+
+from http import HTTPStatus
+
+from flask import request
+from flask_cors import cross_origin
+from flask_restx import Namespace, Resource
+
+from met_api.auth import auth
+from met_api.services.engagement_page_service import EngagementPageService
+from met_api.utils.response_cache import cached_public_response
+from met_api.utils.util import allowedorigins, cors_preflight
+
+
+API = Namespace('engagement_page', description='Endpoints for Engagement Page')
+
+
+@cors_preflight('GET, OPTIONS')
+@API.route('')
+class EngagementPage(Resource):
+    """Resource for the page of an engagement."""
+
+    @staticmethod
+    @cross_origin(origins=allowedorigins())
+    @cached_public_response()
+    @auth.optional
+    def get(engagement_id):
+        """Fetch the engagement, slug, contents, widgets and the translations to a language of an engagement page.
+
+        The fields argument selects some of the sections of the page, as a comma separated list.
+        """
+        try:
+            args = request.args
+            fields = [field.strip() for field in args.get('fields', '', str).split(',') if field.strip()]
+            page = EngagementPageService().get_engagement_page(
+                engagement_id,
+                language_id=args.get('language_id', None, int),
+                fields=fields,
+            )
+            if page is None:
+                return 'Engagement was not found', HTTPStatus.NOT_FOUND
+            return page, HTTPStatus.OK
+        except ValueError as err:
+            return str(err), HTTPStatus.BAD_REQUEST
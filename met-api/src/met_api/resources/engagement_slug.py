@@ -20,6 +20,7 @@ from flask_cors import cross_origin
 from flask_restx import Namespace, Resource
 
 from met_api.services.engagement_slug_service import EngagementSlugService
+from met_api.utils.response_cache import cached_public_response
 from met_api.utils.roles import Role
 from met_api.utils.tenant_validator import require_role
 from met_api.utils.util import allowedorigins, cors_preflight
@@ -34,6 +35,7 @@ class Slug(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @cached_public_response(get_engagement_id=None)
     def get(slug):
         """Fetch an engagement slug matching the provided slug."""
         try:
@@ -65,6 +67,7 @@ class EngagementSlug(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @cached_public_response()
     def get(engagement_id):
         """Fetch an engagement slug for a specific engagement."""
         try:
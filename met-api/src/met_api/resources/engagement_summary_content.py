@@ -23,6 +23,7 @@ from met_api.auth import jwt as _jwt
 from met_api.exceptions.business_exception import BusinessException
 from met_api.schemas.engagement_summary_content import EngagementSummarySchema
 from met_api.services.engagement_summary_content_service import EngagementSummaryContentService
+from met_api.utils.response_cache import cached_public_response, parent_engagement_id
 from met_api.utils.util import allowedorigins, cors_preflight
 
 
@@ -38,6 +39,7 @@ class SummaryContent(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @cached_public_response(parent_engagement_id('engagement_content', 'content_id'))
     def get(content_id):
         """Get engagement summary content."""
         try:
@@ -25,6 +25,7 @@ from met_api.exceptions.business_exception import BusinessException
 from met_api.schemas import utils as schema_utils
 from met_api.schemas.engagement_translation import EngagementTranslationSchema
 from met_api.services.engagement_translation_service import EngagementTranslationService
+from met_api.utils.response_cache import cached_public_response
 from met_api.utils.util import allowedorigins, cors_preflight
 
 
@@ -38,6 +39,7 @@ class EngagementTranslationResourceByLanguage(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @cached_public_response()
     def get(engagement_id, language_id):
         """Fetch a engagement by widget_id and language_id."""
         try:
@@ -51,8 +51,10 @@ class FeedbackList(Resource):
             pagination_options = PaginationOptions(
                 page=args.get('page', None, int),
                 size=args.get('size', None, int),
-                sort_key=args.get('sort_key', 'name', str),
+                sort_key=args.get('sort_key', 'rating', str),
                 sort_order=args.get('sort_order', 'asc', str),
+                cursor=args.get('cursor', None, str),
+                count=args.get('count', 'exact', str),
             )
             status_int = args.get(
                 'status', FeedbackStatusType.Unreviewed.value, int)
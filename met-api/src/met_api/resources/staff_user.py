@@ -69,6 +69,8 @@ class StaffUsers(Resource):
             size=args.get('size', None, int),
             sort_key=args.get('sort_key', '', str),
             sort_order=args.get('sort_order', 'asc', str),
+            cursor=args.get('cursor', None, str),
+            count=args.get('count', 'exact', str),
         )
         users = StaffUserService.find_users(
             pagination_options=pagination_options,
@@ -134,6 +134,8 @@ class SurveySubmissions(Resource):
                 size=args.get('size', None, int),
                 sort_key=args.get('sort_key', 'submission.id', str),
                 sort_order=args.get('sort_order', 'asc', str),
+                cursor=args.get('cursor', None, str),
+                count=args.get('count', 'exact', str),
             )
             advanced_search_filters = {
                 'status': args.get('status', None, int),
@@ -81,6 +81,8 @@ class Surveys(Resource):
                 size=args.get('size', None, int),
                 sort_key=args.get('sort_key', 'survey.name', str),
                 sort_order=args.get('sort_order', 'asc', str),
+                cursor=args.get('cursor', None, str),
+                count=args.get('count', 'exact', str),
             )
 
             search_options = SurveySearchOptions(
@@ -26,6 +26,7 @@ from met_api.schemas import utils as schema_utils
 from met_api.schemas.widget import WidgetSchema
 from met_api.schemas.widget_item import WidgetItemSchema
 from met_api.services.widget_service import WidgetService
+from met_api.utils.response_cache import cached_public_response
 from met_api.utils.token_info import TokenInfo
 from met_api.utils.util import allowedorigins, cors_preflight
 
@@ -42,6 +43,7 @@ class Widget(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @cached_public_response()
     def get(engagement_id):
         """Fetch a list of widgets by engagement_id."""
         try:
@@ -23,6 +23,7 @@ from met_api.auth import jwt as _jwt
 from met_api.exceptions.business_exception import BusinessException
 from met_api.schemas.widget_documents import WidgetDocumentsSchema
 from met_api.services.widget_documents_service import WidgetDocumentService
+from met_api.utils.response_cache import cached_public_response, parent_engagement_id
 from met_api.utils.util import allowedorigins, cors_preflight
 
 
@@ -38,6 +39,7 @@ class WidgetDocuments(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @cached_public_response(parent_engagement_id('widget', 'widget_id'))
     def get(widget_id):
         """Fetch a list of document widgets by engagement_id."""
         try:
@@ -23,6 +23,7 @@ from met_api.auth import jwt as _jwt
 from met_api.exceptions.business_exception import BusinessException
 from met_api.schemas.widget_map import WidgetMapSchema
 from met_api.services.widget_map_service import WidgetMapService
+from met_api.utils.response_cache import cached_public_response, parent_engagement_id
 from met_api.utils.roles import Role
 from met_api.utils.tenant_validator import require_role
 from met_api.utils.util import allowedorigins, cors_preflight
@@ -39,6 +40,7 @@ class Map(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @cached_public_response(parent_engagement_id('widget', 'widget_id'))
     def get(widget_id):
         """Get map widget."""
         try:
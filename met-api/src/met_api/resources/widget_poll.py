@@ -11,6 +11,7 @@ from met_api.schemas import utils as schema_utils
 from met_api.schemas.widget_poll import WidgetPollSchema
 from met_api.services.widget_poll_service import WidgetPollService
 from met_api.services.poll_response_service import PollResponseService
+from met_api.utils.response_cache import cached_public_response, parent_engagement_id
 from met_api.utils.util import allowedorigins, cors_preflight
 from met_api.utils.ip_util import hash_ip
 
@@ -26,6 +27,7 @@ class Polls(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @cached_public_response(parent_engagement_id('widget', 'widget_id'))
     def get(widget_id):
         """Get poll widgets."""
         try:
@@ -103,8 +105,7 @@ class PollResponseRecord(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
-    def post(widget_id, poll_widget_id):
-        # pylint: disable=too-many-return-statements
+    def post(poll_widget_id, **_):
         """Record a response for a given poll widget."""
         try:
             poll_response_data = request.get_json()
@@ -117,52 +118,16 @@ class PollResponseRecord(Resource):
                     status_code=HTTPStatus.BAD_REQUEST,
                 )
 
-            # Prepare poll request object
-            poll_response_dict = {
-                **poll_response_data,
-                'poll_id': poll_widget_id,
-                'widget_id': widget_id,
-                'participant_id': hash_ip(request.remote_addr),
-            }
-
-            # Check if poll active or not
-            if not WidgetPollService.is_poll_active(poll_widget_id):
-                raise BusinessException(
-                    error='Poll is not active',
-                    status_code=HTTPStatus.BAD_REQUEST,
-                )
-
-            # Check if engagement of this poll is published or not
-            if not WidgetPollService.is_poll_engagement_published(
-                poll_widget_id
-            ):
-                raise BusinessException(
-                    error='Poll engagement is not published',
-                    status_code=HTTPStatus.BAD_REQUEST,
-                )
-
-            # Check poll limit execeeded or not
-            if WidgetPollService.check_already_polled(
-                poll_widget_id, poll_response_dict['participant_id'], 10
-            ):
-                raise BusinessException(
-                    error='Limit exceeded for this poll',
-                    status_code=HTTPStatus.BAD_REQUEST,
-                )
-
-            # Record poll response in database
-            poll_response = WidgetPollService.record_response(
-                poll_response_dict
-            )
-            if poll_response.id:
-                return {
-                    'message': 'Response recorded successfully'
-                }, HTTPStatus.CREATED
-
-            raise BusinessException(
-                error='Response failed to record',
-                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            # Record the response if the poll is active, its engagement published and the limit not exceeded
+            WidgetPollService.record_participant_response(
+                poll_widget_id,
+                hash_ip(request.remote_addr),
+                poll_response_data['selected_answer_id'],
+                max_responses=10,
             )
+            return {
+                'message': 'Response recorded successfully'
+            }, HTTPStatus.CREATED
 
         except BusinessException as err:
             return err.error, err.status_code
@@ -177,3 +142,19 @@ class PollResponseRecord(Resource):
             return jsonify(poll_results), HTTPStatus.OK
         except BusinessException as err:
             return err.error, err.status_code
+
+
+@cors_preflight('GET')
+@API.route('/<int:poll_widget_id>/results')
+class PollResults(Resource):
+    """Resource for the results of a poll widget. Does not require authentication."""
+
+    @staticmethod
+    @cross_origin(origins=allowedorigins())
+    def get(poll_widget_id, **_):
+        """Get the response counts of a poll widget, when the poll results are public."""
+        try:
+            poll_results = PollResponseService().get_public_poll_results(poll_widget_id)
+            return jsonify(poll_results), HTTPStatus.OK
+        except BusinessException as err:
+            return err.error, err.status_code
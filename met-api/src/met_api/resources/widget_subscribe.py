@@ -23,6 +23,7 @@ from met_api.exceptions.business_exception import BusinessException
 from met_api.schemas.subscribe_item import SubscribeItemSchema
 from met_api.schemas.widget_subscribe import WidgetSubscribeSchema
 from met_api.services.widget_subscribe_service import WidgetSubscribeService
+from met_api.utils.response_cache import cached_public_response, parent_engagement_id
 from met_api.utils.token_info import TokenInfo
 from met_api.utils.util import allowedorigins, cors_preflight
 
@@ -40,6 +41,7 @@ class WidgetSubscribe(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @cached_public_response(parent_engagement_id('widget', 'widget_id'))
     def get(widget_id):
         """Fetch a list of widgets by engagement_id."""
         try:
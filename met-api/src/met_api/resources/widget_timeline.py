@@ -23,6 +23,7 @@ from met_api.exceptions.business_exception import BusinessException
 from met_api.schemas import utils as schema_utils
 from met_api.schemas.widget_timeline import WidgetTimelineSchema
 from met_api.services.widget_timeline_service import WidgetTimelineService
+from met_api.utils.response_cache import cached_public_response, parent_engagement_id
 from met_api.utils.util import allowedorigins, cors_preflight
 
 
@@ -37,6 +38,7 @@ class Timelines(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @cached_public_response(parent_engagement_id('widget', 'widget_id'))
     def get(widget_id):
         """Get timeline widget."""
         try:
@@ -24,6 +24,7 @@ from met_api.auth import jwt as _jwt
 from met_api.schemas import utils as schema_utils
 from met_api.schemas.widget_translation import WidgetTranslationSchema
 from met_api.services.widget_translation_service import WidgetTranslationService
+from met_api.utils.response_cache import cached_public_response, parent_engagement_id
 from met_api.utils.util import allowedorigins, cors_preflight
 
 
@@ -37,6 +38,7 @@ class WidgetTranslationResourceByLanguage(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @cached_public_response(parent_engagement_id('widget', 'widget_id'))
     def get(widget_id, language_id):
         """Fetch a list of widgets by widget_id and language_id."""
         try:
@@ -0,0 +1,33 @@
+"""Batch loading for schemas dumping lists of models.
+
+Schemas using the mixin declare, per field, the relationship paths the field reads. Before a list is dumped,
+the relationships needed by the fields being dumped are loaded for the whole list at once.
+"""
+
+from typing import Dict, Tuple
+
+from marshmallow import pre_dump
+
+from met_api.utils.batch_loader import get_batch_loader
+
+
+class BatchLoadingMixin:  # pylint: disable=too-few-public-methods
+    """Prefetch the relationships used by the dumped fields when dumping many models."""
+
+    # field name -> relationship paths read by the field
+    batch_load: Dict[str, Tuple[str, ...]] = {}
+
+    @pre_dump(pass_many=True)
+    def _batch_load_relationships(self, data, many, **kwargs):  # pylint: disable=unused-argument
+        """Load the relationships of all the models being dumped with one query per relationship."""
+        if not many:
+            return data
+        paths = [
+            path
+            for field_name, field_paths in self.batch_load.items()
+            if field_name in self.dump_fields
+            for path in field_paths
+        ]
+        if paths:
+            get_batch_loader().load(data, *paths)
+        return data
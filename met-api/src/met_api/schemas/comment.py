@@ -5,8 +5,11 @@ Manages the comment
 
 from marshmallow import EXCLUDE, Schema, fields
 
+from met_api.schemas.batch_loading import BatchLoadingMixin
+from met_api.utils.survey_form_index import get_index_for_survey
 
-class CommentSchema(Schema):
+
+class CommentSchema(BatchLoadingMixin, Schema):
     """Schema for comment."""
 
     class Meta:  # pylint: disable=too-few-public-methods
@@ -14,6 +17,12 @@ class CommentSchema(Schema):
 
         unknown = EXCLUDE
 
+    batch_load = {
+        'status_id': ('submission',),
+        'reviewed_by': ('submission',),
+        'label': ('survey',),
+    }
+
     id = fields.Int(data_key='id')
     text = fields.Str(data_key='text')
     submission_date = fields.Date(data_key='submission_date')
@@ -36,46 +45,11 @@ class CommentSchema(Schema):
         return obj.submission.reviewed_by
 
     def get_comment_label(self, obj):
-        """Check the value for display type to categorize the form as a single/multi page."""
-        """Forms' are stored with a display type as 'form' for single page and 'wizard' for multi page"""
-        form_type = obj.survey.form_json.get('display')
-        is_single_page_survey = form_type == 'form'
-        is_multi_page_survey = form_type == 'wizard'
-
-        """Get the associated label of the comment for a single page survey."""
-        form_type = obj.survey.form_json.get('display')
-        if is_single_page_survey:
-            components = list(obj.survey.form_json.get('components', []))
-            if len(components) == 0:
-                return None
-            component_label = CommentSchema.loop_through_comment_label(self, obj, components)
-            if len(component_label) == 0:
-                return None
-            return component_label[0]
-
-        """Get the associated label of the comment for a multi page survey."""
-        if is_multi_page_survey:
-            pages = list(obj.survey.form_json.get('components', []))
-            for page in pages:
-                components = list(page['components'])
-                if len(components) == 0:
-                    return None
-                component_label = CommentSchema.loop_through_comment_label(self, obj, components)
-                if len(component_label) != 0:
-                    return component_label[0]
-
-    def loop_through_comment_label(self, obj, components):
-        """Loop through the component list to extract the label."""
-        component_label = [
-            component.get(
-                'label',
-                None) for component in components if component.get(
-                'key',
-                None) == obj.component_id]
-        return component_label
-
-
-class PublicCommentSchema(Schema):
+        """Get the associated label of the comment from the survey form."""
+        return get_index_for_survey(obj.survey).get_label(obj.component_id)
+
+
+class PublicCommentSchema(BatchLoadingMixin, Schema):
     """Schema for public comment."""
 
     class Meta:  # pylint: disable=too-few-public-methods
@@ -83,21 +57,14 @@ class PublicCommentSchema(Schema):
 
         unknown = EXCLUDE
 
+    batch_load = {
+        'label': ('survey',),
+    }
+
     id = fields.Int(data_key='id')
     text = fields.Str(data_key='text')
     label = fields.Method('get_comment_label')
 
     def get_comment_label(self, obj):
         """Get the associated label of the comment."""
-        components = list(obj.survey.form_json.get('components', []))
-        if len(components) == 0:
-            return None
-        component_label = [
-            component.get(
-                'label',
-                None) for component in components if component.get(
-                'key',
-                None) == obj.component_id]
-        if len(component_label) == 0:
-            return None
-        return component_label[0]
+        return get_index_for_survey(obj.survey).get_label(obj.component_id)
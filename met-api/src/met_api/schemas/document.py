@@ -15,3 +15,4 @@ class Document(Schema):
     authheader = fields.Str(data_key='authheader', allow_none=True)
     amzdate = fields.Str(data_key='amzdate', allow_none=True)
     s3sourceuri = fields.Str(data_key='s3sourceuri', allow_none=True)
+    presignedurl = fields.Str(data_key='presignedurl', allow_none=True)
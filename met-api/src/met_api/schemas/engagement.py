@@ -7,17 +7,17 @@ from datetime import datetime
 
 from marshmallow import EXCLUDE, Schema, ValidationError, fields, validate, validates_schema
 
-from met_api.constants.comment_status import Status as CommentStatus
 from met_api.constants.engagement_status import Status, SubmissionStatus
+from met_api.schemas.batch_loading import BatchLoadingMixin
 from met_api.schemas.engagement_status_block import EngagementStatusBlockSchema
 from met_api.schemas.engagement_survey import EngagementSurveySchema
-from met_api.schemas.utils import count_comments_by_status
+from met_api.schemas.utils import get_comments_meta_data
 from met_api.utils.datetime import local_datetime
 
 from .engagement_status import EngagementStatusSchema
 
 
-class EngagementSchema(Schema):
+class EngagementSchema(BatchLoadingMixin, Schema):
     """Schema for engagement."""
 
     class Meta:  # pylint: disable=too-few-public-methods
@@ -25,6 +25,13 @@ class EngagementSchema(Schema):
 
         unknown = EXCLUDE
 
+    batch_load = {
+        'engagement_status': ('engagement_status',),
+        'surveys': ('surveys',),
+        'submissions_meta_data': ('surveys',),
+        'status_block': ('status_block',),
+    }
+
     id = fields.Int(data_key='id')
     name = fields.Str(data_key='name', required=True, validate=validate.Length(min=1, error='Name cannot be blank'))
     description = fields.Str(data_key='description')
@@ -54,23 +61,8 @@ class EngagementSchema(Schema):
     def get_submissions_meta_data(self, obj):
         """Get the meta data of the submissions made in the survey."""
         if not obj or len(obj.surveys) == 0:
-            return {
-                'total': 0,
-                'pending': 0,
-                'approved': 0,
-                'rejected': 0,
-                'needs_further_review': 0
-            }
-        submissions = obj.surveys[0].submissions
-        return {
-            'total': len(submissions),
-            'pending': count_comments_by_status(submissions, CommentStatus.Pending.value),
-            'approved': count_comments_by_status(submissions, CommentStatus.Approved.value),
-            'rejected': count_comments_by_status(submissions, CommentStatus.Rejected.value),
-            'needs_further_review': count_comments_by_status(
-                submissions,
-                CommentStatus.Needs_further_review.value)
-        }
+            return get_comments_meta_data(None)
+        return get_comments_meta_data(obj.surveys[0].status_count)
 
     def get_submission_status(self, obj):
         """Get the submission status of the engagement."""
@@ -4,13 +4,14 @@ Manages the submission
 """
 
 from marshmallow import EXCLUDE, Schema, fields
+from met_api.schemas.batch_loading import BatchLoadingMixin
 from met_api.schemas.comment import CommentSchema, PublicCommentSchema
 from met_api.schemas.staff_note import StaffNoteSchema
 
 from .survey import SurveySchema
 
 
-class SubmissionSchema(Schema):
+class SubmissionSchema(BatchLoadingMixin, Schema):
     """Schema for submission."""
 
     class Meta:  # pylint: disable=too-few-public-methods
@@ -18,6 +19,11 @@ class SubmissionSchema(Schema):
 
         unknown = EXCLUDE
 
+    batch_load = {
+        'comments': ('comments', 'comments.survey'),
+        'staff_note': ('staff_note',),
+    }
+
     id = fields.Str(data_key='id')
     submission_json = fields.Dict(data_key='submission_json')
     created_by = fields.Str(data_key='created_by')
@@ -41,7 +47,7 @@ class SubmissionSchema(Schema):
     staff_note = fields.List(fields.Nested(StaffNoteSchema))
 
 
-class PublicSubmissionSchema(Schema):
+class PublicSubmissionSchema(BatchLoadingMixin, Schema):
     """Schema for a public submission."""
 
     class Meta:  # pylint: disable=too-few-public-methods
@@ -49,6 +55,10 @@ class PublicSubmissionSchema(Schema):
 
         unknown = EXCLUDE
 
+    batch_load = {
+        'comments': ('comments', 'comments.survey'),
+    }
+
     id = fields.Int(data_key='id')
     engagement_id = fields.Int(data_key='engagement_id')
     comments = fields.List(fields.Nested(PublicCommentSchema))
@@ -5,13 +5,13 @@ Manages the survey
 
 from marshmallow import EXCLUDE, Schema, fields
 
-from met_api.constants.comment_status import Status
-from met_api.schemas.utils import count_comments_by_status
+from met_api.schemas.batch_loading import BatchLoadingMixin
+from met_api.schemas.utils import get_comments_meta_data
 
 from .engagement import EngagementSchema
 
 
-class SurveySchema(Schema):
+class SurveySchema(BatchLoadingMixin, Schema):
     """Schema for survey."""
 
     class Meta:  # pylint: disable=too-few-public-methods
@@ -19,6 +19,15 @@ class SurveySchema(Schema):
 
         unknown = EXCLUDE
 
+    batch_load = {
+        'engagement': (
+            'engagement',
+            'engagement.engagement_status',
+            'engagement.surveys',
+            'engagement.status_block',
+        ),
+    }
+
     id = fields.Int(data_key='id')
     name = fields.Str(data_key='name')
     form_json = fields.Dict(data_key='form_json')
@@ -35,12 +44,4 @@ class SurveySchema(Schema):
 
     def get_comments_meta_data(self, obj):
         """Get the meta data of the comments made in the survey."""
-        return {
-            'total': len(obj.submissions),
-            'pending': count_comments_by_status(obj.submissions, Status.Pending.value),
-            'approved': count_comments_by_status(obj.submissions, Status.Approved.value),
-            'rejected': count_comments_by_status(obj.submissions, Status.Rejected.value),
-            'needs_further_review': count_comments_by_status(
-                obj.submissions,
-                Status.Needs_further_review.value)
-        }
+        return get_comments_meta_data(obj.status_count)
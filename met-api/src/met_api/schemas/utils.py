@@ -16,14 +16,16 @@
 Test helper functions to load and assert that a JSON payload validates against a defined schema.
 """
 import json
+from itertools import chain
 from os import listdir, path
+from threading import Lock
 from typing import Tuple
 
 from jsonschema import Draft7Validator, RefResolver, SchemaError, draft7_format_checker
-from met_api.constants.user import SYSTEM_REVIEWER
 
 
 BASE_URI = 'https://met.gov.bc.ca/.well_known/schemas'
+DEFAULT_SCHEMA_SEARCH_PATH = path.join(path.dirname(__file__), 'schemas')
 
 
 def get_schema(filename: str) -> dict:
@@ -49,7 +51,7 @@ def get_schema_store(validate_schema: bool = False, schema_search_path: str = No
     """
     try:
         if not schema_search_path:
-            schema_search_path = path.join(path.dirname(__file__), 'schemas')
+            schema_search_path = DEFAULT_SCHEMA_SEARCH_PATH
         schemastore = {}
         fnames = listdir(schema_search_path)
         for fname in fnames:
@@ -70,40 +72,92 @@ def get_schema_store(validate_schema: bool = False, schema_search_path: str = No
         raise error
 
 
+class _ValidatorCache:
+    """Process wide cache of the schema stores and of the validators compiled from them.
+
+    Schema stores are loaded once per search path and validators are compiled once per schema id. Validators do
+    not keep state between validations, so they are shared between requests.
+    """
+
+    def __init__(self):
+        """Create an empty cache."""
+        self._schema_stores = {}
+        self._validators = {}
+        self._lock = Lock()
+
+    def get_schema_store(self, schema_search_path: str, validate_schema: bool) -> dict:
+        """Return the schema store of the search path, loading it on first use."""
+        key = (schema_search_path, validate_schema)
+        schema_store = self._schema_stores.get(key)
+        if schema_store is None:
+            schema_store = get_schema_store(validate_schema, schema_search_path)
+            with self._lock:
+                schema_store = self._schema_stores.setdefault(key, schema_store)
+        return schema_store
+
+    def get_validator(self, schema_id: str, validate_schema: bool, schema_search_path: str) -> Draft7Validator:
+        """Return the validator of the schema, compiling it on first use."""
+        key = (schema_search_path, schema_id, validate_schema)
+        validator = self._validators.get(key)
+        if validator is None:
+            schema_store = self.get_schema_store(schema_search_path, validate_schema)
+            validator = _build_validator(schema_id, schema_store, validate_schema, schema_search_path)
+            with self._lock:
+                validator = self._validators.setdefault(key, validator)
+        return validator
+
+    def clear(self):
+        """Remove the cached schema stores and validators."""
+        with self._lock:
+            self._schema_stores.clear()
+            self._validators.clear()
+
+
+_validator_cache = _ValidatorCache()
+
+
+def _build_validator(schema_id: str, schema_store: dict, validate_schema: bool,
+                     schema_search_path: str) -> Draft7Validator:
+    """Compile the validator of the schema, resolving references against the schema store."""
+    schema = schema_store.get(f'{BASE_URI}/{schema_id}')
+    if validate_schema:
+        Draft7Validator.check_schema(schema)
+
+    schema_file_path = path.join(schema_search_path, schema_id)
+    resolver = RefResolver(f'file://{schema_file_path}.json', schema, schema_store)
+    return Draft7Validator(schema, format_checker=draft7_format_checker, resolver=resolver)
+
+
+def clear_validator_cache():
+    """Remove the cached schema stores and validators, so that schema files are read again."""
+    _validator_cache.clear()
+
+
 def validate(json_data: json,
              schema_id: str,
              schema_store: dict = None,
              validate_schema: bool = False,
              schema_search_path: str = None
              ) -> Tuple[bool, iter]:
-    """Load the json file and validate against loaded schema."""
+    """Load the json file and validate against loaded schema.
+
+    Validators are cached per schema, unless a schema store is given.
+    """
     try:
         if not schema_search_path:
-            schema_search_path = path.join(path.dirname(__file__), 'schemas')
+            schema_search_path = DEFAULT_SCHEMA_SEARCH_PATH
 
-        if not schema_store:
-            schema_store = get_schema_store(validate_schema, schema_search_path)
-
-        schema = schema_store.get(f'{BASE_URI}/{schema_id}')
-        if validate_schema:
-            Draft7Validator.check_schema(schema)
+        if schema_store:
+            validator = _build_validator(schema_id, schema_store, validate_schema, schema_search_path)
+        else:
+            validator = _validator_cache.get_validator(schema_id, validate_schema, schema_search_path)
 
-        schema_file_path = path.join(schema_search_path, schema_id)
-        resolver = RefResolver(f'file://{schema_file_path}.json', schema, schema_store)
-
-        if Draft7Validator(schema,
-                           format_checker=draft7_format_checker,
-                           resolver=resolver
-                           ) \
-                .is_valid(json_data):
+        # the payload is validated once; the first error tells it is invalid and the others follow it
+        errors = validator.iter_errors(json_data)
+        first_error = next(errors, None)
+        if first_error is None:
             return True, None
-
-        errors = Draft7Validator(schema,
-                                 format_checker=draft7_format_checker,
-                                 resolver=resolver
-                                 ) \
-            .iter_errors(json_data)
-        return False, errors
+        return False, chain((first_error,), errors)
 
     except SchemaError as error:
         # handle schema error
@@ -118,16 +172,18 @@ def serialize(errors):
     return error_message
 
 
-def count_comments_by_status(submissions, status):
-    """Count the comments by their status.
+def get_comments_meta_data(status_count) -> dict:
+    """Return the comment counts of a survey.
 
-    :param submissions: List of submissions
-    :param status: Status of the comments
-    :return: Number of comments with the provided status
+    :param status_count: The maintained status counters of the survey, if any
+    :return: Total number of submissions and number of comments in each status
     """
-    return len([
-        submission
-        for submission in submissions
-        if (submission.comment_status_id == status and
-            submission.reviewed_by != SYSTEM_REVIEWER)
-    ])
+    if not status_count:
+        return {
+            'total': 0,
+            'pending': 0,
+            'approved': 0,
+            'rejected': 0,
+            'needs_further_review': 0
+        }
+    return status_count.as_dict()
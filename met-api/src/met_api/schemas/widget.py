@@ -2,10 +2,11 @@
 
 from marshmallow import EXCLUDE, Schema, fields
 
+from met_api.schemas.batch_loading import BatchLoadingMixin
 from met_api.schemas.widget_item import WidgetItemSchema
 
 
-class WidgetSchema(Schema):
+class WidgetSchema(BatchLoadingMixin, Schema):
     """Widget schema."""
 
     class Meta:  # pylint: disable=too-few-public-methods
@@ -13,6 +14,10 @@ class WidgetSchema(Schema):
 
         unknown = EXCLUDE
 
+    batch_load = {
+        'items': ('items',),
+    }
+
     id = fields.Int(data_key='id')
     title = fields.Str(data_key='title')
     widget_type_id = fields.Int(data_key='widget_type_id', required=True)
@@ -19,11 +19,12 @@ from marshmallow_enum import EnumField
 from met_api.models import WidgetEvents as WidgetEventsModel
 
 from .base_schema import BaseSchema
+from .batch_loading import BatchLoadingMixin
 from .event_item import EventItemSchema
 from ..constants.event_types import EventTypes
 
 
-class WidgetEventsSchema(BaseSchema):  # pylint: disable=too-many-ancestors, too-few-public-methods
+class WidgetEventsSchema(BatchLoadingMixin, BaseSchema):  # pylint: disable=too-many-ancestors, too-few-public-methods
     """This is the schema for the Contact link model."""
 
     class Meta(BaseSchema.Meta):  # pylint: disable=too-few-public-methods
@@ -31,5 +32,9 @@ class WidgetEventsSchema(BaseSchema):  # pylint: disable=too-many-ancestors, too
 
         model = WidgetEventsModel
 
+    batch_load = {
+        'event_items': ('event_items',),
+    }
+
     event_items = fields.List(fields.Nested(EventItemSchema))
     type = EnumField(EventTypes)
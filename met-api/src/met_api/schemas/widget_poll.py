@@ -4,6 +4,8 @@ from met_api.models.poll_answers import PollAnswer as PollAnswerModel
 from marshmallow import Schema
 from marshmallow_sqlalchemy.fields import Nested
 
+from met_api.schemas.batch_loading import BatchLoadingMixin
+
 
 class PollAnswerSchema(Schema):
     """
@@ -20,7 +22,7 @@ class PollAnswerSchema(Schema):
         fields = ('id', 'answer_text', 'poll_id')  # Fields to include in the schema.
 
 
-class WidgetPollSchema(Schema):
+class WidgetPollSchema(BatchLoadingMixin, Schema):
     """
     Schema for serializing and deserializing Widget Poll data.
 
@@ -34,6 +36,10 @@ class WidgetPollSchema(Schema):
         model = PollModel  # The model representing Widget Poll.
         fields = ('id', 'title', 'description', 'status', 'widget_id', 'engagement_id', 'answers')
 
+    batch_load = {
+        'answers': ('answers',),
+    }
+
     answers = Nested(PollAnswerSchema, many=True)
     """Nested field for Poll Answers.
 
@@ -19,11 +19,12 @@ from marshmallow_enum import EnumField
 from met_api.models import WidgetSubscribe as WidgetSubscribeModel
 
 from .base_schema import BaseSchema
+from .batch_loading import BatchLoadingMixin
 from .subscribe_item import SubscribeItemSchema
 from ..constants.subscribe_types import SubscribeTypes
 
 
-class WidgetSubscribeSchema(BaseSchema):  # pylint: disable=too-many-ancestors, too-few-public-methods
+class WidgetSubscribeSchema(BatchLoadingMixin, BaseSchema):  # pylint: disable=too-many-ancestors,too-few-public-methods
     """This is the schema for the Contact link model."""
 
     class Meta(BaseSchema.Meta):  # pylint: disable=too-few-public-methods
@@ -31,5 +32,9 @@ class WidgetSubscribeSchema(BaseSchema):  # pylint: disable=too-many-ancestors,
 
         model = WidgetSubscribeModel
 
+    batch_load = {
+        'subscribe_items': ('subscribe_items',),
+    }
+
     subscribe_items = fields.List(fields.Nested(SubscribeItemSchema))
     type = EnumField(SubscribeTypes)
@@ -19,6 +19,8 @@ from met_api.models.timeline_event import TimelineEvent as TimelineEventModel
 from marshmallow import Schema
 from marshmallow_sqlalchemy.fields import Nested
 
+from met_api.schemas.batch_loading import BatchLoadingMixin
+
 
 class TimelineEventSchema(Schema):  # pylint: disable=too-many-ancestors, too-few-public-methods
     """This is the schema for the timeline event model."""
@@ -30,7 +32,7 @@ class TimelineEventSchema(Schema):  # pylint: disable=too-many-ancestors, too-fe
         fields = ('id', 'engagement_id', 'widget_id', 'timeline_id', 'description', 'time', 'position', 'status')
 
 
-class WidgetTimelineSchema(Schema):  # pylint: disable=too-many-ancestors, too-few-public-methods
+class WidgetTimelineSchema(BatchLoadingMixin, Schema):  # pylint: disable=too-many-ancestors, too-few-public-methods
     """This is the schema for the widget timeline model."""
 
     class Meta:  # pylint: disable=too-few-public-methods
@@ -39,4 +41,8 @@ class WidgetTimelineSchema(Schema):  # pylint: disable=too-many-ancestors, too-f
         model = WidgetTimelineModel
         fields = ('id', 'engagement_id', 'widget_id', 'title', 'description', 'events')
 
+    batch_load = {
+        'events': ('events',),
+    }
+
     events = Nested(TimelineEventSchema, many=True)
@@ -3,6 +3,7 @@
 This module is to handle authorization related queries.
 """
 from http import HTTPStatus
+from typing import Optional
 
 from flask import current_app, g
 from flask_restx import abort
@@ -10,7 +11,8 @@ from flask_restx import abort
 from met_api.constants.membership_type import MembershipType
 from met_api.models.engagement import Engagement as EngagementModel
 from met_api.models.membership import Membership as MembershipModel
-from met_api.models.staff_user import StaffUser as StaffUserModel
+from met_api.services.identity_service import IdentityContext, IdentityService
+from met_api.utils import authorization_cache
 from met_api.utils.enums import MembershipStatus
 from met_api.utils.roles import Role
 from met_api.utils.user_context import UserContext, user_context
@@ -25,7 +27,7 @@ def check_auth(**kwargs):
     """Check if user is authorized to perform action on the service."""
     skip_tenant_check = current_app.config.get('IS_SINGLE_TENANT_ENVIRONMENT')
     user_from_context: UserContext = kwargs['user_context']
-    user_from_db = StaffUserModel.get_user_by_external_id(user_from_context.sub)
+    user_from_db = _get_identity(user_from_context).staff_user
     if not user_from_db:
         abort(HTTPStatus.FORBIDDEN, 'User not found')
 
@@ -56,11 +58,16 @@ def check_auth(**kwargs):
     abort(HTTPStatus.FORBIDDEN, UNAUTHORIZED_MSG)
 
 
+def _get_identity(user_from_context: UserContext) -> IdentityContext:
+    """Return the identity resolved for the request, which the role callback has already loaded."""
+    return IdentityService.get_context(user_from_context.sub, g.get('tenant_id'))
+
+
 def _check_engagement_has_tenant(eng_id, tenant_id):
     """Validate users tenant id with engagements tenant id."""
     if not eng_id:
         return
-    engagement_tenant_id = EngagementModel.find_tenant_id_by_id(eng_id)
+    engagement_tenant_id = _get_engagement_tenant_id(eng_id)
     if engagement_tenant_id and str(tenant_id) != str(engagement_tenant_id):
         current_app.logger.debug('Aborting . Tenant Id on Engagement and user context Mismatch\n'
                                  f'engagement_tenant_id:{engagement_tenant_id}\n'
@@ -76,25 +83,41 @@ def _has_team_membership(kwargs, user_from_context, team_permitted_roles) -> boo
 
         return False
 
-    user = StaffUserModel.get_user_by_external_id(user_from_context.sub)
+    user = _get_identity(user_from_context).staff_user
 
     if not user:
 
         return False
 
-    membership = MembershipModel.find_by_engagement_and_user_id(eng_id, user.id, status=MembershipStatus.ACTIVE.value)
+    membership = _get_engagement_membership(eng_id, user.id)
 
-    if not membership:
+    if not membership or membership['status'] != MembershipStatus.ACTIVE.value:
 
         return False
 
     skip_tenant_check = current_app.config.get('IS_SINGLE_TENANT_ENVIRONMENT')
     if not skip_tenant_check:
         # check tenant matching
-        if membership.tenant_id and str(membership.tenant_id) != str(g.tenant_id):
+        if membership['tenant_id'] and str(membership['tenant_id']) != str(g.tenant_id):
             current_app.logger.debug(f'Aborting . Tenant Id on membership and user context Mismatch'
-                                     f'membership.tenant_id:{membership.tenant_id} '
+                                     f'membership.tenant_id:{membership["tenant_id"]} '
                                      f'user_from_context.tenant_id: {g.tenant_id}')
             abort(HTTPStatus.FORBIDDEN, UNAUTHORIZED_MSG)
 
-    return membership.type.name in team_permitted_roles
+    return membership['type'] in team_permitted_roles
+
+
+def _get_engagement_tenant_id(eng_id) -> Optional[int]:
+    """Return the tenant of the engagement."""
+    return authorization_cache.get_engagement_tenant_id(eng_id, lambda: EngagementModel.find_tenant_id_by_id(eng_id))
+
+
+def _get_engagement_membership(eng_id, user_id) -> Optional[dict]:
+    """Return the type, status and tenant of the latest membership of the user to the engagement."""
+    def load():
+        membership = MembershipModel.find_by_engagement_and_user_id(eng_id, user_id)
+        if not membership:
+            return None
+        return {'type': membership.type.name, 'status': membership.status, 'tenant_id': membership.tenant_id}
+
+    return authorization_cache.get_engagement_membership(eng_id, user_id, load)
@@ -13,18 +13,56 @@
 # limitations under the License.
 
 
-"""Service for receipt generation."""
+"""Service for receipt generation.
+
+The access token, the verified template hashes and the HTTP connection pool are shared by all the instances of the
+service in the process, so that rendering a document with a known template makes a single call to CDOGS.
+"""
 import base64
 import json
 import re
+import time
 from http import HTTPStatus
+from threading import Lock
 
 import requests
 from flask import current_app
+from requests.adapters import HTTPAdapter
 
 from met_api.config import Config
 
 
+# Renew the access token this many seconds before it expires
+TOKEN_EXPIRY_MARGIN = 30
+# Used when the token response has no expiry
+DEFAULT_TOKEN_EXPIRES_IN = 300
+
+
+class _CdogsClientState:  # pylint: disable=too-few-public-methods
+    """Process wide state of the CDOGS client."""
+
+    def __init__(self):
+        """Create the shared HTTP session and empty caches."""
+        self.lock = Lock()
+        self.access_token = None
+        self.token_expires_at = 0
+        # template hash code -> time until which the template is known to be cached by CDOGS
+        self.verified_templates = {}
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+        self.http.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
+    def clear(self):
+        """Forget the access token and the verified templates."""
+        with self.lock:
+            self.access_token = None
+            self.token_expires_at = 0
+            self.verified_templates.clear()
+
+
+_state = _CdogsClientState()
+
+
 class CdogsApiService:
     """cdogs api Service class."""
 
@@ -33,8 +71,12 @@ class CdogsApiService:
         # we can't use current_app.config here because it isn't initialized yet
         config = Config().CDOGS_CONFIG
         self.base_url = config['BASE_URL']
+        self.template_cache_ttl = config['TEMPLATE_CACHE_TTL']
 
-        self.access_token = self._get_access_token()
+    @property
+    def access_token(self):
+        """Return the access token, requesting a new one when it is about to expire."""
+        return self._get_access_token()
 
     def generate_document(self, template_hash_code: str, data, options):
         """Generate document based on template and data."""
@@ -50,11 +92,16 @@ class CdogsApiService:
         }
 
         url = f'{self.base_url}/api/v2/template/{template_hash_code}/render'
-        return self._post_generate_document(json_request_body, headers, url)
+        response = self._post_generate_document(json_request_body, headers, url)
+        if response.status_code == HTTPStatus.OK:
+            self._mark_template_verified(template_hash_code)
+        elif response.status_code == HTTPStatus.NOT_FOUND:
+            self.forget_template(template_hash_code)
+        return response
 
     @staticmethod
     def _post_generate_document(json_request_body, headers, url):
-        response = requests.post(url, data=json_request_body, headers=headers, timeout=None)
+        response = _state.http.post(url, data=json_request_body, headers=headers, timeout=None)
         return response
 
     def upload_template(self, template_file_path):
@@ -78,6 +125,7 @@ class CdogsApiService:
 
                 current_app.logger.info('Returning new hash %s', response.headers['X-Template-Hash'])
                 print('Returning new hash %s', response.headers['X-Template-Hash'])
+                self._mark_template_verified(response.headers['X-Template-Hash'])
                 return response.headers['X-Template-Hash']
 
             response_json = json.loads(response.content)
@@ -87,6 +135,7 @@ class CdogsApiService:
                 if match:
                     current_app.logger.info('Template already hashed with code %s', match[0])
                     print('Template already hashed with code %s', match[0])
+                    self._mark_template_verified(match[0])
                     return match[0]
 
                 raise ValueError('Data not found')
@@ -94,7 +143,7 @@ class CdogsApiService:
 
     @staticmethod
     def _post_upload_template(headers, url, template):
-        response = requests.post(url, headers=headers, files=template, timeout=None)
+        response = _state.http.post(url, headers=headers, files=template, timeout=None)
         return response
 
     def check_template_cached(self, template_hash_code: str):
@@ -105,27 +154,63 @@ class CdogsApiService:
 
         url = f'{self.base_url}/api/v2/template/{template_hash_code}'
 
-        response = requests.get(url, headers=headers, timeout=None)
-        return response.status_code == HTTPStatus.OK
+        response = _state.http.get(url, headers=headers, timeout=None)
+        is_cached = response.status_code == HTTPStatus.OK
+        if is_cached:
+            self._mark_template_verified(template_hash_code)
+        return is_cached
+
+    def is_template_verified(self, template_hash_code: str) -> bool:
+        """Return True if the template was found in CDOGS recently enough to skip checking it again."""
+        with _state.lock:
+            return _state.verified_templates.get(template_hash_code, 0) > time.monotonic()
+
+    def _mark_template_verified(self, template_hash_code: str):
+        with _state.lock:
+            _state.verified_templates[template_hash_code] = time.monotonic() + self.template_cache_ttl
+
+    @staticmethod
+    def forget_template(template_hash_code: str):
+        """Forget that the template was verified, for example after CDOGS reported it missing."""
+        with _state.lock:
+            _state.verified_templates.pop(template_hash_code, None)
+
+    @staticmethod
+    def clear_cache():
+        """Forget the cached access token and the verified templates."""
+        _state.clear()
 
     @staticmethod
     def _get_access_token():
-        token_url = Config().CDOGS_CONFIG['TOKEN_URL']
-        service_client = Config().CDOGS_CONFIG['SERVICE_CLIENT']
-        service_client_secret = Config().CDOGS_CONFIG['SERVICE_CLIENT_SECRET']
+        """Return the cached access token, requesting a new one when it is about to expire."""
+        with _state.lock:
+            if _state.access_token and time.monotonic() < _state.token_expires_at:
+                return _state.access_token
+            response_json = CdogsApiService._request_access_token()
+            expires_in = response_json.get('expires_in') or DEFAULT_TOKEN_EXPIRES_IN
+            _state.access_token = response_json['access_token']
+            _state.token_expires_at = time.monotonic() + max(expires_in - TOKEN_EXPIRY_MARGIN, 0)
+            return _state.access_token
+
+    @staticmethod
+    def _request_access_token():
+        config = Config().CDOGS_CONFIG
+        token_url = config['TOKEN_URL']
+        service_client = config['SERVICE_CLIENT']
+        service_client_secret = config['SERVICE_CLIENT_SECRET']
 
         basic_auth_encoded = base64.b64encode(
             bytes(f'{service_client}:{service_client_secret}', 'utf-8')).decode('utf-8')
         data = 'grant_type=client_credentials'
-        response = requests.post(
+        response = _state.http.post(
             token_url,
             data=data,
             headers={
                 'Authorization': f'Basic {basic_auth_encoded}',
                 'Content-Type': 'application/x-www-form-urlencoded'
             },
-            timeout=None
+            # the token is requested holding the lock, so that a stalled request must not block the process
+            timeout=config['CONNECT_TIMEOUT']
         )
 
-        response_json = response.json()
-        return response_json['access_token']
+        return response.json()
@@ -1,5 +1,8 @@
 """Service for comment management."""
 import itertools
+from collections import defaultdict
+
+from flask import current_app
 
 from met_api.constants.comment_status import Status
 from met_api.constants.membership_type import MembershipType
@@ -16,18 +19,20 @@ from met_api.schemas.survey import SurveySchema
 from met_api.services import authorization
 from met_api.services.document_generation_service import DocumentGenerationService
 from met_api.utils.roles import Role
+from met_api.utils.spreadsheet import CSV, XLSX, is_xlsx_available, spreadsheet_response
+from met_api.utils.survey_form_index import SurveyFormIndex, get_index_for_survey
 from met_api.utils.token_info import TokenInfo
 from met_api.utils.enums import GeneratedDocumentTypes, MembershipStatus
 
 
+LOCAL_EXPORT_ENGINE = 'local'
+
+
 class CommentService:
     """Comment management service."""
 
     otherdateformat = '%Y-%m-%d'
 
-    wizard_display = 'wizard'
-    form_display = 'form'
-
     @staticmethod
     def get_comment(comment_id) -> CommentSchema:
         """Get Comment by the id."""
@@ -89,6 +94,25 @@ class CommentService:
             'total': total
         }
 
+    @classmethod
+    def search_comments(cls, survey_id, search_text: str, pagination_options: PaginationOptions = None):
+        """Search the accepted comments by words, returning the best matches first with highlighted snippets."""
+        include_unpublished = CommentService.can_view_unapproved_comments(survey_id)
+
+        comment_schema = CommentSchema(only=('text', 'submission_date', 'label', 'submission_id'))
+        page = Comment.search_accepted_comments_by_survey_id(
+            survey_id, search_text, pagination_options, include_unpublished)
+        items = []
+        for comment, rank, snippet in page.items:
+            item = comment_schema.dump(comment)
+            item['rank'] = rank
+            item['snippet'] = snippet
+            items.append(item)
+        return {
+            'items': items,
+            'total': page.total
+        }
+
     @classmethod
     def create_comments(cls, comments: list, session):
         """Create comment."""
@@ -120,28 +144,12 @@ class CommentService:
     @classmethod
     def extract_components(cls, survey_form: dict):
         """Extract components from survey form."""
-        components = list(survey_form.get('components', []))
-
-        is_comments_from_form_survey = survey_form.get('display') == cls.form_display
-        if is_comments_from_form_survey:
-            return components
-
-        is_comments_from_wizard_survey = survey_form.get('display') == cls.wizard_display
-        if is_comments_from_wizard_survey:
-            return list(itertools.chain.from_iterable([page.get('components', []) for page in components]))
-        return []
+        return SurveyFormIndex(survey_form).raw_components
 
     @classmethod
     def extract_comments_from_survey(cls, survey_submission: SubmissionSchema, survey: SurveySchema):
         """Extract comments from survey submission."""
-        survey_form = survey.get('form_json', {})
-        components = cls.extract_components(survey_form)
-        if len(components) == 0:
-            return []
-        # get the 'id' for each component that has 'inputType' text and filter out the rest.
-        text_component_keys = [
-            component.get('key', None) for component in components
-            if component.get('inputType', None) == 'text']
+        text_component_keys = get_index_for_survey(survey).text_keys
         submission = survey_submission.get('submission_json', {})
         comments = [cls.__form_comment(key, submission.get(key, ''), survey_submission, survey)
                     for key in text_component_keys if submission.get(key, '') != '']
@@ -151,6 +159,8 @@ class CommentService:
     def export_comments_to_spread_sheet_staff(cls, survey_id):
         """Export comments to spread sheet."""
         survey = SurveyModel.find_by_id(survey_id)
+        if cls._is_local_export():
+            return spreadsheet_response(cls._get_staff_sheet_rows(survey), CSV, 'comments_sheet')
         comments = Comment.get_comments_by_survey_id(survey_id)
         # TODO: Uncomment depending on future metadata work
         # metadata_model = EngagementMetadataModel.find_by_id(survey.engagement_id)
@@ -174,17 +184,7 @@ class CommentService:
     def get_titles(cls, survey: SurveySchema):
         """Get the titles to be displayed on the sheet."""
         # Title could be dynamic based on the number of comment type questions on the survey
-        survey_form = survey.form_json
-        labels = []
-        components = cls.extract_components(survey_form)
-        if len(components) == 0:
-            return []
-        for component in components:
-            if component.get('inputType', None) == 'text':
-                if 'label' in component:
-                    labels.append(component['label'])
-
-        return [{'label': label} for label in labels if label is not None]
+        return [{'label': label} for label in get_index_for_survey(survey).text_labels]
 
     @classmethod
     def get_data_rows(cls, titles, comments, project_name):
@@ -251,6 +251,10 @@ class CommentService:
             Role.EXPORT_ALL_TO_CSV.value
         )
         authorization.check_auth(one_of_roles=one_of_roles, engagement_id=survey.engagement_id)
+        if cls._is_local_export():
+            if is_xlsx_available():
+                return spreadsheet_response(cls._get_proponent_sheet_rows(survey), XLSX, 'proponent_comments_sheet')
+            current_app.logger.warning('openpyxl is not installed, exporting the proponent sheet with CDOGS')
         comments = Comment.get_public_viewable_comments_by_survey_id(survey_id)
         formatted_comments = cls.format_comments(comments)
         document_options = {
@@ -261,47 +265,95 @@ class CommentService:
         }
         return DocumentGenerationService().generate_document(data=formatted_comments, options=document_options)
 
+    @staticmethod
+    def _is_local_export():
+        """Return True if the comment sheets are generated by the API instead of the document generation service."""
+        return current_app.config.get('COMMENT_EXPORT_ENGINE') == LOCAL_EXPORT_ENGINE
+
+    @classmethod
+    def _get_staff_sheet_rows(cls, survey):
+        """Get the rows of the staff sheet, with one row per submission, laid out like the staff template."""
+        form_index = get_index_for_survey(survey)
+        labels = form_index.text_labels
+        yield ['Comment No.', 'Submitted', *labels, 'Status', 'Published Date', 'Reason for Rejection', 'Reviewer',
+               'Project']
+
+        rows = Comment.get_staff_export_rows(survey.id)
+        for _, submission_rows in itertools.groupby(rows, key=lambda row: row.submission_id):
+            submission_rows = list(submission_rows)
+            submission = submission_rows[0]._asdict()
+            texts = {form_index.get_label(row.component_id): row.text for row in submission_rows}
+            yield [
+                submission.get('submission_id'),
+                cls._format_sheet_date(submission.get('created_date')),
+                *[texts.get(label, '') for label in labels],
+                Status(submission.get('comment_status_id')).name,
+                cls._format_sheet_date(submission.get('review_date')),
+                cls.get_rejection_note(submission),
+                submission.get('reviewed_by'),
+                None,
+            ]
+
+    @classmethod
+    def _get_proponent_sheet_rows(cls, survey):
+        """Get the rows of the proponent sheet, with a text and an answer column per question."""
+        form_index = get_index_for_survey(survey)
+        # Questions sharing a label share a column, and columns are in order of their first comment
+        component_ids_by_label = {}
+        for component_id in Comment.get_public_viewable_component_ids(survey.id):
+            component_ids_by_label.setdefault(form_index.get_label(component_id), []).append(component_id)
+        yield list(itertools.chain.from_iterable(
+            (label, 'Proponent Answer') for label in component_ids_by_label))
+
+        columns = [
+            Comment.get_public_viewable_texts(survey.id, component_ids)
+            for component_ids in component_ids_by_label.values()
+        ]
+        for texts in itertools.zip_longest(*columns, fillvalue=''):
+            yield list(itertools.chain.from_iterable((comment_text, None) for comment_text in texts))
+
+    @staticmethod
+    def _format_sheet_date(value):
+        """Format a date the way the sheet templates display it, for example September 1, 2023."""
+        if not value:
+            return None
+        return f'{value:%B} {value.day}, {value.year}'
+
     @classmethod
     def group_comments_by_submission_id(cls, comments):
         """Group the comments together, arranging them in the same order as the titles."""
-        grouped_comments = []
+        # Groups are kept by submission ID so that each comment finds its group in constant time
+        grouped_comments = {}
         for comment in comments:
             submission_id = comment['submission_id']
             text = comment.get('text', '')  # Get the text, or an empty string if it's missing
             label = comment['label']
 
-            # Check if a group with the same submission ID already exists
-            existing_group = next((group for group in grouped_comments
-                                   if group['submission_id'] == submission_id), None)
+            group = grouped_comments.get(submission_id)
+            if group is None:
+                group = grouped_comments[submission_id] = {'submission_id': submission_id, 'commentText': []}
+            group['commentText'].append({'text': text, 'label': label})
 
-            if existing_group:
-                # Add the new comment
-                existing_group['commentText'].append({'text': text, 'label': label})
-            else:
-                new_group = {'submission_id': submission_id, 'commentText': [{'text': text, 'label': label}]}
-                grouped_comments.append(new_group)
-
-        return grouped_comments
+        return list(grouped_comments.values())
 
     @classmethod
     def get_visible_titles(cls, survey, comments):
         """Add unique labels to titles list in order of appearance."""
-        visible_titles = []
-        for comment in comments:
-            label = comment['label']
-            if label not in [title['label'] for title in visible_titles]:
-                visible_titles.append({'label': label})
-
-        return [title for title in cls.get_titles(survey) if title in visible_titles]
+        visible_labels = {comment['label'] for comment in comments}
+        return [title for title in cls.get_titles(survey) if title['label'] in visible_labels]
 
     @classmethod
     def sort_comments_by_titles(cls, titles, grouped_comments):
         """Sort commentText within each group based on the order of titles."""
         for group in grouped_comments:
+            comments_by_label = defaultdict(list)
+            for comment in group['commentText']:
+                comments_by_label[comment['label']].append(comment)
+
             sorted_comment_text = []
             for title in titles:
                 label = title['label']
-                matching_comments = [comment for comment in group['commentText'] if comment['label'] == label]
+                matching_comments = comments_by_label.get(label)
                 if not matching_comments:
                     sorted_comment_text.append({'text': '', 'label': label})
                 else:
@@ -313,56 +365,30 @@ class CommentService:
     @classmethod
     def format_comments(cls, comments):
         """Format comments."""
-        # Create a dictionary to store comments grouped by labels
-        comments_by_label = {}
-
-        # Create a list to store unique titles in order of appearance
-        unique_titles = []
-
-        # Iterate over the input data
+        # Comments grouped by label, the labels being kept in order of appearance
+        comments_by_label = defaultdict(list)
         for comment in comments:
             # Get the submission_id, or an empty string if it's missing
             submission_id = comment.get('submission_id', '')
-            label = comment['label']
             text = comment.get('text', '')  # Get the text, or an empty string if it's missing
-
-            # If the label is not already in unique_titles, add it
-            if label not in unique_titles:
-                unique_titles.append(label)
-
-            # If label is not in comments_by_label, create an empty list for it
-            if label not in comments_by_label:
-                comments_by_label[label] = []
-
-            # Append the comment to the corresponding label in comments_by_label
-            comments_by_label[label].append({'text': text, 'submission_id': submission_id})
+            comments_by_label[comment['label']].append({'text': text, 'submission_id': submission_id})
 
         # Create a list of titles with label information in order of appearance
-        titles = [{'label': title, 'proponent_answers': 'Proponent Answer'} for title in unique_titles]
-
-        # Create a list of comments organized by label order
-        formatted_comments = []
-        row_id = 1
-
-        # Iterate over each row_id until there are no more comments
-        while any(comments_by_label.get(title['label']) for title in titles):
-            comment_row = {'row_id': row_id, 'commentText': []}
-
-            for title in titles:
-                label = title['label']
-                label_comments = comments_by_label.get(label, [{'text': '', 'submission_id': ''}])
-                # If there are comments for this label, pop the first one
-                if label_comments:
-                    comment_text = label_comments.pop(0)
-                else:
-                    # If there are no comments for this label, use a default empty text
-                    comment_text = {'text': '', 'submission_id': ''}
-
-                comment_row['commentText'].append(comment_text)
-
-            # Append the comment row to the list of comments
-            formatted_comments.append(comment_row)
-            row_id += 1
+        titles = [{'label': label, 'proponent_answers': 'Proponent Answer'} for label in comments_by_label]
+
+        # Each row holds the next comment of every label, or a blank text once a label runs out of comments
+        label_comments = list(comments_by_label.values())
+        row_count = max((len(answers) for answers in label_comments), default=0)
+        formatted_comments = [
+            {
+                'row_id': index + 1,
+                'commentText': [
+                    answers[index] if index < len(answers) else {'text': '', 'submission_id': ''}
+                    for answers in label_comments
+                ]
+            }
+            for index in range(row_count)
+        ]
 
         # Create the final output structure
         return {'titles': titles, 'comments': formatted_comments}
@@ -15,11 +15,13 @@
 
 """Service for document generation."""
 import os
+from http import HTTPStatus
 
 from flask import current_app
 
 from met_api.models.generated_document_template import GeneratedDocumentTemplate
 from met_api.services.cdogs_api_service import CdogsApiService
+from met_api.services.reference_data_service import DocumentTemplateRecord, ReferenceDataService
 
 
 class DocumentGenerationService:  # pylint:disable=too-few-public-methods
@@ -38,35 +40,13 @@ class DocumentGenerationService:  # pylint:disable=too-few-public-methods
         if not document_type:
             raise ValueError('Document type not provided')
 
-        document_template: GeneratedDocumentTemplate = GeneratedDocumentTemplate() \
-            .get_template_by_type(type_id=document_type)
+        document_template = ReferenceDataService.get_document_template(document_type)
         if document_template is None:
             raise ValueError('Template not saved in DB')
 
-        template_cached = False
-        if document_template.hash_code:
-            current_app.logger.info('Checking if template %s is cached', document_template.hash_code)
-            template_cached = self.cdgos_api_service.check_template_cached(document_template.hash_code)
-
-        if document_template.hash_code is None or not template_cached:
-            current_app.logger.info('Uploading new template')
-
-            template_name = options.get('template_name')
-            file_dir = os.path.dirname(os.path.realpath('__file__'))
-            document_template_path = os.path.join(
-                file_dir,
-                'src/met_api/generated_documents_carbone_templates/',
-                template_name
-            )
-
-            if not os.path.exists(document_template_path):
-                raise ValueError('Template file does not exist')
-
-            new_hash_code = self.cdgos_api_service.upload_template(template_file_path=document_template_path)
-            if not new_hash_code:
-                raise ValueError('Unable to obtain valid hashcode')
-            document_template.hash_code = new_hash_code
-            document_template.save()
+        hash_code = document_template.hash_code
+        if not self._is_template_available(hash_code):
+            hash_code = self._upload_template(document_template, options)
 
         generator_options = {
                 'cachereport': False,
@@ -76,8 +56,51 @@ class DocumentGenerationService:  # pylint:disable=too-few-public-methods
         }
 
         current_app.logger.info('Generating document')
-        return self.cdgos_api_service.generate_document(
-            template_hash_code=document_template.hash_code,
+        response = self.cdgos_api_service.generate_document(
+            template_hash_code=hash_code,
             data=data,
             options=generator_options
         )
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            # CDOGS no longer has the template, upload it again
+            current_app.logger.info('Template %s not found', hash_code)
+            hash_code = self._upload_template(document_template, options)
+            response = self.cdgos_api_service.generate_document(
+                template_hash_code=hash_code,
+                data=data,
+                options=generator_options
+            )
+        return response
+
+    def _is_template_available(self, hash_code):
+        """Return True if CDOGS has the template, checking it only when it was not verified recently."""
+        if not hash_code:
+            return False
+        if self.cdgos_api_service.is_template_verified(hash_code):
+            return True
+        current_app.logger.info('Checking if template %s is cached', hash_code)
+        return self.cdgos_api_service.check_template_cached(hash_code)
+
+    def _upload_template(self, document_template: DocumentTemplateRecord, options) -> str:
+        """Upload the template file, save its hash code and return it."""
+        current_app.logger.info('Uploading new template')
+
+        template_name = options.get('template_name')
+        file_dir = os.path.dirname(os.path.realpath('__file__'))
+        document_template_path = os.path.join(
+            file_dir,
+            'src/met_api/generated_documents_carbone_templates/',
+            template_name
+        )
+
+        if not os.path.exists(document_template_path):
+            raise ValueError('Template file does not exist')
+
+        new_hash_code = self.cdgos_api_service.upload_template(template_file_path=document_template_path)
+        if not new_hash_code:
+            raise ValueError('Unable to obtain valid hashcode')
+        template_model = GeneratedDocumentTemplate.find_by_id(document_template.id)
+        template_model.hash_code = new_hash_code
+        template_model.save()
+        ReferenceDataService.invalidate()
+        return new_hash_code
@@ -0,0 +1,106 @@
+"""Service for sending the emails of the outbox."""
+from collections import Counter
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from typing import List, Optional
+
+from flask import current_app
+
+from met_api.constants.email_outbox_status import EmailOutboxStatus
+from met_api.models.db import db
+from met_api.models.email_outbox import EmailOutbox
+from met_api.utils import notification
+
+
+# Responses of the notification service after which sending the same email again can succeed
+RETRIED_STATUS_CODES = (HTTPStatus.UNAUTHORIZED, HTTPStatus.REQUEST_TIMEOUT, HTTPStatus.TOO_MANY_REQUESTS)
+
+
+class EmailOutboxService:
+    """Email outbox dispatch service."""
+
+    @classmethod
+    def dispatch(cls, max_batches: int = 100) -> Counter:
+        """Send the emails due, a batch at a time, until none is due or max_batches were sent.
+
+        Each batch is leased in its own transaction and sent in a single request to the notification service, after
+        which the status of its emails is committed, so that concurrent dispatchers never send the same email and a
+        stopped dispatcher leaves at most its current batch to be sent again. Returns the number of emails by
+        resulting status.
+        """
+        config = current_app.config
+        lease = timedelta(seconds=config['EMAIL_OUTBOX_LEASE'])
+        totals = Counter()
+        for _ in range(max_batches):
+            emails = EmailOutbox.claim_due(config['EMAIL_OUTBOX_BATCH_SIZE'], lease)
+            db.session.commit()
+            if not emails:
+                break
+            for email in emails:
+                if not notification.is_allowed_email(email.email_address):
+                    totals[cls._record(email, 'The email is not allowed in this environment.', False).name] += 1
+            emails = [email for email in emails if email.status == EmailOutboxStatus.SENDING]
+            for email, result in zip(emails, cls._send_batch(emails)):
+                if result['status'] == EmailOutboxStatus.SENT.name:
+                    totals[cls._record(email).name] += 1
+                else:
+                    retried = _is_retried_status(result.get('status_code'))
+                    totals[cls._record(email, result['error'], retried).name] += 1
+            db.session.commit()
+
+        if retention_days := config['EMAIL_OUTBOX_RETENTION_DAYS']:
+            totals['PURGED'] = EmailOutbox.purge_sent(datetime.utcnow() - timedelta(days=retention_days))
+            db.session.commit()
+        return totals
+
+    @staticmethod
+    def _send_batch(emails: List[EmailOutbox]) -> List[dict]:
+        """Send the emails, returning the result of each.
+
+        When the request itself fails, every email of the batch fails with its error, and is retried.
+        """
+        if not emails:
+            return []
+        try:
+            return notification.send_email_batch([{
+                'subject': email.subject,
+                'email': email.email_address,
+                'html_body': email.html_body,
+                'args': email.args,
+                'template_id': email.template_id,
+                'reference': email.idempotency_key,
+            } for email in emails])
+        except Exception as exc:  # NOQA # pylint:disable=broad-except
+            current_app.logger.warning('<Sending a batch of %s emails of the outbox failed: %s', len(emails), exc)
+            return [{'status': EmailOutboxStatus.FAILED.name, 'error': str(exc) or type(exc).__name__}] * len(emails)
+
+    @staticmethod
+    def _record(email: EmailOutbox, error: Optional[str] = None, retried: bool = True) -> EmailOutboxStatus:
+        """Record the status of an email once sent, and when it failed the time of its next attempt."""
+        config = current_app.config
+        if error is None:
+            email.status = EmailOutboxStatus.SENT
+            email.sent_date = datetime.utcnow()
+            email.last_error = None
+            return email.status
+
+        email.last_error = error
+        if email.attempts >= config['EMAIL_OUTBOX_MAX_ATTEMPTS'] or not retried:
+            current_app.logger.error('<Email %s of the outbox failed after %s attempts: %s', email.id, email.attempts,
+                                     error)
+            email.status = EmailOutboxStatus.FAILED
+        else:
+            delay = min(config['EMAIL_OUTBOX_RETRY_DELAY'] * 2 ** (email.attempts - 1),
+                        config['EMAIL_OUTBOX_MAX_RETRY_DELAY'])
+            email.status = EmailOutboxStatus.PENDING
+            email.next_attempt_date = datetime.utcnow() + timedelta(seconds=delay)
+        return email.status
+
+
+def _is_retried_status(status_code: Optional[int]) -> bool:
+    """Return False for the rejections of the provider which sending the same email again would repeat.
+
+    An email failing without a status code, as when the provider could not be reached, is retried.
+    """
+    return status_code is None or status_code >= HTTPStatus.INTERNAL_SERVER_ERROR or \
+        status_code in RETRIED_STATUS_CODES
@@ -12,6 +12,7 @@ from met_api.models import Engagement as EngagementModel
 from met_api.models import EngagementSlug as EngagementSlugModel
 from met_api.models import Survey as SurveyModel
 from met_api.models import Tenant as TenantModel
+from met_api.models.db import db
 from met_api.models.email_verification import EmailVerification
 from met_api.schemas.email_verification import EmailVerificationSchema
 from met_api.services.participant_service import ParticipantService
@@ -64,12 +65,15 @@ class EmailVerificationService:
             'participant_id')
         verification_token = uuid.uuid4()
         email_verification['verification_token'] = verification_token
-        EmailVerification.create(email_verification, session)
+        # the email is queued in the transaction of the verification, so both are committed together
+        EmailVerification.create(email_verification, session or db.session)
 
         # TODO: remove this once email logic is brought over from submission service to here
         if email_verification.get('type', None) != EmailVerificationType.RejectedComment:
             cls._send_verification_email(email_verification, subscription_type)
 
+        if session is None:
+            db.session.commit()
         return email_verification
 
     @classmethod
@@ -116,8 +120,8 @@ class EmailVerificationService:
             participant_id
         )
         try:
-            # user hasn't been created yet.so create token using SA.
-            notification.send_email(
+            notification.queue_email(
+                idempotency_key=f'email_verification_{email_verification.get("verification_token")}',
                 subject=subject, email=email_to, html_body=body, args=args, template_id=template_id)
         except Exception as exc:  # noqa: B902
             current_app.logger.error(
@@ -4,12 +4,12 @@ from http import HTTPStatus
 from sqlalchemy.exc import IntegrityError
 from met_api.constants.membership_type import MembershipType
 from met_api.models.engagement_content_translation import EngagementContentTranslation as ECTranslationModel
-from met_api.models.language import Language as LanguageModel
 from met_api.schemas.engagement_content_translation import EngagementContentTranslationSchema as ECTranslationSchema
 from met_api.services import authorization
 from met_api.utils.roles import Role
 from met_api.exceptions.business_exception import BusinessException
 from met_api.services.engagement_content_service import EngagementContentService
+from met_api.services.reference_data_service import ReferenceDataService
 
 
 class EngagementContentTranslationService:
@@ -35,7 +35,7 @@ class EngagementContentTranslationService:
     def create_engagement_content_translation(translation_data, pre_populate=True):
         """Create engagement content translation."""
         try:
-            language_record = LanguageModel.find_by_id(translation_data['language_id'])
+            language_record = ReferenceDataService.get_language(translation_data['language_id'])
             if not language_record:
                 raise ValueError('Language not found')
 
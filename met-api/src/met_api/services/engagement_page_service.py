@@ -0,0 +1,225 @@
+"""Service assembling the public page of an engagement."""
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from met_api.constants.widget import WidgetType
+from met_api.models import db
+from met_api.models.contact import Contact as ContactModel
+from met_api.models.engagement_content import EngagementContent as EngagementContentModel
+from met_api.models.engagement_content_translation import EngagementContentTranslation as ECTranslationModel
+from met_api.models.engagement_custom_content import EngagementCustom as EngagementCustomModel
+from met_api.models.engagement_slug import EngagementSlug as EngagementSlugModel
+from met_api.models.engagement_summary_content import EngagementSummary as EngagementSummaryModel
+from met_api.models.engagement_translation import EngagementTranslation as EngagementTranslationModel
+from met_api.models.event_item import EventItem as EventItemModel
+from met_api.models.event_item_translation import EventItemTranslation as EventItemTranslationModel
+from met_api.models.poll_answer_translation import PollAnswerTranslation as PollAnswerTranslationModel
+from met_api.models.poll_answers import PollAnswer as PollAnswerModel
+from met_api.models.subscribe_item import SubscribeItem as SubscribeItemModel
+from met_api.models.subscribe_item_translation import SubscribeItemTranslation as SubscribeItemTranslationModel
+from met_api.models.timeline_event import TimelineEvent as TimelineEventModel
+from met_api.models.timeline_event_translation import TimelineEventTranslation as TimelineEventTranslationModel
+from met_api.models.widget import Widget as WidgetModel
+from met_api.models.widget_documents import WidgetDocuments as WidgetDocumentsModel
+from met_api.models.widget_events import WidgetEvents as WidgetEventsModel
+from met_api.models.widget_map import WidgetMap as WidgetMapModel
+from met_api.models.widget_poll import Poll as PollModel
+from met_api.models.widget_timeline import WidgetTimeline as WidgetTimelineModel
+from met_api.models.widget_translation import WidgetTranslation as WidgetTranslationModel
+from met_api.models.widget_video import WidgetVideo as WidgetVideoModel
+from met_api.models.widgets_subscribe import WidgetSubscribe as WidgetSubscribeModel
+from met_api.schemas.contact import ContactSchema
+from met_api.schemas.engagement_content import EngagementContentSchema
+from met_api.schemas.engagement_content_translation import EngagementContentTranslationSchema as ECTranslationSchema
+from met_api.schemas.engagement_custom_content import EngagementCustomSchema
+from met_api.schemas.engagement_summary_content import EngagementSummarySchema
+from met_api.schemas.engagement_translation import EngagementTranslationSchema
+from met_api.schemas.event_item_translation_schema import EventItemTranslationSchema
+from met_api.schemas.poll_answer_translation_schema import PollAnswerTranslationSchema
+from met_api.schemas.subscribe_item_translation_schema import SubscribeItemTranslationSchema
+from met_api.schemas.timeline_event_translation_schema import TimelineEventTranslationSchema
+from met_api.schemas.widget import WidgetSchema
+from met_api.schemas.widget_events import WidgetEventsSchema
+from met_api.schemas.widget_map import WidgetMapSchema
+from met_api.schemas.widget_poll import WidgetPollSchema
+from met_api.schemas.widget_subscribe import WidgetSubscribeSchema
+from met_api.schemas.widget_timeline import WidgetTimelineSchema
+from met_api.schemas.widget_translation import WidgetTranslationSchema
+from met_api.schemas.widget_video import WidgetVideoSchema
+from met_api.services.engagement_service import EngagementService
+from met_api.services.object_storage_service import ObjectStorageService
+from met_api.services.widget_documents_service import WidgetDocumentService
+
+
+# Sections of the page, all of them returned unless some are selected
+PAGE_FIELDS = ('engagement', 'slug', 'contents', 'widgets', 'translations')
+
+# Widget type -> model and schema of the details returned by the endpoint of the widget type
+WIDGET_DETAILS = {
+    WidgetType.SUBSCRIBE.value: (WidgetSubscribeModel, WidgetSubscribeSchema),
+    WidgetType.EVENTS.value: (WidgetEventsModel, WidgetEventsSchema),
+    WidgetType.Map.value: (WidgetMapModel, WidgetMapSchema),
+    WidgetType.Video.value: (WidgetVideoModel, WidgetVideoSchema),
+    WidgetType.Timeline.value: (WidgetTimelineModel, WidgetTimelineSchema),
+    WidgetType.Poll.value: (PollModel, WidgetPollSchema),
+}
+
+
+class EngagementPageService:
+    """Engagement page service.
+
+    Assembles what the public page of an engagement otherwise loads with a request per content, widget and
+    translation, with one query per kind of row for the whole engagement.
+    """
+
+    def __init__(self):
+        """Initialize."""
+        self.object_storage = ObjectStorageService()
+
+    def get_engagement_page(self, engagement_id, language_id=None, fields: Optional[Iterable[str]] = None):
+        """Get the engagement, slug, contents, widgets and translations shown on the page of an engagement.
+
+        The details of each widget are those returned by the endpoint of its widget type. The translations are
+        included only for a language.
+        """
+        fields = self._get_fields(fields)
+        engagement_service = EngagementService()
+        engagement_model = engagement_service.find_visible_engagement(engagement_id)
+        if not engagement_model:
+            return None
+
+        page = {}
+        if 'engagement' in fields:
+            page['engagement'] = engagement_service.dump_engagement(engagement_model)
+        if 'slug' in fields:
+            engagement_slug = EngagementSlugModel.find_by_engagement_id(engagement_id)
+            page['slug'] = engagement_slug.slug if engagement_slug else ''
+        if 'contents' in fields:
+            page['contents'] = self._get_contents(engagement_id)
+        if 'widgets' in fields:
+            page['widgets'] = self._get_widgets(engagement_id)
+        if 'translations' in fields and language_id is not None:
+            page['translations'] = self._get_translations(engagement_id, language_id)
+        return page
+
+    @staticmethod
+    def _get_fields(fields: Optional[Iterable[str]]) -> set:
+        if not fields:
+            return set(PAGE_FIELDS)
+        fields = set(fields)
+        if unknown_fields := fields.difference(PAGE_FIELDS):
+            raise ValueError(f'Unknown engagement page fields: {", ".join(sorted(unknown_fields))}')
+        return fields
+
+    @staticmethod
+    def _get_contents(engagement_id) -> list:
+        """Get the contents of the engagement, each with its summary and custom content."""
+        contents = EngagementContentModel.get_contents_by_engagement_id(engagement_id)
+        content_ids = [content.id for content in contents]
+        summaries = _group_by(EngagementSummaryModel.engagement_content_id, EngagementSummarySchema(many=True),
+                              _find_by(EngagementSummaryModel.engagement_content_id, content_ids))
+        custom_contents = _group_by(EngagementCustomModel.engagement_content_id, EngagementCustomSchema(many=True),
+                                    _find_by(EngagementCustomModel.engagement_content_id, content_ids))
+        return [
+            {
+                **content,
+                'summary': summaries.get(content['id'], []),
+                'custom': custom_contents.get(content['id'], []),
+            }
+            for content in EngagementContentSchema(many=True).dump(contents)
+        ]
+
+    def _get_widgets(self, engagement_id) -> list:
+        """Get the widgets of the engagement, each with the details of its widget type."""
+        widget_models = WidgetModel.get_widgets_by_engagement_id(engagement_id)
+        widgets = WidgetSchema(many=True).dump(widget_models)
+
+        widgets_by_type = defaultdict(list)
+        for widget in widget_models:
+            widgets_by_type[widget.widget_type_id].append(widget)
+        details = {}
+        for widget_type, widgets_of_type in widgets_by_type.items():
+            widget_ids = [widget.id for widget in widgets_of_type]
+            if widget_type == WidgetType.WHO_IS_LISTENING.value:
+                details.update(self._get_contacts(widgets_of_type))
+            elif widget_type == WidgetType.DOCUMENTS.value:
+                details.update(self._get_documents(widget_ids))
+            elif widget_type in WIDGET_DETAILS:
+                model, schema = WIDGET_DETAILS[widget_type]
+                order_by = (model.sort_index,) if hasattr(model, 'sort_index') else ()
+                details.update(_group_by(model.widget_id, schema(many=True),
+                                         _find_by(model.widget_id, widget_ids, *order_by)))
+
+        for widget in widgets:
+            widget['details'] = details.get(widget['id'], [])
+        return widgets
+
+    def _get_contacts(self, widgets: list) -> dict:
+        """Get the contacts listed by the who is listening widgets, in the order of their items."""
+        widget_items = [item for widget in widgets for item in widget.items]
+        contact_models = _find_by(ContactModel.id, [item.widget_data_id for item in widget_items])
+        contacts = {
+            contact['id']: {**contact, 'avatar_url': self.object_storage.get_url(contact.get('avatar_filename', None))}
+            for contact in ContactSchema(many=True).dump(contact_models)
+        }
+        contacts_by_widget = defaultdict(list)
+        for item in widget_items:
+            if contact := contacts.get(item.widget_data_id):
+                contacts_by_widget[item.widget_id].append(contact)
+        return contacts_by_widget
+
+    @staticmethod
+    def _get_documents(widget_ids: list) -> dict:
+        """Get the folders and files of the documents widgets."""
+        documents_by_widget = defaultdict(list)
+        for document in _find_by(WidgetDocumentsModel.widget_id, widget_ids):
+            documents_by_widget[document.widget_id].append(document)
+        return {
+            widget_id: WidgetDocumentService.get_documents_tree(documents_by_widget[widget_id])
+            for widget_id in widget_ids
+        }
+
+    @staticmethod
+    def _get_translations(engagement_id, language_id) -> dict:
+        """Get the translations to the language of the engagement, its contents, widgets and widget items."""
+        def find_translations(model, engagement_column, *joins):
+            query = db.session.query(model)
+            for join_model in joins:
+                query = query.join(join_model)
+            return query.filter(engagement_column == engagement_id, model.language_id == language_id)\
+                .order_by(model.id)\
+                .all()
+
+        return {
+            'engagement': EngagementTranslationSchema(many=True).dump(find_translations(
+                EngagementTranslationModel, EngagementTranslationModel.engagement_id)),
+            'contents': ECTranslationSchema(many=True).dump(find_translations(
+                ECTranslationModel, EngagementContentModel.engagement_id, EngagementContentModel)),
+            'widgets': WidgetTranslationSchema(many=True).dump(find_translations(
+                WidgetTranslationModel, WidgetModel.engagement_id, WidgetModel)),
+            'poll_answers': PollAnswerTranslationSchema(many=True).dump(find_translations(
+                PollAnswerTranslationModel, PollModel.engagement_id, PollAnswerModel, PollModel)),
+            'event_items': EventItemTranslationSchema(many=True).dump(find_translations(
+                EventItemTranslationModel, WidgetModel.engagement_id, EventItemModel, WidgetEventsModel, WidgetModel)),
+            'subscribe_items': SubscribeItemTranslationSchema(many=True).dump(find_translations(
+                SubscribeItemTranslationModel, WidgetModel.engagement_id, SubscribeItemModel, WidgetSubscribeModel,
+                WidgetModel)),
+            'timeline_events': TimelineEventTranslationSchema(many=True).dump(find_translations(
+                TimelineEventTranslationModel, TimelineEventModel.engagement_id, TimelineEventModel)),
+        }
+
+
+def _find_by(column, values: list, *order_by) -> list:
+    """Get the models whose column is one of the values, with a single query."""
+    if not values:
+        return []
+    model = column.class_
+    return db.session.query(model).filter(column.in_(values)).order_by(*order_by, model.id).all()
+
+
+def _group_by(column, schema, models: list) -> dict:
+    """Dump the models at once, so that their relationships are batch loaded, and group them by the column."""
+    grouped = defaultdict(list)
+    for model, dumped in zip(models, schema.dump(models)):
+        grouped[getattr(model, column.key)].append(dumped)
+    return grouped
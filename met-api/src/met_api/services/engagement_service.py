@@ -1,6 +1,7 @@
 """Service for engagement management."""
 from datetime import datetime
 from http import HTTPStatus
+from typing import Optional
 
 from flask import current_app
 
@@ -9,6 +10,7 @@ from met_api.constants.engagement_status import Status
 from met_api.constants.membership_type import MembershipType
 from met_api.exceptions.business_exception import BusinessException
 from met_api.models.engagement import Engagement as EngagementModel
+from met_api.models.engagement_metadata import parse_metadata_facet
 from met_api.models.engagement_scope_options import EngagementScopeOptions
 from met_api.models.engagement_slug import EngagementSlug as EngagementSlugModel
 from met_api.models.engagement_status_block import EngagementStatusBlock as EngagementStatusBlockModel
@@ -22,7 +24,7 @@ from met_api.services.engagement_content_service import EngagementContentService
 from met_api.services.engagement_summary_content_service import EngagementSummaryContentService
 from met_api.services.object_storage_service import ObjectStorageService
 from met_api.services.project_service import ProjectService
-from met_api.utils import email_util, notification
+from met_api.utils import authorization_cache, email_util, notification
 from met_api.utils.enums import SourceAction, SourceType
 from met_api.utils.roles import Role
 from met_api.utils.template import Template
@@ -41,6 +43,14 @@ class EngagementService:
 
     def get_engagement(self, engagement_id) -> EngagementSchema:
         """Get Engagement by the id."""
+        engagement_model = self.find_visible_engagement(engagement_id)
+        if engagement_model:
+            return self.dump_engagement(engagement_model)
+        return None
+
+    @staticmethod
+    def find_visible_engagement(engagement_id) -> Optional[EngagementModel]:
+        """Get the engagement model by the id, if the user has access to it."""
         engagement_model: EngagementModel = EngagementModel.find_by_id(engagement_id)
 
         if engagement_model:
@@ -55,11 +65,13 @@ class EngagementService:
                     Role.VIEW_ALL_ENGAGEMENTS.value
                 )
                 authorization.check_auth(one_of_roles=one_of_roles, engagement_id=engagement_id)
+        return engagement_model
 
-            engagement = EngagementSchema().dump(engagement_model)
-            engagement['banner_url'] = self.object_storage.get_url(engagement['banner_filename'])
-            return engagement
-        return None
+    def dump_engagement(self, engagement_model: EngagementModel) -> dict:
+        """Serialize the engagement along with the url of its banner."""
+        engagement = EngagementSchema().dump(engagement_model)
+        engagement['banner_url'] = self.object_storage.get_url(engagement['banner_filename'])
+        return engagement
 
     def get_engagements_paginated(
             self,
@@ -73,22 +85,41 @@ class EngagementService:
         has_team_access = search_options.get('has_team_access')
         scope_options = self._get_scope_options(user_roles, has_team_access)
 
-        items, total = EngagementModel.get_engagements_paginated(
+        page = EngagementModel.get_engagements_paginated(
             external_user_id,
             pagination_options,
             scope_options,
             search_options,
         )
         engagements_schema = EngagementSchema(many=True)
-        engagements = engagements_schema.dump(items)
+        engagements = engagements_schema.dump(page.items)
 
         if include_banner_url:
             engagements = self._attach_banner_url(engagements)
         return {
             'items': engagements,
-            'total': total
+            'total': page.total,
+            'next_cursor': page.next_cursor
         }
 
+    def get_metadata_facets(self, external_user_id, search_options=None) -> list:
+        """Get the number of engagements matching the search for each metadata value, grouped by taxon."""
+        search_options = search_options or {}
+        scope_options = self._get_scope_options(TokenInfo.get_user_roles(), search_options.get('has_team_access'))
+        facet_counts = EngagementModel.get_metadata_facet_counts(external_user_id, scope_options, search_options)
+
+        values_by_taxon = {}
+        for facet, count in facet_counts:
+            taxon_id, value = parse_metadata_facet(facet)
+            values_by_taxon.setdefault(taxon_id, []).append({'value': value, 'count': count})
+        return [
+            {
+                'taxon_id': taxon_id,
+                'values': sorted(values, key=lambda value: (-value['count'], value['value'])),
+            }
+            for taxon_id, values in sorted(values_by_taxon.items())
+        ]
+
     def _attach_banner_url(self, engagements: list):
         for engagement in engagements:
             engagement['banner_url'] = self.object_storage.get_url(engagement['banner_filename'])
@@ -291,6 +322,8 @@ class EngagementService:
             updated_engagement = EngagementModel.edit_engagement(data)
             if not updated_engagement:
                 raise ValueError('Engagement to update was not found')
+            if 'tenant_id' in data:
+                authorization_cache.invalidate_engagement_tenant(engagement_id)
 
             has_epic_fields_getting_updated = 'end_date' in data or 'start_date' in data
             if has_epic_fields_getting_updated:
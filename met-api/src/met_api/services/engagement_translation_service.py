@@ -10,10 +10,10 @@ from met_api.models.engagement_slug import EngagementSlug as EngagementSlugModel
 from met_api.models.engagement_status_block import EngagementStatusBlock as EngagementStatusBlockModel
 from met_api.models.engagement_summary_content import EngagementSummary as EngagementSummaryModel
 from met_api.models.engagement_translation import EngagementTranslation as EngagementTranslationModel
-from met_api.models.language import Language as LanguageModel
 from met_api.schemas.language import LanguageSchema
 from met_api.schemas.engagement_translation import EngagementTranslationSchema
 from met_api.services import authorization
+from met_api.services.reference_data_service import ReferenceDataService
 from met_api.utils.roles import Role
 
 
@@ -54,7 +54,7 @@ class EngagementTranslationService:
             )
             authorization.check_auth(one_of_roles=one_of_roles, engagement_id=engagement.id)
 
-            language_record = LanguageModel.find_by_id(translation_data['language_id'])
+            language_record = ReferenceDataService.get_language(translation_data['language_id'])
             if not language_record:
                 raise ValueError('Language to translate was not found')
 
@@ -23,14 +23,15 @@ class FeedbackService:
                                ):
         """Get feedbacks paginated."""
         feedback_schema = FeedbackSchema(many=True)
-        items, total = Feedback.get_all_paginated(
+        page = Feedback.get_all_paginated(
             pagination_options,
             search_text,
             status,
         )
         return {
-            'items': feedback_schema.dump(items),
-            'total': total
+            'items': feedback_schema.dump(page.items),
+            'total': page.total,
+            'next_cursor': page.next_cursor
         }
 
     @classmethod
@@ -0,0 +1,69 @@
+"""Service for the identity of the authenticated user.
+
+The staff user, tenant group and tenant roles of the user are needed by the role callback of the JWT manager and by
+the authorization checks, which run several times per request. They are resolved once per request and kept on g.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from flask import g, has_request_context
+
+from met_api.models import db
+from met_api.models.group_role_mapping import GroupRoleMapping
+from met_api.models.staff_user import StaffUser as StaffUserModel
+from met_api.models.user_group_membership import UserGroupMembership
+from met_api.models.user_role import UserRole
+
+
+IDENTITY_CONTEXTS = 'identity_contexts'
+
+
+@dataclass
+class IdentityContext:
+    """The staff user and tenant roles of an authenticated user."""
+
+    external_id: str
+    tenant_id: Optional[int]
+    staff_user: Optional[StaffUserModel] = None
+    group_name: Optional[str] = None
+    tenant_roles: List[str] = field(default_factory=list)
+
+
+class IdentityService:
+    """Identity resolution service."""
+
+    @classmethod
+    def get_context(cls, external_id: str, tenant_id: Optional[int]) -> IdentityContext:
+        """Return the identity of the user within the tenant, resolving it once per request."""
+        if not has_request_context():
+            return cls._resolve(external_id, tenant_id)
+        contexts: Dict[Tuple[str, Optional[int]], IdentityContext] = g.setdefault(IDENTITY_CONTEXTS, {})
+        key = (external_id, tenant_id)
+        if key not in contexts:
+            contexts[key] = cls._resolve(external_id, tenant_id)
+        return contexts[key]
+
+    @staticmethod
+    def clear_context():
+        """Forget the identities resolved by the request, after the staff users or their groups change."""
+        if has_request_context():
+            g.pop(IDENTITY_CONTEXTS, None)
+
+    @staticmethod
+    def _resolve(external_id: str, tenant_id: Optional[int]) -> IdentityContext:
+        """Load the active staff user, the group of the user within the tenant and the roles of the group."""
+        context = IdentityContext(
+            external_id=external_id,
+            tenant_id=tenant_id,
+            staff_user=StaffUserModel.get_user_by_external_id(external_id),
+        )
+        membership = UserGroupMembership.get_group_by_user_id(external_id, tenant_id)
+        if membership:
+            context.group_name = membership.groups.name
+            roles = db.session.query(UserRole.name) \
+                .join(GroupRoleMapping, GroupRoleMapping.role_id == UserRole.id) \
+                .filter(GroupRoleMapping.group_id == membership.group_id) \
+                .order_by(UserRole.id) \
+                .all()
+            context.tenant_roles = [role.name for role in roles]
+        return context
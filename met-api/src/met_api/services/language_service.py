@@ -9,6 +9,8 @@ from met_api.models.language_tenant_mapping import LanguageTenantMapping
 from met_api.schemas.language import LanguageSchema
 from met_api.schemas.language_tenant_mapping import LanguageTenantMappingSchema
 from met_api.services import authorization
+from met_api.services.reference_data_service import ReferenceDataService
+from met_api.services.tenant_service import TenantService
 from met_api.utils.roles import Role
 
 
@@ -18,13 +20,13 @@ class LanguageService:
     @staticmethod
     def get_language_by_id(language_id):
         """Get language by id."""
-        language_record = Language.find_by_id(language_id)
+        language_record = ReferenceDataService.get_language(language_id)
         return LanguageSchema().dump(language_record)
 
     @staticmethod
     def get_languages():
         """Get languages."""
-        languages_records = Language.get_languages()
+        languages_records = ReferenceDataService.get_languages()
         return LanguageSchema(many=True).dump(languages_records)
 
     @staticmethod
@@ -33,6 +35,7 @@ class LanguageService:
         updated_language = Language.update_language(language_id, data)
         if not updated_language:
             raise ValueError('Language to update was not found')
+        ReferenceDataService.invalidate()
         return updated_language
 
     @classmethod
@@ -49,6 +52,7 @@ class LanguageService:
             language_mapping.add_language_to_tenant(language_id, tenant.id)
         except SQLAlchemyError as e:
             raise ValueError('Error adding language to tenant.') from e
+        ReferenceDataService.invalidate()
         return LanguageTenantMappingSchema().dump(language_mapping)
 
     @classmethod
@@ -65,9 +69,13 @@ class LanguageService:
         except SQLAlchemyError as e:
             current_app.logger.error('Error deleting tenant {}', e)
             raise ValueError('Error deleting tenant.') from e
+        ReferenceDataService.invalidate()
         return {'status': 'success', 'message': 'Tenant deleted successfully'}
 
-    @staticmethod
-    def get_languages_by_tenant(tenant_short_name: str):
+    @classmethod
+    def get_languages_by_tenant(cls, tenant_short_name: str):
         """Get all languages associated with a given tenant."""
-        return LanguageTenantMapping.get_all_by_tenant_short_name(tenant_short_name)
+        tenant = TenantService.get_cached(tenant_short_name)
+        if not tenant:
+            raise ValueError('Error finding tenant.', cls, tenant_short_name)
+        return ReferenceDataService.get_tenant_languages(tenant['id'])
@@ -12,6 +12,7 @@ from met_api.schemas.staff_user import StaffUserSchema
 from met_api.services import authorization
 from met_api.services.staff_user_service import StaffUserService
 from met_api.services.user_group_membership_service import UserGroupMembershipService
+from met_api.utils import authorization_cache
 from met_api.utils.constants import CompositeRoles
 from met_api.utils.enums import CompositeRoleId, MembershipStatus
 from met_api.utils.roles import Role
@@ -141,6 +142,7 @@ class MembershipService:
             user_id,
             new_membership_details
         )
+        authorization_cache.invalidate_engagement_memberships(user_id, engagement_id)
         return new_membership
 
     @staticmethod
@@ -214,6 +216,7 @@ class MembershipService:
             membership.user_id,
             new_membership_details
         )
+        authorization_cache.invalidate_engagement_memberships(membership.user_id, membership.engagement_id)
 
         return new_membership
 
@@ -234,16 +237,21 @@ class MembershipService:
             membership.user_id,
             new_membership_details
         )
+        authorization_cache.invalidate_engagement_memberships(membership.user_id, membership.engagement_id)
         return new_membership
 
     @staticmethod
     def revoke_memberships_bulk(user_id: int):
         """Revoke memberships in bulk."""
         revoked_memberships = MembershipModel.revoke_memberships_bulk(user_id)
+        authorization_cache.invalidate_engagement_memberships(
+            user_id, *(membership.engagement_id for membership in revoked_memberships))
         return revoked_memberships
 
     @staticmethod
     def deactivate_memberships_bulk(user_id: int):
         """Revoke memberships in bulk."""
         revoked_memberships = MembershipModel.deactivate_memberships_bulk(user_id)
+        authorization_cache.invalidate_engagement_memberships(
+            user_id, *(membership.engagement_id for membership in revoked_memberships))
         return revoked_memberships
@@ -1,13 +1,13 @@
 """Service for object storage management."""
 import os
 import uuid
+from datetime import datetime
 from typing import List
-
-import requests
-from aws_requests_auth.aws_auth import AWSRequestsAuth
+from urllib.parse import urlparse
 
 from met_api.config import Config
 from met_api.schemas.document import Document
+from met_api.utils.sigv4 import SigV4Signer
 
 
 class ObjectStorageService:
@@ -17,28 +17,34 @@ class ObjectStorageService:
         """Initialize the service."""
         # initialize s3 config from environment variables
         s3_client = Config().S3_CONFIG
-        self.s3_auth = AWSRequestsAuth(
-            aws_access_key=s3_client['ACCESS_KEY_ID'],
-            aws_secret_access_key=s3_client['SECRET_ACCESS_KEY'],
-            aws_host=s3_client['HOST'],
-            aws_region=s3_client['REGION'],
-            aws_service=s3_client['SERVICE']
+        self.s3_auth = SigV4Signer(
+            access_key=s3_client['ACCESS_KEY_ID'],
+            secret_key=s3_client['SECRET_ACCESS_KEY'],
+            host=s3_client['HOST'],
+            region=s3_client['REGION'],
+            service=s3_client['SERVICE']
         )
         self.s3_bucket = s3_client['BUCKET']
+        self.presigned_url_expiry = s3_client['PRESIGNED_URL_EXPIRY']
 
     def get_url(self, filename: str):
         """Get the object url."""
-        if (not self.s3_auth.aws_host or not self.s3_bucket or not filename):
+        if (not self.s3_auth.host or not self.s3_bucket or not filename):
             return ''
 
-        return f'https://{self.s3_auth.aws_host}/{self.s3_bucket}/{filename}'
+        return f'https://{self.s3_auth.host}/{self.s3_bucket}/{filename}'
 
     def get_auth_headers(self, documents: List[Document]):
-        """Get the S3 auth headers for the provided documents."""
+        """Get the S3 auth headers for the provided documents.
+
+        New documents are signed for an upload and existing documents for a download. The signatures are
+        computed locally, with the same timestamp for the whole batch. Each document also gets a presigned URL
+        for the same request.
+        """
         if (
-            self.s3_auth.aws_access_key is None or
-            self.s3_auth.aws_secret_access_key is None or
-            self.s3_auth.aws_host is None or
+            self.s3_auth.access_key is None or
+            self.s3_auth.secret_key is None or
+            self.s3_auth.host is None or
             self.s3_bucket is None
         ):
             return {
@@ -46,21 +52,21 @@ class ObjectStorageService:
                 'message': 'accesskey is None or secretkey is None or S3 host is None or formsbucket is None'
             }, 500
 
+        timestamp = datetime.utcnow()
         for file in documents:
             s3sourceuri = file.get('s3sourceuri', None)
             filenamesplittext = os.path.splitext(file.get('filename'))
             uniquefilename = f'{uuid.uuid4()}{filenamesplittext[1]}'
 
             s3uri = s3sourceuri if s3sourceuri is not None else self.get_url(uniquefilename)
+            method = 'PUT' if s3sourceuri is None else 'GET'
+            path = urlparse(s3uri).path
 
-            if s3sourceuri is None:
-                response = requests.put(s3uri, data=None, auth=self.s3_auth, timeout=None)
-            else:
-                response = requests.get(s3uri, auth=self.s3_auth, timeout=None)
-
+            headers = self.s3_auth.sign_headers(method, path, timestamp)
             file['filepath'] = s3uri
-            file['authheader'] = response.request.headers['Authorization']
-            file['amzdate'] = response.request.headers['x-amz-date']
+            file['authheader'] = headers['Authorization']
+            file['amzdate'] = headers['x-amz-date']
             file['uniquefilename'] = uniquefilename if s3sourceuri is None else ''
+            file['presignedurl'] = self.s3_auth.presign_url(method, path, self.presigned_url_expiry, timestamp)
 
         return documents
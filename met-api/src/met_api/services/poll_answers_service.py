@@ -4,7 +4,9 @@ from http import HTTPStatus
 from sqlalchemy.exc import SQLAlchemyError
 
 from met_api.exceptions.business_exception import BusinessException
+from met_api.models.db import db
 from met_api.models.poll_answers import PollAnswer as PollAnswerModel
+from met_api.models.poll_response_count import PollResponseCount
 
 
 class PollAnswerService:
@@ -36,4 +38,7 @@ class PollAnswerService:
     @staticmethod
     def delete_poll_answers(poll_id: int):
         """Delete poll answers for a given poll ID."""
-        PollAnswerModel.delete_answers_by_poll_id(poll_id)
+        PollAnswerModel.delete_answers_by_poll_id(poll_id, db.session)
+        # the responses selecting the answers are deleted with them
+        PollResponseCount.rebuild([poll_id])
+        db.session.commit()
@@ -1,19 +1,19 @@
 """Service for Poll Response management."""
 
 from http import HTTPStatus
-from typing import Callable
-from sqlalchemy import func
+from flask import current_app
 from sqlalchemy.exc import SQLAlchemyError
 from met_api.exceptions.business_exception import BusinessException
+from met_api.models.poll_response_count import PollResponseCount
 from met_api.models.poll_responses import PollResponse as PollResponseModel
 from met_api.services.poll_answers_service import PollAnswerService
-from met_api.models import Poll, PollAnswer, db
+from met_api.constants.engagement_status import Status as EngagementStatus
+from met_api.models import Engagement, Poll, PollAnswer, db
 from met_api.services import authorization
+from met_api.services.engagement_service import EngagementService
 from met_api.constants.membership_type import MembershipType
 from met_api.utils.roles import Role
 
-func: Callable
-
 
 class PollResponseService:
     """Service for managing PollResponses."""
@@ -42,6 +42,48 @@ class PollResponseService:
             # Log the exception or handle it as needed
             raise BusinessException(f'Error creating poll response: {e}', HTTPStatus.INTERNAL_SERVER_ERROR) from e
 
+    @staticmethod
+    def record_response(poll_id: int, participant_id: str, selected_answer_id: int, max_responses: int) -> int:
+        """
+        Record a poll response with a single statement checking the poll, its engagement and the limit of responses.
+
+        Returns the id of the response. The reason of a rejected response is looked up only when it is rejected.
+        """
+        try:
+            response_id = PollResponseModel.insert_response(poll_id, participant_id, selected_answer_id,
+                                                            max_responses)
+            if response_id is None:
+                db.session.rollback()
+                PollResponseService._raise_rejection(poll_id, participant_id, selected_answer_id, max_responses)
+            db.session.commit()
+            return response_id
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise BusinessException(f'Error creating poll response: {e}', HTTPStatus.INTERNAL_SERVER_ERROR) from e
+
+    @staticmethod
+    def _raise_rejection(poll_id: int, participant_id: str, selected_answer_id: int, max_responses: int):
+        """Raise the reason why a response to the poll is not allowed."""
+        poll = db.session.query(
+            Poll.status,
+            Engagement.status_id,
+            PollResponseModel.count_responses_query(poll_id, participant_id),
+            db.session.query(PollAnswer.id).filter(PollAnswer.poll_id == poll_id,
+                                                   PollAnswer.id == selected_answer_id).exists(),
+        ).join(Engagement, Engagement.id == Poll.engagement_id).filter(Poll.id == poll_id).first()
+        if poll is None:
+            raise BusinessException('Poll widget not found', HTTPStatus.NOT_FOUND)
+        status, engagement_status_id, response_count, is_valid_answer = poll
+        if status != 'active':
+            raise BusinessException('Poll is not active', HTTPStatus.BAD_REQUEST)
+        if engagement_status_id != EngagementStatus.Published.value:
+            raise BusinessException('Poll engagement is not published', HTTPStatus.BAD_REQUEST)
+        if response_count >= max_responses:
+            raise BusinessException('Limit exceeded for this poll', HTTPStatus.BAD_REQUEST)
+        if not is_valid_answer:
+            raise BusinessException('Invalid selected answer for the poll.', HTTPStatus.BAD_REQUEST)
+        raise BusinessException('Response failed to record', HTTPStatus.INTERNAL_SERVER_ERROR)
+
     @staticmethod
     def get_poll_count(poll_id: int, ip_addr: str = None) -> int:
         """
@@ -80,27 +122,26 @@ class PollResponseService:
             raise BusinessException('Poll not found', HTTPStatus.NOT_FOUND)
         # Check authorization
         PollResponseService._check_authorization(poll.engagement_id)
+        return PollResponseService._get_poll_results(poll)
 
-        # Query to join PollAnswer and PollResponse and count responses for each answer
-        poll_data = (
-            db.session.query(
-                PollAnswer.id.label('answer_id'),
-                PollAnswer.answer_text,
-                func.count(PollResponseModel.selected_answer_id).label('response_count')
-            )
-            .select_from(PollAnswer)
-            .outerjoin(PollResponseModel, PollAnswer.id == PollResponseModel.selected_answer_id)
-            .filter(PollAnswer.poll_id == poll_id)
-            .group_by(PollAnswer.id, PollAnswer.answer_text)
-            .all()
-        )
-
-        # Calculate total responses
-        total_responses = sum(response_count for _, _, response_count in poll_data)
+    @staticmethod
+    def get_public_poll_results(poll_id):
+        """Get the poll details and response counts of a poll of a visible engagement, if the results are public."""
+        if not current_app.config.get('POLL_RESULTS_PUBLIC'):
+            raise BusinessException('Poll results are not public', HTTPStatus.FORBIDDEN)
+        poll = Poll.query.get(poll_id)
+        if not poll or not EngagementService.find_visible_engagement(poll.engagement_id):
+            raise BusinessException('Poll not found', HTTPStatus.NOT_FOUND)
+        return PollResponseService._get_poll_results(poll)
 
-        # Construct response dictionary
-        response = {
-            'poll_id': poll_id,
+    @staticmethod
+    def _get_poll_results(poll: Poll) -> dict:
+        """Return the poll details with the response counts of each answer, read from the poll counters."""
+        total_responses, answer_totals = PollResponseCount.get_totals(poll.id)
+        answers = [(answer.id, answer.answer_text, answer_totals.get(answer.id, 0))
+                   for answer in sorted(poll.answers, key=lambda answer: answer.id)]
+        return {
+            'poll_id': poll.id,
             'title': poll.title,
             'description': poll.description,
             'total_response': total_responses,
@@ -110,8 +151,6 @@ class PollResponseService:
                     'answer_text': answer_text,
                     'total_response': response_count,
                     'percentage': (response_count / total_responses * 100) if total_responses > 0 else 0
-                } for answer_id, answer_text, response_count in poll_data
+                } for answer_id, answer_text, response_count in answers
             ]
         }
-
-        return response
@@ -30,19 +30,14 @@ class ProjectService:
 
             epic_comment_period_payload = ProjectService._construct_epic_payload(engagement)
 
-            eao_service_account_token = ProjectService._get_eao_service_account_token()
-
             if engagement_metadata and engagement_metadata.project_tracking_id:
                 update_url = f'{epic_integration["URL"]}/{engagement_metadata.project_tracking_id}'
-                api_response = RestService.put(endpoint=update_url, token=eao_service_account_token,
-                                               data=epic_comment_period_payload,
-                                               raise_for_status=False)
+                api_response = ProjectService._invoke_epic(RestService.put, update_url, epic_comment_period_payload)
                 # no handling of return so far since epic doesnt return anything
 
             else:
                 create_url = f'{epic_integration["URL"]}'
-                api_response = RestService.post(endpoint=create_url, token=eao_service_account_token,
-                                                data=epic_comment_period_payload, raise_for_status=False)
+                api_response = ProjectService._invoke_epic(RestService.post, create_url, epic_comment_period_payload)
                 response_data = api_response.json()
 
                 if api_response.status_code == HTTPStatus.OK:
@@ -84,10 +79,22 @@ class ProjectService:
         return epic_comment_period_payload
 
     @staticmethod
-    def _get_eao_service_account_token():
+    def _invoke_epic(rest_method, url, payload):
+        """Call EPIC with the service account token, retrying once with a new token if it is rejected."""
+        api_response = rest_method(endpoint=url, token=ProjectService._get_eao_service_account_token(),
+                                   data=payload, raise_for_status=False)
+        if api_response.status_code == HTTPStatus.UNAUTHORIZED:
+            api_response = rest_method(endpoint=url,
+                                       token=ProjectService._get_eao_service_account_token(force_refresh=True),
+                                       data=payload, raise_for_status=False)
+        return api_response
+
+    @staticmethod
+    def _get_eao_service_account_token(force_refresh: bool = False):
         epic = current_app.config['EPIC_CONFIG']
         kc_service_id = epic.get('KEYCLOAK_SERVICE_ACCOUNT_ID')
         kc_secret = epic.get('KEYCLOAK_SERVICE_ACCOUNT_SECRET')
         client_id = epic.get('KEYCLOAK_CLIENT_ID')
         issuer_url = epic.get('JWT_OIDC_ISSUER')
-        return RestService.get_access_token_with_password(kc_service_id, kc_secret, client_id, issuer_url)
+        return RestService.get_access_token_with_password(kc_service_id, kc_secret, client_id, issuer_url,
+                                                          force_refresh=force_refresh)
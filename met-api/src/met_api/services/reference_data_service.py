@@ -0,0 +1,235 @@
+"""Service for the reference data.
+
+Lookup tables such as the comment statuses, the languages or the document templates change almost never, but are
+read on hot paths. Each table is loaded once per process into immutable records and kept for
+REFERENCE_DATA_CACHE_TTL seconds. Writes to the tables bump a version stamp kept in the shared cache, which makes
+all the workers reload their tables within a few seconds.
+"""
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Mapping, Optional, Tuple
+from uuid import uuid4
+
+from flask import current_app
+
+from met_api.models.comment_status import CommentStatus as CommentStatusModel
+from met_api.models.engagement_status import EngagementStatus as EngagementStatusModel
+from met_api.models.generated_document_template import GeneratedDocumentTemplate as GeneratedDocumentTemplateModel
+from met_api.models.language import Language as LanguageModel
+from met_api.models.language_tenant_mapping import LanguageTenantMapping as LanguageTenantMappingModel
+from met_api.models.membership_status_code import MembershipStatusCode as MembershipStatusCodeModel
+from met_api.models.user_role import UserRole as UserRoleModel
+from met_api.models.widget_type import WidgetType as WidgetTypeModel
+from met_api.utils.cache import cache
+
+
+VERSION_CACHE_KEY = 'reference_data_version'
+# seconds between two checks of the shared version stamp
+VERSION_CHECK_INTERVAL = 5
+
+
+@dataclass(frozen=True)
+class StatusRecord:
+    """A status of a comment, engagement or membership."""
+
+    id: int
+    status_name: str
+    description: Optional[str]
+
+
+@dataclass(frozen=True)
+class NamedRecord:
+    """A widget type or user role."""
+
+    id: int
+    name: str
+    description: Optional[str]
+
+
+@dataclass(frozen=True)
+class LanguageRecord:
+    """A language."""
+
+    id: int
+    name: str
+    code: str
+    right_to_left: Optional[bool]
+
+
+@dataclass(frozen=True)
+class DocumentTemplateRecord:
+    """A template of the generated documents."""
+
+    id: int
+    type_id: int
+    hash_code: Optional[str]
+    extension: str
+
+
+class _ReferenceDataCache:
+    """Tables loaded per process, dropped when they expire or when the shared version stamp changes."""
+
+    def __init__(self):
+        """Create an empty cache."""
+        self._tables: Dict[str, Tuple[float, object]] = {}
+        self._lock = Lock()
+        self._version = None
+        self._checked_at = None
+        # incremented on each invalidation, so that tables loaded meanwhile are not kept
+        self._generation = 0
+
+    def get(self, name: str, load: Callable):
+        """Return the table, loading it when missing or expired."""
+        ttl = current_app.config.get('REFERENCE_DATA_CACHE_TTL')
+        if not ttl:
+            return load()
+        now = monotonic()
+        with self._lock:
+            self._check_version(now)
+            loaded_at, table = self._tables.get(name, (None, None))
+            if loaded_at is not None and now - loaded_at < ttl:
+                return table
+            generation = self._generation
+        table = load()
+        with self._lock:
+            if generation == self._generation:
+                self._tables[name] = (now, table)
+        return table
+
+    def _check_version(self, now: float):
+        if self._checked_at is not None and now - self._checked_at < VERSION_CHECK_INTERVAL:
+            return
+        self._checked_at = now
+        version = cache.get(VERSION_CACHE_KEY)
+        if version != self._version:
+            self._version = version
+            self._clear()
+
+    def _clear(self):
+        self._tables.clear()
+        self._generation += 1
+
+    def invalidate(self):
+        """Drop the tables of all the workers."""
+        version = uuid4().hex
+        with self._lock:
+            self._clear()
+            self._version = version
+            self._checked_at = monotonic()
+        cache.set(VERSION_CACHE_KEY, version, timeout=0)
+
+    def clear(self):
+        """Drop the tables of this process."""
+        with self._lock:
+            self._clear()
+            self._checked_at = None
+
+
+_cache = _ReferenceDataCache()
+
+
+def _load_statuses(model) -> Tuple[StatusRecord, ...]:
+    return tuple(
+        StatusRecord(id=status.id, status_name=status.status_name, description=status.description)
+        for status in model.query.order_by(model.id).all()
+    )
+
+
+def _load_named_records(model) -> Tuple[NamedRecord, ...]:
+    return tuple(
+        NamedRecord(id=record.id, name=record.name, description=record.description)
+        for record in model.query.order_by(model.id).all()
+    )
+
+
+def _load_languages() -> Mapping[int, LanguageRecord]:
+    return MappingProxyType({
+        language.id: LanguageRecord(id=language.id, name=language.name, code=language.code,
+                                    right_to_left=language.right_to_left)
+        for language in LanguageModel.query.order_by(LanguageModel.id).all()
+    })
+
+
+def _load_tenant_language_ids() -> Mapping[int, FrozenSet[int]]:
+    language_ids = {}
+    for mapping in LanguageTenantMappingModel.query.all():
+        language_ids.setdefault(mapping.tenant_id, set()).add(mapping.language_id)
+    return MappingProxyType({tenant_id: frozenset(ids) for tenant_id, ids in language_ids.items()})
+
+
+def _load_document_templates() -> Mapping[Tuple[int, str], DocumentTemplateRecord]:
+    return MappingProxyType({
+        (template.type_id, template.extension): DocumentTemplateRecord(
+            id=template.id, type_id=template.type_id, hash_code=template.hash_code, extension=template.extension)
+        for template in GeneratedDocumentTemplateModel.query.order_by(GeneratedDocumentTemplateModel.id).all()
+    })
+
+
+class ReferenceDataService:
+    """Reference data service."""
+
+    @staticmethod
+    def get_comment_statuses() -> Tuple[StatusRecord, ...]:
+        """Return the comment statuses."""
+        return _cache.get('comment_statuses', lambda: _load_statuses(CommentStatusModel))
+
+    @classmethod
+    def get_comment_status_ids(cls) -> FrozenSet[int]:
+        """Return the ids of the comment statuses."""
+        return frozenset(status.id for status in cls.get_comment_statuses())
+
+    @staticmethod
+    def get_engagement_statuses() -> Tuple[StatusRecord, ...]:
+        """Return the engagement statuses."""
+        return _cache.get('engagement_statuses', lambda: _load_statuses(EngagementStatusModel))
+
+    @staticmethod
+    def get_membership_status_codes() -> Tuple[StatusRecord, ...]:
+        """Return the membership status codes."""
+        return _cache.get('membership_status_codes', lambda: _load_statuses(MembershipStatusCodeModel))
+
+    @staticmethod
+    def get_widget_types() -> Tuple[NamedRecord, ...]:
+        """Return the widget types."""
+        return _cache.get('widget_types', lambda: _load_named_records(WidgetTypeModel))
+
+    @staticmethod
+    def get_user_roles() -> Tuple[NamedRecord, ...]:
+        """Return the user roles."""
+        return _cache.get('user_roles', lambda: _load_named_records(UserRoleModel))
+
+    @staticmethod
+    def get_languages() -> Tuple[LanguageRecord, ...]:
+        """Return the languages."""
+        return tuple(_cache.get('languages', _load_languages).values())
+
+    @staticmethod
+    def get_language(language_id: int) -> Optional[LanguageRecord]:
+        """Return the language with the given id."""
+        try:
+            return _cache.get('languages', _load_languages).get(int(language_id))
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def get_tenant_languages(cls, tenant_id: int) -> Tuple[LanguageRecord, ...]:
+        """Return the languages selected by the tenant."""
+        language_ids = _cache.get('tenant_language_ids', _load_tenant_language_ids).get(tenant_id, frozenset())
+        return tuple(language for language in cls.get_languages() if language.id in language_ids)
+
+    @staticmethod
+    def get_document_template(type_id: int, extension: str = 'xlsx') -> Optional[DocumentTemplateRecord]:
+        """Return the template of the document type."""
+        return _cache.get('document_templates', _load_document_templates).get((type_id, extension))
+
+    @staticmethod
+    def invalidate():
+        """Reload the reference data in all the workers, after it changes."""
+        _cache.invalidate()
+
+    @staticmethod
+    def clear_cache():
+        """Reload the reference data of this process."""
+        _cache.clear()
@@ -4,6 +4,7 @@ from met_api.models.report_setting import ReportSetting as ReportSettingModel
 from met_api.models.survey import Survey as SurveyModel
 from met_api.schemas.report_setting import ReportSettingSchema
 from met_api.constants.report_setting_type import FormIoComponentType
+from met_api.utils.survey_form_index import get_survey_form_index
 
 
 class ReportSettingService:
@@ -24,24 +25,13 @@ class ReportSettingService:
 
         survey_id = report_setting_data.get('id', None)
 
-        form_json = report_setting_data.get('form_json', None)
-        form_type = form_json.get('display', None)
-
-        is_single_page_survey = form_type == 'form'
-        is_multi_page_survey = form_type == 'wizard'
+        form_index = get_survey_form_index(survey_id, report_setting_data.get('updated_date', None),
+                                           report_setting_data.get('form_json', None))
         survey_question_keys = []
-
-        if is_single_page_survey:
-            form_components = form_json.get('components', None)
-            cls._extract_form_component(survey_id, form_components, survey_question_keys)
-
-        if is_multi_page_survey:
-            pages = form_json.get('components', None)
-            for page in pages:
-                form_components = page.get('components', None)
-                cls._extract_form_component(survey_id, form_components, survey_question_keys)
+        cls._extract_form_component(survey_id, form_index.raw_components, survey_question_keys)
 
         cls._delete_questions_removed_from_form(survey_id, survey_question_keys)
+        ReportSettingModel.clear_display_map(survey_id)
 
         return report_setting_data
 
@@ -153,4 +143,5 @@ class ReportSettingService:
         } for setting in new_report_settings]
 
         updated_report_settings = ReportSettingModel.update_report_settings_bulk(report_settings_update_mapping)
+        ReportSettingModel.clear_display_map(survey_id)
         return updated_report_settings
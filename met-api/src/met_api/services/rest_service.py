@@ -13,7 +13,9 @@
 # limitations under the License.
 """Service to invoke Rest services."""
 import json
-from typing import Iterable
+import time
+from threading import Lock
+from typing import Callable, Dict, Iterable, Tuple
 
 import requests
 from flask import current_app, request
@@ -24,6 +26,58 @@ from requests.exceptions import ConnectionError as ReqConnectionError
 from met_api.utils.enums import AuthHeaderType, ContentType
 
 
+# Tokens are renewed this many seconds before they expire
+TOKEN_EXPIRY_MARGIN = 30
+
+
+class TokenCache:
+    """Thread safe cache of access tokens, kept until shortly before they expire."""
+
+    def __init__(self, expiry_margin: int = TOKEN_EXPIRY_MARGIN):
+        """Create an empty cache."""
+        self.expiry_margin = expiry_margin
+        self.hits = 0
+        self.misses = 0
+        self._tokens: Dict[Tuple, Tuple[str, float]] = {}
+        self._lock = Lock()
+
+    def get(self, key: Tuple, request_token: Callable[[], dict], force_refresh: bool = False) -> str:
+        """Return the cached token for the key, or request a new one with the callable and cache it.
+
+        The callable returns the token endpoint response, with the access_token and its expires_in.
+        """
+        with self._lock:
+            cached = self._tokens.get(key)
+            if cached and not force_refresh and time.monotonic() < cached[1]:
+                self.hits += 1
+                return cached[0]
+            self.misses += 1
+            # requested while holding the lock, so that concurrent callers wait for a single request
+            token_response = request_token()
+            token = token_response.get('access_token')
+            expires_in = token_response.get('expires_in') or 0
+            if token and expires_in > self.expiry_margin:
+                self._tokens[key] = (token, time.monotonic() + expires_in - self.expiry_margin)
+            else:
+                self._tokens.pop(key, None)
+            return token
+
+    def clear(self):
+        """Remove all the cached tokens and reset the counters."""
+        with self._lock:
+            self._tokens.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Return the hit and miss counters."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._tokens)}
+
+
+token_cache = TokenCache()
+
+
 class RestService:
     """Service to invoke Rest services which uses OAuth 2.0 implementation."""
 
@@ -107,8 +161,13 @@ class RestService:
         return RestService._invoke('put', endpoint, token, auth_header_type, content_type, data, raise_for_status)
 
     @staticmethod
-    def get_service_account_token(kc_service_id: str = None, kc_secret: str = None, issuer_url: str = None) -> str:
-        """Generate a service account token."""
+    def get_service_account_token(kc_service_id: str = None, kc_secret: str = None, issuer_url: str = None,
+                                  force_refresh: bool = False) -> str:
+        """Generate a service account token.
+
+        Tokens are cached per client and issuer until shortly before they expire. Use force_refresh to replace
+        a cached token that was rejected.
+        """
         keycloak = current_app.config['KEYCLOAK_CONFIG']
         kc_service_id = kc_service_id or keycloak.get('SERVICE_ACCOUNT_ID')
         kc_secret = kc_secret or keycloak.get('SERVICE_ACCOUNT_SECRET')
@@ -117,33 +176,48 @@ class RestService:
         if kc_service_id is None or kc_secret is None or issuer_url is None:
             raise ValueError('Missing required parameters')
 
-        token_url = issuer_url + '/protocol/openid-connect/token'
-        auth_response = requests.post(token_url, auth=(kc_service_id, kc_secret), headers={
-            'Content-Type': ContentType.FORM_URL_ENCODED.value}, data='grant_type=client_credentials',
-            timeout=None)
-        auth_response.raise_for_status()
-        return auth_response.json().get('access_token')
+        def request_token():
+            token_url = issuer_url + '/protocol/openid-connect/token'
+            auth_response = requests.post(token_url, auth=(kc_service_id, kc_secret), headers={
+                'Content-Type': ContentType.FORM_URL_ENCODED.value}, data='grant_type=client_credentials',
+                timeout=keycloak.get('CONNECT_TIMEOUT'))
+            auth_response.raise_for_status()
+            return auth_response.json()
+
+        return token_cache.get((kc_service_id, issuer_url), request_token, force_refresh)
 
     @staticmethod
-    def get_access_token_with_password(username, password, client_id, issuer_url):
-        """Generate an access token with password grant."""
-        token_url = issuer_url + '/protocol/openid-connect/token'
+    def get_access_token_with_password(username, password, client_id, issuer_url,  # pylint: disable=too-many-arguments
+                                       force_refresh: bool = False):
+        """Generate an access token with password grant.
 
-        headers = {
-            'Content-Type': 'application/x-www-form-urlencoded',
-        }
+        Tokens are cached per client, issuer and user until shortly before they expire.
+        """
+        def request_token():
+            token_url = issuer_url + '/protocol/openid-connect/token'
 
-        data = {
-            'username': username,
-            'password': password,
-            'grant_type': 'password',
-            'client_id': client_id
-        }
+            headers = {
+                'Content-Type': 'application/x-www-form-urlencoded',
+            }
+
+            data = {
+                'username': username,
+                'password': password,
+                'grant_type': 'password',
+                'client_id': client_id
+            }
 
-        auth_response = requests.post(token_url, headers=headers, data=data, timeout=None)
-        auth_response.raise_for_status()
+            auth_response = requests.post(token_url, headers=headers, data=data,
+                                          timeout=current_app.config['KEYCLOAK_CONFIG'].get('CONNECT_TIMEOUT'))
+            auth_response.raise_for_status()
+            return auth_response.json()
 
-        return auth_response.json().get('access_token')
+        return token_cache.get((client_id, issuer_url, username), request_token, force_refresh)
+
+    @staticmethod
+    def get_token_cache_stats() -> dict:
+        """Return the hit and miss counters of the token cache."""
+        return token_cache.stats()
 
 
 def _get_token() -> str:
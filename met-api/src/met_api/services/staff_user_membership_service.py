@@ -4,6 +4,7 @@ from http import HTTPStatus
 from met_api.exceptions.business_exception import BusinessException
 from met_api.models.staff_user import StaffUser as StaffUserModel
 from met_api.schemas.staff_user import StaffUserSchema
+from met_api.services.identity_service import IdentityService
 from met_api.services.membership_service import MembershipService
 from met_api.services.staff_user_service import StaffUserService
 from met_api.services.user_group_membership_service import UserGroupMembershipService
@@ -69,4 +70,5 @@ class StaffUserMembershipService:
 
         user.status_id = UserStatus.ACTIVE.value if active else UserStatus.INACTIVE.value
         user.save()
+        IdentityService.clear_context()
         return StaffUserSchema().dump(user)
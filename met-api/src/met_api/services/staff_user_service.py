@@ -4,9 +4,11 @@ from http import HTTPStatus
 from flask import current_app, g
 
 from met_api.exceptions.business_exception import BusinessException
+from met_api.models.db import db
 from met_api.models.pagination_options import PaginationOptions
 from met_api.models.staff_user import StaffUser as StaffUserModel
 from met_api.schemas.staff_user import StaffUserSchema
+from met_api.services.identity_service import IdentityService
 from met_api.services.user_group_membership_service import UserGroupMembershipService
 from met_api.utils import notification
 from met_api.utils.constants import CompositeRoles
@@ -40,18 +42,20 @@ class StaffUserService:
 
         external_id = user.get('external_id')
         db_user = StaffUserModel.get_user_by_external_id(external_id, include_inactive=True)
+        IdentityService.clear_context()
 
         if db_user is None:
-            new_user = StaffUserModel.create_user(user)
+            new_user = StaffUserModel.create_user(user, db.session)
             if len(user.get('roles', [])) == 0:
                 self._send_access_request_email(new_user)
+            db.session.commit()
             return new_user
 
         return StaffUserModel.update_user(db_user.id, user)
 
     @staticmethod
     def _send_access_request_email(user: StaffUserModel) -> None:
-        """Send a new user email.Throws error if fails."""
+        """Queue a new user email.Throws error if fails."""
         templates = current_app.config['EMAIL_TEMPLATES']
         to_email_address = templates['ACCESS_REQUEST']['DEST_EMAIL_ADDRESS']
         if to_email_address is None:
@@ -59,11 +63,12 @@ class StaffUserService:
         template_id = templates['ACCESS_REQUEST']['ID']
         subject, body, args = StaffUserService._render_email_template(user)
         try:
-            notification.send_email(subject=subject,
-                                    email=to_email_address,
-                                    html_body=body,
-                                    args=args,
-                                    template_id=template_id)
+            notification.queue_email(idempotency_key=f'access_request_{user.id}',
+                                     subject=subject,
+                                     email=to_email_address,
+                                     html_body=body,
+                                     args=args,
+                                     template_id=template_id)
         except Exception as exc:  # noqa: B902
             current_app.logger.error('<Notification for new user registration failed', exc)
             raise BusinessException(
@@ -118,15 +123,16 @@ class StaffUserService:
         include_inactive=False
     ):
         """Return a list of users."""
-        users, total = StaffUserModel.get_all_paginated(pagination_options, search_text, include_inactive)
-        user_collection = StaffUserSchema(many=True).dump(users)
+        page = StaffUserModel.get_all_paginated(pagination_options, search_text, include_inactive)
+        user_collection = StaffUserSchema(many=True).dump(page.items)
 
         if include_roles:
             cls.attach_roles(user_collection)
 
         return {
             'items': user_collection,
-            'total': total
+            'total': page.total,
+            'next_cursor': page.next_cursor
         }
 
     @staticmethod
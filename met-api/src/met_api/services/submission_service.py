@@ -16,7 +16,6 @@ from met_api.models import EngagementSettingsModel
 from met_api.models import Survey as SurveyModel
 from met_api.models import Tenant as TenantModel
 from met_api.models.comment import Comment
-from met_api.models.comment_status import CommentStatus
 from met_api.models.db import db, transactional
 from met_api.models.engagement_slug import EngagementSlug as EngagementSlugModel
 from met_api.models.pagination_options import PaginationOptions
@@ -27,6 +26,7 @@ from met_api.schemas.submission import PublicSubmissionSchema, SubmissionSchema
 from met_api.services import authorization
 from met_api.services.comment_service import CommentService
 from met_api.services.email_verification_service import EmailVerificationService
+from met_api.services.reference_data_service import ReferenceDataService
 from met_api.services.staff_user_service import StaffUserService
 from met_api.services.survey_service import SurveyService
 from met_api.utils import notification
@@ -81,7 +81,8 @@ class SubmissionService:
         lang_code = submission.get('language_code', current_app.config['DEFAULT_LANGUAGE'])
         survey_id = submission.get('survey_id')
         survey = SurveyService.get(survey_id)
-        engagement_id = survey.get('engagement_id')
+        # the schema dumps the engagement id as a string, so it is read from the survey loaded by the validation
+        engagement_id = SurveyModel.find_by_id(survey_id).engagement_id
         # Restrict submission on unpublished engagement
         if SubmissionService.is_unpublished(engagement_id):
             return {}
@@ -104,7 +105,7 @@ class SubmissionService:
         if engagement_settings:
             if engagement_settings.send_report:
                 SubmissionService._send_submission_response_email(
-                    participant_id, engagement_id, lang_code)
+                    submission_result.id, participant_id, engagement_id, lang_code)
         return submission_result
 
     @classmethod
@@ -183,7 +184,7 @@ class SubmissionService:
             'survey_id': submission.survey_id,
             'submission_id': submission.id,
             'type': EmailVerificationType.RejectedComment,
-        }, session)
+        }, session=session)
         SubmissionService._send_rejected_email(
             staff_review_details, submission, review_note,
             email_verification.get('verification_token'), lang_code)
@@ -197,8 +198,7 @@ class SubmissionService:
         has_threat = values.get('has_threat', None)
         rejected_reason_other = values.get('rejected_reason_other', None)
 
-        valid_statuses = [
-            status.id for status in CommentStatus.get_comment_statuses()]
+        valid_statuses = ReferenceDataService.get_comment_status_ids()
 
         if not user:
             raise ValueError('Invalid user.')
@@ -307,12 +307,12 @@ class SubmissionService:
             if 'status' in advanced_search_filters:
                 if advanced_search_filters['status'] in (Status.Rejected.value, Status.Pending.value):
                     # Cant view any Rejected/Pending
-                    return {'items': [], 'total': 0}
+                    return {'items': [], 'total': 0, 'next_cursor': None}
                 if not advanced_search_filters['status']:
                     # No blanket search.Return only approved if filter doesnt have any status
                     advanced_search_filters['status'] = Status.Approved.value
 
-        items, total = Comment.get_by_survey_id_paginated(
+        page = Comment.get_by_survey_id_paginated(
             survey_id,
             pagination_options,
             search_text,
@@ -320,25 +320,27 @@ class SubmissionService:
                 advanced_search_filters.values()) else None
         )
         return {
-            'items': SubmissionSchema(many=True, exclude=['submission_json']).dump(items),
-            'total': total
+            'items': SubmissionSchema(many=True, exclude=['submission_json']).dump(page.items),
+            'total': page.total,
+            'next_cursor': page.next_cursor
         }
 
     @staticmethod
     def _send_rejected_email(staff_review_details: dict, submission: SubmissionModel,
                              review_note, token, lang_code) -> None:
-        """Send an verification email.Throws error if fails."""
+        """Queue a rejected comment email.Throws error if fails."""
         participant_id = submission.participant_id
         participant = ParticipantModel.find_by_id(participant_id)
         template_id, subject, body, args = SubmissionService._render_email_template(
             staff_review_details, submission, review_note, token, lang_code)
         try:
-            notification.send_email(subject=subject,
-                                    email=ParticipantModel.decode_email(
-                                        participant.email_address),
-                                    html_body=body,
-                                    args=args,
-                                    template_id=template_id)
+            notification.queue_email(idempotency_key=f'rejected_comment_{token}',
+                                     subject=subject,
+                                     email=ParticipantModel.decode_email(
+                                         participant.email_address),
+                                     html_body=body,
+                                     args=args,
+                                     template_id=template_id)
         except Exception as exc:  # noqa: B902
             current_app.logger.error(
                 '<Notification for rejected comment failed', exc)
@@ -405,20 +407,21 @@ class SubmissionService:
         return template_id, subject, body, args
 
     @staticmethod
-    def _send_submission_response_email(participant_id, engagement_id, lang_code) -> None:
-        """Send response to survey submission."""
+    def _send_submission_response_email(submission_id, participant_id, engagement_id, lang_code) -> None:
+        """Queue the response to survey submission."""
         participant = ParticipantModel.find_by_id(participant_id)
         templates = current_app.config['EMAIL_TEMPLATES']
         template_id = templates['SUBMISSION_RESPONSE']['ID']
         subject, body, args = SubmissionService._render_submission_response_email_template(
             engagement_id, lang_code)
         try:
-            notification.send_email(subject=subject,
-                                    email=ParticipantModel.decode_email(
-                                        participant.email_address),
-                                    html_body=body,
-                                    args=args,
-                                    template_id=template_id)
+            notification.queue_email(idempotency_key=f'submission_response_{submission_id}',
+                                     subject=subject,
+                                     email=ParticipantModel.decode_email(
+                                         participant.email_address),
+                                     html_body=body,
+                                     args=args,
+                                     template_id=template_id)
         except Exception as exc:  # noqa: B902
             current_app.logger.error(
                 '<Notification for submission response failed', exc)
@@ -83,15 +83,16 @@ class SurveyService:
         # check if user can view surveys linked to unassigned engagement
         search_options.can_view_all_engagements = SurveyService._can_view_all_engagements(user_roles)
 
-        items, total = SurveyModel.get_surveys_paginated(
+        page = SurveyModel.get_surveys_paginated(
             pagination_options,
             search_options,
         )
         surveys_schema = SurveySchema(many=True)
 
         return {
-            'items': surveys_schema.dump(items),
-            'total': total
+            'items': surveys_schema.dump(page.items),
+            'total': page.total,
+            'next_cursor': page.next_cursor
         }
 
     @staticmethod
@@ -185,6 +186,7 @@ class SurveyService:
         ReportSettingService.refresh_report_setting({
             'id': updated_survey.id,
             'form_json': updated_survey.form_json,
+            'updated_date': updated_survey.updated_date,
         })
 
         return updated_survey
@@ -1,4 +1,5 @@
 """Service for tenant."""
+from typing import Optional
 
 from flask import current_app
 from sqlalchemy.exc import SQLAlchemyError
@@ -21,11 +22,37 @@ class TenantService:
         try:
             tenants = TenantModel.query.all()
             for tenant in tenants:
-                key = tenant.short_name.upper()
-                cache.set(f'tenant_{key}', tenant)
+                cls._cache_tenant(tenant)
         except SQLAlchemyError as e:
             current_app.logger.info('Error on building cache {}', e)
 
+    @staticmethod
+    def _get_cache_key(short_name: str) -> str:
+        return f'tenant_{short_name.upper()}'
+
+    @classmethod
+    def _cache_tenant(cls, tenant: TenantModel) -> dict:
+        """Cache the tenant as a plain dict, which can be shared by all the workers."""
+        cached_tenant = {'id': tenant.id, 'short_name': tenant.short_name, 'name': tenant.name}
+        cache.set(cls._get_cache_key(tenant.short_name), cached_tenant)
+        return cached_tenant
+
+    @classmethod
+    def get_cached(cls, short_name: str) -> Optional[dict]:
+        """Return the id, short name and name of a tenant, from the cache if possible."""
+        cached_tenant = cache.get(cls._get_cache_key(short_name))
+        if cached_tenant:
+            return cached_tenant
+        tenant = TenantModel.find_by_short_name(short_name)
+        if not tenant:
+            return None
+        return cls._cache_tenant(tenant)
+
+    @classmethod
+    def invalidate_cache(cls, *short_names: str):
+        """Remove tenants from the cache, for all the workers sharing it."""
+        cache.delete_many(*(cls._get_cache_key(short_name) for short_name in short_names))
+
     @classmethod
     def get(cls, tenant_id):
         """Get a tenant by id."""
@@ -65,11 +92,13 @@ class TenantService:
         tenant = TenantModel.find_by_short_name(tenant_id)
         if not tenant:
             raise ValueError(NOT_FOUND_MSG, cls, tenant_id)
+        previous_short_name = tenant.short_name
         try:
             tenant.update(data)
         except SQLAlchemyError as e:
             current_app.logger.error('Error updating tenant {}', e)
             raise ValueError('Error updating tenant.') from e
+        cls.invalidate_cache(previous_short_name, tenant.short_name)
         return TenantSchema().dump(tenant)
 
     @classmethod
@@ -82,9 +111,11 @@ class TenantService:
         tenant = TenantModel.find_by_short_name(tenant_id)
         if not tenant:
             raise ValueError(NOT_FOUND_MSG, cls, tenant_id)
+        short_name = tenant.short_name
         try:
             tenant.delete()
         except SQLAlchemyError as e:
             current_app.logger.error('Error deleting tenant {}', e)
             raise ValueError('Error deleting tenant.') from e
+        cls.invalidate_cache(short_name)
         return {'status': 'success', 'message': 'Tenant deleted successfully'}
@@ -3,6 +3,7 @@ from typing import List, Tuple
 
 from met_api.models.user_group_membership import UserGroupMembership
 from met_api.models.user_role import UserRole
+from met_api.services.identity_service import IdentityService
 
 
 class UserGroupMembershipService:
@@ -41,9 +42,11 @@ class UserGroupMembershipService:
     @staticmethod
     def assign_composite_role_to_user(membership_data):
         """Create user_group_membership."""
+        IdentityService.clear_context()
         return UserGroupMembership.create_user_group_membership(membership_data)
 
     @staticmethod
     def reassign_composite_role_to_user(membership_data):
         """Update user_group_membership."""
+        IdentityService.clear_context()
         return UserGroupMembership.update_user_group_membership(membership_data)
@@ -17,6 +17,11 @@ class WidgetDocumentService:
     def get_documents_by_widget_id(widget_id):
         """Get documents by widget id."""
         docs = WidgetDocumentsModel.get_all_by_widget_id(widget_id)
+        return WidgetDocumentService.get_documents_tree(docs)
+
+    @staticmethod
+    def get_documents_tree(docs):
+        """Get the folders and files of the documents of a widget as a tree."""
         if not docs:
             return {}
         # create all folders structure
@@ -1,6 +1,7 @@
 """Service for Widget Poll management."""
 from http import HTTPStatus
 
+from flask import current_app
 from sqlalchemy.exc import SQLAlchemyError
 
 from met_api.constants.engagement_status import Status as EngagementStatus
@@ -11,9 +12,14 @@ from met_api.services import authorization
 from met_api.services.engagement_service import EngagementService
 from met_api.services.poll_answers_service import PollAnswerService
 from met_api.services.poll_response_service import PollResponseService
+from met_api.utils.rate_limiter import TokenBucketLimiter
 from met_api.utils.roles import Role
 
 
+# Responses of the networks of the participants, throttled before reaching the database
+response_limiter = TokenBucketLimiter()
+
+
 class WidgetPollService:
     """Service for managing WidgetPolls."""
 
@@ -63,30 +69,14 @@ class WidgetPollService:
             raise BusinessException(str(exc), HTTPStatus.BAD_REQUEST) from exc
 
     @staticmethod
-    def record_response(response_data: dict):
-        """Record a response for a poll."""
-        try:
-            return PollResponseService.create_response(response_data)
-        except SQLAlchemyError as exc:
-            raise BusinessException(str(exc), HTTPStatus.BAD_REQUEST) from exc
-
-    @staticmethod
-    def check_already_polled(poll_id: int, ip_addr: str, count: int) -> bool:
-        """Check if an IP has already polled more than the given count."""
-        try:
-            poll_count = PollResponseService.get_poll_count(poll_id, ip_addr)
-            return poll_count >= count
-        except SQLAlchemyError as exc:
-            raise BusinessException(str(exc), HTTPStatus.BAD_REQUEST) from exc
-
-    @staticmethod
-    def is_poll_active(poll_id: int) -> bool:
-        """Check if the poll is active."""
-        try:
-            poll = WidgetPollService.get_poll_by_id(poll_id)
-            return poll.status == 'active'
-        except SQLAlchemyError as exc:
-            raise BusinessException(str(exc), HTTPStatus.BAD_REQUEST) from exc
+    def record_participant_response(poll_id: int, participant_id: str, selected_answer_id: int,
+                                    max_responses: int) -> int:
+        """Record a response of a participant, throttled per participant and checked by a single statement."""
+        config = current_app.config
+        if not response_limiter.allow(participant_id, config.get('POLL_RESPONSE_RATE'),
+                                      config.get('POLL_RESPONSE_BURST')):
+            raise BusinessException('Too many responses, please try again later', HTTPStatus.TOO_MANY_REQUESTS)
+        return PollResponseService.record_response(poll_id, participant_id, selected_answer_id, max_responses)
 
     @staticmethod
     def is_poll_engagement_published(poll_id: int) -> bool:
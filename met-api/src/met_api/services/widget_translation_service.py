@@ -5,7 +5,6 @@ from sqlalchemy.exc import IntegrityError
 from met_api.constants.membership_type import MembershipType
 from met_api.constants.widget import WidgetType
 from met_api.exceptions.business_exception import BusinessException
-from met_api.models.language import Language as LanguageModel
 from met_api.models.widget import Widget as WidgetModel
 from met_api.models.widget_map import WidgetMap as WidgetMapModel
 from met_api.models.widget_poll import Poll as PollModel
@@ -13,6 +12,7 @@ from met_api.models.widget_translation import WidgetTranslation as WidgetTransla
 from met_api.models.widget_video import WidgetVideo as WidgetVideoModel
 from met_api.schemas.widget_translation import WidgetTranslationSchema
 from met_api.services import authorization
+from met_api.services.reference_data_service import ReferenceDataService
 from met_api.utils.roles import Role
 
 
@@ -42,7 +42,7 @@ class WidgetTranslationService:
             )
             authorization.check_auth(one_of_roles=one_of_roles, engagement_id=widget.engagement_id)
 
-            language_record = LanguageModel.find_by_id(translation_data['language_id'])
+            language_record = ReferenceDataService.get_language(translation_data['language_id'])
             if not language_record:
                 raise ValueError('Language to translate was not found')
 
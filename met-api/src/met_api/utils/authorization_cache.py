@@ -0,0 +1,63 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Short lived cache of the engagement memberships and tenants checked by the authorization.
+
+Entries are kept in the shared cache for AUTHORIZATION_CACHE_TIMEOUT seconds, and removed as soon as the
+memberships or the tenant of an engagement change.
+"""
+from typing import Callable, Optional
+
+from flask import current_app
+
+from met_api.utils.cache import cache
+
+
+ENGAGEMENT_TENANT_KEY = 'engagement_tenant_{engagement_id}'
+ENGAGEMENT_MEMBERSHIP_KEY = 'engagement_membership_{engagement_id}_{user_id}'
+
+
+def _get_cached(key: str, load: Callable):
+    """Return the value cached under the key, loading and caching it when missing.
+
+    Values are wrapped, so that missing memberships and engagements are cached as well.
+    """
+    timeout = current_app.config.get('AUTHORIZATION_CACHE_TIMEOUT')
+    if not timeout:
+        return load()
+    cached = cache.get(key)
+    if cached is None:
+        cached = {'value': load()}
+        cache.set(key, cached, timeout=timeout)
+    return cached['value']
+
+
+def get_engagement_tenant_id(engagement_id, load: Callable) -> Optional[int]:
+    """Return the tenant of the engagement."""
+    return _get_cached(ENGAGEMENT_TENANT_KEY.format(engagement_id=engagement_id), load)
+
+
+def get_engagement_membership(engagement_id, user_id, load: Callable) -> Optional[dict]:
+    """Return the type, status and tenant of the membership of the user to the engagement."""
+    return _get_cached(ENGAGEMENT_MEMBERSHIP_KEY.format(engagement_id=engagement_id, user_id=user_id), load)
+
+
+def invalidate_engagement_memberships(user_id, *engagement_ids):
+    """Remove the cached memberships of the user to the engagements."""
+    cache.delete_many(*(ENGAGEMENT_MEMBERSHIP_KEY.format(engagement_id=engagement_id, user_id=user_id)
+                        for engagement_id in engagement_ids))
+
+
+def invalidate_engagement_tenant(engagement_id):
+    """Remove the cached tenant of the engagement."""
+    cache.delete(ENGAGEMENT_TENANT_KEY.format(engagement_id=engagement_id))
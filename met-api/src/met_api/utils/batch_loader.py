@@ -0,0 +1,130 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Request scoped batch loading of model relationships.
+
+Serializing a list of models touches the same relationship on every row, which makes SQLAlchemy lazy load it
+one row at a time. The batch loader collects the keys of all the rows instead and loads each relationship with a
+single IN query, then populates the relationship on every row so that schema fields read it from memory.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set
+
+from flask import g, has_app_context
+from sqlalchemy import inspect
+from sqlalchemy.orm import object_session
+from sqlalchemy.orm.attributes import set_committed_value
+
+
+class BatchLoader:
+    """Load a relationship of many models with one query per relationship."""
+
+    def __init__(self):
+        """Initialize the loader statistics."""
+        self.queries = 0
+        self.loaded = 0
+
+    def load(self, objects: Iterable, *paths: str) -> None:
+        """Load the relationship paths of the given models.
+
+        Paths are relationship names, and can be dotted to load the relationships of the related models,
+        for example 'comments' and 'comments.survey'. Objects that are not persistent models are ignored.
+        """
+        objects = [obj for obj in objects if _is_persistent(obj)]
+        if not objects:
+            return
+        for path in sorted(set(paths), key=lambda p: p.count('.')):
+            targets = objects
+            for name in path.split('.'):
+                targets = self._load_relationship(targets, name)
+                if not targets:
+                    break
+
+    def _load_relationship(self, objects: List, name: str) -> List:
+        """Populate one relationship of the given models and return the related models."""
+        related = []
+        objects_by_class = defaultdict(list)
+        for obj in objects:
+            objects_by_class[type(obj)].append(obj)
+
+        for model, instances in objects_by_class.items():
+            relationship = inspect(model).relationships.get(name)
+            if relationship is None:
+                continue
+            unloaded = [obj for obj in instances if name in inspect(obj).unloaded]
+            if unloaded and not self._populate(relationship, unloaded):
+                # relationships through an association table are left to their regular loader
+                for obj in unloaded:
+                    getattr(obj, name)
+            for obj in instances:
+                value = getattr(obj, name)
+                if relationship.uselist:
+                    related.extend(value or [])
+                elif value is not None:
+                    related.append(value)
+        return related
+
+    def _populate(self, relationship, objects: List) -> bool:
+        """Load the related rows of the given models with one query and set them on each model."""
+        if relationship.secondary is not None or len(relationship.local_remote_pairs) != 1:
+            return False
+        local_column, remote_column = relationship.local_remote_pairs[0]
+        local_key = relationship.parent.get_property_by_column(local_column).key
+        target = relationship.mapper
+        remote_key = target.get_property_by_column(remote_column).key
+        session = object_session(objects[0])
+
+        keys = {getattr(obj, local_key) for obj in objects} - {None}
+        rows_by_key = defaultdict(list)
+        if not relationship.uselist and target.primary_key == (remote_column,):
+            # many to one by primary key: reuse the models that are already in the session
+            rows_by_key.update(_find_in_session(session, target, keys))
+            keys -= rows_by_key.keys()
+        if keys:
+            query = session.query(target.class_).filter(getattr(target.class_, remote_key).in_(keys))
+            query = query.order_by(*relationship.order_by) if relationship.order_by \
+                else query.order_by(*target.primary_key)
+            self.queries += 1
+            for row in query.all():
+                rows_by_key[getattr(row, remote_key)].append(row)
+                self.loaded += 1
+
+        for obj in objects:
+            rows = rows_by_key.get(getattr(obj, local_key), [])
+            set_committed_value(obj, relationship.key, list(rows) if relationship.uselist else next(iter(rows), None))
+        return True
+
+
+def _find_in_session(session, mapper, keys: Set) -> Dict:
+    """Return the models with the given primary keys that are loaded in the session, as lists by key."""
+    found = {}
+    for key in keys:
+        row = session.identity_map.get(mapper.identity_key_from_primary_key([key]))
+        if row is not None and not inspect(row).expired:
+            found[key] = [row]
+    return found
+
+
+def _is_persistent(obj) -> bool:
+    """Return True if the object is a model attached to a session."""
+    state = inspect(obj, raiseerr=False)
+    return state is not None and hasattr(state, 'persistent') and state.persistent
+
+
+def get_batch_loader() -> BatchLoader:
+    """Return the batch loader of the current request."""
+    if not has_app_context():
+        return BatchLoader()
+    if 'batch_loader' not in g:
+        g.batch_loader = BatchLoader()
+    return g.batch_loader
@@ -11,9 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Bring in the common cache."""
+"""Bring in the common cache.
+
+The backend is configured from the CACHE_* settings of the app, so that the cache can be shared by the workers of
+the API: the filesystem backend works locally (in shared memory when its directory is on a tmpfs such as /dev/shm)
+and the Redis backend needs the optional redis package. Values must be picklable, such as plain dicts.
+"""
 from flask_caching import Cache
 
 
 # lower case name as used by convention in most Flask apps
-cache = Cache(config={'CACHE_TYPE': 'simple'})  # pylint: disable=invalid-name
+cache = Cache()  # pylint: disable=invalid-name
@@ -1,32 +1,20 @@
-"""Filters used to filter by metadata contents in various ways."""
-
-from met_api.models.engagement_metadata import EngagementMetadata, MetadataTaxonFilterType
-from sqlalchemy import func
-
-
-def list_match_all(query, values):
-    """Create and return a subquery selecting engagements that have all of the provided values."""
-    # Create a subquery to find engagements that have the required number of matching metadata entries
-    values_count = len(values)
-    subquery = query.filter(
-        EngagementMetadata.value.in_(values)
-    ).group_by(
-        # Group by engagement_id to count the number of matching values
-        EngagementMetadata.engagement_id
-    ).having(
-        # Ensure that the number of matching values is equal to the number of values provided
-        func.count('*') == values_count
-    ) .subquery()
-    return subquery
-
-
-def list_match_any(query, values):
-    """Create and return a subquery selecting engagements that have any of the provided values."""
-    metadata_subq = query.filter(
-        EngagementMetadata.value.in_(values)
-    ).subquery()
-
-    return metadata_subq
+"""Filters used to filter by metadata contents in various ways.
+
+The filters apply to the metadata_values array of the engagements, which holds their metadata facets and is covered by
+a GIN index, so that any number of criteria is answered by a single index scan.
+"""
+
+from met_api.models.engagement_metadata import MetadataTaxonFilterType
+
+
+def list_match_all(column, facets):
+    """Return the condition on the engagements that have all of the provided metadata facets."""
+    return column.contains(facets)
+
+
+def list_match_any(column, facets):
+    """Return the condition on the engagements that have any of the provided metadata facets."""
+    return column.overlap(facets)
 
 
 """
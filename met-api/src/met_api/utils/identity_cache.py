@@ -0,0 +1,144 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Request scoped identity cache of the model finders.
+
+A request goes through several services which look up the same rows, such as the survey and engagement of a
+submission, and the session only answers the lookups by primary key of rows which are loaded and not expired. The
+finders decorated with identity_cached read through a cache kept on g instead, which remembers their results,
+including the rows which were not found, until the models they return are written, the session commits or rolls
+back, or the request ends. The cache also counts the statements run by the request.
+"""
+from functools import wraps
+from typing import Callable, Dict, Set, Tuple
+
+from flask import g, has_request_context
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+
+IDENTITY_CACHE = 'identity_cache'
+
+
+class IdentityCache:
+    """Results of the finders called by a request, by model, finder and arguments."""
+
+    def __init__(self):
+        """Initialize the cache statistics."""
+        self.queries = 0
+        self.hits = 0
+        self._session = None
+        self._entries: Dict[Tuple, object] = {}
+
+    def get(self, session, key: Tuple, load: Callable):
+        """Return the result of the finder for the key, (model, finder name, arguments), loading it when missing."""
+        if session is not self._session:
+            self._entries.clear()
+            self._session = session
+        if key in self._entries and not _has_pending_changes(session, key[0]):
+            result = self._entries[key]
+            if _is_current(result):
+                self.hits += 1
+                return list(result) if isinstance(result, list) else result
+        result = load()
+        self._entries[key] = list(result) if isinstance(result, list) else result
+        return result
+
+    def invalidate(self, *models):
+        """Forget the results of the finders of the given models, and of the models they inherit from."""
+        for key in [key for key in self._entries if any(issubclass(model, key[0]) for model in models)]:
+            del self._entries[key]
+
+    def invalidate_table(self, table_name: str):
+        """Forget the results of the finders of the models of the table."""
+        for key in [key for key in self._entries if getattr(key[0], '__tablename__', None) == table_name]:
+            del self._entries[key]
+
+    def clear(self):
+        """Forget the results of all the finders."""
+        self._entries.clear()
+
+
+def identity_cached(finder: Callable) -> Callable:
+    """Decorate a finder classmethod of a model, taking hashable arguments, to read through the cache."""
+    @wraps(finder)
+    def decorated_finder(cls, *args):
+        if not has_request_context():
+            return finder(cls, *args)
+        return get_identity_cache().get(cls.query.session, (cls, finder.__name__, args), lambda: finder(cls, *args))
+    return decorated_finder
+
+
+def get_identity_cache() -> IdentityCache:
+    """Return the identity cache of the current request."""
+    if IDENTITY_CACHE not in g:
+        g.identity_cache = IdentityCache()
+    return g.identity_cache
+
+
+def reset_identity_cache():
+    """Start an empty identity cache, for a new request reusing the app context."""
+    if has_request_context():
+        g.pop(IDENTITY_CACHE, None)
+
+
+def _is_current(result) -> bool:
+    """Return True if the models of the result are still loaded in the session and not expired."""
+    for instance in (result if isinstance(result, list) else [result]):
+        state = inspect(instance, raiseerr=False)
+        if state is not None and hasattr(state, 'persistent') and (not state.persistent or state.expired):
+            return False
+    return True
+
+
+def _has_pending_changes(session, model) -> bool:
+    """Return True if models of the class are written but not flushed, which a query would flush first."""
+    return any(isinstance(instance, model) for instance in (*session.new, *session.dirty, *session.deleted))
+
+
+def _get_request_cache():
+    return g.get(IDENTITY_CACHE) if has_request_context() else None
+
+
+@event.listens_for(Session, 'after_flush')
+def _invalidate_flushed(session, _flush_context):
+    if (cache := _get_request_cache()) is not None:
+        models: Set[type] = {type(instance) for instance in (*session.new, *session.dirty, *session.deleted)}
+        cache.invalidate(*models)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _invalidate_executed(orm_execute_state):
+    """Forget the results of the models of the table written by a statement, or all of them if it is unknown."""
+    if (cache := _get_request_cache()) is None or orm_execute_state.is_select:
+        return
+    table_name = getattr(getattr(orm_execute_state.statement, 'table', None), 'name', None)
+    if table_name is not None:
+        cache.invalidate_table(table_name)
+    else:
+        cache.clear()
+
+
+@event.listens_for(Session, 'after_commit')
+@event.listens_for(Session, 'after_soft_rollback')
+def _clear_ended(*_):
+    """Forget all the results once the transaction ends, as other transactions may have written the rows since."""
+    if (cache := _get_request_cache()) is not None:
+        cache.clear()
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _count_query(*_):
+    if has_request_context():
+        get_identity_cache().queries += 1
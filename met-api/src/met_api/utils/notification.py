@@ -2,10 +2,13 @@
 
 import json
 import re
+from http import HTTPStatus
+from typing import List
 
 import requests
 
 from flask import current_app
+from met_api.models.email_outbox import EmailOutbox
 from met_api.models.tenant import Tenant
 from met_api.services.rest_service import RestService
 from met_api.constants.email_verification import INTERNAL_EMAIL_DOMAIN
@@ -25,17 +28,51 @@ def get_tenant_site_url(tenant_id, path=''):
         return site_url + path
 
 
-def send_email(subject, email, html_body, args, template_id):
-    """Send the email asynchronously, using the given details."""
+def queue_email(idempotency_key, subject, email, html_body, args, template_id):  # pylint: disable=too-many-arguments
+    """Queue the email in the outbox within the current transaction, to be sent once the transaction commits.
+
+    The idempotency key identifies the email, such as its type and the token it carries, so that retrying the
+    request does not send it twice. Returns the id of the queued email, or None if it was not queued.
+    """
+    if not email or not is_valid_email(email):
+        return None
+
+    if not is_allowed_email(email):
+        raise ValueError('The email provided is not allowed in this environment.')
+
+    return EmailOutbox.enqueue(idempotency_key, email, subject, html_body, args, template_id)
+
+
+def send_email(subject, email, html_body, args, template_id, reference=None):  # pylint: disable=too-many-arguments
+    """Send the email asynchronously, using the given details.
+
+    The reference, such as the idempotency key of an email of the outbox, is passed to the notification provider.
+    """
     if not email or not is_valid_email(email):
         return
 
     if not is_allowed_email(email):
         raise ValueError('The email provided is not allowed in this environment.')
 
-    sender = current_app.config['EMAIL_TEMPLATES']['FROM_ADDRESS']
-    service_account_token = RestService.get_service_account_token()
     send_email_endpoint = current_app.config.get('NOTIFICATIONS_EMAIL_ENDPOINT')
+    _post_authorized(send_email_endpoint, _get_email_payload(subject, email, html_body, args, template_id, reference))
+
+
+def send_email_batch(emails: List[dict]) -> List[dict]:
+    """Send the emails in a single request, returning the result of each email in order.
+
+    Each email holds the arguments of send_email, and was checked to be valid and allowed. Each result has the status,
+    SENT or FAILED, of the email, and for a failed email its error and the status code of the provider if it rejected
+    it.
+    """
+    send_email_endpoint = current_app.config.get('NOTIFICATIONS_EMAIL_BATCH_ENDPOINT')
+    payloads = [_get_email_payload(**email) for email in emails]
+    return _post_authorized(send_email_endpoint, {'emails': payloads}).json()['results']
+
+
+def _get_email_payload(subject, email, html_body, args, template_id,  # pylint: disable=too-many-arguments
+                       reference=None):
+    sender = current_app.config['EMAIL_TEMPLATES']['FROM_ADDRESS']
     payload = {
         'bodyType': 'html',
         'body': html_body,
@@ -45,12 +82,26 @@ def send_email(subject, email, html_body, args, template_id):
         'args': args,
         'template_id': template_id,
     }
-    response = requests.post(send_email_endpoint,
-                             headers={
-                                 'Content-Type': 'application/json',
-                                 'Authorization': f'Bearer {service_account_token}'},
-                             data=json.dumps(payload))
+    if reference:
+        payload['reference'] = reference
+    return payload
+
+
+def _post_authorized(endpoint, payload):
+    response = _post_email(endpoint, payload, RestService.get_service_account_token())
+    if response.status_code == HTTPStatus.UNAUTHORIZED:
+        # the cached token was revoked or expired early, retry once with a new one
+        response = _post_email(endpoint, payload, RestService.get_service_account_token(force_refresh=True))
     response.raise_for_status()
+    return response
+
+
+def _post_email(send_email_endpoint, payload, service_account_token):
+    return requests.post(send_email_endpoint,
+                         headers={
+                             'Content-Type': 'application/json',
+                             'Authorization': f'Bearer {service_account_token}'},
+                         data=json.dumps(payload))
 
 
 def is_valid_email(email: str):
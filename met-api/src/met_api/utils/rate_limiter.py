@@ -0,0 +1,57 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""In-process token bucket rate limiter.
+
+Each key, such as the hash of the network of a participant, gets a bucket of burst tokens refilled at rate tokens per
+second, and each request takes a token. Buckets are kept in the memory of the worker, so the limit applies per worker,
+in front of the checks done by the database.
+"""
+import time
+from collections import OrderedDict
+from threading import Lock
+
+
+class TokenBucketLimiter:
+    """Token buckets of the keys, keeping the most recently used max_keys buckets."""
+
+    def __init__(self, max_keys: int = 10000):
+        """Initialize."""
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()  # key -> (tokens, monotonic time of the last update)
+        self._lock = Lock()
+
+    def allow(self, key, rate: float, burst: int) -> bool:
+        """Take a token from the bucket of the key, returning False when the bucket is empty.
+
+        A rate of 0 disables the limit.
+        """
+        if not rate:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                # the least recently used bucket is the one most likely to be full again
+                self._buckets.popitem(last=False)
+            return allowed
+
+    def clear(self):
+        """Remove all the buckets."""
+        with self._lock:
+            self._buckets.clear()
@@ -0,0 +1,296 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of the responses to the anonymous GET requests of the public engagement pages.
+
+Responses to requests without an Authorization header are kept in the shared cache for PUBLIC_RESPONSE_CACHE_TIMEOUT
+seconds, keyed by tenant, path with its query string and language, along with an ETag computed from their content, so
+that revalidations with If-None-Match are answered with 304 Not Modified.
+
+Each entry records the version of its engagement, which changes when a write to the engagement, its widgets, contents,
+translations, slug or status is flushed or run as a bulk statement and again when it is committed, and the version of
+all the public responses, which changes in the same way on the writes whose engagement cannot be resolved. Entries
+recorded with other versions are not served.
+"""
+import functools
+import hashlib
+import uuid
+from typing import Callable, Iterable, Optional
+
+from flask import current_app, has_app_context, request
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from met_api.models.db import db
+from met_api.utils import constants
+from met_api.utils.cache import cache
+
+
+ENTRY_KEY = 'public_response_{digest}'
+VERSION_KEY = 'public_response_version'
+ENGAGEMENT_VERSION_KEY = 'public_response_version_{engagement_id}'
+PARENT_KEY = 'public_response_parent_{table}_{row_id}'
+# cached responses may be stored by the browsers, but must be revalidated with their ETag
+CACHE_CONTROL = 'no-cache'
+
+# Tables of the public engagement pages, with the column holding their engagement id or the id of their parent row
+ENGAGEMENT_COLUMNS = {
+    'engagement': ('id', None),
+    'engagement_content': ('engagement_id', None),
+    'engagement_custom_content': ('engagement_id', None),
+    'engagement_summary_content': ('engagement_id', None),
+    'engagement_translation': ('engagement_id', None),
+    'engagement_slug': ('engagement_id', None),
+    'engagement_status_block': ('engagement_id', None),
+    'engagement_metadata': ('engagement_id', None),
+    'survey': ('engagement_id', None),
+    'widget': ('engagement_id', None),
+    'widget_map': ('engagement_id', None),
+    'widget_polls': ('engagement_id', None),
+    'widget_timeline': ('engagement_id', None),
+    'widget_video': ('engagement_id', None),
+    'timeline_event': ('engagement_id', None),
+    'engagement_content_translation': ('engagement_content_id', 'engagement_content'),
+    'widget_documents': ('widget_id', 'widget'),
+    'widget_events': ('widget_id', 'widget'),
+    'widget_item': ('widget_id', 'widget'),
+    'widget_subscribe': ('widget_id', 'widget'),
+    'widget_translation': ('widget_id', 'widget'),
+    'event_item': ('widget_events_id', 'widget_events'),
+    'subscribe_item': ('widget_subscribe_id', 'widget_subscribe'),
+    'poll_answers': ('poll_id', 'widget_polls'),
+    'event_item_translation': ('event_item_id', 'event_item'),
+    'subscribe_item_translation': ('subscribe_item_id', 'subscribe_item'),
+    'poll_answer_translation': ('poll_answer_id', 'poll_answers'),
+    'timeline_event_translation': ('timeline_event_id', 'timeline_event'),
+}
+# Tables of the rows shown on the pages of any engagement
+SHARED_TABLES = ('contact',)
+
+_PENDING_ENGAGEMENT_IDS = 'public_response_engagement_ids'
+_PENDING_ALL = 'public_response_all'
+# set in the environment of the requests answered from the cache
+_PUBLIC_RESPONSE = 'met_api.public_response'
+
+
+def engagement_id_arg(kwargs: dict) -> Optional[int]:
+    """Return the engagement id of the view arguments."""
+    return kwargs.get('engagement_id')
+
+
+def parent_engagement_id(table: str, arg: str) -> Callable[[dict], Optional[int]]:
+    """Return the function resolving the engagement of the row of the table identified by the view argument.
+
+    The engagement of a row never changes, so it is resolved once and kept in the cache.
+    """
+    def resolve(kwargs: dict) -> Optional[int]:
+        row_id = kwargs.get(arg)
+        if not str(row_id).isdigit():
+            return None
+        key = PARENT_KEY.format(table=table, row_id=row_id)
+        engagement_id = cache.get(key)
+        if engagement_id is None:
+            engagement_id = _get_engagement_id(db.session.connection(), table, int(row_id))
+            if engagement_id is not None:
+                cache.set(key, engagement_id, timeout=_get_timeout())
+        return engagement_id
+    return resolve
+
+
+def cached_public_response(get_engagement_id: Optional[Callable[[dict], Optional[int]]] = engagement_id_arg):
+    """Cache the responses of the view to the anonymous GET requests.
+
+    The engagement of a response is resolved from the view arguments, or else read from the engagement_id of its body.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            timeout = _get_timeout()
+            if not timeout or request.method != 'GET' or 'Authorization' in request.headers:
+                return view(*args, **kwargs)
+
+            key = ENTRY_KEY.format(digest=hashlib.sha256(_get_request_key().encode()).hexdigest())
+            engagement_id = get_engagement_id(kwargs) if get_engagement_id else None
+            entry = cache.get(key)
+            if entry is None or entry['versions'] != _get_versions(entry['engagement_id']):
+                # the versions are read before the response, so that a concurrent write makes the entry outdated
+                versions = _get_versions(engagement_id) if engagement_id is not None else None
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code != 200 or not response.is_json:
+                    return response
+                if engagement_id is None:
+                    engagement_id = _get_body_engagement_id(response.get_json())
+                    versions = _get_versions(engagement_id)
+                body = response.get_data()
+                entry = {
+                    'engagement_id': engagement_id,
+                    'versions': versions,
+                    'body': body,
+                    'mimetype': response.mimetype,
+                    'etag': hashlib.sha256(body).hexdigest()[:32],
+                }
+                cache.set(key, entry, timeout=timeout)
+
+            request.environ[_PUBLIC_RESPONSE] = True
+            response = current_app.response_class(entry['body'], mimetype=entry['mimetype'])
+            response.set_etag(entry['etag'])
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
+
+
+def set_cache_control(response):
+    """Let the browsers keep the cached public responses, which would otherwise be marked no-store."""
+    if request.environ.get(_PUBLIC_RESPONSE):
+        response.headers['Cache-Control'] = CACHE_CONTROL
+    return response
+
+
+def invalidate_engagements(*engagement_ids):
+    """Outdate the cached responses of the engagements."""
+    for engagement_id in engagement_ids:
+        cache.set(ENGAGEMENT_VERSION_KEY.format(engagement_id=engagement_id), uuid.uuid4().hex, timeout=_get_timeout())
+
+
+def invalidate_all():
+    """Outdate all the cached responses."""
+    cache.set(VERSION_KEY, uuid.uuid4().hex, timeout=_get_timeout())
+
+
+def invalidate_rows(table: str, rows: Iterable):
+    """Outdate the cached responses of the engagements of the rows written with the bulk methods of the session.
+
+    bulk_save_objects, bulk_insert_mappings and bulk_update_mappings neither flush instances nor run ORM statements,
+    so the session events do not see their rows. The rows are the mappings or instances passed to them, holding their
+    engagement column or their id.
+    """
+    if not has_app_context() or not _get_timeout():
+        return
+    column, parent_table = ENGAGEMENT_COLUMNS[table]
+    connection = db.session.connection()
+    engagement_ids = set()
+    for row in rows:
+        values = row if isinstance(row, dict) else vars(row)
+        if values.get(column) is not None:
+            engagement_ids.add(_get_engagement_id(connection, parent_table, values[column])
+                               if parent_table is not None else values[column])
+        else:
+            engagement_ids.add(_get_engagement_id(connection, table, values.get('id')))
+    _invalidate(db.session, engagement_ids - {None}, None in engagement_ids)
+
+
+def _get_timeout() -> int:
+    return current_app.config.get('PUBLIC_RESPONSE_CACHE_TIMEOUT', 0)
+
+
+def _get_request_key() -> str:
+    tenant = request.headers.get(constants.TENANT_ID_HEADER, '')
+    language = request.headers.get('Accept-Language', '')
+    return f'{tenant}|{request.full_path}|{language}'
+
+
+def _get_versions(engagement_id) -> tuple:
+    versions = cache.get_many(VERSION_KEY, ENGAGEMENT_VERSION_KEY.format(engagement_id=engagement_id))
+    return tuple(versions)
+
+
+def _get_body_engagement_id(body) -> Optional[int]:
+    if isinstance(body, list):
+        body = body[0] if body else None
+    return body.get('engagement_id') if isinstance(body, dict) else None
+
+
+def _get_engagement_id(connection, table: str, row_id) -> Optional[int]:
+    """Return the engagement of the row of the table, looking up its parent rows."""
+    while row_id is not None and table != 'engagement':
+        column, parent_table = ENGAGEMENT_COLUMNS[table]
+        table_columns = db.metadata.tables[table].c
+        row_id = connection.execute(select(table_columns[column]).where(table_columns.id == row_id)).scalar()
+        table = parent_table or 'engagement'
+    return row_id
+
+
+@event.listens_for(Session, 'after_flush')
+def _invalidate_flushed(session, _flush_context):
+    """Outdate the cached responses of the engagements whose public rows were written."""
+    if not has_app_context() or not _get_timeout():
+        return
+    engagement_ids, unresolved = set(), False
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(instance, '__tablename__', None)
+        if table in SHARED_TABLES:
+            unresolved = True
+        if table not in ENGAGEMENT_COLUMNS:
+            continue
+        column, parent_table = ENGAGEMENT_COLUMNS[table]
+        engagement_id = getattr(instance, column, None)
+        if parent_table is not None:
+            engagement_id = _get_engagement_id(session.connection(), parent_table, engagement_id)
+        if engagement_id is None:
+            unresolved = True
+        else:
+            engagement_ids.add(engagement_id)
+    _invalidate(session, engagement_ids, unresolved)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _invalidate_executed(orm_execute_state):
+    """Outdate the cached responses of the engagements whose public rows are written by a bulk statement.
+
+    The bulk updates and deletes, such as query.update(), do not go through the flush. Their engagements are resolved
+    by selecting the rows matching their criteria before they run; the statements without criteria, and the inserts,
+    outdate all the cached responses.
+    """
+    if orm_execute_state.is_select or not has_app_context() or not _get_timeout():
+        return
+    statement = orm_execute_state.statement
+    table = getattr(getattr(statement, 'table', None), 'name', None)
+    if table in SHARED_TABLES:
+        _invalidate(orm_execute_state.session, set(), True)
+    if table not in ENGAGEMENT_COLUMNS:
+        return
+    whereclause = getattr(statement, 'whereclause', None)
+    if orm_execute_state.is_insert or whereclause is None:
+        _invalidate(orm_execute_state.session, set(), True)
+        return
+    connection = orm_execute_state.session.connection()
+    column, parent_table = ENGAGEMENT_COLUMNS[table]
+    row_ids = connection.execute(
+        select(db.metadata.tables[table].c[column]).where(whereclause), orm_execute_state.parameters or {}
+    ).scalars().all()
+    engagement_ids = set(row_ids) if parent_table is None else \
+        {_get_engagement_id(connection, parent_table, row_id) for row_id in row_ids}
+    _invalidate(orm_execute_state.session, engagement_ids - {None}, None in engagement_ids)
+
+
+def _invalidate(session, engagement_ids: set, unresolved: bool):
+    if unresolved:
+        invalidate_all()
+        session.info[_PENDING_ALL] = True
+    invalidate_engagements(*engagement_ids)
+    session.info.setdefault(_PENDING_ENGAGEMENT_IDS, set()).update(engagement_ids)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed(session):
+    """Outdate the responses cached by concurrent requests while the writes were not committed yet."""
+    if session.info.pop(_PENDING_ALL, False):
+        invalidate_all()
+    if engagement_ids := session.info.pop(_PENDING_ENGAGEMENT_IDS, None):
+        invalidate_engagements(*engagement_ids)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_rolled_back(session):
+    session.info.pop(_PENDING_ENGAGEMENT_IDS, None)
+    session.info.pop(_PENDING_ALL, None)
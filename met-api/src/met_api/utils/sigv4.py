@@ -0,0 +1,135 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""AWS signature version 4 signing of object storage requests.
+
+Signatures are computed locally, either as Authorization headers or as presigned URLs, following
+https://docs.aws.amazon.com/AmazonS3/latest/API/sig-v4-authenticating-requests.html
+"""
+import hashlib
+import hmac
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote, unquote
+
+
+ALGORITHM = 'AWS4-HMAC-SHA256'
+EMPTY_PAYLOAD_HASH = hashlib.sha256(b'').hexdigest()
+UNSIGNED_PAYLOAD = 'UNSIGNED-PAYLOAD'
+# the longest expiry accepted for presigned URLs, seven days
+MAX_PRESIGNED_EXPIRY = 7 * 24 * 60 * 60
+
+
+def _hmac(key: bytes, msg: str) -> bytes:
+    return hmac.new(key, msg.encode('utf-8'), hashlib.sha256).digest()
+
+
+def _quote(value: str, safe: str = '-_.~') -> str:
+    return quote(value, safe=safe)
+
+
+class SigV4Signer:
+    """Sign requests to an object storage host."""
+
+    def __init__(self, access_key: str, secret_key: str, host: str,  # pylint: disable=too-many-arguments
+                 region: str, service: str, session_token: Optional[str] = None):
+        """Initialize the signer with the credentials and the signing scope."""
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.host = host
+        self.region = region
+        self.service = service
+        self.session_token = session_token
+        self._signing_key: Tuple[Optional[str], Optional[bytes]] = (None, None)
+
+    def _get_signing_key(self, datestamp: str) -> bytes:
+        """Return the signing key of the day, derived once per day instead of once per request."""
+        key_datestamp, key = self._signing_key
+        if key_datestamp != datestamp:
+            key = _hmac(('AWS4' + self.secret_key).encode('utf-8'), datestamp)
+            for scope in (self.region, self.service, 'aws4_request'):
+                key = _hmac(key, scope)
+            self._signing_key = (datestamp, key)
+        return key
+
+    def _credential_scope(self, datestamp: str) -> str:
+        return f'{datestamp}/{self.region}/{self.service}/aws4_request'
+
+    def _sign(self, canonical_request: str, amzdate: str, datestamp: str) -> str:
+        string_to_sign = '\n'.join((
+            ALGORITHM,
+            amzdate,
+            self._credential_scope(datestamp),
+            hashlib.sha256(canonical_request.encode('utf-8')).hexdigest(),
+        ))
+        return hmac.new(self._get_signing_key(datestamp), string_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
+
+    def sign_headers(self, method: str, path: str, timestamp: Optional[datetime] = None,
+                     payload_hash: str = EMPTY_PAYLOAD_HASH) -> Dict[str, str]:
+        """Return the headers authorizing the request, signed for the host and date headers."""
+        timestamp = timestamp or datetime.utcnow()
+        amzdate = timestamp.strftime('%Y%m%dT%H%M%SZ')
+        datestamp = timestamp.strftime('%Y%m%d')
+
+        canonical_headers = f'host:{self.host}\nx-amz-date:{amzdate}\n'
+        signed_headers = 'host;x-amz-date'
+        if self.session_token:
+            canonical_headers += f'x-amz-security-token:{self.session_token}\n'
+            signed_headers += ';x-amz-security-token'
+
+        canonical_request = '\n'.join((
+            method, canonical_path(path), '', canonical_headers, signed_headers, payload_hash
+        ))
+        signature = self._sign(canonical_request, amzdate, datestamp)
+
+        headers = {
+            'Authorization': f'{ALGORITHM} Credential={self.access_key}/{self._credential_scope(datestamp)}, '
+                             f'SignedHeaders={signed_headers}, Signature={signature}',
+            'x-amz-date': amzdate,
+            'x-amz-content-sha256': payload_hash,
+        }
+        if self.session_token:
+            headers['X-Amz-Security-Token'] = self.session_token
+        return headers
+
+    def presign_url(self, method: str, path: str, expires_in: int,  # pylint: disable=too-many-arguments
+                    timestamp: Optional[datetime] = None, scheme: str = 'https') -> str:
+        """Return a URL authorizing the request in its query string until it expires."""
+        if not 0 < expires_in <= MAX_PRESIGNED_EXPIRY:
+            raise ValueError(f'Presigned URL expiry must be between 1 and {MAX_PRESIGNED_EXPIRY} seconds')
+        timestamp = timestamp or datetime.utcnow()
+        amzdate = timestamp.strftime('%Y%m%dT%H%M%SZ')
+        datestamp = timestamp.strftime('%Y%m%d')
+
+        query = {
+            'X-Amz-Algorithm': ALGORITHM,
+            'X-Amz-Credential': f'{self.access_key}/{self._credential_scope(datestamp)}',
+            'X-Amz-Date': amzdate,
+            'X-Amz-Expires': str(expires_in),
+            'X-Amz-SignedHeaders': 'host',
+        }
+        if self.session_token:
+            query['X-Amz-Security-Token'] = self.session_token
+        canonical_query = '&'.join(f'{_quote(key)}={_quote(value)}' for key, value in sorted(query.items()))
+
+        path = canonical_path(path)
+        canonical_request = '\n'.join((
+            method, path, canonical_query, f'host:{self.host}\n', 'host', UNSIGNED_PAYLOAD
+        ))
+        signature = self._sign(canonical_request, amzdate, datestamp)
+        return f'{scheme}://{self.host}{path}?{canonical_query}&X-Amz-Signature={signature}'
+
+
+def canonical_path(path: str) -> str:
+    """Return the URI encoded path, encoding paths that are already encoded only once."""
+    return _quote(unquote(path or '/'), safe='/-_.~')
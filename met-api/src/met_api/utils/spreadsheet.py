@@ -0,0 +1,94 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Streaming of spreadsheet rows as CSV or XLSX responses.
+
+CSV rows are written to the response in chunks as they are produced. XLSX needs the optional openpyxl package; the
+workbook is written in write only mode to a temporary file, so that memory use does not grow with the number of
+rows, and the file is streamed once complete.
+"""
+import csv
+import io
+import tempfile
+from typing import Iterable, Iterator, List
+
+from flask import Response, stream_with_context
+
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+except ImportError:  # pragma: no cover
+    Workbook = None
+    ILLEGAL_CHARACTERS_RE = None
+
+CSV = 'csv'
+XLSX = 'xlsx'
+
+MIME_TYPES = {
+    CSV: 'text/csv',
+    XLSX: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+CHUNK_SIZE = 64 * 1024
+
+
+def is_xlsx_available() -> bool:
+    """Return True if XLSX files can be written."""
+    return Workbook is not None
+
+
+def stream_csv(rows: Iterable[List], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Write the rows as CSV, yielding the encoded output in chunks."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def stream_xlsx(rows: Iterable[List], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Write the rows to a single sheet workbook, yielding the file in chunks."""
+    if not is_xlsx_available():
+        raise ValueError('XLSX export requires the openpyxl package')
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for row in rows:
+        sheet.append([_clean_cell(value) for value in row])
+    with tempfile.TemporaryFile() as file:
+        workbook.save(file)
+        file.seek(0)
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def _clean_cell(value):
+    """Remove the control characters that are not allowed in XLSX cells."""
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub('', value)
+    return value
+
+
+def spreadsheet_response(rows: Iterable[List], export_format: str, report_name: str) -> Response:
+    """Return a response streaming the rows as a spreadsheet file."""
+    stream = stream_xlsx(rows) if export_format == XLSX else stream_csv(rows)
+    return Response(
+        stream_with_context(stream),
+        mimetype=MIME_TYPES[export_format],
+        headers={'content-disposition': f'attachment; filename={report_name}.{export_format}'}
+    )
@@ -0,0 +1,176 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compiled index of the components of a survey form.
+
+Forms are stored with a display type of 'form' for single page surveys and 'wizard' for multi page surveys, where
+the questions are nested in the pages. The index flattens the questions once and maps them by key, so that looking
+up the label of a comment does not walk the form again. Indexes are cached per survey and last update date.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, List, Optional
+
+
+FORM_DISPLAY = 'form'
+WIZARD_DISPLAY = 'wizard'
+TEXT_INPUT_TYPE = 'text'
+SELECT_TYPE = 'simpleselect'
+
+CACHE_SIZE = 256
+
+
+@dataclass
+class FormComponent:
+    """A question of the survey form."""
+
+    key: Optional[str]
+    label: Optional[str]
+    type: Optional[str]
+    page: int
+    position: int
+    values: Dict = field(default_factory=dict)
+    component: Dict = field(default_factory=dict)
+
+    @property
+    def is_text(self) -> bool:
+        """Return True if the question accepts a comment."""
+        return self.component.get('inputType') == TEXT_INPUT_TYPE
+
+
+class SurveyFormIndex:
+    """The questions of a survey form, in form order and by key."""
+
+    def __init__(self, form_json: Optional[Dict]):
+        """Flatten the form pages and index the questions by key."""
+        self.components: List[FormComponent] = []
+        self.by_key: Dict[str, FormComponent] = {}
+        for page, components in enumerate(_get_pages(form_json or {})):
+            for position, component in enumerate(components):
+                self._add(FormComponent(
+                    key=component.get('key'),
+                    label=component.get('label'),
+                    type=component.get('type'),
+                    page=page,
+                    position=position,
+                    values=_get_values(component),
+                    component=component,
+                ))
+        self.text_components: List[FormComponent] = [component for component in self.components if component.is_text]
+        self.text_keys: List[str] = [component.key for component in self.text_components]
+        self.text_labels: List[str] = [
+            component.label for component in self.text_components if component.label is not None
+        ]
+
+    def _add(self, component: FormComponent):
+        self.components.append(component)
+        # the first question wins when keys are repeated, like the linear lookups did
+        self.by_key.setdefault(component.key, component)
+
+    def get(self, key: str) -> Optional[FormComponent]:
+        """Return the question with the given key."""
+        return self.by_key.get(key)
+
+    def get_label(self, key: str) -> Optional[str]:
+        """Return the label of the question with the given key."""
+        component = self.by_key.get(key)
+        return component.label if component else None
+
+    @property
+    def raw_components(self) -> List[Dict]:
+        """Return the form components of all the pages, in form order."""
+        return [component.component for component in self.components]
+
+
+def _get_pages(form_json: Dict) -> List[List[Dict]]:
+    """Return the components of each page of the form."""
+    components = form_json.get('components') or []
+    display = form_json.get('display')
+    if display == FORM_DISPLAY:
+        return [components]
+    if display == WIZARD_DISPLAY:
+        return [page.get('components') or [] for page in components]
+    return []
+
+
+def _get_values(component: Dict) -> Dict:
+    """Map the option values of the question to their labels."""
+    if component.get('type') == SELECT_TYPE:
+        options = (component.get('data') or {}).get('values')
+    else:
+        options = component.get('values')
+    values = {}
+    for option in options or []:
+        values.setdefault(option.get('value'), option.get('label'))
+    return values
+
+
+class _IndexCache:
+    """Bounded least recently used cache of form indexes."""
+
+    def __init__(self, max_size: int):
+        """Create an empty cache."""
+        self.max_size = max_size
+        self._indexes = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, form_json: Optional[Dict]) -> SurveyFormIndex:
+        """Return the cached index for the key, building it from the form if missing."""
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+                return index
+        index = SurveyFormIndex(form_json)
+        with self._lock:
+            self._indexes[key] = index
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self.max_size:
+                self._indexes.popitem(last=False)
+        return index
+
+    def clear(self):
+        """Remove all the cached indexes."""
+        with self._lock:
+            self._indexes.clear()
+
+    def __len__(self):
+        """Return the number of cached indexes."""
+        return len(self._indexes)
+
+
+_cache = _IndexCache(CACHE_SIZE)
+
+
+def get_survey_form_index(survey_id: Optional[int], updated_date, form_json: Optional[Dict]) -> SurveyFormIndex:
+    """Return the index of a survey form.
+
+    The survey is updated whenever its form changes, so the index is cached by survey id and update date.
+    Forms that are not saved yet are indexed without caching.
+    """
+    if survey_id is None or updated_date is None:
+        return SurveyFormIndex(form_json)
+    return _cache.get((survey_id, str(updated_date)), form_json)
+
+
+def get_index_for_survey(survey) -> SurveyFormIndex:
+    """Return the form index of a survey model or dumped survey."""
+    if isinstance(survey, dict):
+        return get_survey_form_index(survey.get('id'), survey.get('updated_date'), survey.get('form_json'))
+    return get_survey_form_index(survey.id, survey.updated_date, survey.form_json)
+
+
+def clear_survey_form_index_cache():
+    """Remove all the cached form indexes."""
+    _cache.clear()
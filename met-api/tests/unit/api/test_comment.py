@@ -16,10 +16,14 @@
 
 Test-Suite to ensure that the /Comment endpoint is working as expected.
 """
+import csv
+import io
 import json
+from datetime import datetime
 from http import HTTPStatus
 from unittest.mock import MagicMock, patch
 
+import pytest
 from faker import Faker
 
 from met_api.constants.membership_type import MembershipType
@@ -27,10 +31,12 @@ from met_api.constants.staff_note_type import StaffNoteType
 from met_api.services.comment_service import CommentService
 from met_api.utils import notification
 from met_api.utils.enums import ContentType
-from tests.utilities.factory_scenarios import TestJwtClaims
+from tests.utilities.factory_scenarios import (
+    TestCommentInfo, TestJwtClaims, TestReportSettingInfo, TestSubmissionInfo, TestSurveyInfo)
 from tests.utilities.factory_utils import (
     factory_auth_header, factory_comment_model, factory_membership_model, factory_participant_model,
-    factory_staff_user_model, factory_submission_model, factory_survey_and_eng_model, set_global_tenant)
+    factory_staff_user_model, factory_submission_model, factory_survey_and_eng_model,
+    factory_survey_report_setting_model, set_global_tenant)
 
 
 fake = Faker()
@@ -54,6 +60,28 @@ def test_get_comments(client, jwt, session):  # pylint:disable=unused-argument
     assert rv.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
 
 
+def test_search_comments(client, jwt, session):  # pylint:disable=unused-argument
+    """Assert that comments can be searched."""
+    claims = TestJwtClaims.public_user_role
+
+    participant = factory_participant_model()
+    survey, eng = factory_survey_and_eng_model()
+    submission = factory_submission_model(survey.id, eng.id, participant.id, TestSubmissionInfo.approved_submission)
+    factory_survey_report_setting_model({
+        **TestReportSettingInfo.report_setting_1, 'survey_id': survey.id, 'question_key': 'simpletext'})
+    factory_comment_model(survey.id, submission.id, {**TestCommentInfo.comment1, 'text': 'More trees in the park'})
+    headers = factory_auth_header(jwt=jwt, claims=claims)
+    rv = client.get(f'/api/comments/survey/{survey.id}/search?search_text=trees&page=1&size=10',
+                    headers=headers, content_type=ContentType.JSON.value)
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.json.get('total') == 1
+    assert rv.json.get('items')[0]['snippet'] == 'More <mark>trees</mark> in the park'
+
+    rv = client.get(f'/api/comments/survey/{survey.id}/search?search_text=', headers=headers,
+                    content_type=ContentType.JSON.value)
+    assert rv.status_code == HTTPStatus.BAD_REQUEST
+
+
 def test_review_comment(client, jwt, session,
                         setup_admin_user_and_claims):  # pylint:disable=unused-argument
     """Assert that a comment can be reviewed."""
@@ -169,7 +197,7 @@ def test_review_comment_review_note(client, jwt, session,
     }
 
     headers = factory_auth_header(jwt=jwt, claims=claims)
-    with patch.object(notification, 'send_email', return_value=False) as mock_mail:
+    with patch.object(notification, 'queue_email', return_value=False) as mock_mail:
         rv = client.put(f'/api/submissions/{submission.id}',
                         data=json.dumps(to_dict), headers=headers, content_type=ContentType.JSON.value)
         assert rv.status_code == HTTPStatus.OK
@@ -274,6 +302,78 @@ def test_get_comments_spreadsheet_proponent(mocker, client, jwt, session,
     assert rv.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
 
 
+def _create_exported_comments(texts):
+    """Create a survey with one text question and an approved submission for each comment text."""
+    participant = factory_participant_model()
+    survey, eng = factory_survey_and_eng_model({
+        **TestSurveyInfo.survey1,
+        'form_json': {'display': 'form', 'components': [
+            {'key': 'simpletext', 'label': 'Question', 'type': 'simpletextarea', 'inputType': 'text'}
+        ]},
+    })
+    factory_survey_report_setting_model({
+        **TestReportSettingInfo.report_setting_1,
+        'survey_id': survey.id,
+        'question_key': 'simpletext',
+        'display': True,
+    })
+    submissions = []
+    for comment_text in texts:
+        submission = factory_submission_model(survey.id, eng.id, participant.id, {
+            **TestSubmissionInfo.approved_submission,
+            'created_date': datetime(2023, 9, 1),
+            'review_date': datetime(2023, 9, 2),
+            'reviewed_by': 'Reviewer',
+        })
+        factory_comment_model(survey.id, submission.id, {**TestCommentInfo.comment1, 'text': comment_text})
+        submissions.append(submission)
+    return survey, submissions
+
+
+def test_get_comments_spreadsheet_staff_local(client, jwt, session, monkeypatch,
+                                              setup_admin_user_and_claims):  # pylint:disable=unused-argument
+    """Assert that the staff comments sheet can be streamed without the document generation service."""
+    _, claims = setup_admin_user_and_claims
+    monkeypatch.setitem(client.application.config, 'COMMENT_EXPORT_ENGINE', 'local')
+    survey, submissions = _create_exported_comments(['first, comment', 'second comment'])
+    headers = factory_auth_header(jwt=jwt, claims=claims)
+
+    rv = client.get(f'/api/comments/survey/{survey.id}/sheet/staff', headers=headers)
+
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.mimetype == 'text/csv'
+    assert 'comments_sheet.csv' in rv.headers['content-disposition']
+    assert list(csv.reader(io.StringIO(rv.get_data(as_text=True)))) == [
+        ['Comment No.', 'Submitted', 'Question', 'Status', 'Published Date', 'Reason for Rejection', 'Reviewer',
+         'Project'],
+        [str(submissions[0].id), 'September 1, 2023', 'first, comment', 'Approved', 'September 2, 2023', '',
+         'Reviewer', ''],
+        [str(submissions[1].id), 'September 1, 2023', 'second comment', 'Approved', 'September 2, 2023', '',
+         'Reviewer', ''],
+    ]
+
+
+def test_get_comments_spreadsheet_proponent_local(client, jwt, session, monkeypatch,
+                                                  setup_admin_user_and_claims):  # pylint:disable=unused-argument
+    """Assert that the proponent comments sheet can be streamed without the document generation service."""
+    openpyxl = pytest.importorskip('openpyxl')
+    _, claims = setup_admin_user_and_claims
+    monkeypatch.setitem(client.application.config, 'COMMENT_EXPORT_ENGINE', 'local')
+    survey, _ = _create_exported_comments(['b comment', 'a comment'])
+    headers = factory_auth_header(jwt=jwt, claims=claims)
+
+    rv = client.get(f'/api/comments/survey/{survey.id}/sheet/proponent', headers=headers)
+
+    assert rv.status_code == HTTPStatus.OK
+    assert 'proponent_comments_sheet.xlsx' in rv.headers['content-disposition']
+    sheet = openpyxl.load_workbook(io.BytesIO(rv.get_data())).active
+    assert list(sheet.values) == [
+        ('Question', 'Proponent Answer'),
+        ('a comment', None),
+        ('b comment', None),
+    ]
+
+
 def test_get_comments_spreadsheet_without_role(mocker, client, jwt, session):  # pylint:disable=unused-argument
     """Assert that proponent comments sheet can be fetched."""
     mock_post_generate_document_response = MagicMock()
@@ -367,6 +367,33 @@ def test_search_engagements(client, jwt, session,
         'total') == 2, 'Similar name, team member search fetches multiple results'
 
 
+def test_get_engagements_by_cursor(client, jwt, session,
+                                   setup_admin_user_and_claims):  # pylint:disable=unused-argument
+    """Assert that engagements can be paged through by cursor."""
+    base_name = fake.name()
+    set_global_tenant()
+    _, claims = setup_admin_user_and_claims
+    headers = factory_auth_header(jwt=jwt, claims=claims)
+    engagement_ids = [factory_engagement_model(name=f'{base_name}{index % 2}').id for index in range(5)]
+
+    fetched_ids = []
+    cursor = ''
+    while cursor is not None:
+        rv = client.get(f'/api/engagements/?search_text={base_name}&size=2&sort_key=engagement.name'
+                        f'&sort_order=asc&count=none&cursor={cursor}',
+                        headers=headers, content_type=ContentType.JSON.value)
+        assert rv.status_code == HTTPStatus.OK
+        assert rv.json.get('total') is None
+        fetched_ids.extend(engagement['id'] for engagement in rv.json.get('items'))
+        cursor = rv.json.get('next_cursor')
+    assert sorted(fetched_ids) == sorted(engagement_ids)
+    assert len(set(fetched_ids)) == len(engagement_ids)
+
+    rv = client.get(f'/api/engagements/?search_text={base_name}&size=2&sort_key=engagement.description;',
+                    headers=headers, content_type=ContentType.JSON.value)
+    assert rv.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
 def test_search_engagements_not_logged_in(client, session):  # pylint:disable=unused-argument
     """Assert that an engagement can be fetched without JWT Token."""
     factory_engagement_model()
@@ -721,3 +748,39 @@ def test_get_engagements_metadata_match_any(client, session):  # pylint:disable=
     assert rv.status_code == HTTPStatus.OK
     # the filter should return the engagements with either value
     assert rv.json.get('total') == 10
+
+
+def test_get_engagement_metadata_facets(client, session):  # pylint:disable=unused-argument
+    """Assert that the metadata values are counted over the engagements matching the filters."""
+    engagements = [factory_engagement_model({
+        **TestEngagementInfo.engagement1,
+        'tenant_id': 1
+    }) for _ in range(0, 3)]
+    category = factory_metadata_taxon_model(1, {'name': 'Category', 'data_type': 'text', 'tenant_id': 1})
+    region = factory_metadata_taxon_model(1, {'name': 'Region', 'data_type': 'text', 'tenant_id': 1})
+    for engagement, categories, regions in zip(
+            engagements, (['Parks', 'Roads'], ['Parks'], ['Roads']), (['North'], ['North'], ['South'])):
+        for value in categories:
+            factory_engagement_metadata_model({'engagement_id': engagement.id, 'taxon_id': category.id, 'value': value})
+        for value in regions:
+            factory_engagement_metadata_model({'engagement_id': engagement.id, 'taxon_id': region.id, 'value': value})
+
+    rv = client.get('/api/engagements/facets')
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.json == [
+        {'taxon_id': category.id, 'values': [{'value': 'Parks', 'count': 2}, {'value': 'Roads', 'count': 2}]},
+        {'taxon_id': region.id, 'values': [{'value': 'North', 'count': 2}, {'value': 'South', 'count': 1}]},
+    ]
+
+    # both criteria are matched against the same indexed facets
+    metadata = json.dumps([
+        {'values': ['Parks', 'Roads'], 'filter_type': 'chips_any', 'taxon_id': category.id},
+        {'values': ['North'], 'filter_type': 'chips_all', 'taxon_id': region.id},
+    ], separators=(',', ':'))
+    rv = client.get(f'/api/engagements/?metadata={metadata}')
+    assert rv.json.get('total') == 2
+    rv = client.get(f'/api/engagements/facets?metadata={metadata}')
+    assert rv.json == [
+        {'taxon_id': category.id, 'values': [{'value': 'Parks', 'count': 2}, {'value': 'Roads', 'count': 1}]},
+        {'taxon_id': region.id, 'values': [{'value': 'North', 'count': 2}]},
+    ]
@@ -0,0 +1,147 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to verify the Engagement Page API end-point.
+
+Test-Suite to ensure that the engagement page is assembled with a fixed number of queries.
+"""
+from contextlib import contextmanager
+from http import HTTPStatus
+
+from sqlalchemy import event
+
+from met_api.constants.engagement_status import Status
+from met_api.constants.widget import WidgetType
+from met_api.models import db
+from met_api.models.contact import Contact as ContactModel
+from met_api.models.engagement_summary_content import EngagementSummary as EngagementSummaryModel
+from met_api.models.widget import Widget as WidgetModel
+from tests.utilities.factory_scenarios import (
+    TestContactInfo, TestEventnfo, TestPollAnswerInfo, TestTimelineInfo, TestWidgetDocumentInfo, TestWidgetVideo)
+from tests.utilities.factory_utils import (
+    factory_document_model, factory_enagement_content_model, factory_engagement_model,
+    factory_engagement_slug_model, factory_engagement_translation_model, factory_event_item_model,
+    factory_event_item_translation_model, factory_poll_answer_model, factory_poll_model, factory_timeline_event_model,
+    factory_video_model, factory_widget_event_model, factory_widget_item_model,
+    factory_widget_timeline_model, factory_widget_translation_model)
+
+
+FRENCH_LANGUAGE_ID = 49
+
+
+@contextmanager
+def _count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):  # pylint: disable=unused-argument
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def _widget(engagement, widget_type):
+    widget = WidgetModel(engagement_id=engagement.id, widget_type_id=widget_type.value)
+    widget.save()
+    return widget
+
+
+def _add_widget_rows(engagement, widgets):
+    """Add a contact, a document, an event item, a poll answer, a timeline event and a video to the widgets."""
+    contact = ContactModel(**TestContactInfo.contact1)
+    contact.save()
+    factory_widget_item_model({'widget_id': widgets[WidgetType.WHO_IS_LISTENING].id, 'widget_data_id': contact.id})
+    factory_document_model({**TestWidgetDocumentInfo.document1, 'widget_id': widgets[WidgetType.DOCUMENTS].id})
+    widget_event = factory_widget_event_model(widgets[WidgetType.EVENTS])
+    event_item = factory_event_item_model(widget_event, TestEventnfo.event_meetup['items'][0])
+    poll = factory_poll_model(widgets[WidgetType.Poll])
+    factory_poll_answer_model(poll, TestPollAnswerInfo.answer1)
+    timeline = factory_widget_timeline_model({**TestTimelineInfo.widget_timeline, 'engagement_id': engagement.id,
+                                              'widget_id': widgets[WidgetType.Timeline].id})
+    factory_timeline_event_model({**TestTimelineInfo.timeline_event, 'engagement_id': engagement.id,
+                                  'widget_id': timeline.widget_id, 'timeline_id': timeline.id})
+    factory_video_model({**TestWidgetVideo.video1, 'id': None, 'engagement_id': engagement.id,
+                         'widget_id': widgets[WidgetType.Video].id})
+    return event_item
+
+
+def test_get_engagement_page(client, session):  # pylint:disable=unused-argument
+    """Assert that the engagement page is returned with the details of each widget and the translations."""
+    engagement = factory_engagement_model(status=Status.Published.value)
+    factory_engagement_slug_model({'slug': 'engagement-page', 'engagement_id': engagement.id})
+    content = factory_enagement_content_model(engagement.id)
+    EngagementSummaryModel(content='Summary', rich_content='{}', engagement_content_id=content.id,
+                           engagement_id=engagement.id).save()
+    widgets = {
+        widget_type: _widget(engagement, widget_type)
+        for widget_type in (WidgetType.WHO_IS_LISTENING, WidgetType.DOCUMENTS, WidgetType.EVENTS, WidgetType.Poll,
+                            WidgetType.Timeline, WidgetType.Video)
+    }
+    event_item = _add_widget_rows(engagement, widgets)
+    factory_engagement_translation_model({'engagement_id': engagement.id, 'language_id': FRENCH_LANGUAGE_ID,
+                                          'name': 'Engagement en français'})
+    factory_widget_translation_model({'widget_id': widgets[WidgetType.Poll].id, 'language_id': FRENCH_LANGUAGE_ID,
+                                      'title': 'Sondage'})
+    factory_event_item_translation_model({'event_item_id': event_item.id, 'language_id': FRENCH_LANGUAGE_ID,
+                                          'description': 'Événement'})
+
+    with _count_queries() as statements:
+        rv = client.get(f'/api/engagements/{engagement.id}/page?language_id={FRENCH_LANGUAGE_ID}')
+    assert rv.status_code == HTTPStatus.OK
+    page = rv.json
+    assert page['engagement']['name'] == engagement.name
+    assert page['slug'] == 'engagement-page'
+    assert page['contents'][0]['summary'][0]['content'] == 'Summary'
+    details = {widget['widget_type_id']: widget['details'] for widget in page['widgets']}
+    assert details[WidgetType.WHO_IS_LISTENING][0]['name'] == TestContactInfo.contact1['name']
+    assert details[WidgetType.DOCUMENTS]['children'][0]['title'] == TestWidgetDocumentInfo.document1['title']
+    assert details[WidgetType.EVENTS][0]['event_items'][0]['id'] == event_item.id
+    assert details[WidgetType.Poll][0]['answers'][0]['answer_text'] == TestPollAnswerInfo.answer1['answer_text']
+    assert len(details[WidgetType.Timeline][0]['events']) == 1
+    assert len(details[WidgetType.Video]) == 1
+    translations = page['translations']
+    assert translations['engagement'][0]['name'] == 'Engagement en français'
+    assert translations['widgets'][0]['title'] == 'Sondage'
+    assert translations['event_items'][0]['description'] == 'Événement'
+    assert translations['poll_answers'] == []
+
+    # more rows in the widgets do not make more queries
+    _add_widget_rows(engagement, widgets)
+    with _count_queries() as more_statements:
+        rv = client.get(f'/api/engagements/{engagement.id}/page?language_id={FRENCH_LANGUAGE_ID}')
+    assert len(rv.json['widgets']) == len(widgets)
+    details = {widget['widget_type_id']: widget['details'] for widget in rv.json['widgets']}
+    assert len(details[WidgetType.WHO_IS_LISTENING]) == 2
+    assert len(details[WidgetType.EVENTS]) == 2
+    assert len(more_statements) == len(statements)
+
+
+def test_get_engagement_page_fields(client, session):  # pylint:disable=unused-argument
+    """Assert that the page is limited to the selected fields, and hidden for the unpublished engagements."""
+    engagement = factory_engagement_model(status=Status.Published.value)
+    _widget(engagement, WidgetType.Video)
+
+    rv = client.get(f'/api/engagements/{engagement.id}/page?fields=widgets')
+    assert rv.status_code == HTTPStatus.OK
+    assert list(rv.json) == ['widgets']
+    assert rv.json['widgets'][0]['details'] == []
+
+    rv = client.get(f'/api/engagements/{engagement.id}/page?fields=widgets,comments')
+    assert rv.status_code == HTTPStatus.BAD_REQUEST
+
+    draft_engagement = factory_engagement_model(status=Status.Draft.value)
+    rv = client.get(f'/api/engagements/{draft_engagement.id}/page')
+    assert rv.status_code == HTTPStatus.NOT_FOUND
@@ -258,3 +258,30 @@ def test_get_poll_response(client, jwt, session, setup_admin_user_and_claims):
     assert rv.json.get('answers')[2].get('answer_id') == answer3.id
     assert rv.json.get('answers')[2].get('total_response') == 0
     assert rv.json.get('answers')[2].get('percentage') == 0
+
+
+def test_get_public_poll_results(client, app, session, monkeypatch):
+    """Assert that the results of a poll are read from the counters, without authentication when they are public."""
+    engagement = factory_engagement_model(status=Status.Published.value)
+    widget = factory_widget_model({'engagement_id': engagement.id})
+    poll = factory_poll_model(widget, TestWidgetPollInfo.poll1)
+    answer1 = factory_poll_answer_model(poll, TestPollAnswerInfo.answer1)
+    answer2 = factory_poll_answer_model(poll, TestPollAnswerInfo.answer2)
+    factory_poll_response_model(poll, answer1)
+    factory_poll_response_model(poll, answer1)
+    factory_poll_response_model(poll, answer2)
+
+    rv = client.get(f'/api/widgets/{widget.id}/polls/{poll.id}/results')
+    assert rv.status_code == HTTPStatus.FORBIDDEN
+
+    monkeypatch.setitem(app.config, 'POLL_RESULTS_PUBLIC', True)
+    rv = client.get(f'/api/widgets/{widget.id}/polls/{poll.id}/results')
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.json.get('total_response') == 3
+    assert [answer.get('total_response') for answer in rv.json.get('answers')] == [2, 1]
+
+    draft_engagement = factory_engagement_model(status=Status.Draft.value)
+    draft_widget = factory_widget_model({'engagement_id': draft_engagement.id})
+    draft_poll = factory_poll_model(draft_widget, TestWidgetPollInfo.poll1)
+    rv = client.get(f'/api/widgets/{draft_widget.id}/polls/{draft_poll.id}/results')
+    assert rv.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,74 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the EmailOutbox model.
+
+Test suite to ensure that the emails are queued once and leased to a single dispatcher.
+"""
+from datetime import datetime, timedelta
+
+from faker import Faker
+
+from met_api.constants.email_outbox_status import EmailOutboxStatus
+from met_api.models import db
+from met_api.models.email_outbox import EmailOutbox
+
+
+fake = Faker()
+
+
+def _enqueue(idempotency_key):
+    return EmailOutbox.enqueue(idempotency_key, fake.email(), fake.sentence(), fake.paragraph(), {}, 'template')
+
+
+def test_enqueue_is_idempotent(session):  # pylint:disable=unused-argument
+    """Assert that an email is queued only once for its idempotency key."""
+    email_id = _enqueue('key')
+    assert email_id is not None
+    assert _enqueue('key') is None
+
+    email = EmailOutbox.query.one()
+    assert email.id == email_id
+    assert email.status == EmailOutboxStatus.PENDING
+    assert email.attempts == 0
+
+
+def test_claim_due(session):  # pylint:disable=unused-argument
+    """Assert that the emails due are leased oldest first, and are due again once their lease expires."""
+    first_id, second_id, third_id = _enqueue('first'), _enqueue('second'), _enqueue('third')
+    EmailOutbox.query.filter_by(id=third_id).update({'next_attempt_date': datetime.utcnow() + timedelta(hours=1)})
+
+    emails = EmailOutbox.claim_due(1, timedelta(minutes=5))
+    assert [email.id for email in emails] == [first_id]
+    emails = EmailOutbox.claim_due(10, timedelta(minutes=5))
+    assert [email.id for email in emails] == [second_id]
+    assert emails[0].status == EmailOutboxStatus.SENDING
+    assert emails[0].attempts == 1
+    assert not EmailOutbox.claim_due(10, timedelta(minutes=5))
+
+    # the lease of an email whose dispatcher stopped expires
+    EmailOutbox.query.filter_by(id=first_id).update({'next_attempt_date': datetime.utcnow() - timedelta(seconds=1)})
+    emails = EmailOutbox.claim_due(10, timedelta(minutes=5))
+    assert [(email.id, email.attempts) for email in emails] == [(first_id, 2)]
+
+
+def test_purge_sent(session):  # pylint:disable=unused-argument
+    """Assert that only the emails sent before the date are purged."""
+    sent_id, recent_id, pending_id = _enqueue('sent'), _enqueue('recent'), _enqueue('pending')
+    now = datetime.utcnow()
+    EmailOutbox.query.filter_by(id=sent_id)\
+        .update({'status': EmailOutboxStatus.SENT, 'sent_date': now - timedelta(days=40)})
+    EmailOutbox.query.filter_by(id=recent_id).update({'status': EmailOutboxStatus.SENT, 'sent_date': now})
+
+    assert EmailOutbox.purge_sent(now - timedelta(days=30)) == 1
+    assert {email_id for email_id, in db.session.query(EmailOutbox.id)} == {recent_id, pending_id}
@@ -65,7 +65,7 @@ def test_get_engagements_paginated_name_search(session):
     }
 
     # verify name search
-    result, count = EngagementModel.get_engagements_paginated(
+    result, count, _ = EngagementModel.get_engagements_paginated(
         external_user_id,
         pagination_options,
         scope_options,
@@ -103,7 +103,7 @@ def test_get_engagements_paginated_status_search(session):
     # status search
     factory_engagement_model(status=Status.Closed.value)
     factory_engagement_model(status=Status.Closed.value)
-    result, count = EngagementModel.get_engagements_paginated(
+    result, count, _ = EngagementModel.get_engagements_paginated(
         external_user_id,
         pagination_options,
         scope_options,
@@ -114,7 +114,7 @@ def test_get_engagements_paginated_status_search(session):
     )
     assert count == 2
 
-    result, count = EngagementModel.get_engagements_paginated(
+    result, count, _ = EngagementModel.get_engagements_paginated(
         external_user_id,
         pagination_options,
         scope_options,
@@ -126,7 +126,7 @@ def test_get_engagements_paginated_status_search(session):
     assert count == 11
     assert len(result) == 11
 
-    result, count = EngagementModel.get_engagements_paginated(
+    result, count, _ = EngagementModel.get_engagements_paginated(
         external_user_id,
         pagination_options,
         scope_options,
@@ -146,7 +146,7 @@ def test_get_engagements_paginated_status_search(session):
         sort_order=''
     )
 
-    result, count = EngagementModel.get_engagements_paginated(
+    result, count, _ = EngagementModel.get_engagements_paginated(
         external_user_id,
         pagination_options,
         scope_options,
@@ -203,23 +203,23 @@ def test_get_engagements_metadata_match_all(session):
             search_options
         )
     # search for metadata
-    _, count = refresh_engagements()
+    _, count, _ = refresh_engagements()
     assert count == 5
 
     engagements[1].metadata.append(EngagementMetadata(
         taxon_id=taxon.id, value='test'))
-    _, count = refresh_engagements()
+    _, count, _ = refresh_engagements()
     assert count == 6
 
     search_options['metadata'][0]['values'] = ['test', 'test2']
-    _, count = refresh_engagements()
+    _, count, _ = refresh_engagements()
     # This should find *all* matching values, so the inclusion of a non-matching
     # value "test2" should reduce the result to 0
     assert count == 0
 
     engagements[0].metadata.append(EngagementMetadata(
         taxon_id=taxon.id, value='test2'))
-    _, count = refresh_engagements()
+    _, count, _ = refresh_engagements()
 
     # There should now be a single engagement with both "test" and "test2"
     assert count == 1
@@ -278,16 +278,16 @@ def test_get_engagements_metadata_match_any(session):
             search_options
         )
     # search for metadata
-    _, count = refresh_engagements()
+    _, count, _ = refresh_engagements()
     assert count == 5
 
     engagements[1].metadata.append(EngagementMetadata(
         taxon_id=taxon.id, value='test'))
-    _, count = refresh_engagements()
+    _, count, _ = refresh_engagements()
     assert count == 6
 
     search_options['metadata'][0]['values'] = ['test', 'test2']
-    _, count = refresh_engagements()
+    _, count, _ = refresh_engagements()
     # This should find *any* matching value, so the inclusion of a non-matching
     # value "test2" should not change the result
     assert count == 6
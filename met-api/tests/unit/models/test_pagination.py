@@ -0,0 +1,82 @@
+"""Tests for the pagination of the list queries.
+
+Test suite to ensure that pages fetched by cursor match the pages fetched by offset.
+"""
+import pytest
+
+from met_api.constants.feedback import FeedbackStatusType
+from met_api.models import Feedback as FeedbackModel
+from met_api.models.pagination_options import PaginationOptions
+from tests.utilities.factory_utils import factory_feedback_model
+
+
+def _get_all_by_cursor(sort_key, sort_order, size):
+    """Walk the pages by cursor, returning the ids of the rows and the number of pages."""
+    ids, pages, cursor = [], 0, ''
+    while cursor is not None:
+        pagination_options = PaginationOptions(
+            page=None, size=size, sort_key=sort_key, sort_order=sort_order, cursor=cursor, count='none')
+        items, total, cursor = FeedbackModel.get_all_paginated(pagination_options, FeedbackStatusType.Unreviewed)
+        assert total is None
+        ids.extend(item.id for item in items)
+        pages += 1
+    return ids, pages
+
+
+@pytest.mark.parametrize('sort_key', ['rating', 'feedback.created_date', 'submission_path', ''])
+@pytest.mark.parametrize('sort_order', ['asc', 'desc'])
+def test_cursor_pages_cover_all_rows(session, sort_key, sort_order):
+    """Assert that the cursor pages return every row once, including rows with equal or NULL sort values."""
+    feedbacks = [factory_feedback_model() for _ in range(7)]
+    for index, feedback in enumerate(feedbacks[:4]):
+        feedback.submission_path = f'/engagements/{index % 2}'
+        feedback.save()
+
+    all_rows = PaginationOptions(page=None, size=None, sort_key=sort_key, sort_order=sort_order, cursor='')
+    expected_ids = [item.id for item in FeedbackModel.get_all_paginated(all_rows, FeedbackStatusType.Unreviewed).items]
+    assert sorted(expected_ids) == sorted(feedback.id for feedback in feedbacks)
+
+    ids, pages = _get_all_by_cursor(sort_key, sort_order, size=3)
+    assert ids == expected_ids
+    assert pages == 3
+
+
+def test_count_modes(session):
+    """Assert that the total is exact, estimated or skipped as requested."""
+    for _ in range(3):
+        factory_feedback_model()
+    pagination_options = PaginationOptions(page=1, size=2, sort_key='rating', sort_order='asc')
+    status = FeedbackStatusType.Unreviewed
+
+    assert FeedbackModel.get_all_paginated(pagination_options, status).total == 3
+    pagination_options.count = 'estimate'
+    assert isinstance(FeedbackModel.get_all_paginated(pagination_options, status).total, int)
+    pagination_options.count = 'none'
+    assert FeedbackModel.get_all_paginated(pagination_options, status).total is None
+    pagination_options.count = 'approximate'
+    with pytest.raises(ValueError):
+        FeedbackModel.get_all_paginated(pagination_options, status)
+
+
+def test_invalid_sort_key_and_cursor(session):
+    """Assert that sort keys outside of the whitelist and tampered or mismatched cursors are rejected."""
+    for _ in range(3):
+        factory_feedback_model()
+    status = FeedbackStatusType.Unreviewed
+    with pytest.raises(ValueError):
+        FeedbackModel.get_all_paginated(
+            PaginationOptions(page=1, size=2, sort_key='rating; drop table feedback', sort_order='asc'), status)
+
+    first_page = FeedbackModel.get_all_paginated(
+        PaginationOptions(page=None, size=0, sort_key='rating', sort_order='asc', cursor=''), status)
+    assert first_page.next_cursor is None
+    next_cursor = FeedbackModel.get_all_paginated(
+        PaginationOptions(page=None, size=2, sort_key='rating', sort_order='asc', cursor=''), status).next_cursor
+    assert next_cursor
+    with pytest.raises(ValueError):
+        FeedbackModel.get_all_paginated(
+            PaginationOptions(page=None, size=2, sort_key='rating', sort_order='desc', cursor=next_cursor), status)
+    for cursor in ('not a cursor', 'e30'):
+        with pytest.raises(ValueError):
+            FeedbackModel.get_all_paginated(
+                PaginationOptions(page=None, size=2, sort_key='rating', sort_order='asc', cursor=cursor), status)
@@ -0,0 +1,96 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the PollResponseCount model.
+
+Test suite to ensure that the poll response counters are kept in sync with the poll responses.
+"""
+from faker import Faker
+
+from met_api.models import db
+from met_api.models.poll_response_count import PollResponseCount
+from met_api.models.poll_responses import PollResponse as PollResponseModel
+from met_api.services.poll_answers_service import PollAnswerService
+from tests.utilities.factory_scenarios import TestPollAnswerInfo, TestWidgetPollInfo
+from tests.utilities.factory_utils import (
+    factory_engagement_model, factory_poll_answer_model, factory_poll_model, factory_poll_response_model,
+    factory_widget_model)
+
+
+fake = Faker()
+
+
+def _create_poll():
+    engagement = factory_engagement_model()
+    widget = factory_widget_model({'engagement_id': engagement.id})
+    poll = factory_poll_model(widget, TestWidgetPollInfo.poll1)
+    answers = [factory_poll_answer_model(poll, answer_info)
+               for answer_info in (TestPollAnswerInfo.answer1, TestPollAnswerInfo.answer2)]
+    return poll, answers
+
+
+def _get_totals(poll_id):
+    db.session.expire_all()
+    return PollResponseCount.get_totals(poll_id)
+
+
+def test_counts_follow_response_lifecycle(session):
+    """Assert that recording, changing, soft deleting and deleting responses moves them between the counters."""
+    poll, (answer1, answer2) = _create_poll()
+    assert _get_totals(poll.id) == (0, {})
+
+    response = factory_poll_response_model(poll, answer1)
+    factory_poll_response_model(poll, answer1)
+    factory_poll_response_model(poll, answer2)
+    assert _get_totals(poll.id) == (3, {answer1.id: 2, answer2.id: 1})
+
+    PollResponseModel.update_response(response.id, {'selected_answer_id': answer2.id})
+    assert _get_totals(poll.id) == (3, {answer1.id: 1, answer2.id: 2})
+
+    # soft deleted responses are no longer counted, until they are restored
+    PollResponseModel.update_response(response.id, {'is_deleted': True})
+    assert _get_totals(poll.id) == (2, {answer1.id: 1, answer2.id: 1})
+    PollResponseModel.update_response(response.id, {'is_deleted': False})
+    assert _get_totals(poll.id) == (3, {answer1.id: 1, answer2.id: 2})
+
+    db.session.delete(PollResponseModel.find_by_id(response.id))
+    db.session.commit()
+    assert _get_totals(poll.id) == (2, {answer1.id: 1, answer2.id: 1})
+
+
+def test_insert_response_counts(session):
+    """Assert that a response inserted with a single statement is counted by the same statement."""
+    poll, (answer1, _) = _create_poll()
+    participant_id = fake.uuid4()
+
+    assert PollResponseModel.insert_response(poll.id, participant_id, answer1.id, max_responses=1)
+    assert PollResponseModel.insert_response(poll.id, participant_id, answer1.id, max_responses=1) is None
+    assert _get_totals(poll.id) == (1, {answer1.id: 1})
+
+
+def test_rebuild(session):
+    """Assert that the counters are recomputed from the responses, and when the answers are deleted."""
+    poll, (answer1, answer2) = _create_poll()
+    factory_poll_response_model(poll, answer1)
+    factory_poll_response_model(poll, answer2)
+    soft_deleted_response = factory_poll_response_model(poll, answer2)
+    # changes made without the ORM are not counted
+    db.session.query(PollResponseModel).filter(PollResponseModel.id == soft_deleted_response.id)\
+        .update({'is_deleted': True})
+    assert _get_totals(poll.id) == (3, {answer1.id: 1, answer2.id: 2})
+
+    assert PollResponseCount.rebuild([poll.id]) == 1
+    assert _get_totals(poll.id) == (2, {answer1.id: 1, answer2.id: 1})
+
+    PollAnswerService.delete_poll_answers(poll.id)
+    assert _get_totals(poll.id) == (0, {})
@@ -0,0 +1,70 @@
+"""Tests for the substring search of the admin lists.
+
+Test suite to ensure that the searches match the text as typed, and use the trigram operators only when available.
+"""
+from unittest.mock import patch
+
+from sqlalchemy.dialects import postgresql
+
+from met_api.models import search
+from met_api.models.engagement import Engagement as EngagementModel
+from met_api.models.engagement_scope_options import EngagementScopeOptions
+from met_api.models.engagement_slug import EngagementSlug as EngagementSlugModel
+from met_api.models.pagination_options import PaginationOptions
+from tests.utilities.factory_utils import factory_engagement_model, factory_engagement_slug_model
+
+
+def _search_engagements(search_text, sort_key='name', sort_order='asc'):
+    pagination_options = PaginationOptions(page=1, size=10, sort_key=sort_key, sort_order=sort_order)
+    scope_options = EngagementScopeOptions(restricted=False)
+    return EngagementModel.get_engagements_paginated(None, pagination_options, scope_options,
+                                                     {'search_text': search_text})
+
+
+def test_search_matches_text_as_typed(session):
+    """Assert that the LIKE wildcards of the search text are matched literally."""
+    discount = factory_engagement_model(name='Parks 100% funded')
+    factory_engagement_model(name='Parks 100 funded')
+    underscore = factory_engagement_model(name='Lake_shore trail')
+    factory_engagement_model(name='Lakeshore trail')
+
+    assert [engagement.id for engagement in _search_engagements('100%').items] == [discount.id]
+    assert [engagement.id for engagement in _search_engagements('e_s').items] == [underscore.id]
+    assert _search_engagements('PARKS').total == 2
+
+
+def test_search_relevance_sort_key(session):
+    """Assert that the relevance sort key is accepted only along with a search text."""
+    factory_engagement_model(name='Trail upgrade')
+    factory_engagement_model(name='Trail')
+
+    page = _search_engagements('trail', sort_key='relevance', sort_order='desc')
+    assert page.total == 2
+    with patch.object(search, 'has_pg_trgm', return_value=True):
+        similarity = search.relevance(EngagementModel.name, 'trail')
+    assert 'word_similarity' in str(similarity.compile(dialect=postgresql.dialect()))
+
+
+def test_typo_tolerant_search(session, app, monkeypatch):
+    """Assert that the similar words are matched only when enabled and pg_trgm is installed."""
+    monkeypatch.setitem(app.config, 'ADMIN_SEARCH_TYPO_TOLERANT', True)
+    with patch.object(search, 'has_pg_trgm', return_value=False):
+        condition = search.matches(EngagementModel.name, 'trial')
+    assert '<%' not in str(condition.compile(dialect=postgresql.dialect()))
+
+    with patch.object(search, 'has_pg_trgm', return_value=True):
+        condition = search.matches(EngagementModel.name, 'trial')
+    assert '<%' in str(condition.compile(dialect=postgresql.dialect()))
+
+
+def test_find_slug_ignoring_case(session):
+    """Assert that the slugs are found ignoring case, and that similar slugs are matched by prefix only."""
+    engagement = factory_engagement_model()
+    other_engagement = factory_engagement_model()
+    factory_engagement_slug_model({'slug': 'bike-lanes', 'engagement_id': engagement.id})
+    factory_engagement_slug_model({'slug': 'bike-lanes-2', 'engagement_id': other_engagement.id})
+
+    assert EngagementSlugModel.find_by_slug('Bike-Lanes').engagement_id == engagement.id
+    assert EngagementSlugModel.find_by_slug('bike_lanes') is None
+    assert len(EngagementSlugModel.find_similar_slugs('bike-lanes')) == 2
+    assert EngagementSlugModel.find_similar_slugs('bike_lanes') == []
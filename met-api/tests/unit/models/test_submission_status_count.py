@@ -0,0 +1,100 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the SubmissionStatusCount model.
+
+Test suite to ensure that the comment status counters are kept in sync with the submissions.
+"""
+from faker import Faker
+
+from met_api.constants.comment_status import Status
+from met_api.constants.user import SYSTEM_REVIEWER
+from met_api.models import db
+from met_api.models.submission import Submission as SubmissionModel
+from met_api.models.submission_status_count import SubmissionStatusCount
+from tests.utilities.factory_scenarios import TestSubmissionInfo
+from tests.utilities.factory_utils import (
+    factory_participant_model, factory_submission_model, factory_survey_and_eng_model)
+
+
+fake = Faker()
+
+
+def _get_counts(survey_id):
+    db.session.expire_all()
+    return SubmissionStatusCount.find_by_survey_id(survey_id).as_dict()
+
+
+def test_counts_follow_submission_lifecycle(session):
+    """Assert that creating and reviewing submissions moves them between the counters."""
+    participant = factory_participant_model()
+    survey, eng = factory_survey_and_eng_model()
+
+    # a submission without comments is approved by the system and only counted in the total
+    SubmissionModel.create({
+        'submission_json': {'radio': 'yes'},
+        'survey_id': survey.id,
+        'engagement_id': eng.id,
+        'participant_id': participant.id,
+    })
+    pending_submission = SubmissionModel.create({
+        'submission_json': {'simpletextarea': fake.sentence()},
+        'survey_id': survey.id,
+        'engagement_id': eng.id,
+        'participant_id': participant.id,
+    })
+    assert _get_counts(survey.id) == {
+        'total': 2, 'pending': 1, 'approved': 0, 'rejected': 0, 'needs_further_review': 0
+    }
+
+    SubmissionModel.update_comment_status(pending_submission.id, {
+        'status_id': Status.Rejected.value,
+        'has_profanity': True,
+        'reviewed_by': fake.name(),
+    })
+    assert _get_counts(survey.id) == {
+        'total': 2, 'pending': 0, 'approved': 0, 'rejected': 1, 'needs_further_review': 0
+    }
+
+    submission = SubmissionModel.find_by_id(pending_submission.id)
+    submission.comment_status_id = Status.Pending.value
+    submission.save()
+    assert _get_counts(survey.id) == {
+        'total': 2, 'pending': 1, 'approved': 0, 'rejected': 0, 'needs_further_review': 0
+    }
+
+    submission.delete()
+    assert _get_counts(survey.id) == {
+        'total': 1, 'pending': 0, 'approved': 0, 'rejected': 0, 'needs_further_review': 0
+    }
+
+
+def test_rebuild_counts(session):
+    """Assert that the counters can be rebuilt from the submission table."""
+    participant = factory_participant_model()
+    survey, eng = factory_survey_and_eng_model()
+    factory_submission_model(survey.id, eng.id, participant.id, TestSubmissionInfo.approved_submission)
+    factory_submission_model(survey.id, eng.id, participant.id, TestSubmissionInfo.pending_submission)
+    factory_submission_model(survey.id, eng.id, participant.id, {
+        **TestSubmissionInfo.approved_submission,
+        'reviewed_by': SYSTEM_REVIEWER,
+    })
+    expected_counts = _get_counts(survey.id)
+
+    db.session.query(SubmissionStatusCount).filter_by(survey_id=survey.id).delete()
+    assert SubmissionStatusCount.find_by_survey_id(survey.id) is None
+
+    assert SubmissionStatusCount.rebuild([survey.id]) == 1
+    assert _get_counts(survey.id) == expected_counts == {
+        'total': 3, 'pending': 1, 'approved': 1, 'rejected': 0, 'needs_further_review': 0
+    }
@@ -0,0 +1,69 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Authorization service.
+
+Test suite to ensure that engagement memberships and tenants are cached until they change.
+"""
+from unittest.mock import patch
+
+from met_api.models.engagement import Engagement as EngagementModel
+from met_api.models.membership import Membership as MembershipModel
+from met_api.services import authorization
+from met_api.services.membership_service import MembershipService
+from met_api.utils.enums import MembershipStatus
+from tests.utilities.factory_utils import factory_engagement_model, factory_membership_model, factory_staff_user_model
+
+
+def test_engagement_membership_cached(session):
+    """Assert that memberships are cached until they are revoked, reinstated or written."""
+    engagement = factory_engagement_model()
+    user = factory_staff_user_model()
+    assert authorization._get_engagement_membership(engagement.id, user.id) is None
+
+    membership = factory_membership_model(user_id=user.id, engagement_id=engagement.id)
+    cached_membership = authorization._get_engagement_membership(engagement.id, user.id)
+    assert cached_membership == {
+        'type': 'TEAM_MEMBER', 'status': MembershipStatus.ACTIVE.value, 'tenant_id': membership.tenant_id
+    }
+    with patch.object(MembershipModel, 'find_by_engagement_and_user_id') as mock_find:
+        assert authorization._get_engagement_membership(engagement.id, user.id) == cached_membership
+        mock_find.assert_not_called()
+
+    MembershipService.revoke_membership(membership)
+    assert authorization._get_engagement_membership(engagement.id, user.id)['status'] == \
+        MembershipStatus.REVOKED.value
+
+    MembershipService.revoke_memberships_bulk(user.id)
+    MembershipService.reinstate_membership(MembershipModel.find_by_engagement_and_user_id(engagement.id, user.id))
+    assert authorization._get_engagement_membership(engagement.id, user.id)['status'] == \
+        MembershipStatus.ACTIVE.value
+
+    MembershipService.deactivate_memberships_bulk(user.id)
+    assert authorization._get_engagement_membership(engagement.id, user.id)['status'] == \
+        MembershipStatus.INACTIVE.value
+
+
+def test_engagement_tenant_cached(session):
+    """Assert that the tenant of an engagement is cached until it changes."""
+    engagement = factory_engagement_model()
+    tenant_id = authorization._get_engagement_tenant_id(engagement.id)
+    assert tenant_id == engagement.tenant_id
+
+    with patch.object(EngagementModel, 'find_tenant_id_by_id') as mock_find:
+        assert authorization._get_engagement_tenant_id(engagement.id) == tenant_id
+        mock_find.assert_not_called()
+
+    engagement.tenant_id = None
+    engagement.save()
+    assert authorization._get_engagement_tenant_id(engagement.id) is None
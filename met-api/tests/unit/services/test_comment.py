@@ -17,10 +17,12 @@
 Test-Suite to ensure that the Comment service routines are working as expected.
 """
 from met_api.services.comment_service import CommentService
-from tests.utilities.factory_scenarios import TestJwtClaims, TestSubmissionInfo
+from tests.utilities.factory_scenarios import (
+    TestCommentInfo, TestJwtClaims, TestReportSettingInfo, TestSubmissionInfo)
 from tests.utilities.factory_utils import (
     factory_comment_model, factory_membership_model, factory_participant_model, factory_staff_user_model,
-    factory_submission_model, factory_survey_and_eng_model, patch_token_info, set_global_tenant)
+    factory_submission_model, factory_survey_and_eng_model, factory_survey_report_setting_model, patch_token_info,
+    set_global_tenant)
 
 
 def test_get_comments(session, monkeypatch):  # pylint:disable=unused-argument
@@ -53,3 +55,84 @@ def test_get_comments_approved_comments(session):  # pylint:disable=unused-argum
     comment_records = CommentService().get_comments_by_submission(submission.id)
     assert len(comment_records) == 1
     assert comment_records[0]['status_id'] == approved_submission.get('comment_status_id')
+
+
+def test_format_comments():
+    """Assert that comments are laid out in rows with one column per label in order of appearance."""
+    comments = [
+        {'submission_id': 1, 'label': 'Q1', 'text': 'a'},
+        {'submission_id': 1, 'label': 'Q2', 'text': 'b'},
+        {'submission_id': 2, 'label': 'Q1', 'text': 'c'},
+        {'submission_id': 3, 'label': 'Q1'},
+    ]
+
+    result = CommentService.format_comments(comments)
+
+    assert result['titles'] == [
+        {'label': 'Q1', 'proponent_answers': 'Proponent Answer'},
+        {'label': 'Q2', 'proponent_answers': 'Proponent Answer'},
+    ]
+    assert result['comments'] == [
+        {'row_id': 1, 'commentText': [{'text': 'a', 'submission_id': 1}, {'text': 'b', 'submission_id': 1}]},
+        {'row_id': 2, 'commentText': [{'text': 'c', 'submission_id': 2}, {'text': '', 'submission_id': ''}]},
+        {'row_id': 3, 'commentText': [{'text': '', 'submission_id': 3}, {'text': '', 'submission_id': ''}]},
+    ]
+    assert CommentService.format_comments([]) == {'titles': [], 'comments': []}
+
+
+def test_group_and_sort_comments_by_titles():
+    """Assert that comments are grouped by submission and sorted in the order of the titles."""
+    comments = [
+        {'submission_id': 1, 'label': 'Q2', 'text': 'a'},
+        {'submission_id': 2, 'label': 'Q1', 'text': 'b'},
+        {'submission_id': 1, 'label': 'Q1', 'text': 'c'},
+        {'submission_id': 1, 'label': 'Other', 'text': 'd'},
+    ]
+    titles = [{'label': 'Q1'}, {'label': 'Q2'}]
+
+    grouped = CommentService.group_comments_by_submission_id(comments)
+
+    assert [group['submission_id'] for group in grouped] == [1, 2]
+    assert CommentService.sort_comments_by_titles(titles, grouped) == [
+        {'submission_id': 1, 'commentText': [{'text': 'c', 'label': 'Q1'}, {'text': 'a', 'label': 'Q2'}]},
+        {'submission_id': 2, 'commentText': [{'text': 'b', 'label': 'Q1'}, {'text': '', 'label': 'Q2'}]},
+    ]
+
+
+def test_search_comments(session, app, monkeypatch):  # pylint:disable=unused-argument
+    """Assert that comments are searched by words and phrases, best matches first, with escaped snippets."""
+    patch_token_info(TestJwtClaims.staff_admin_role, monkeypatch)
+    set_global_tenant()
+    participant = factory_participant_model()
+    survey, eng = factory_survey_and_eng_model()
+    submission = factory_submission_model(survey.id, eng.id, participant.id, TestSubmissionInfo.approved_submission)
+    factory_survey_report_setting_model({
+        **TestReportSettingInfo.report_setting_1, 'survey_id': survey.id, 'question_key': 'simpletext'})
+    texts = [
+        'The new bike lanes on Main Street are great',
+        'Bike parking <b>near</b> the market is missing',
+        'Lanes for buses first, bike lanes second, bike lanes everywhere',
+        'Nothing to add',
+    ]
+    comments = [factory_comment_model(survey.id, submission.id, {**TestCommentInfo.comment1, 'text': text})
+                for text in texts]
+
+    def search(search_text):
+        return CommentService.search_comments(survey.id, search_text)['items']
+
+    results = search('bike lanes')
+    assert [result['text'] for result in results] == [texts[2], texts[0]]
+    assert results[0]['rank'] > results[1]['rank']
+    assert [result['text'] for result in search('"lanes on main"')] == [texts[0]]
+    assert {result['text'] for result in search('BIK')} == set(texts[:3])
+    assert [result['text'] for result in search('bike -lanes')] == [texts[1]]
+
+    snippet = search('parking')[0]['snippet']
+    assert '<mark>parking</mark>' in snippet
+    assert '&lt;b&gt;near&lt;/b&gt;' in snippet
+
+    monkeypatch.setitem(app.config, 'COMMENT_FULL_TEXT_SEARCH', False)
+    results = search('Main Str')
+    assert [result['text'] for result in results] == [texts[0]]
+    assert results[0]['rank'] == 0
+    assert comments[3].text not in [result['text'] for result in search('lanes')]
@@ -0,0 +1,78 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Document Generation Service class.
+
+Test-Suite to ensure that documents are generated with as few calls to CDOGS as possible.
+"""
+from http import HTTPStatus
+from unittest.mock import MagicMock
+
+from met_api.config import Config
+from met_api.services import cdogs_api_service
+from met_api.services.cdogs_api_service import CdogsApiService
+from met_api.services.document_generation_service import DocumentGenerationService
+from met_api.utils.enums import GeneratedDocumentTypes
+
+
+DOCUMENT_OPTIONS = {
+    'document_type': GeneratedDocumentTypes.COMMENT_SHEET_STAFF.value,
+    'template_name': 'staff_comments_sheet.xlsx',
+    'convert_to': 'csv',
+    'report_name': 'comments_sheet'
+}
+
+
+def _response(status_code, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+def test_generate_document_reuses_token_and_template(session, mocker):  # pylint:disable=unused-argument
+    """Assert that a document generated again with a known template makes a single call to CDOGS."""
+    CdogsApiService.clear_cache()
+    mock_token = mocker.patch.object(CdogsApiService, '_request_access_token',
+                                     return_value={'access_token': 'token', 'expires_in': 300})
+    mock_upload = mocker.patch.object(CdogsApiService, '_post_upload_template',
+                                      return_value=_response(HTTPStatus.OK, {'X-Template-Hash': 'hash_code'}))
+    mock_check = mocker.patch.object(CdogsApiService, 'check_template_cached', return_value=True)
+    mock_render = mocker.patch.object(CdogsApiService, '_post_generate_document',
+                                      return_value=_response(HTTPStatus.OK))
+
+    DocumentGenerationService().generate_document(data={}, options=DOCUMENT_OPTIONS)
+    assert (mock_token.call_count, mock_upload.call_count, mock_render.call_count) == (1, 1, 1)
+
+    DocumentGenerationService().generate_document(data={}, options=DOCUMENT_OPTIONS)
+    assert (mock_token.call_count, mock_upload.call_count, mock_render.call_count) == (1, 1, 2)
+    mock_check.assert_not_called()
+
+    # the template is uploaded again when CDOGS no longer has it
+    mock_render.side_effect = [_response(HTTPStatus.NOT_FOUND), _response(HTTPStatus.OK)]
+    response = DocumentGenerationService().generate_document(data={}, options=DOCUMENT_OPTIONS)
+    assert response.status_code == HTTPStatus.OK
+    assert (mock_token.call_count, mock_upload.call_count, mock_render.call_count) == (1, 2, 4)
+    CdogsApiService.clear_cache()
+
+
+def test_access_token_request_times_out(session, mocker):  # pylint:disable=unused-argument
+    """Assert that the access token, requested holding the lock of the client, is requested with a timeout."""
+    CdogsApiService.clear_cache()
+    token_response = _response(HTTPStatus.OK)
+    token_response.json.return_value = {'access_token': 'token', 'expires_in': 300}
+    mock_post = mocker.patch.object(cdogs_api_service._state.http, 'post', return_value=token_response)
+
+    assert CdogsApiService().access_token == 'token'
+    assert mock_post.call_args.kwargs['timeout'] == Config().CDOGS_CONFIG['CONNECT_TIMEOUT']
+    CdogsApiService.clear_cache()
@@ -0,0 +1,107 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to verify the EmailOutboxService class.
+
+Test suite to ensure that the emails of the outbox are sent, retried with backoff, and marked as failed.
+"""
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from unittest.mock import patch
+
+from faker import Faker
+from requests import ConnectionError as RequestsConnectionError
+
+from met_api.constants.email_outbox_status import EmailOutboxStatus
+from met_api.models.email_outbox import EmailOutbox
+from met_api.services.email_outbox_service import EmailOutboxService
+from met_api.utils import notification
+
+
+fake = Faker()
+
+
+def _failed(status_code):
+    return {'status': EmailOutboxStatus.FAILED.name, 'error': f'{status_code} Error', 'status_code': status_code}
+
+
+def test_dispatch_sends_due_emails(app, session):  # pylint:disable=unused-argument
+    """Assert that the due emails are sent once, in one request, with their idempotency key as reference."""
+    email_address = fake.email()
+    first_id = EmailOutbox.enqueue('first', email_address, 'Subject', 'Body', {'name': 'value'}, 'template')
+    second_id = EmailOutbox.enqueue('second', fake.email(), 'Subject', 'Body', {}, 'template')
+
+    with patch.object(notification, 'send_email_batch',
+                      return_value=[{'status': 'SENT'}, {'status': 'SENT'}]) as send_email_batch:
+        totals = EmailOutboxService.dispatch()
+        assert not EmailOutboxService.dispatch()[EmailOutboxStatus.SENT.name]
+
+    assert totals[EmailOutboxStatus.SENT.name] == 2
+    send_email_batch.assert_called_once()
+    emails = send_email_batch.call_args.args[0]
+    assert emails[0] == {'subject': 'Subject', 'email': email_address, 'html_body': 'Body', 'args': {'name': 'value'},
+                         'template_id': 'template', 'reference': 'first'}
+    for email_id in (first_id, second_id):
+        email = EmailOutbox.find_by_id(email_id)
+        assert email.status == EmailOutboxStatus.SENT
+        assert email.sent_date is not None
+
+
+def test_dispatch_retries_with_backoff(app, session):  # pylint:disable=unused-argument
+    """Assert that an email which failed is sent again later, until its attempts run out."""
+    email_id = EmailOutbox.enqueue('key', fake.email(), 'Subject', 'Body', {}, 'template')
+    retry_delay = app.config['EMAIL_OUTBOX_RETRY_DELAY']
+
+    with patch.object(notification, 'send_email_batch', return_value=[_failed(HTTPStatus.SERVICE_UNAVAILABLE)]):
+        totals = EmailOutboxService.dispatch()
+        email = EmailOutbox.find_by_id(email_id)
+        assert totals[EmailOutboxStatus.PENDING.name] == 1
+        assert email.attempts == 1
+        assert email.last_error
+        assert email.next_attempt_date > datetime.utcnow() + timedelta(seconds=retry_delay - 5)
+
+    # a batch whose request failed is retried too
+    email.next_attempt_date = datetime.utcnow()
+    email.save()
+    with patch.object(notification, 'send_email_batch', side_effect=RequestsConnectionError('Unreachable')):
+        assert EmailOutboxService.dispatch()[EmailOutboxStatus.PENDING.name] == 1
+        assert EmailOutbox.find_by_id(email_id).last_error == 'Unreachable'
+
+        email = EmailOutbox.find_by_id(email_id)
+        email.attempts = app.config['EMAIL_OUTBOX_MAX_ATTEMPTS'] - 1
+        email.next_attempt_date = datetime.utcnow()
+        email.save()
+        assert EmailOutboxService.dispatch()[EmailOutboxStatus.FAILED.name] == 1
+        assert EmailOutbox.find_by_id(email_id).status == EmailOutboxStatus.FAILED
+
+
+def test_dispatch_fails_rejected_emails(app, session):  # pylint:disable=unused-argument
+    """Assert that an email rejected by the provider, or not allowed, is not sent again."""
+    email_id = EmailOutbox.enqueue('key', fake.email(), 'Subject', 'Body', {}, 'template')
+
+    with patch.object(notification, 'send_email_batch',
+                      return_value=[_failed(HTTPStatus.BAD_REQUEST)]) as send_email_batch:
+        assert EmailOutboxService.dispatch()[EmailOutboxStatus.FAILED.name] == 1
+        assert not EmailOutboxService.dispatch()[EmailOutboxStatus.FAILED.name]
+
+    send_email_batch.assert_called_once()
+    email = EmailOutbox.find_by_id(email_id)
+    assert email.status == EmailOutboxStatus.FAILED
+    assert email.attempts == 1
+
+    not_allowed_id = EmailOutbox.enqueue('not_allowed', fake.email(), 'Subject', 'Body', {}, 'template')
+    with patch.object(notification, 'send_email_batch') as send_email_batch, \
+            patch.dict(app.config, {'SEND_EMAIL_INTERNAL_ONLY': True}):
+        assert EmailOutboxService.dispatch()[EmailOutboxStatus.FAILED.name] == 1
+    send_email_batch.assert_not_called()
+    assert EmailOutbox.find_by_id(not_allowed_id).status == EmailOutboxStatus.FAILED
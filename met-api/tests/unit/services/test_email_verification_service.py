@@ -22,6 +22,7 @@ import pytest
 from faker import Faker
 
 from met_api.exceptions.business_exception import BusinessException
+from met_api.models.email_outbox import EmailOutbox
 from met_api.services.email_verification_service import EmailVerificationService
 from met_api.constants.email_verification import EmailVerificationType
 from met_api.utils import notification
@@ -47,13 +48,12 @@ def test_create_email_verification(client, jwt, session, ):  # pylint:disable=un
         'survey_id': survey.id,
         'type': EmailVerificationType.Survey
     }
-    with patch.object(notification, 'send_email', return_value=False) as mock_mail:
-        EmailVerificationService().create(to_dict)
-        mock_mail.assert_called()
-        actual_data = mock_mail.call_args.kwargs
-        assert eng.name in actual_data.get('subject')
-        assert actual_data.get('email') == email
-        assert actual_data.get('args').get('engagement_name') == eng.name
+    email_verification = EmailVerificationService().create(to_dict)
+    queued_email = EmailOutbox.query.filter_by(
+        idempotency_key=f'email_verification_{email_verification["verification_token"]}').one()
+    assert eng.name in queued_email.subject
+    assert queued_email.email_address == email
+    assert queued_email.args.get('engagement_name') == eng.name
 
 
 def test_create_email_verification_exception(client, jwt, session, ):  # pylint:disable=unused-argument
@@ -72,6 +72,6 @@ def test_create_email_verification_exception(client, jwt, session, ):  # pylint:
         'type': EmailVerificationType.Survey
     }
     with pytest.raises(BusinessException) as exception:
-        with patch.object(notification, 'send_email', side_effect=Exception('mocked error')):
+        with patch.object(notification, 'queue_email', side_effect=Exception('mocked error')):
             EmailVerificationService().create(to_dict)
     assert exception.type == BusinessException
@@ -15,6 +15,8 @@
 
 from faker import Faker
 
+from met_api.models import db
+from met_api.models.engagement import Engagement as EngagementModel
 from met_api.services.engagement_metadata_service import EngagementMetadataService
 from tests.utilities.factory_scenarios import TestEngagementMetadataInfo
 from tests.utilities.factory_utils import factory_engagement_metadata_model, factory_metadata_requirements
@@ -142,3 +144,19 @@ def test_delete_engagement_metadata(session):
     existing_metadata = engagement_metadata_service.get_by_engagement(
         engagement.id)
     assert not any(em['id'] == eng_meta.id for em in existing_metadata)
+
+
+def test_metadata_values_refreshed(session):
+    """Assert that the indexed metadata values of the engagement follow the metadata writes."""
+    taxon, engagement, _, _ = factory_metadata_requirements()
+
+    def metadata_values():
+        return sorted(db.session.query(EngagementModel.metadata_values).filter_by(id=engagement.id).scalar())
+
+    assert metadata_values() == []
+    engagement_metadata_service.update_by_taxon(engagement.id, taxon.id, ['a', 'b:c'])
+    assert metadata_values() == [f'{taxon.id}:a', f'{taxon.id}:b:c']
+    metadata = engagement_metadata_service.update_by_taxon(engagement.id, taxon.id, ['d'])
+    assert metadata_values() == [f'{taxon.id}:d']
+    engagement_metadata_service.delete(metadata[0]['id'])
+    assert metadata_values() == []
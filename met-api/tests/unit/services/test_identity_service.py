@@ -0,0 +1,65 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Identity service.
+
+Test suite to ensure that the identity of the user is resolved once per request.
+"""
+import json
+from datetime import datetime
+from http import HTTPStatus
+from unittest.mock import patch
+
+from met_api.services.identity_service import IdentityService
+from met_api.utils.enums import CompositeRoleNames, ContentType
+from met_api.utils.roles import Role
+from tests.utilities.factory_scenarios import TestEngagementInfo
+from tests.utilities.factory_utils import factory_auth_header
+
+
+def test_identity_resolved_once_per_request(client, jwt, session,
+                                            setup_admin_user_and_claims):  # pylint:disable=unused-argument
+    """Assert that the role callback and the authorization checks share the identity of the request."""
+    _, claims = setup_admin_user_and_claims
+    headers = factory_auth_header(jwt=jwt, claims=claims)
+    engagement_info = {
+        key: TestEngagementInfo.engagement1[key]
+        for key in ('name', 'status', 'is_internal', 'description', 'rich_description', 'content', 'rich_content')
+    }
+    engagement_info['start_date'] = engagement_info['end_date'] = datetime.today().strftime('%Y-%m-%d')
+
+    with patch.object(IdentityService, '_resolve', wraps=IdentityService._resolve) as mock_resolve:
+        rv = client.post('/api/engagements/', data=json.dumps(engagement_info),
+                         headers=headers, content_type=ContentType.JSON.value)
+        assert rv.status_code == HTTPStatus.OK
+        assert mock_resolve.call_count == 1
+
+        rv = client.get(f'/api/engagements/{rv.json.get("id")}', headers=headers)
+        assert rv.status_code == HTTPStatus.OK
+        assert mock_resolve.call_count == 2
+
+
+def test_get_context(app, session, setup_admin_user_and_claims):
+    """Assert that the context holds the staff user, group and roles of the user within the tenant."""
+    user, _ = setup_admin_user_and_claims
+
+    with app.test_request_context():
+        context = IdentityService.get_context(user.external_id, user.tenant_id)
+        assert IdentityService.get_context(user.external_id, user.tenant_id) is context
+        IdentityService.clear_context()
+        assert IdentityService.get_context(user.external_id, user.tenant_id) is not context
+
+    assert context.staff_user.id == user.id
+    assert context.group_name == CompositeRoleNames.ADMIN.value
+    assert Role.CREATE_ENGAGEMENT.value in context.tenant_roles
+    assert IdentityService.get_context('unknown', user.tenant_id).tenant_roles == []
@@ -0,0 +1,51 @@
+"""Tests for the ReferenceDataService.
+
+Test suite to ensure that the reference data is cached per process until it changes.
+"""
+from unittest.mock import patch
+
+from met_api.models.comment_status import CommentStatus as CommentStatusModel
+from met_api.models.language import Language as LanguageModel
+from met_api.services.language_service import LanguageService
+from met_api.services.reference_data_service import ReferenceDataService
+from tests.utilities.factory_utils import factory_tenant_model
+
+
+def test_reference_data_cached(session, app, monkeypatch):  # pylint:disable=unused-argument
+    """Assert that the reference data is loaded once until it is invalidated."""
+    monkeypatch.setitem(app.config, 'REFERENCE_DATA_CACHE_TTL', 900)
+    ReferenceDataService.clear_cache()
+
+    statuses = ReferenceDataService.get_comment_statuses()
+    assert {status.id for status in statuses} == {status.id for status in CommentStatusModel.get_comment_statuses()}
+    assert ReferenceDataService.get_language(49).name == 'French'
+    assert ReferenceDataService.get_language('not an id') is None
+
+    with patch.object(CommentStatusModel, 'query') as mock_status_query, \
+            patch.object(LanguageModel, 'query') as mock_language_query:
+        assert ReferenceDataService.get_comment_statuses() == statuses
+        assert ReferenceDataService.get_comment_status_ids() == frozenset(status.id for status in statuses)
+        assert len(ReferenceDataService.get_languages()) == 187
+        mock_status_query.order_by.assert_not_called()
+        mock_language_query.order_by.assert_not_called()
+
+    LanguageService.update_language(49, {'name': 'Français'})
+    assert ReferenceDataService.get_language(49).name == 'Français'
+    ReferenceDataService.clear_cache()
+
+
+def test_tenant_languages_invalidated(session, app, monkeypatch):  # pylint:disable=unused-argument
+    """Assert that the languages of a tenant are reloaded after the mapping changes."""
+    monkeypatch.setitem(app.config, 'REFERENCE_DATA_CACHE_TTL', 900)
+    ReferenceDataService.clear_cache()
+    tenant = factory_tenant_model()
+
+    assert ReferenceDataService.get_tenant_languages(tenant.id) == ()
+    with patch('met_api.services.authorization.check_auth'):
+        LanguageService.map_language_to_tenant(49, tenant.short_name)
+    assert [language.id for language in LanguageService.get_languages_by_tenant(tenant.short_name)] == [49]
+
+    with patch('met_api.services.authorization.check_auth'):
+        LanguageService.remove_language_mapping_from_tenant(49, tenant.short_name)
+    assert ReferenceDataService.get_tenant_languages(tenant.id) == ()
+    ReferenceDataService.clear_cache()
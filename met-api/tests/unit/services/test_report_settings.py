@@ -15,9 +15,12 @@
 
 Test suite to ensure that the Survey report settings service routines are working as expected.
 """
+from met_api.models.comment import Comment as CommentModel
 from met_api.services.report_setting_service import ReportSettingService
-from tests.utilities.factory_scenarios import TestSurveyInfo
-from tests.utilities.factory_utils import factory_survey_and_eng_model
+from tests.utilities.factory_scenarios import TestReportSettingInfo, TestSurveyInfo
+from tests.utilities.factory_utils import (
+    factory_comment_model, factory_participant_model, factory_submission_model, factory_survey_and_eng_model,
+    factory_survey_report_setting_model)
 
 
 def test_refresh_report_setting(session):  # pylint:disable=unused-argument
@@ -33,3 +36,26 @@ def test_refresh_report_setting(session):  # pylint:disable=unused-argument
     report_settings = ReportSettingService.get_report_setting(survey.id)
     assert len(report_settings) == 1
     assert report_settings[0].get('survey_id') == survey.id
+
+
+def test_comment_display_follows_report_setting(session):  # pylint:disable=unused-argument
+    """Assert comments resolve their display flag from the survey settings, which updates invalidate."""
+    survey, eng = factory_survey_and_eng_model(TestSurveyInfo.survey3)
+    participant = factory_participant_model()
+    submission = factory_submission_model(survey.id, eng.id, participant.id)
+    comments = [factory_comment_model(survey.id, submission.id) for _ in range(3)]
+    report_setting = factory_survey_report_setting_model({
+        **TestReportSettingInfo.report_setting_1,
+        'survey_id': survey.id,
+        'question_key': comments[0].component_id,
+    })
+
+    assert all(comment.is_displayed is True for comment in comments)
+    displayed = CommentModel.query.filter(CommentModel.survey_id == survey.id, CommentModel.is_displayed).count()
+    assert displayed == len(comments)
+
+    ReportSettingService.update_report_setting(survey.id, [{'id': report_setting.id, 'display': False}])
+
+    assert all(comment.is_displayed is False for comment in comments)
+    displayed = CommentModel.query.filter(CommentModel.survey_id == survey.id, CommentModel.is_displayed).count()
+    assert displayed == 0
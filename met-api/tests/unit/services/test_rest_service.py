@@ -0,0 +1,57 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Rest Service class.
+
+Test-Suite to ensure that service account tokens are cached until they expire.
+"""
+from unittest.mock import MagicMock
+
+from met_api.services.rest_service import RestService, token_cache
+
+
+def _token_response(access_token, expires_in=300):
+    response = MagicMock()
+    response.json.return_value = {'access_token': access_token, 'expires_in': expires_in}
+    return response
+
+
+def test_service_account_token_is_cached(app, mocker):
+    """Assert that the service account token is requested once per client and issuer."""
+    token_cache.clear()
+    mock_post = mocker.patch('met_api.services.rest_service.requests.post',
+                             side_effect=[_token_response('token1'), _token_response('token2'),
+                                          _token_response('token3')])
+    with app.app_context():
+        assert RestService.get_service_account_token('client', 'secret', 'https://issuer') == 'token1'
+        assert RestService.get_service_account_token('client', 'secret', 'https://issuer') == 'token1'
+        assert RestService.get_service_account_token('other', 'secret', 'https://issuer') == 'token2'
+        assert RestService.get_service_account_token('client', 'secret', 'https://issuer',
+                                                     force_refresh=True) == 'token3'
+
+    assert mock_post.call_count == 3
+    assert RestService.get_token_cache_stats() == {'hits': 1, 'misses': 3, 'size': 2}
+    token_cache.clear()
+
+
+def test_expired_token_is_requested_again(app, mocker):
+    """Assert that a token expiring within the safety margin is not cached."""
+    token_cache.clear()
+    mock_post = mocker.patch('met_api.services.rest_service.requests.post',
+                             side_effect=[_token_response('token1', expires_in=10), _token_response('token2')])
+    with app.app_context():
+        assert RestService.get_access_token_with_password('user', 'password', 'client', 'https://issuer') == 'token1'
+        assert RestService.get_access_token_with_password('user', 'password', 'client', 'https://issuer') == 'token2'
+
+    assert mock_post.call_count == 2
+    token_cache.clear()
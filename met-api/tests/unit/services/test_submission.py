@@ -15,11 +15,16 @@
 
 Test suite to ensure that the Submission service routines are working as expected.
 """
+from contextlib import contextmanager
 from typing import List
 from unittest.mock import patch
 
+from sqlalchemy import event
+
 from met_api.constants.email_verification import EmailVerificationType
+from met_api.models import db
 from met_api.models.comment import Comment
+from met_api.models.email_outbox import EmailOutbox
 from met_api.schemas.comment import CommentSchema
 from met_api.services import authorization
 from met_api.constants.comment_status import Status
@@ -30,7 +35,23 @@ from met_api.services.submission_service import SubmissionService
 
 from tests.utilities.factory_utils import (
     factory_comment_model, factory_email_verification, factory_engagement_setting_model, factory_participant_model,
-    factory_staff_user_model, factory_submission_model, factory_survey_and_eng_model)
+    factory_staff_user_model, factory_submission_model, factory_survey_and_eng_model, factory_tenant_model)
+
+
+@contextmanager
+def _count_queries():
+    """Count the statements executed in the block, other than the savepoints of the test session."""
+    statements = []
+
+    def _before_cursor_execute(*args):
+        if 'SAVEPOINT' not in args[2]:
+            statements.append(args[2])
+
+    event.listen(db.engine, 'before_cursor_execute', _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', _before_cursor_execute)
 
 
 def test_create_submission(session):  # pylint:disable=unused-argument
@@ -196,3 +217,46 @@ def test_check_if_submission_can_handle_multiple_comments(session):
 
     # Assert that the function returns True since there is a comment in a text field that starts with 'simpletextfield2'
     assert 'simpletextfield2' in submission_json.keys()
+
+
+def test_create_and_review_submission_queries(app, session):  # pylint:disable=unused-argument
+    """Assert that creating and reviewing a submission, with their emails, look up each model once."""
+    tenant = factory_tenant_model()
+    survey, eng = factory_survey_and_eng_model()
+    eng.tenant_id = tenant.id
+    eng.save()
+    participant = factory_participant_model()
+    email_verification = factory_email_verification(survey.id)
+    email_verification.participant_id = participant.id
+    email_verification.save()
+    engagement_setting = factory_engagement_setting_model(eng.id)
+    engagement_setting.send_report = True
+    engagement_setting.save()
+    staff_user = factory_staff_user_model(3)
+    token, external_id = email_verification.verification_token, staff_user.external_id
+    submission_request: SubmissionSchema = {
+        'submission_json': {'simpletextarea': 'Test Comment'},
+        'survey_id': survey.id,
+        'verification_token': token,
+    }
+    staff_review_details = {
+        'status_id': Status.Rejected.value,
+        'has_personal_info': True,
+        'notify_email': True,
+        'staff_note': [{'note': 'Review', 'note_type': 'Review'}, {'note': 'Internal', 'note_type': 'Internal'}],
+    }
+    db.session.expunge_all()
+
+    with patch.object(authorization, 'check_auth', return_value=True):
+        with app.test_request_context(), _count_queries() as statements:
+            submission = SubmissionService().create(token, submission_request)
+        # the survey and engagement, the survey dump, the verification, the submission, and the queued email
+        assert len(statements) == 15
+
+        submission_id = submission.id
+        db.session.expunge_all()
+        with app.test_request_context(), _count_queries() as statements:
+            SubmissionService().review_comment(submission_id, staff_review_details, external_id)
+        # the reviewer and submission, the review, the staff notes, the verification, the queued email and the dump
+        assert len(statements) == 18
+    assert EmailOutbox.query.count() == 2
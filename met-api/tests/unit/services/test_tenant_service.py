@@ -125,3 +125,24 @@ def test_delete_tenant_error(session):
             with patch.object(TenantModel, 'delete', side_effect=SQLAlchemyError):
                 with pytest.raises(ValueError):
                     TenantService.delete(tenant.short_name)
+
+
+def test_get_cached_tenant(session):
+    """Test that tenants are cached as dicts until they are updated or deleted."""
+    tenant = factory_tenant_model({**TestTenantInfo.tenant1, 'short_name': 'CACHED'})
+    TenantService.invalidate_cache('CACHED', 'RENAMED')
+
+    cached_tenant = TenantService.get_cached('cached')
+    assert cached_tenant == {'id': tenant.id, 'short_name': 'CACHED', 'name': tenant.name}
+    with patch.object(TenantModel, 'find_by_short_name') as mock_find:
+        assert TenantService.get_cached('CACHED') == cached_tenant
+        mock_find.assert_not_called()
+
+    with patch.object(authorization, 'check_auth', return_value=True):
+        TenantService.update('CACHED', {'short_name': 'RENAMED', 'name': 'Renamed Tenant'})
+    assert TenantService.get_cached('CACHED') is None
+    assert TenantService.get_cached('RENAMED')['name'] == 'Renamed Tenant'
+
+    with patch.object(authorization, 'check_auth', return_value=True):
+        TenantService.delete('RENAMED')
+    assert TenantService.get_cached('RENAMED') is None
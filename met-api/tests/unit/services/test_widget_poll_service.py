@@ -19,17 +19,24 @@ from http import HTTPStatus
 from unittest.mock import patch
 
 import pytest
+from faker import Faker
+from sqlalchemy import event
 
 from met_api.constants.engagement_status import Status as EngagementStatus
 from met_api.exceptions.business_exception import BusinessException
+from met_api.models import db
+from met_api.models.poll_responses import PollResponse as PollResponseModel
 from met_api.services import authorization
 from met_api.services.poll_response_service import PollResponseService
 from met_api.services.widget_poll_service import WidgetPollService
-from tests.utilities.factory_scenarios import TestPollAnswerInfo, TestPollResponseInfo, TestWidgetPollInfo
+from tests.utilities.factory_scenarios import TestPollAnswerInfo, TestWidgetPollInfo
 from tests.utilities.factory_utils import (
     factory_engagement_model, factory_poll_answer_model, factory_poll_model, factory_widget_model)
 
 
+fake = Faker()
+
+
 def test_get_polls_by_widget_id(session):
     """Assert that polls can be fetched by widget ID."""
     widget = _create_widget()
@@ -103,63 +110,85 @@ def test_update_poll(session):
         assert exc_info.value.status_code == HTTPStatus.BAD_REQUEST
 
 
-def test_record_response(session):
-    """Assert that a poll can be created."""
+def test_record_participant_response(session):
+    """Assert that a response is recorded with a single statement, and rejected with the reason."""
     widget = _create_widget()
     poll = factory_poll_model(widget, TestWidgetPollInfo.poll1)
     answer = factory_poll_answer_model(poll, TestPollAnswerInfo.answer1)
-    response_data = TestPollResponseInfo.response1
-    response_data['poll_id'] = poll.id
-    response_data['widget_id'] = widget.id
-    response_data['selected_answer_id'] = answer.id
+    participant_id = fake.uuid4()
+    poll_id, answer_id = poll.id, answer.id
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):  # pylint: disable=unused-argument
+        # the savepoints stand for the commits in the tests
+        if 'SAVEPOINT' not in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        response_id = WidgetPollService.record_participant_response(poll_id, participant_id, answer_id,
+                                                                    max_responses=2)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    assert response_id is not None
+    assert len(statements) == 1
+    assert 'INSERT INTO poll_responses' in statements[0]
+    assert PollResponseModel.find_by_id(response_id).widget_id == widget.id
 
-    response = WidgetPollService.record_response(response_data)
-    assert response.id is not None
-    assert response.selected_answer_id == answer.id
-
-    # Test creating response with invalid selected_answer_id
-    response_data['selected_answer_id'] = 100
     with pytest.raises(BusinessException) as exc_info:
-        _ = WidgetPollService.record_response(response_data)
+        WidgetPollService.record_participant_response(poll.id, participant_id, 100, max_responses=2)
+    assert exc_info.value.error == 'Invalid selected answer for the poll.'
 
-    assert exc_info.value.status_code == HTTPStatus.BAD_REQUEST
+    WidgetPollService.record_participant_response(poll.id, participant_id, answer.id, max_responses=2)
+    with pytest.raises(BusinessException) as exc_info:
+        WidgetPollService.record_participant_response(poll.id, participant_id, answer.id, max_responses=2)
+    assert exc_info.value.error == 'Limit exceeded for this poll'
+    assert PollResponseService.get_poll_count(poll.id, participant_id) == 2
 
+    with pytest.raises(BusinessException) as exc_info:
+        WidgetPollService.record_participant_response(100, participant_id, answer.id, max_responses=2)
+    assert exc_info.value.status_code == HTTPStatus.NOT_FOUND
 
-def test_check_already_polled(session):
-    """Checking whether the poll is already polled the specfied limit with same ip."""
-    response_data = TestPollResponseInfo.response1
-    widget = _create_widget()
+    engagement = factory_engagement_model(status=EngagementStatus.Unpublished.value)
+    widget = factory_widget_model({'engagement_id': engagement.id})
     poll = factory_poll_model(widget, TestWidgetPollInfo.poll1)
-    already_polled = WidgetPollService.check_already_polled(
-        poll.id, response_data['participant_id'], 1
-    )
-    assert already_polled is False
+    answer = factory_poll_answer_model(poll, TestPollAnswerInfo.answer1)
+    with pytest.raises(BusinessException) as exc_info:
+        WidgetPollService.record_participant_response(poll.id, participant_id, answer.id, max_responses=2)
+    assert exc_info.value.error == 'Poll engagement is not published'
+
 
-    # Check already polled or not after poll response is created
+def test_record_participant_response_inactive_poll(session):
+    """Assert that a response to a poll which is not active is rejected."""
+    widget = _create_widget()
+    poll = factory_poll_model(widget, TestWidgetPollInfo.poll2)
     answer = factory_poll_answer_model(poll, TestPollAnswerInfo.answer1)
-    response_data['poll_id'] = poll.id
-    response_data['widget_id'] = widget.id
-    response_data['selected_answer_id'] = answer.id
-    PollResponseService.create_response(response_data)
+    participant_id = fake.uuid4()
 
-    already_polled = WidgetPollService.check_already_polled(
-        poll.id, response_data['participant_id'], 1
-    )
-    assert already_polled is True
+    with pytest.raises(BusinessException) as exc_info:
+        WidgetPollService.record_participant_response(poll.id, participant_id, answer.id, max_responses=2)
+    assert exc_info.value.status_code == HTTPStatus.BAD_REQUEST
+    assert exc_info.value.error == 'Poll is not active'
+    assert PollResponseService.get_poll_count(poll.id, participant_id) == 0
 
 
-def test_is_poll_active(session):
-    """Check if poll is active or not."""
+def test_record_participant_response_rate_limit(session, app, monkeypatch):
+    """Assert that the responses of a participant are throttled."""
     widget = _create_widget()
     poll = factory_poll_model(widget, TestWidgetPollInfo.poll1)
-    is_active = WidgetPollService.is_poll_active(poll.id)
-    assert is_active is True
+    answer = factory_poll_answer_model(poll, TestPollAnswerInfo.answer1)
+    participant_id = fake.uuid4()
+    monkeypatch.setitem(app.config, 'POLL_RESPONSE_RATE', 0.001)
+    monkeypatch.setitem(app.config, 'POLL_RESPONSE_BURST', 2)
 
-    # Test wrong poll id
+    for _ in range(2):
+        WidgetPollService.record_participant_response(poll.id, participant_id, answer.id, max_responses=10)
     with pytest.raises(BusinessException) as exc_info:
-        _ = WidgetPollService.is_poll_active(100)
-
-    assert exc_info.value.status_code == HTTPStatus.NOT_FOUND
+        WidgetPollService.record_participant_response(poll.id, participant_id, answer.id, max_responses=10)
+    assert exc_info.value.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    # other participants are not throttled
+    assert WidgetPollService.record_participant_response(poll.id, fake.uuid4(), answer.id, max_responses=10)
 
 
 def test_is_poll_engagement_published(session):
@@ -180,7 +209,7 @@ def test_is_poll_engagement_published(session):
 
     # Test wrong poll id
     with pytest.raises(BusinessException) as exc_info:
-        _ = WidgetPollService.is_poll_active(100)
+        _ = WidgetPollService.is_poll_engagement_published(100)
 
     assert exc_info.value.status_code == HTTPStatus.NOT_FOUND
 
@@ -0,0 +1,89 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the batch loader.
+
+Test suite to ensure that dumping a page of models loads each relationship with a single query.
+"""
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from met_api.models import db
+from met_api.models.submission import Submission as SubmissionModel
+from met_api.schemas.submission import SubmissionSchema
+from met_api.utils.batch_loader import BatchLoader
+from tests.utilities.factory_scenarios import TestSubmissionInfo
+from tests.utilities.factory_utils import (
+    factory_comment_model, factory_participant_model, factory_submission_model, factory_survey_and_eng_model)
+
+
+SUBMISSION_COUNT = 5
+DUMPED_FIELDS = ('id', 'comments.text', 'comments.label', 'comments.status_id', 'staff_note')
+
+
+@contextmanager
+def _count_queries():
+    """Count the statements executed in the block."""
+    statements = []
+
+    def _before_cursor_execute(*args):
+        statements.append(args[2])
+
+    event.listen(db.engine, 'before_cursor_execute', _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', _before_cursor_execute)
+
+
+def _create_submissions():
+    participant = factory_participant_model()
+    survey, eng = factory_survey_and_eng_model()
+    for _ in range(SUBMISSION_COUNT):
+        submission = factory_submission_model(survey.id, eng.id, participant.id, TestSubmissionInfo.pending_submission)
+        factory_comment_model(survey.id, submission.id)
+        factory_comment_model(survey.id, submission.id)
+    return survey
+
+
+def test_dump_submissions_batches_relationships(session):
+    """Assert that dumping many submissions loads each relationship once for the whole page."""
+    survey = _create_submissions()
+    db.session.expire_all()
+    submissions = SubmissionModel.get_by_survey_id(survey.id)
+
+    with _count_queries() as statements:
+        result = SubmissionSchema(many=True, only=DUMPED_FIELDS).dump(submissions)
+
+    assert len(result) == SUBMISSION_COUNT
+    assert all(len(submission['comments']) == 2 for submission in result)
+    # comments and staff notes, regardless of the number of submissions; the survey is already in the session
+    assert len(statements) == 2
+
+
+def test_load_reuses_loaded_models(session):
+    """Assert that many to one relationships already in the session are not fetched again."""
+    survey = _create_submissions()
+    db.session.expire_all()
+    submissions = SubmissionModel.get_by_survey_id(survey.id)
+    loader = BatchLoader()
+
+    loader.load(submissions, 'comments', 'comments.submission')
+
+    assert loader.queries == 1
+    assert loader.loaded == SUBMISSION_COUNT * 2
+    with _count_queries() as statements:
+        for submission in submissions:
+            assert all(comment.submission is submission for comment in submission.comments)
+    assert not statements
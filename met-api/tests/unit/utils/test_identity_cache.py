@@ -0,0 +1,94 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the identity cache.
+
+Test suite to ensure that the finders of a request read through the cache until the models they return are written.
+"""
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from met_api.models import db
+from met_api.models.engagement import Engagement as EngagementModel
+from met_api.models.engagement_slug import EngagementSlug as EngagementSlugModel
+from met_api.models.staff_note import StaffNote
+from met_api.utils.identity_cache import get_identity_cache
+from tests.utilities.factory_utils import (
+    factory_participant_model, factory_submission_model, factory_survey_and_eng_model)
+
+
+@contextmanager
+def _count_queries():
+    """Count the statements executed in the block, other than the savepoints of the test session."""
+    statements = []
+
+    def _before_cursor_execute(*args):
+        if 'SAVEPOINT' not in args[2]:
+            statements.append(args[2])
+
+    event.listen(db.engine, 'before_cursor_execute', _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', _before_cursor_execute)
+
+
+def test_finders_read_through_cache(app, session):  # pylint:disable=unused-argument
+    """Assert that a request looks up a model, or a model which is not found, only once."""
+    _, eng = factory_survey_and_eng_model()
+    eng_id = eng.id
+    db.session.expunge_all()
+
+    with app.test_request_context(), _count_queries() as statements:
+        engagement = EngagementModel.find_by_id(eng_id)
+        assert EngagementModel.find_by_id(eng_id) is engagement
+        assert EngagementSlugModel.find_by_engagement_id(eng_id) is None
+        assert EngagementSlugModel.find_by_engagement_id(eng_id) is None
+        assert get_identity_cache().hits == 2
+
+    assert len(statements) == 2
+
+
+def test_writes_invalidate_cache(app, session):  # pylint:disable=unused-argument
+    """Assert that the results of a model are looked up again once the model is written or the session commits."""
+    participant = factory_participant_model()
+    survey, eng = factory_survey_and_eng_model()
+    submission = factory_submission_model(survey.id, eng.id, participant.id)
+    survey_id, submission_id = survey.id, submission.id
+    db.session.expunge_all()
+
+    with app.test_request_context():
+        assert not StaffNote.get_staff_note_by_type(submission_id, 'Review')
+        note = StaffNote(note='Note', note_type='Review', survey_id=survey_id, submission_id=submission_id)
+        note.flush()
+        assert StaffNote.get_staff_note_by_type(submission_id, 'Review') == [note]
+
+        # bulk statements forget the results of the models of their table
+        StaffNote.query.filter_by(id=note.id).delete()
+        assert not StaffNote.get_staff_note_by_type(submission_id, 'Review')
+
+        with _count_queries() as statements:
+            StaffNote.get_staff_note_by_type(submission_id, 'Review')
+            db.session.commit()
+            StaffNote.get_staff_note_by_type(submission_id, 'Review')
+        assert len(statements) == 1
+
+
+def test_no_cache_outside_requests(session):  # pylint:disable=unused-argument
+    """Assert that the finders are not cached outside of a request."""
+    with _count_queries() as statements:
+        assert EngagementSlugModel.find_by_engagement_id(0) is None
+        assert EngagementSlugModel.find_by_engagement_id(0) is None
+
+    assert len(statements) == 2
@@ -16,8 +16,13 @@
 
 Test-Suite to ensure that the Notification methods are working as expected.
 """
+import json
+from http import HTTPStatus
+from unittest.mock import MagicMock
+
 import pytest
 
+from met_api.services.rest_service import RestService
 from met_api.utils import notification
 from met_api.constants.email_verification import INTERNAL_EMAIL_DOMAIN
 
@@ -44,3 +49,36 @@ def test_is_allowed_email(app, email, expected, send_email_internal_only):
     app.config['SEND_EMAIL_INTERNAL_ONLY'] = send_email_internal_only
     with app.app_context():
         assert notification.is_allowed_email(email) == expected
+
+
+def test_send_email_refreshes_rejected_token(app, mocker):
+    """Assert that an email rejected for its token is sent again with a new token."""
+    mock_token = mocker.patch.object(RestService, 'get_service_account_token', side_effect=['old', 'new'])
+    unauthorized, sent = MagicMock(status_code=HTTPStatus.UNAUTHORIZED), MagicMock(status_code=HTTPStatus.OK)
+    mock_post = mocker.patch('met_api.utils.notification.requests.post', side_effect=[unauthorized, sent])
+
+    with app.app_context():
+        notification.send_email('subject', 'test' + INTERNAL_EMAIL_DOMAIN, '<p>body</p>', {}, 'template')
+
+    mock_token.assert_called_with(force_refresh=True)
+    assert mock_post.call_args.kwargs['headers']['Authorization'] == 'Bearer new'
+    sent.raise_for_status.assert_called_once()
+
+
+def test_send_email_batch(app, mocker):
+    """Assert that a batch of emails is sent in a single request, returning the result of each email."""
+    mocker.patch.object(RestService, 'get_service_account_token', return_value='token')
+    results = [{'reference': 'first', 'status': 'SENT'}, {'reference': 'second', 'status': 'SENT'}]
+    mock_post = mocker.patch('met_api.utils.notification.requests.post',
+                             return_value=MagicMock(status_code=HTTPStatus.OK, json=lambda: {'results': results}))
+    emails = [{'subject': 'subject', 'email': f'{reference}@gov.bc.ca', 'html_body': '<p>body</p>', 'args': {},
+               'template_id': 'template', 'reference': reference} for reference in ('first', 'second')]
+
+    with app.app_context():
+        assert notification.send_email_batch(emails) == results
+
+    mock_post.assert_called_once()
+    assert mock_post.call_args.args[0] == app.config['NOTIFICATIONS_EMAIL_BATCH_ENDPOINT']
+    payloads = json.loads(mock_post.call_args.kwargs['data'])['emails']
+    assert [(payload['to'], payload['reference']) for payload in payloads] == \
+        [(['first@gov.bc.ca'], 'first'), (['second@gov.bc.ca'], 'second')]
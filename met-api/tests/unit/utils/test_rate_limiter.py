@@ -0,0 +1,54 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the token bucket rate limiter.
+
+Test suite to ensure that the requests of a key are limited to the burst, then to the rate.
+"""
+from unittest.mock import patch
+
+from met_api.utils.rate_limiter import TokenBucketLimiter
+
+
+def test_token_bucket_limiter():
+    """Assert that a bucket allows the burst, then refills at the rate."""
+    limiter = TokenBucketLimiter()
+    with patch('met_api.utils.rate_limiter.time.monotonic', return_value=100.0) as monotonic:
+        assert all(limiter.allow('a', rate=2, burst=3) for _ in range(3))
+        assert not limiter.allow('a', rate=2, burst=3)
+        # the buckets of the other keys are full
+        assert limiter.allow('b', rate=2, burst=3)
+
+        monotonic.return_value = 100.5
+        assert limiter.allow('a', rate=2, burst=3)
+        assert not limiter.allow('a', rate=2, burst=3)
+
+        # the bucket does not fill over the burst
+        monotonic.return_value = 200.0
+        assert all(limiter.allow('a', rate=2, burst=3) for _ in range(3))
+        assert not limiter.allow('a', rate=2, burst=3)
+
+
+def test_token_bucket_limiter_disabled_and_bounded():
+    """Assert that a rate of 0 disables the limit, and that only the most recently used buckets are kept."""
+    limiter = TokenBucketLimiter(max_keys=2)
+    assert all(limiter.allow('a', rate=0, burst=1) for _ in range(5))
+
+    with patch('met_api.utils.rate_limiter.time.monotonic', return_value=100.0):
+        assert limiter.allow('a', rate=1, burst=1)
+        assert limiter.allow('b', rate=1, burst=1)
+        assert not limiter.allow('a', rate=1, burst=1)
+        assert limiter.allow('c', rate=1, burst=1)
+        # the bucket of b was the least recently used
+        assert limiter.allow('b', rate=1, burst=1)
+        assert not limiter.allow('c', rate=1, burst=1)
@@ -0,0 +1,142 @@
+"""Tests for the cache of the public responses.
+
+Test suite to ensure that the anonymous responses are cached, revalidated with their ETag and outdated by the writes.
+"""
+import json
+from http import HTTPStatus
+from unittest.mock import patch
+
+from flask import g
+
+from met_api.constants.engagement_status import Status
+from met_api.models import db
+from met_api.models.contact import Contact
+from met_api.services.engagement_service import EngagementService
+from met_api.services.widget_documents_service import WidgetDocumentService
+from met_api.utils.enums import ContentType
+from tests.utilities.factory_scenarios import TestContactInfo, TestEngagementContentInfo, TestWidgetDocumentInfo
+from tests.utilities.factory_utils import (
+    factory_auth_header, factory_document_model, factory_engagement_model, factory_engagement_slug_model,
+    factory_widget_model)
+
+
+def test_public_response_cached(client, jwt, session, app, monkeypatch,
+                                setup_admin_user_and_claims):  # pylint:disable=unused-argument
+    """Assert that the anonymous responses are served from the cache until their engagement changes."""
+    monkeypatch.setitem(app.config, 'PUBLIC_RESPONSE_CACHE_TIMEOUT', 300)
+    engagement = factory_engagement_model(status=Status.Published.value)
+
+    rv = client.get(f'/api/engagements/{engagement.id}')
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.headers['Cache-Control'] == 'no-cache'
+    etag = rv.headers['ETag']
+
+    with patch.object(EngagementService, 'get_engagement') as mock_get_engagement:
+        rv = client.get(f'/api/engagements/{engagement.id}')
+        assert rv.status_code == HTTPStatus.OK
+        assert rv.json['name'] == engagement.name
+        rv = client.get(f'/api/engagements/{engagement.id}', headers={'If-None-Match': etag})
+        assert rv.status_code == HTTPStatus.NOT_MODIFIED
+        mock_get_engagement.assert_not_called()
+
+    engagement.name = 'Renamed engagement'
+    engagement.save()
+    rv = client.get(f'/api/engagements/{engagement.id}', headers={'If-None-Match': etag})
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.json['name'] == 'Renamed engagement'
+    assert rv.headers['ETag'] != etag
+
+    _, claims = setup_admin_user_and_claims
+    headers = factory_auth_header(jwt=jwt, claims=claims)
+    with patch.object(EngagementService, 'get_engagement', return_value={'name': 'not cached'}):
+        rv = client.get(f'/api/engagements/{engagement.id}', headers=headers)
+    assert rv.json == {'name': 'not cached'}
+    assert 'no-store' in rv.headers['Cache-Control']
+
+
+def test_public_response_of_child_rows(client, session, app, monkeypatch):  # pylint:disable=unused-argument
+    """Assert that the responses keyed by widget or slug are outdated by the writes to their engagement."""
+    monkeypatch.setitem(app.config, 'PUBLIC_RESPONSE_CACHE_TIMEOUT', 300)
+    engagement = factory_engagement_model(status=Status.Published.value)
+    widget = factory_widget_model({'engagement_id': engagement.id})
+    factory_engagement_slug_model({'slug': 'cached-slug', 'engagement_id': engagement.id})
+
+    assert client.get(f'/api/widgets/{widget.id}/documents').json == {}
+    assert client.get('/api/slugs/cached-slug').json['engagement_id'] == engagement.id
+    with patch.object(WidgetDocumentService, 'get_documents_by_widget_id') as mock_get_documents:
+        assert client.get(f'/api/widgets/{widget.id}/documents').json == {}
+        mock_get_documents.assert_not_called()
+
+    factory_document_model({**TestWidgetDocumentInfo.document1, 'widget_id': widget.id})
+    assert len(client.get(f'/api/widgets/{widget.id}/documents').json) == 1
+
+    engagement.name = 'Renamed engagement'
+    engagement.save()
+    with patch('met_api.services.engagement_slug_service.EngagementSlugModel.find_by_slug',
+               return_value=None) as mock_find_by_slug:
+        client.get('/api/slugs/cached-slug')
+        mock_find_by_slug.assert_called_once()
+
+
+def _get_anonymous(client, url, headers=None):
+    """GET the url anonymously, forgetting the token of the previous requests, which share the app context."""
+    g.pop('jwt_oidc_token_info', None)
+    return client.get(url, headers=headers)
+
+
+def test_public_response_outdated_by_edits(client, jwt, session, app, monkeypatch,
+                                           setup_admin_user_and_claims):  # pylint:disable=unused-argument
+    """Assert that the edits of the staff, which run bulk updates, outdate the cached responses."""
+    monkeypatch.setitem(app.config, 'PUBLIC_RESPONSE_CACHE_TIMEOUT', 300)
+    engagement = factory_engagement_model(status=Status.Published.value)
+    _, claims = setup_admin_user_and_claims
+    headers = factory_auth_header(jwt=jwt, claims=claims)
+    content_ids = []
+    for content_info in (TestEngagementContentInfo.content1, TestEngagementContentInfo.content2):
+        rv = client.post(f'/api/engagement/{engagement.id}/content',
+                         data=json.dumps({**content_info, 'engagement_id': engagement.id}),
+                         headers=headers, content_type=ContentType.JSON.value)
+        content_ids.append(rv.json['id'])
+
+    etag = _get_anonymous(client, f'/api/engagements/{engagement.id}').headers['ETag']
+    rv = client.patch('/api/engagements/', data=json.dumps({'id': engagement.id, 'name': 'Edited engagement'}),
+                      headers=headers, content_type=ContentType.JSON.value)
+    assert rv.status_code == HTTPStatus.OK
+    rv = _get_anonymous(client, f'/api/engagements/{engagement.id}', {'If-None-Match': etag})
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.json['name'] == 'Edited engagement'
+
+    contents = _get_anonymous(client, f'/api/engagement/{engagement.id}/content').json
+    assert [content['id'] for content in contents] == content_ids
+    rv = client.patch(f'/api/engagement/{engagement.id}/content/{content_ids[0]}',
+                      data=json.dumps({'title': 'Edited title'}),
+                      headers=headers, content_type=ContentType.JSON.value)
+    assert rv.status_code == HTTPStatus.OK
+    contents = _get_anonymous(client, f'/api/engagement/{engagement.id}/content').json
+    assert contents[0]['title'] == 'Edited title'
+
+    rv = client.patch(f'/api/engagement/{engagement.id}/content/sort_index',
+                      data=json.dumps([{'id': content_id} for content_id in reversed(content_ids)]),
+                      headers=headers, content_type=ContentType.JSON.value)
+    assert rv.status_code == HTTPStatus.NO_CONTENT
+    contents = _get_anonymous(client, f'/api/engagement/{engagement.id}/content').json
+    assert [content['id'] for content in contents] == list(reversed(content_ids))
+
+
+def test_public_response_outdated_by_shared_write_commit(client, session, app,
+                                                         monkeypatch):  # pylint:disable=unused-argument
+    """Assert that a response cached between the flush and the commit of a shared row is not served once committed."""
+    monkeypatch.setitem(app.config, 'PUBLIC_RESPONSE_CACHE_TIMEOUT', 300)
+    engagement = factory_engagement_model(status=Status.Published.value)
+
+    contact = Contact(**TestContactInfo.contact1)
+    db.session.add(contact)
+    db.session.flush()
+    # a concurrent request caches the response while the contact is not committed yet
+    etag = client.get(f'/api/engagements/{engagement.id}').headers['ETag']
+    db.session.commit()
+
+    with patch.object(EngagementService, 'get_engagement', return_value={'name': 'not cached'}) as mock_get:
+        rv = client.get(f'/api/engagements/{engagement.id}', headers={'If-None-Match': etag})
+        mock_get.assert_called_once()
+    assert rv.status_code == HTTPStatus.OK
@@ -0,0 +1,49 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the JSON schema validation utilities.
+
+Test suite to ensure that payloads are validated with cached validators.
+"""
+from unittest.mock import patch
+
+from met_api.schemas import utils as schema_utils
+
+
+def test_validate_reuses_schema_store():
+    """Assert that the schema files are read once and that errors are reported."""
+    schema_utils.clear_validator_cache()
+    with patch.object(schema_utils, 'get_schema_store', wraps=schema_utils.get_schema_store) as mock_get_store:
+        assert schema_utils.validate({'selected_answer_id': 1}, 'poll_response') == (True, None)
+        valid_format, errors = schema_utils.validate({'selected_answer_id': 'one'}, 'poll_response')
+        assert schema_utils.validate({}, 'contact')[0] is False
+
+    assert mock_get_store.call_count == 1
+    assert valid_format is False
+    assert schema_utils.serialize(errors) == ["'one' is not of type 'integer'"]
+
+
+def test_validate_reports_all_errors():
+    """Assert that the error iterator includes the error found first."""
+    valid_format, errors = schema_utils.validate({'language_id': 'en'}, 'engagement_translation')
+
+    assert valid_format is False
+    assert schema_utils.serialize(errors) == ["'engagement_id' is a required property", "'en' is not of type 'number'"]
+
+
+def test_validate_with_schema_store():
+    """Assert that a given schema store is used instead of the cached one."""
+    schema_store = {f'{schema_utils.BASE_URI}/number': {'type': 'integer'}}
+
+    assert schema_utils.validate(1, 'number', schema_store=schema_store) == (True, None)
+    assert schema_utils.validate('1', 'number', schema_store=schema_store)[0] is False
@@ -0,0 +1,73 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the survey form index.
+
+Test suite to ensure that single and multi page forms are indexed by question key.
+"""
+from datetime import datetime
+
+from met_api.utils.survey_form_index import SurveyFormIndex, clear_survey_form_index_cache, get_survey_form_index
+
+
+WIZARD_FORM = {
+    'display': 'wizard',
+    'components': [
+        {'key': 'page1', 'type': 'panel', 'components': [
+            {'key': 'name', 'label': 'Name', 'type': 'simpletextfield', 'inputType': 'text'},
+            {'key': 'colour', 'label': 'Colour', 'type': 'simpleradios',
+             'values': [{'value': 'r', 'label': 'Red'}, {'value': 'b', 'label': 'Blue'}]},
+        ]},
+        {'key': 'page2', 'type': 'panel', 'components': [
+            {'key': 'city', 'label': 'City', 'type': 'simpleselect',
+             'data': {'values': [{'value': 'vic', 'label': 'Victoria'}]}},
+            {'key': 'comment', 'label': 'Comment', 'type': 'simpletextarea', 'inputType': 'text'},
+        ]},
+    ]
+}
+
+
+def test_index_wizard_form():
+    """Assert that the questions of all the pages are indexed in form order."""
+    index = SurveyFormIndex(WIZARD_FORM)
+
+    assert [component.key for component in index.components] == ['name', 'colour', 'city', 'comment']
+    assert index.text_keys == ['name', 'comment']
+    assert index.text_labels == ['Name', 'Comment']
+    assert index.get_label('comment') == 'Comment'
+    assert index.get_label('page1') is None
+    comment = index.get('comment')
+    assert (comment.page, comment.position, comment.type) == (1, 1, 'simpletextarea')
+    assert index.get('colour').values == {'r': 'Red', 'b': 'Blue'}
+    assert index.get('city').values == {'vic': 'Victoria'}
+
+
+def test_index_single_page_form():
+    """Assert that a single page form is indexed and that unknown displays have no questions."""
+    form = {'display': 'form', 'components': WIZARD_FORM['components'][0]['components']}
+
+    assert SurveyFormIndex(form).text_keys == ['name']
+    assert not SurveyFormIndex({'display': 'pdf', 'components': form['components']}).components
+    assert not SurveyFormIndex(None).components
+
+
+def test_index_cached_by_update_date():
+    """Assert that the index is reused until the survey is updated."""
+    clear_survey_form_index_cache()
+    updated_date = datetime.utcnow()
+
+    index = get_survey_form_index(1, updated_date, WIZARD_FORM)
+    assert get_survey_form_index(1, updated_date, WIZARD_FORM) is index
+    assert get_survey_form_index(1, str(updated_date), WIZARD_FORM) is index
+    assert get_survey_form_index(1, datetime.utcnow(), {'display': 'form'}) is not index
+    assert get_survey_form_index(1, None, WIZARD_FORM) is not index
@@ -220,6 +220,10 @@ class _Config():  # pylint: disable=too-few-public-methods
 
     # The API endpoint used to send emails to participants.
     NOTIFICATIONS_EMAIL_ENDPOINT = os.getenv('NOTIFICATIONS_EMAIL_ENDPOINT')
+    # The API endpoint used to send several emails in one request, and the emails sent in each request.
+    NOTIFICATIONS_EMAIL_BATCH_ENDPOINT = os.getenv('NOTIFICATIONS_EMAIL_BATCH_ENDPOINT') or \
+        f'{NOTIFICATIONS_EMAIL_ENDPOINT}/batch'
+    NOTIFICATIONS_EMAIL_BATCH_SIZE = int(os.getenv('NOTIFICATIONS_EMAIL_BATCH_SIZE', '100'))
 
     # config for comment_redact_service
     N_DAYS = os.getenv('N_DAYS', 14)
@@ -228,6 +232,14 @@ class _Config():  # pylint: disable=too-few-public-methods
     # config for email queue
     MAIL_BATCH_SIZE = os.getenv('MAIL_BATCH_SIZE', 10)
 
+    # config for email outbox dispatcher
+    EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv('EMAIL_OUTBOX_BATCH_SIZE', '50'))
+    EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv('EMAIL_OUTBOX_MAX_ATTEMPTS', '8'))
+    EMAIL_OUTBOX_RETRY_DELAY = int(os.getenv('EMAIL_OUTBOX_RETRY_DELAY', '60'))
+    EMAIL_OUTBOX_MAX_RETRY_DELAY = int(os.getenv('EMAIL_OUTBOX_MAX_RETRY_DELAY', '3600'))
+    EMAIL_OUTBOX_LEASE = int(os.getenv('EMAIL_OUTBOX_LEASE', '300'))
+    EMAIL_OUTBOX_RETENTION_DAYS = int(os.getenv('EMAIL_OUTBOX_RETENTION_DAYS', '30'))
+
     # config for offset days to send reminder emails
     OFFSET_DAYS = os.getenv('OFFSET_DAYS', 2)
 
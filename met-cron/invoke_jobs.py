@@ -63,6 +63,8 @@ def run(job_name):
     from tasks.met_publish import MetEngagementPublish
     from tasks.met_purge import MetPurge
     from tasks.met_comment_redact import MetCommentRedact
+    from tasks.met_poll_results_reconcile import MetPollResultsReconcile
+    from tasks.email_outbox_dispatcher import EmailOutboxDispatcher
     from tasks.subscription_mailer import SubscriptionMailer
     application = create_app()
 
@@ -81,6 +83,12 @@ def run(job_name):
     elif job_name == 'COMMENT_REDACT':
         MetCommentRedact.do_redact()
         application.logger.info('<<<< Completed MET COMMENT_REDACT >>>>')
+    elif job_name == 'POLL_RESULTS_RECONCILE':
+        MetPollResultsReconcile.do_reconcile()
+        application.logger.info('<<<< Completed MET POLL_RESULTS_RECONCILE >>>>')
+    elif job_name == 'EMAIL_OUTBOX':
+        EmailOutboxDispatcher.do_dispatch()
+        application.logger.info('<<<< Completed MET EMAIL_OUTBOX >>>>')
     elif job_name == 'PUBLISH_EMAIL':
         SubscriptionMailer.do_email()
         application.logger.info('<<<< Completed MET PUBLISH_EMAIL >>>>')
@@ -0,0 +1,3 @@
+#! /bin/sh
+echo 'run invoke_jobs.py POLL_RESULTS_RECONCILE'
+python3 invoke_jobs.py POLL_RESULTS_RECONCILE
\ No newline at end of file
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Set
 
 from flask import current_app
 
@@ -9,6 +9,7 @@ from met_api.constants.user import SYSTEM_USER
 from met_api.models.comment import Comment as MetCommentModel
 from met_api.models.engagement import Engagement as MetEngagementModel
 from met_api.models.submission import Submission as MetSubmissionModel
+from met_api.models.submission_status_count import SubmissionStatusCount as MetSubmissionStatusCountModel
 from met_api.models.db import db
 from sqlalchemy import and_
 
@@ -23,6 +24,7 @@ class CommentRedactService:  # pylint: disable=too-few-public-methods
             1. Get submissions for engagements closed for N_DAYS
             2. Redact comments in comments table by submission_ids
             3. Redact comments in submission_json by submission_ids
+            4. Reconcile the comment status counters of the affected surveys
 
         """
         n_days: int = int(current_app.config.get('N_DAYS'))
@@ -34,6 +36,7 @@ class CommentRedactService:  # pylint: disable=too-few-public-methods
         submissions_ids = [submission.id for submission in submissions]
         CommentRedactService._redact_comments_by_submission_ids(submissions_ids)
         CommentRedactService._redact_submission_json_comments(submissions_ids)
+        CommentRedactService._rebuild_status_counts({submission.survey_id for submission in submissions})
         db.session.commit()
 
 
@@ -85,3 +88,9 @@ class CommentRedactService:  # pylint: disable=too-few-public-methods
             submission.submission_json = new_submission_json
             submission.updated_by = SYSTEM_USER
             submission.updated_date = datetime.utcnow()
+
+
+    @staticmethod
+    def _rebuild_status_counts(survey_ids: Set[int]):
+        current_app.logger.info(f'>>>>>Rebuilding comment status counters for surveys: {survey_ids}')
+        MetSubmissionStatusCountModel.rebuild(survey_ids)
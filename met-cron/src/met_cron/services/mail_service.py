@@ -10,6 +10,7 @@ from met_api.models.engagement import Engagement as EngagementModel
 from met_api.models.participant import Participant as ParticipantModel
 from met_api.models.subscription import Subscription as SubscriptionModel
 from met_api.services.email_verification_service import EmailVerificationService
+from met_api.services.rest_service import RestService
 from met_api.utils import notification
 from met_cron.utils.subscription_checker import CheckSubscription
 
@@ -28,6 +29,7 @@ class EmailService:  # pylint: disable=too-few-public-methods
             SubscriptionModel.is_subscribed == True).all()
         subscriber: SubscriptionModel
         email_list = []
+        emails = []
         for subscriber in subscription_list:
             is_subscribed = CheckSubscription.check_subscription(subscriber, engagement_id)
             if is_subscribed:
@@ -35,19 +37,23 @@ class EmailService:  # pylint: disable=too-few-public-methods
                     participant = ParticipantModel.find_by_id(subscriber.participant_id)
                     if participant.email_address is not None:
                         email_address = ParticipantModel.decode_email(participant.email_address)
-                        if email_address not in email_list:
+                        if email_address not in email_list and notification.is_valid_email(email_address) \
+                                and notification.is_allowed_email(email_address):
                             email_list.append(email_address)
                             body, args = EmailService._render_email_template(engagement, participant, template)
-                            EmailService._send_email_notification(subject,
-                                                                  email_address,
-                                                                  body,
-                                                                  args,
-                                                                  template_id)
+                            emails.append({'subject': subject, 'email': email_address, 'html_body': body,
+                                           'args': args, 'template_id': template_id})
                 except Exception as exc:  # noqa: B902
                     current_app.logger.error('<Extracting email address for subscribers failed', exc)
                     raise BusinessException(
                         error='Error extracting email address for subscribers.',
                         status_code=HTTPStatus.INTERNAL_SERVER_ERROR) from exc
+        # the subscribers are emailed in batches, one request to the notification api per batch
+        batch_size = current_app.config['NOTIFICATIONS_EMAIL_BATCH_SIZE']
+        for start in range(0, len(emails), batch_size):
+            EmailService._send_email_notifications(emails[start:start + batch_size])
+        # the service account token is cached by the rest service and shared by all the emails of the job
+        current_app.logger.info('Service account token cache: %s', RestService.get_token_cache_stats())
 
     @staticmethod
     def _render_email_template(engagement, participant, template):
@@ -88,15 +94,18 @@ class EmailService:  # pylint: disable=too-few-public-methods
         return tenant.name
 
     @staticmethod
-    def _send_email_notification(subject, email, body, args, template_id):
+    def _send_email_notifications(emails):
         try:
-            notification.send_email(subject=subject,
-                                    email=email,
-                                    html_body=body,
-                                    args=args,
-                                    template_id=template_id)                
+            results = notification.send_email_batch(emails)
         except Exception as exc:  # noqa: B902
             current_app.logger.error('<Notification for publish engagement failed', exc)
             raise BusinessException(
                 error='Error sending publish engagement notification email.',
                 status_code=HTTPStatus.INTERNAL_SERVER_ERROR) from exc
+        failed = [result for result in results if result['status'] != 'SENT']
+        if failed:
+            current_app.logger.error('<Notification for publish engagement failed for %s of %s emails: %s',
+                                     len(failed), len(results), failed[0].get('error'))
+            raise BusinessException(
+                error='Error sending publish engagement notification email.',
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR)
@@ -0,0 +1,19 @@
+from flask import current_app
+
+from met_api.models.db import db
+from met_api.models.poll_response_count import PollResponseCount as MetPollResponseCountModel
+
+
+class PollResultsService:  # pylint: disable=too-few-public-methods
+    """Reconciliation Service of the Poll Results."""
+
+    @staticmethod
+    def reconcile_response_counts():
+        """Recompute the per-poll and per-answer response counters from the poll responses.
+
+        The counters are maintained when the responses are recorded or deleted; this recomputes them in a single
+        transaction, correcting the responses changed outside of the API.
+        """
+        rebuilt = MetPollResponseCountModel.rebuild()
+        db.session.commit()
+        current_app.logger.info(f'>>>>>Rebuilt the response counters of {rebuilt} polls')
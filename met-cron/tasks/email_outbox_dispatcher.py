@@ -0,0 +1,31 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""MET Email Outbox Dispatcher."""
+from datetime import datetime
+
+from flask import current_app
+
+from met_api.services.email_outbox_service import EmailOutboxService
+
+
+class EmailOutboxDispatcher:  # pylint:disable=too-few-public-methods
+    """Task to send the emails queued in the outbox."""
+
+    @classmethod
+    def do_dispatch(cls):
+        """Send the emails of the outbox which are due."""
+        print('Starting email outbox dispatch at------------------------', datetime.now())
+
+        totals = EmailOutboxService.dispatch()
+        current_app.logger.info(f'>>>>>Email outbox dispatched: {dict(totals)}')
@@ -0,0 +1,28 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""MET Poll Results Reconcile."""
+from datetime import datetime
+
+from met_cron.services.poll_results_service import PollResultsService
+
+
+class MetPollResultsReconcile:  # pylint:disable=too-few-public-methods
+    """Task to recompute the response counters of the polls."""
+
+    @classmethod
+    def do_reconcile(cls):
+        """Recompute the poll response counters from the poll responses."""
+        print('Starting poll results reconciliation at------------------------', datetime.now())
+
+        PollResultsService.reconcile_response_counts()
@@ -10,6 +10,7 @@ from analytics_api.models.response_type_option import ResponseTypeOption as EtlR
 from analytics_api.models.user_response_detail import UserResponseDetail as EtlUserResponseDetailModel
 from analytics_api.models.survey import Survey as EtlSurveyModel
 from analytics_api.utils.util import FormIoComponentType
+from met_api.utils.survey_form_index import get_survey_form_index
 
 
 # Perform the ETL on submissions.
@@ -116,21 +117,10 @@ def load_submission(context, new_submission, updated_submission, submission_new_
                     met_survey.id)
                 continue
 
-            form_type = met_survey.form_json.get('display', None)
-
-            # check and load data for single page survey.
-            if form_type == 'form':
-                form_questions = met_survey.form_json.get('components', None)
-                _extract_submission(form_questions, met_survey, metsession, submission, met_etl_session, context,
-                                    submission_new_runcycleid, etl_survey)
-
-            # check and load data for multi page survey.
-            if form_type == 'wizard':
-                pages = met_survey.form_json.get('components', None)
-                for page in pages:
-                    form_questions = page.get('components', None)
-                    _extract_submission(form_questions, met_survey, metsession, submission, met_etl_session, context,
-                                        submission_new_runcycleid, etl_survey)
+            # the form index flattens single and multi page surveys and is reused across submissions
+            form_index = get_survey_form_index(met_survey.id, met_survey.updated_date, met_survey.form_json)
+            _extract_submission(form_index.components, met_survey, metsession, submission, met_etl_session, context,
+                                submission_new_runcycleid, etl_survey)
 
     metsession.close()
 
@@ -142,7 +132,7 @@ def load_submission(context, new_submission, updated_submission, submission_new_
 # load data to table response_type_textarea
 def _extract_submission(form_questions, met_survey, metsession, submission, met_etl_session, context,
                         submission_new_runcycleid, etl_survey):
-            if (form_questions) is None:
+            if not form_questions:
                 # throw error or notify by logging
                 context.log.info(
                     'Survey Found without any component in form_json: %s.Skipping it',
@@ -157,7 +147,7 @@ def _extract_submission(form_questions, met_survey, metsession, submission, met_
             for component in form_questions:
                 # go thru each component type and check for answer in the submission_json.
                 # instead of going through each answer and iterate , we find the questions from the form and try to get the answer.
-                answer_key = submission.submission_json.get(component['key'])
+                answer_key = submission.submission_json.get(component.key)
 
                 if not (answer_key):
                     continue
@@ -165,10 +155,10 @@ def _extract_submission(form_questions, met_survey, metsession, submission, met_
                 # TODO comments related to category type question has a different format in the source system
                 # TODO the key needs to be finalized in the source system before doing a fix on the ETL.
                 # for now excluding the comment for a category type question as we are not using this data for analytics.
-                if component['key'] == 'categorycommentcontainer':
+                if component.key == 'categorycommentcontainer':
                     continue
 
-                component_type = component['type'].lower()
+                component_type = component.type.lower()
                 context.log.info('Type for submission id : %s. is %s ', submission.id, component_type)
 
                 if component_type == FormIoComponentType.RADIO.value:
@@ -197,16 +187,15 @@ def _extract_submission(form_questions, met_survey, metsession, submission, met_
 def _save_radio(met_etl_session, context, answer_key, component, survey, participant, submission, submission_new_runcycleid):
     # radio responses just has the key to the value selected, so value has to be found from question
     context.log.info('Input type Radio is created:survey id: %s. request_key is %s ',
-                     survey.id, component['key'])
+                     survey.id, component.key)
     answer_key_str = str(answer_key)
-    answer = next((x for x in component.get('values') if x.get('value') == answer_key_str), None)
 
-    if not answer:
+    if answer_key_str not in component.values:
         return
 
-    answer_value = answer.get('label')
+    answer_value = component.values[answer_key_str]
     context.log.info('Input type Radio is created:survey id: %s. request_key is %s value:%s request_id:%s',
-                     survey.id, component['key'], answer_value, component['id'])
+                     survey.id, component.key, answer_value, component.component['id'])
 
     _save_options(met_etl_session, survey, component, answer_value, getattr(participant, 'id', None),
                   submission_new_runcycleid, submission)
@@ -216,13 +205,7 @@ def _save_radio(met_etl_session, context, answer_key, component, survey, partici
 def _save_checkbox(met_etl_session, context, answer_key, component, survey, participant, submission, submission_new_runcycleid):
     # checkbox responses just has the key to the value selected, so value has to be found from question
     context.log.info('Input type Selectbox is created:survey id: %s. request_key is %s  Answer Key %s',
-                     survey.id, component['key'], answer_key)
-
-    selectbox_mapping = {}
-
-    if component.get('values') is not None:
-        for item in component.get('values'):
-            selectbox_mapping[item.get('value')] = item.get('label')
+                     survey.id, component.key, answer_key)
 
     if answer_key is not None:
         for key, value in answer_key.items():
@@ -231,12 +214,12 @@ def _save_checkbox(met_etl_session, context, answer_key, component, survey, part
 
             if is_yes:
                 # need to find the label of the drop down.
-                answer_label = selectbox_mapping.get(key)
+                answer_label = component.values.get(key)
 
                 context.log.info('Input type Selectbox is created:survey id: %s. '
-                                 'request_key is %s value:%s request_id:%s', survey.id, component['key'],
+                                 'request_key is %s value:%s request_id:%s', survey.id, component.key,
                                  answer_label,
-                                 component['id'])
+                                 component.component['id'])
 
                 _save_options(met_etl_session, survey, component, answer_label, getattr(participant, 'id', None),
                               submission_new_runcycleid, submission)
@@ -246,17 +229,15 @@ def _save_checkbox(met_etl_session, context, answer_key, component, survey, part
 def _save_select(met_etl_session, context, answer_key, component, survey, participant, submission, submission_new_runcycleid):
     # selected responses just has the key to the value selected, so value has to be found from question
     context.log.info('Input type Select is created:survey id: %s. request_key is %s ',
-                     survey.id, component['key'])
+                     survey.id, component.key)
     answer_key_str = str(answer_key)
-    component_data = component.get('data')
-    answer = next((x for x in component_data.get('values') if x.get('value') == answer_key_str), None)
 
-    if not answer:
+    if answer_key_str not in component.values:
         return
 
-    answer_value = answer.get('label')
+    answer_value = component.values[answer_key_str]
     context.log.info('Input type Select is created:survey id: %s. request_key is %s value:%s request_id:%s',
-                     survey.id, component['key'], answer_value, component['id'])
+                     survey.id, component.key, answer_value, component.component['id'])
 
     _save_options(met_etl_session, survey, component, answer_value, getattr(participant, 'id', None),
                   submission_new_runcycleid, submission)
@@ -266,29 +247,23 @@ def _save_select(met_etl_session, context, answer_key, component, survey, partic
 def _save_survey(met_etl_session, context, answer_key, component, survey, participant, submission, submission_new_runcycleid):
     # selected survey just has the key to the value selected, so value has to be found from question
     context.log.info('Input type Survey is created:survey id: %s. request_key is %s ',
-                     survey.id, component['key'])
-
-    survey_mapping = {}
-
-    if component.get('values') is not None:
-        for item in component.get('values'):
-            survey_mapping[item.get('value')] = item.get('label')
+                     survey.id, component.key)
 
     if answer_key is not None:
         for key, value in answer_key.items():
-            answer_label = survey_mapping.get(value)
+            answer_label = component.values.get(value)
 
             context.log.info('Input type Survey is created:survey id: %s. '
-                             'request_key is %s value:%s request_id:%s', survey.id, component['key'],
-                             answer_label, component['id'])
+                             'request_key is %s value:%s request_id:%s', survey.id, component.key,
+                             answer_label, component.component['id'])
 
             # id for survey type question is same for all sub questions so request id is a combination of 
             # id and the key
             radio_response = EtlResponseTypeOptionModel(
                 survey_id=survey.id,
-                request_key=component['key']+'-'+key,
+                request_key=component.key+'-'+key,
                 value=answer_label,
-                request_id=component['id']+'-'+key,
+                request_id=component.component['id']+'-'+key,
                 participant_id=getattr(participant, 'id', None),
                 is_active=True,
                 runcycle_id=submission_new_runcycleid,
@@ -302,9 +277,9 @@ def _save_survey(met_etl_session, context, answer_key, component, survey, partic
 def _save_options(met_etl_session, survey, component, value, participant, submission_new_runcycleid, submission):
     radio_response = EtlResponseTypeOptionModel(
         survey_id=survey.id,
-        request_key=component['key'],
+        request_key=component.key,
         value=value,
-        request_id=component['id'],
+        request_id=component.component['id'],
         participant_id=getattr(participant, 'id', None),
         is_active=True,
         runcycle_id=submission_new_runcycleid,
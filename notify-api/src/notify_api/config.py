@@ -59,6 +59,10 @@ class _Config():  # pylint: disable=too-few-public-methods
     GC_NOTIFY_API_KEY = os.getenv('GC_NOTIFY_API_KEY')
     GC_NOTIFY_API_BASE_URL = os.getenv('GC_NOTIFY_API_BASE_URL')
 
+    # Batch emails: the most emails accepted by a request, and the threads sending the emails of a request
+    EMAIL_BATCH_MAX_SIZE = int(os.getenv('EMAIL_BATCH_MAX_SIZE', '500'))
+    EMAIL_BATCH_WORKERS = int(os.getenv('EMAIL_BATCH_WORKERS', '8'))
+
     #   Set up OIDC variables.
     SECRET_KEY = os.getenv('SECRET_KEY')
 
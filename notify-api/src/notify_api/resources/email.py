@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Endpoints to check manage notifications."""
-from flask import jsonify, request
+from http import HTTPStatus
+
+from flask import current_app, jsonify, request
 from flask_restx import Namespace, Resource
 
 from notify_api.auth import Auth
@@ -32,3 +34,25 @@ class EmailNotification(Resource):
         email_payload = request.get_json(force=True)
         get_email_service().send(email_payload)
         return jsonify({})
+
+
+@API.route('/email/batch')
+class EmailBatchNotification(Resource):
+    """Batch notification resource."""
+
+    @staticmethod
+    @Auth.require
+    def post():
+        """Send the email notifications of the batch, returning the result of each email in order."""
+        email_payloads = request.get_json(force=True).get('emails')
+        max_size = current_app.config['EMAIL_BATCH_MAX_SIZE']
+        if not isinstance(email_payloads, list) or not email_payloads:
+            return {'message': 'emails must be a non-empty list.'}, HTTPStatus.BAD_REQUEST
+        if len(email_payloads) > max_size:
+            return {'message': f'A batch holds at most {max_size} emails.'}, HTTPStatus.BAD_REQUEST
+        results = get_email_service().send_batch(email_payloads, current_app.config['EMAIL_BATCH_WORKERS'])
+        return jsonify({
+            'results': results,
+            'sent': sum(result['status'] == 'SENT' for result in results),
+            'failed': sum(result['status'] == 'FAILED' for result in results),
+        })
@@ -13,17 +13,24 @@
 # limitations under the License.
 """Initialize and inject the email service by type."""
 import os
+from functools import lru_cache
+
 from .email_base_service import EmailBaseService
 from .email_ches_notify import EmailChesNotify
 from .email_gc_notify import EmailGCNotify
 
 
 def get_email_service():
-    """Return SMS Service implementation."""
+    """Return the Email Service implementation, shared by the requests so that its client and token are reused."""
+    return _get_email_service(os.getenv('EMAIL_PROVIDER'))
+
+
+@lru_cache(maxsize=None)
+def _get_email_service(email_provider):
     _instance: EmailBaseService
-    if os.getenv('EMAIL_PROVIDER') == 'GC_NOTIFY':
+    if email_provider == 'GC_NOTIFY':
         _instance = EmailGCNotify()
-    elif os.getenv('EMAIL_PROVIDER') == 'CHES':
+    elif email_provider == 'CHES':
         _instance = EmailChesNotify()
     else:
         _instance = EmailGCNotify()
@@ -14,11 +14,16 @@
 """Abstract class for Email implementation."""
 
 from abc import ABC, abstractmethod
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
 
 
-class EmailBaseService(ABC):  # pylint: disable=too-few-public-methods
-    """Abstract base class for Email Service."""
+class EmailBaseService(ABC):
+    """Abstract base class for Email Service.
+
+    An instance is shared by the requests, and by the workers sending a batch, so implementations keep their clients
+    and tokens on the instance and must be thread safe.
+    """
 
     @abstractmethod
     def send(self, email_payload: Dict):
@@ -26,3 +31,26 @@ class EmailBaseService(ABC):  # pylint: disable=too-few-public-methods
         # TODO: Implement send method in subclasses.
         # pylint: disable=W0719
         raise Exception('Not Implemented')
+
+    def send_batch(self, email_payloads: List[Dict], max_workers: int) -> List[Dict]:
+        """Send the emails with a pool of at most max_workers threads, returning the result of each email in order.
+
+        A failed email does not stop the others; its result holds the error, and the status code of the provider
+        response when it rejected the email.
+        """
+        with ThreadPoolExecutor(max_workers=max(min(max_workers, len(email_payloads)), 1)) as executor:
+            return list(executor.map(self._send_to_result, email_payloads))
+
+    def _send_to_result(self, email_payload: Dict) -> Dict:
+        result = {'reference': email_payload.get('reference')}
+        try:
+            self.send(email_payload)
+            result['status'] = 'SENT'
+        except Exception as e:  # NOQA # pylint:disable=broad-except
+            result['status'] = 'FAILED'
+            result['error'] = str(e) or type(e).__name__
+            # the errors of GC Notify carry the status code, and those of requests carry the response
+            status_code = getattr(e, 'status_code', None) or getattr(getattr(e, 'response', None), 'status_code', None)
+            if status_code is not None:
+                result['status_code'] = status_code
+        return result
@@ -17,19 +17,31 @@ This module is being invoked from a job and it sends SMS reminders to customers.
 """
 import os
 import json
+import threading
+import time
+from http import HTTPStatus
+
 import requests
 
 from .email_base_service import EmailBaseService
 
 
+# Seconds before the expiry of the CHES token at which a new one is requested
+TOKEN_EXPIRY_MARGIN = 30
+
+
 class EmailChesNotify(EmailBaseService):  # pylint: disable=too-few-public-methods
     """Implementation from Ches Email Notify."""
 
+    def __init__(self):
+        """Start without a token; the first email requests one, which the following emails reuse until it expires."""
+        self.timeout = int(os.getenv('CHES_TIMEOUT', '30'))
+        self._token = None
+        self._token_expiry = 0
+        self._token_lock = threading.Lock()
+
     def send(self, email_payload):
         """Send email."""
-        ches_token_url = os.getenv('CHES_SSO_TOKEN_URL')
-        ches_client_id = os.getenv('CHES_SSO_CLIENT_ID')
-        ches_client_secret = os.getenv('CHES_SSO_CLIENT_SECRET')
         ches_email_endpoint = os.getenv('CHES_POST_EMAIL_ENDPOINT')
         ches_payload = {
             'bodyType': email_payload.get('bodyType'),
@@ -38,22 +50,41 @@ class EmailChesNotify(EmailBaseService):  # pylint: disable=too-few-public-metho
             'subject': email_payload.get('subject'),
             'to': email_payload.get('to')
         }
-        token_request_data = \
-            f'client_id={ches_client_id}&client_secret={ches_client_secret}&grant_type=client_credentials'
-        token_request_headers = {'Content-Type': 'application/x-www-form-urlencoded'}
         try:
-            ches_token_response = requests.post(ches_token_url,
-                                                data=token_request_data,
-                                                headers=token_request_headers,
-                                                timeout=None)
-            ches_api_token = ches_token_response.json().get('access_token')
-            email_request_headers = \
-                {'Content-Type': 'application/json', 'Authorization': f'Bearer {ches_api_token}'}
-            email_response = requests.post(ches_email_endpoint,
-                                           headers=email_request_headers,
-                                           data=json.dumps(ches_payload),
-                                           timeout=None)
+            email_response = self._post_email(ches_email_endpoint, ches_payload, self._get_token())
+            if email_response.status_code == HTTPStatus.UNAUTHORIZED:
+                # the cached token was revoked, retry once with a new one
+                email_response = self._post_email(ches_email_endpoint, ches_payload,
+                                                  self._get_token(force_refresh=True))
             print(email_response)
+            email_response.raise_for_status()
         except Exception as e:  # noqa: B902
             print(e)  # log and continue
             raise e
+
+    def _post_email(self, ches_email_endpoint, ches_payload, ches_api_token):
+        email_request_headers = \
+            {'Content-Type': 'application/json', 'Authorization': f'Bearer {ches_api_token}'}
+        return requests.post(ches_email_endpoint,
+                             headers=email_request_headers,
+                             data=json.dumps(ches_payload),
+                             timeout=self.timeout)
+
+    def _get_token(self, force_refresh=False):
+        """Return the cached CHES SSO token, requesting a new one when it is missing or about to expire."""
+        with self._token_lock:
+            if force_refresh or self._token is None or time.monotonic() >= self._token_expiry:
+                ches_client_id = os.getenv('CHES_SSO_CLIENT_ID')
+                ches_client_secret = os.getenv('CHES_SSO_CLIENT_SECRET')
+                token_request_data = \
+                    f'client_id={ches_client_id}&client_secret={ches_client_secret}&grant_type=client_credentials'
+                token_request_headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+                ches_token_response = requests.post(os.getenv('CHES_SSO_TOKEN_URL'),
+                                                    data=token_request_data,
+                                                    headers=token_request_headers,
+                                                    timeout=self.timeout)
+                ches_token_response.raise_for_status()
+                token = ches_token_response.json()
+                self._token = token.get('access_token')
+                self._token_expiry = time.monotonic() + int(token.get('expires_in', 0)) - TOKEN_EXPIRY_MARGIN
+            return self._token
@@ -21,20 +21,22 @@ from .email_base_service import EmailBaseService
 class EmailGCNotify(EmailBaseService):  # pylint: disable=too-few-public-methods
     """Implementation for email from GC Notify."""
 
+    def __init__(self):
+        """Create the client once, to be reused by every email sent by the instance."""
+        self.notifications_client = NotificationsAPIClient(api_key=os.getenv('GC_NOTIFY_API_KEY'),
+                                                           base_url=os.getenv('GC_NOTIFY_API_BASE_URL'))
+
     def send(self, email_payload):
         """Send email through GCNotify."""
-        api_key = os.getenv('GC_NOTIFY_API_KEY')
-        print('----email_payload', email_payload)
-        gc_notify_url = os.getenv('GC_NOTIFY_API_BASE_URL')
         email_template_id = email_payload.get('template_id')
-        notifications_client = NotificationsAPIClient(api_key=api_key, base_url=gc_notify_url)
         email_to = ','.join(email_payload.get('to'))
         args = email_payload.get('args')
         try:
-            response = notifications_client.send_email_notification(
+            response = self.notifications_client.send_email_notification(
                 email_address=email_to,
                 template_id=email_template_id,
-                personalisation=args)
+                personalisation=args,
+                reference=email_payload.get('reference'))
             print(response)
 
         except Exception as e:  # noqa: B902